@@ -25,7 +25,7 @@ from .extraction_strategy import (
     JsonXPathExtractionStrategy,
 )
 from .chunking_strategy import ChunkingStrategy, RegexChunking
-from .markdown_generation_strategy import DefaultMarkdownGenerator
+from .markdown_generation_strategy import DefaultMarkdownGenerator, LXMLMarkdownGenerator
 from .content_filter_strategy import (
     PruningContentFilter,
     BM25ContentFilter,
@@ -33,10 +33,13 @@ from .content_filter_strategy import (
     RelevantContentFilter,
 )
 from .models import CrawlResult, MarkdownGenerationResult
+from .parsed_document import ParsedDocument
 from .async_dispatcher import (
     MemoryAdaptiveDispatcher,
     SemaphoreDispatcher,
+    DomainFairDispatcher,
     RateLimiter,
+    TokenBucket,
     CrawlerMonitor,
     DisplayMode,
     BaseDispatcher,
@@ -62,6 +65,7 @@ from .deep_crawling import (
     PathDepthScorer,
     BestFirstCrawlingStrategy,
     DFSDeepCrawlStrategy,
+    MultiProcessDeepCrawlStrategy,
     DeepCrawlDecorator,
 )
 
@@ -75,6 +79,7 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "MultiProcessDeepCrawlStrategy",
     "FilterChain",
     "URLPatternFilter",
     "ContentTypeFilter",
@@ -106,6 +111,7 @@ __all__ = [
     "ChunkingStrategy",
     "RegexChunking",
     "DefaultMarkdownGenerator",
+    "LXMLMarkdownGenerator",
     "RelevantContentFilter",
     "PruningContentFilter",
     "BM25ContentFilter",
@@ -113,10 +119,13 @@ __all__ = [
     "BaseDispatcher",
     "MemoryAdaptiveDispatcher",
     "SemaphoreDispatcher",
+    "DomainFairDispatcher",
     "RateLimiter",
+    "TokenBucket",
     "CrawlerMonitor",
     "DisplayMode",
     "MarkdownGenerationResult",
+    "ParsedDocument",
     "Crawl4aiDockerClient",
     "ProxyRotationStrategy",
     "RoundRobinProxyStrategy",
@@ -212,6 +212,15 @@ class BrowserConfig:
         light_mode (bool): Disables certain background features for performance gains. Default: False.
         extra_args (list): Additional command-line arguments passed to the browser.
                            Default: [].
+        page_pool_size (int): Idle pages kept open per browser context, created ahead of use and
+                              reused between crawls instead of opening and closing a page each time.
+                              0 disables the pool. Default: 0.
+        page_max_uses (int): Crawls a pooled page serves before it is closed and replaced.
+                             Default: 50.
+        browser_count (int): Browsers to launch, each with its own Playwright connection. Pages
+                             go to the browser with the fewest open pages. Default: 1.
+        browser_max_pages (int): Pages a browser serves before it is replaced by a fresh one,
+                                 once its open pages are done. 0 never replaces it. Default: 0.
     """
 
     def __init__(
@@ -251,6 +260,10 @@ class BrowserConfig:
         extra_args: list = None,
         debugging_port: int = 9222,
         host: str = "localhost",
+        page_pool_size: int = 0,
+        page_max_uses: int = 50,
+        browser_count: int = 1,
+        browser_max_pages: int = 0,
     ):
         self.browser_type = browser_type
         self.headless = headless
@@ -287,6 +300,10 @@ class BrowserConfig:
         self.sleep_on_close = sleep_on_close
         self.verbose = verbose
         self.debugging_port = debugging_port
+        self.page_pool_size = page_pool_size
+        self.page_max_uses = page_max_uses
+        self.browser_count = browser_count
+        self.browser_max_pages = browser_max_pages
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -335,6 +352,10 @@ class BrowserConfig:
             text_mode=kwargs.get("text_mode", False),
             light_mode=kwargs.get("light_mode", False),
             extra_args=kwargs.get("extra_args", []),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_max_uses=kwargs.get("page_max_uses", 50),
+            browser_count=kwargs.get("browser_count", 1),
+            browser_max_pages=kwargs.get("browser_max_pages", 0),
         )
 
     def to_dict(self):
@@ -367,6 +388,10 @@ class BrowserConfig:
             "sleep_on_close": self.sleep_on_close,
             "verbose": self.verbose,
             "debugging_port": self.debugging_port,
+            "page_pool_size": self.page_pool_size,
+            "page_max_uses": self.page_max_uses,
+            "browser_count": self.browser_count,
+            "browser_max_pages": self.browser_max_pages,
         }
 
     def clone(self, **kwargs):
@@ -511,6 +536,9 @@ class CrawlerRunConfig():
                              Default: False.
         prettiify (bool): If True, apply `fast_format_html` to produce prettified HTML output.
                           Default: False.
+        content_fingerprint (bool): If True, store a 64-bit SimHash of the page's markdown in
+                                    `CrawlResult.fingerprint`, for near-duplicate detection.
+                                    Default: False.
         parser_type (str): Type of parser to use for HTML parsing.
                            Default: "lxml".
         scraping_strategy (ContentScrapingStrategy): Scraping strategy to use.
@@ -524,6 +552,12 @@ class CrawlerRunConfig():
         cache_mode (CacheMode or None): Defines how caching is handled.
                                         If None, defaults to CacheMode.ENABLED internally.
                                         Default: CacheMode.BYPASS.
+        cache_ttl (float or None): Seconds a cached entry stays fresh. Stale entries are
+                                   refetched, or revalidated with a conditional GET in
+                                   CacheMode.REVALIDATE. If None, entries never go stale,
+                                   except in CacheMode.REVALIDATE where every hit is
+                                   revalidated.
+                                   Default: None.
         session_id (str or None): Optional session ID to persist the browser context and the created
                                   page instance. If the ID already exists, the crawler does not
                                   create a new page and uses the current page to preserve the state.
@@ -654,6 +688,7 @@ class CrawlerRunConfig():
         keep_attrs: list = None,
         remove_forms: bool = False,
         prettiify: bool = False,
+        content_fingerprint: bool = False,
         parser_type: str = "lxml",
         scraping_strategy: ContentScrapingStrategy = None,
         proxy_config: dict = None,
@@ -662,6 +697,7 @@ class CrawlerRunConfig():
         fetch_ssl_certificate: bool = False,
         # Caching Parameters
         cache_mode: CacheMode = CacheMode.BYPASS,
+        cache_ttl: Optional[float] = None,
         session_id: str = None,
         bypass_cache: bool = False,
         disable_cache: bool = False,
@@ -733,6 +769,7 @@ class CrawlerRunConfig():
         self.keep_attrs = keep_attrs or []
         self.remove_forms = remove_forms
         self.prettiify = prettiify
+        self.content_fingerprint = content_fingerprint
         self.parser_type = parser_type
         self.scraping_strategy = scraping_strategy or WebScrapingStrategy()
         self.proxy_config = proxy_config
@@ -743,6 +780,7 @@ class CrawlerRunConfig():
 
         # Caching Parameters
         self.cache_mode = cache_mode
+        self.cache_ttl = cache_ttl
         self.session_id = session_id
         self.bypass_cache = bypass_cache
         self.disable_cache = disable_cache
@@ -862,6 +900,7 @@ class CrawlerRunConfig():
             keep_attrs=kwargs.get("keep_attrs", []),
             remove_forms=kwargs.get("remove_forms", False),
             prettiify=kwargs.get("prettiify", False),
+            content_fingerprint=kwargs.get("content_fingerprint", False),
             parser_type=kwargs.get("parser_type", "lxml"),
             scraping_strategy=kwargs.get("scraping_strategy"),
             proxy_config=kwargs.get("proxy_config"),
@@ -870,6 +909,7 @@ class CrawlerRunConfig():
             fetch_ssl_certificate=kwargs.get("fetch_ssl_certificate", False),
             # Caching Parameters
             cache_mode=kwargs.get("cache_mode", CacheMode.BYPASS),
+            cache_ttl=kwargs.get("cache_ttl"),
             session_id=kwargs.get("session_id"),
             bypass_cache=kwargs.get("bypass_cache", False),
             disable_cache=kwargs.get("disable_cache", False),
@@ -962,12 +1002,14 @@ class CrawlerRunConfig():
             "keep_attrs": self.keep_attrs,
             "remove_forms": self.remove_forms,
             "prettiify": self.prettiify,
+            "content_fingerprint": self.content_fingerprint,
             "parser_type": self.parser_type,
             "scraping_strategy": self.scraping_strategy,
             "proxy_config": self.proxy_config,
             "proxy_rotation_strategy": self.proxy_rotation_strategy,
             "fetch_ssl_certificate": self.fetch_ssl_certificate,
             "cache_mode": self.cache_mode,
+            "cache_ttl": self.cache_ttl,
             "session_id": self.session_id,
             "bypass_cache": self.bypass_cache,
             "disable_cache": self.disable_cache,
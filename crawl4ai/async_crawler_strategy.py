@@ -4,27 +4,30 @@ import asyncio
 import base64
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List, Union
+from typing import Awaitable, Callable, Dict, Any, Iterable, List, Union
 from typing import Optional, AsyncGenerator, Final
 import os
 from playwright.async_api import Page, Error
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
-import hashlib
 import uuid
 from .js_snippet import load_js_script
-from .models import AsyncCrawlResponse
+from .models import AsyncCrawlResponse, ConnectionStats, DomainFetchStats
 from .config import SCREENSHOT_HEIGHT_TRESHOLD
 from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
 from .async_logger import AsyncLogger
 from .ssl_certificate import SSLCertificate
 from .user_agent_generator import ValidUAGenerator
-from .browser_manager import BrowserManager
+from .browser_manager import BrowserManager, ShardedBrowserManager
 
 import aiofiles
 import aiohttp
 import cchardet
+import codecs
+import fnmatch
+import re
+import httpx
 from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
 from types import MappingProxyType
@@ -102,10 +105,15 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             "before_retrieve_html": None,
         }
 
-        # Initialize browser manager with config
-        self.browser_manager = BrowserManager(
-            browser_config=self.browser_config, logger=self.logger
-        )
+        # Initialize browser manager with config, spread over several browsers if asked
+        if self.browser_config.browser_count > 1 or self.browser_config.browser_max_pages:
+            self.browser_manager = ShardedBrowserManager(
+                browser_config=self.browser_config, logger=self.logger
+            )
+        else:
+            self.browser_manager = BrowserManager(
+                browser_config=self.browser_config, logger=self.logger
+            )
 
     async def __aenter__(self):
         await self.start()
@@ -514,11 +522,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
         # Handle navigator overrides
         if config.override_navigator or config.simulate_user or config.magic:
-            await context.add_init_script(load_js_script("navigator_overrider"))
+            await self.browser_manager.add_navigator_overrides(context)
 
         # Call hook after page creation
         await self.execute_hook("on_page_context_created", page, context=context, config=config)
 
+        # Listeners added to the page, removed again when a pooled page is reused
+        listeners = []
+
+        def listen(event: str, handler: Callable) -> None:
+            page.on(event, handler)
+            listeners.append((event, handler))
+
         # Set up console logging if requested
         if config.log_console:
 
@@ -538,9 +553,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"msg": msg.text},
                     )
 
-            page.on("console", log_consol)
-            page.on("pageerror", lambda e: log_consol(e, "error"))
+            listen("console", log_consol)
+            listen("pageerror", lambda e: log_consol(e, "error"))
 
+        failed = False
         try:
             # Get SSL certificate information if requested and URL is HTTPS
             ssl_cert = None
@@ -549,7 +565,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
+                listen(
                     "download",
                     lambda download: asyncio.create_task(
                         self._handle_download(download)
@@ -561,16 +577,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await self.execute_hook("before_goto", page, context=context, url=url, config=config)
 
                 try:
-                    # Generate a unique nonce for this request
-                    nonce = hashlib.sha256(os.urandom(32)).hexdigest()
-
-                    # Add CSP headers to the request
-                    await page.set_extra_http_headers(
-                        {
-                            "Content-Security-Policy": f"default-src 'self'; script-src 'self' 'nonce-{nonce}' 'strict-dynamic'"
-                        }
-                    )
-
+                    # The page's CSP headers were set when BrowserManager opened it
                     response = await page.goto(
                         url, wait_until=config.wait_until, timeout=config.page_timeout
                     )
@@ -861,12 +868,15 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
 
         except Exception as e:
+            failed = True
             raise e
 
         finally:
-            # If no session_id is given we should close the page
+            for event, handler in listeners:
+                page.remove_listener(event, handler)
+            # If no session_id is given the page goes back to the browser manager
             if not config.session_id:
-                await page.close()
+                await self.browser_manager.release_page(page, failed=failed)
 
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
         """
@@ -1622,17 +1632,101 @@ class HTTPStatusError(HTTPCrawlerError):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class UnwantedContentError(HTTPCrawlerError):
+    """Raised when a response's content type is not one the crawler accepts"""
+    pass
+
+
+class BodyTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds the crawler's max_body_size"""
+    pass
+
+
+class _HTTPXResponse:
+    """The parts of aiohttp's ClientResponse that _handle_http reads, over an httpx response."""
+
+    __slots__ = ('_response',)
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
+
+    @property
+    def charset(self) -> Optional[str]:
+        return self._response.charset_encoding
+
+    @property
+    def url(self) -> httpx.URL:
+        return self._response.url
+
+    @property
+    def content(self) -> _HTTPXResponse:
+        return self
+
+    def iter_chunked(self, n: int) -> AsyncGenerator[bytes, None]:
+        return self._response.aiter_bytes(n)
+
+
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
+
+    Once started, either with `async with` or by the AsyncWebCrawler that runs it,
+    the strategy keeps one client and its keep-alive connection pool until it is
+    closed, so requests to a host reuse open connections and cached DNS lookups
+    across arun and arun_many calls. Requests made without starting it each get a
+    client of their own. `connection_stats` counts requests and the connections
+    they opened.
+
+    Bodies are streamed. Responses whose Content-Type does not match
+    `allowed_content_types`, or whose body grows past `max_body_size`, are dropped
+    as soon as the headers or the bytes read so far show it. A charset the server
+    does not declare is detected on the first CHARSET_SAMPLE_SIZE bytes, and the
+    body is decoded chunk by chunk as it arrives.
+
+    Args:
+        browser_config: HTTP method, headers, body and redirect/SSL settings.
+        logger: Logger for failed crawls.
+        max_connections: Open connections in the pool, across hosts.
+        dns_cache_ttl: Seconds a DNS lookup is cached for.
+        chunk_size: Bytes read at a time from local files and response bodies.
+        max_connections_per_host: Open connections per host; 0 for no limit.
+            Not supported by httpx clients.
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        http2: Send requests through an httpx client that negotiates HTTP/2
+            with servers offering it. Needs the `h2` package (httpx[http2]).
+        client_factory: Builds the client instead, either an aiohttp.ClientSession
+            or an httpx.AsyncClient.
+        max_body_size: Largest body read, in bytes after decompression; None for
+            no limit.
+        allowed_content_types: Media type patterns, such as "text/*", of the
+            responses read; None for all. Responses without a Content-Type are read.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = (
+        'logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config',
+        'max_connections_per_host', 'keepalive_timeout', 'http2', 'client_factory', 'connection_stats',
+        'max_body_size', 'allowed_content_types',
+    )
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+    DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 15.0
+    DEFAULT_MAX_BODY_SIZE: Final[int] = 32 * 1024 * 1024
+    DEFAULT_CONTENT_TYPES: Final = (
+        'text/*', 'application/xhtml+xml', 'application/xml', 'application/*+xml',
+        'application/json', 'application/*+json',
+    )
+    CHARSET_SAMPLE_SIZE: Final[int] = 64 * 1024
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
 
     _BASE_HEADERS: Final = MappingProxyType({
@@ -1650,7 +1744,13 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        http2: bool = False,
+        client_factory: Optional[Callable[[], Union[aiohttp.ClientSession, httpx.AsyncClient]]] = None,
+        max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+        allowed_content_types: Optional[Iterable[str]] = DEFAULT_CONTENT_TYPES,
     ):
         """Initialize the HTTP crawler with config"""
         self.browser_config = browser_config or HTTPCrawlerConfig()
@@ -1658,7 +1758,16 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         self.max_connections = max_connections
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.http2 = http2
+        self.client_factory = client_factory
+        self.connection_stats = ConnectionStats()
+        self.max_body_size = max_body_size
+        self.allowed_content_types = (
+            tuple(t.lower() for t in allowed_content_types) if allowed_content_types is not None else None
+        )
+        self._session: Optional[Union[aiohttp.ClientSession, httpx.AsyncClient]] = None
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -1669,7 +1778,35 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         self.set_hook('before_request', lambda *args, **kwargs: None)
         self.set_hook('after_request', lambda *args, **kwargs: None)
         self.set_hook('on_error', lambda *args, **kwargs: None)
-                      
+
+    @classmethod
+    def for_browser(
+        cls, browser_config: BrowserConfig, logger: Optional[AsyncLogger] = None
+    ) -> AsyncHTTPCrawlerStrategy:
+        """
+        An HTTP strategy sending a browser's user agent and headers, and checking
+        certificates unless the browser ignores HTTPS errors.
+        """
+        return cls(
+            browser_config=HTTPCrawlerConfig(
+                headers={**(browser_config.headers or {}), 'User-Agent': browser_config.user_agent},
+                verify_ssl=not browser_config.ignore_https_errors,
+            ),
+            logger=logger,
+        )
+
+    @staticmethod
+    def can_replace_browser(
+        browser_config: BrowserConfig, config: Optional[CrawlerRunConfig] = None
+    ) -> bool:
+        """
+        Whether requests can go out the way the browser's would. The HTTP client uses
+        neither proxies nor the browser's cookies.
+        """
+        return not (
+            browser_config.proxy or browser_config.proxy_config or browser_config.cookies
+            or (config is not None and config.proxy_config)
+        )
 
     async def __aenter__(self) -> AsyncHTTPCrawlerStrategy:
         await self.start()
@@ -1680,12 +1817,16 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
     @contextlib.asynccontextmanager
     async def _session_context(self):
-        try:
-            if not self._session:
-                await self.start()
+        # A started strategy shares its client; otherwise the request gets its own,
+        # so closing it cannot cut off other requests in flight
+        if self._session:
             yield self._session
+            return
+        client = self._create_client()
+        try:
+            yield client
         finally:
-            await self.close()
+            await self._close_client(client)
 
     def set_hook(self, hook_type: str, hook_func: Callable) -> None:
         if hook_type in self.hooks:
@@ -1704,33 +1845,96 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             return await hook_func(*args, **kwargs)
         return hook_func(*args, **kwargs)
 
+    def _create_client(self) -> Union[aiohttp.ClientSession, httpx.AsyncClient]:
+        if self.client_factory:
+            return self.client_factory()
+        if self.http2:
+            return httpx.AsyncClient(
+                http2=True,
+                verify=self.browser_config.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+                timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
+            )
+
+        async def on_connection_create_end(session, context, params):
+            self.connection_stats.connections_opened += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+            force_close=False
+        )
+        return aiohttp.ClientSession(
+            headers=dict(self._BASE_HEADERS),
+            connector=connector,
+            timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT),
+            trace_configs=[trace_config],
+        )
+
+    async def _close_client(self, client: Union[aiohttp.ClientSession, httpx.AsyncClient]) -> None:
+        try:
+            if isinstance(client, httpx.AsyncClient):
+                await asyncio.wait_for(client.aclose(), timeout=5.0)
+            elif not client.closed:
+                await asyncio.wait_for(client.close(), timeout=5.0)
+        except asyncio.TimeoutError:
+            if self.logger:
+                self.logger.warning(
+                    message="Session cleanup timed out",
+                    tag="CLEANUP"
+                )
+
     async def start(self) -> None:
         if not self._session:
-            connector = aiohttp.TCPConnector(
-                limit=self.max_connections,
-                ttl_dns_cache=self.dns_cache_ttl,
-                use_dns_cache=True,
-                force_close=False
-            )
-            self._session = aiohttp.ClientSession(
-                headers=dict(self._BASE_HEADERS),
-                connector=connector,
-                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT)
-            )
+            self._session = self._create_client()
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
+        if self._session:
             try:
-                await asyncio.wait_for(self._session.close(), timeout=5.0)
-            except asyncio.TimeoutError:
-                if self.logger:
-                    self.logger.warning(
-                        message="Session cleanup timed out",
-                        tag="CLEANUP"
-                    )
+                await self._close_client(self._session)
             finally:
                 self._session = None
 
+    @contextlib.asynccontextmanager
+    async def _send(
+        self,
+        client: Union[aiohttp.ClientSession, httpx.AsyncClient],
+        url: str,
+        request_kwargs: Dict[str, Any],
+        method: Optional[str] = None
+    ):
+        """Send a request through either kind of client, yielding an aiohttp-like response."""
+        self.connection_stats.requests += 1
+        method = method or self.browser_config.method
+        if not isinstance(client, httpx.AsyncClient):
+            async with client.request(method, url, **request_kwargs) as response:
+                yield response
+            return
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self.connection_stats.connections_opened += 1
+
+        kwargs = dict(request_kwargs)
+        timeout = kwargs.pop('timeout')
+        kwargs.pop('ssl', None)
+        kwargs['timeout'] = httpx.Timeout(timeout.total, connect=timeout.connect, read=timeout.sock_read)
+        kwargs['follow_redirects'] = kwargs.pop('allow_redirects')
+        # Connection-specific headers are not allowed over HTTP/2
+        kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k.lower() != 'connection'}
+        kwargs['extensions'] = {'trace': trace}
+        async with client.stream(method, url, **kwargs) as response:
+            yield _HTTPXResponse(response)
+
     async def _stream_file(self, path: str) -> AsyncGenerator[memoryview, None]:
         async with aiofiles.open(path, mode='rb') as f:
             while chunk := await f.read(self.chunk_size):
@@ -1761,8 +1965,11 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     async def _handle_http(
         self, 
         url: str, 
-        config: CrawlerRunConfig
+        config: CrawlerRunConfig,
+        conditional_headers: Optional[Dict[str, str]] = None,
+        method: Optional[str] = None
     ) -> AsyncCrawlResponse:
+        method = method or self.browser_config.method
         async with self._session_context() as session:
             timeout = ClientTimeout(
                 total=config.page_timeout or self.DEFAULT_TIMEOUT,
@@ -1773,6 +1980,10 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             headers = dict(self._BASE_HEADERS)
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
+            if config.user_agent:
+                headers['User-Agent'] = config.user_agent
+            if conditional_headers:
+                headers.update(conditional_headers)
 
             request_kwargs = {
                 'timeout': timeout,
@@ -1781,7 +1992,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 'headers': headers
             }
 
-            if self.browser_config.method == "POST":
+            if method == "POST":
                 if self.browser_config.data:
                     request_kwargs['data'] = self.browser_config.data
                 if self.browser_config.json:
@@ -1790,21 +2001,16 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             await self.hooks['before_request'](url, request_kwargs)
 
             try:
-                async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
-                    
-                    if not (200 <= response.status < 300):
+                async with self._send(session, url, request_kwargs, method) as response:
+                    not_modified = response.status == 304 and bool(conditional_headers)
+                    if not (200 <= response.status < 300) and not not_modified:
                         raise HTTPStatusError(
                             response.status,
                             f"Unexpected status code for {url}"
                         )
                     
-                    encoding = response.charset
-                    if not encoding:
-                        encoding = cchardet.detect(content.tobytes())['encoding'] or 'utf-8'                    
-                    
                     result = AsyncCrawlResponse(
-                        html=content.tobytes().decode(encoding, errors='replace'),
+                        html='' if method == "HEAD" else await self._read_text(response, url),
                         response_headers=dict(response.headers),
                         status_code=response.status,
                         redirected_url=str(response.url)
@@ -1813,15 +2019,19 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     await self.hooks['after_request'](result)
                     return result
 
-            except aiohttp.ServerTimeoutError as e:
+            except HTTPCrawlerError as e:
+                await self.hooks['on_error'](e)
+                raise
+
+            except (aiohttp.ServerTimeoutError, httpx.TimeoutException) as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
                 
-            except aiohttp.ClientConnectorError as e:
+            except (aiohttp.ClientConnectorError, httpx.ConnectError) as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionError(f"Connection failed: {str(e)}")
                 
-            except aiohttp.ClientError as e:
+            except (aiohttp.ClientError, httpx.HTTPError) as e:
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP client error: {str(e)}")
             
@@ -1833,6 +2043,87 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
 
+    def _check_headers(self, response, url: str) -> None:
+        media_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if media_type and self.allowed_content_types is not None and not any(
+            fnmatch.fnmatchcase(media_type, pattern) for pattern in self.allowed_content_types
+        ):
+            raise UnwantedContentError(f"Unwanted content type {media_type} for {url}")
+
+        length = response.headers.get('Content-Length', '')
+        if self.max_body_size is not None and length.isdigit() and int(length) > self.max_body_size:
+            raise BodyTooLargeError(
+                f"Body of {url} is {length} bytes, over the {self.max_body_size} byte limit"
+            )
+
+    @staticmethod
+    def _decoder(encoding: Optional[str], sample: bytes) -> codecs.IncrementalDecoder:
+        encoding = encoding or cchardet.detect(sample)['encoding'] or 'utf-8'
+        try:
+            return codecs.getincrementaldecoder(encoding)(errors='replace')
+        except LookupError:
+            return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    async def _read_text(self, response, url: str) -> str:
+        """Stream the body of a response and decode it as it arrives."""
+        self._check_headers(response, url)
+
+        decoder = self._decoder(response.charset, b'') if response.charset else None
+        # Chunks held back until there are enough bytes to detect the charset on
+        sample: List[bytes] = []
+        sampled = 0
+        size = 0
+        text: List[str] = []
+        async for chunk in response.content.iter_chunked(self.chunk_size):
+            size += len(chunk)
+            if self.max_body_size is not None and size > self.max_body_size:
+                raise BodyTooLargeError(
+                    f"Body of {url} is over the {self.max_body_size} byte limit"
+                )
+            if decoder is None:
+                sample.append(chunk)
+                sampled += len(chunk)
+                if sampled < self.CHARSET_SAMPLE_SIZE:
+                    continue
+                chunk = b''.join(sample)
+                sample = []
+                decoder = self._decoder(None, chunk)
+            text.append(decoder.decode(chunk))
+
+        if decoder is None:
+            chunk = b''.join(sample)
+            decoder = self._decoder(None, chunk)
+            text.append(decoder.decode(chunk))
+        text.append(decoder.decode(b'', final=True))
+        return ''.join(text)
+
+    async def revalidate(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        config: Optional[CrawlerRunConfig] = None,
+        head: bool = False
+    ) -> AsyncCrawlResponse:
+        """
+        Conditional GET for a cached page.
+
+        Sends If-None-Match / If-Modified-Since built from the cached validators. A
+        response with status_code 304 means the cached copy is still current (its html
+        is empty); any other response is the fresh page. With `head=True` a conditional
+        HEAD is sent instead, for callers that fetch a changed page some other way: its
+        response only tells whether the page changed, and its html is always empty.
+        """
+        config = config or CrawlerRunConfig()
+        conditional_headers = {}
+        if etag:
+            conditional_headers['If-None-Match'] = etag
+        if last_modified:
+            conditional_headers['If-Modified-Since'] = last_modified
+        return await self._handle_http(
+            url, config, conditional_headers, method="HEAD" if head else None
+        )
+
     async def crawl(
         self, 
         url: str, 
@@ -1862,4 +2153,238 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     tag="CRAWL",
                     params={"error": str(e), "url": url}
                 )
-            raise
\ No newline at end of file
+            raise
+
+####################################################################################################
+# Hybrid Crawler Strategy
+####################################################################################################
+
+class AsyncHybridCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Fetches pages with AsyncHTTPCrawlerStrategy and falls back to a browser, an
+    AsyncPlaywrightCrawlerStrategy by default, for the ones that need it.
+
+    A page goes to the browser directly when its config asks for something only a
+    browser can do (js_code, wait_for, screenshots, sessions, ...) or its domain has
+    been marked browser-only. Otherwise it is fetched over HTTP and escalated when
+    the response looks rendered by JavaScript: less than `min_text_length`
+    characters of visible text, or one of `spa_markers`, such as an empty root
+    element. Pages the HTTP fetch fails for, by status code, connection or SSL
+    error or unwanted content, are escalated too.
+
+    The HTTP client cannot use proxies or the browser's cookies, so with a proxy in
+    the BrowserConfig or CrawlerRunConfig, or cookies in the BrowserConfig, pages go
+    to the browser directly. `ignore_https_errors` carries over to the HTTP client.
+
+    Once `min_samples` pages of a domain have been tried over HTTP, a domain whose
+    escalation_rate reaches `escalation_threshold` is marked browser-only, so its
+    pages stop costing an HTTP request first. `domain_stats` holds the counts per
+    domain. The browser is only launched for the first page that needs it.
+
+    Args:
+        browser_config: Browser settings of the default browser strategy.
+        logger: Logger for escalations and failed crawls.
+        http_strategy: Fetches pages over HTTP. Defaults to an
+            AsyncHTTPCrawlerStrategy sending the browser's user agent and headers.
+        browser_strategy: Fetches the pages escalated to a browser.
+        min_text_length: Visible characters below which a page is escalated.
+        spa_markers: Regular expressions for the HTML of pages rendered client-side.
+        min_samples: Pages of a domain tried over HTTP before it can be marked
+            browser-only.
+        escalation_threshold: Escalation rate marking a domain browser-only;
+            None to never mark one.
+    """
+
+    DEFAULT_SPA_MARKERS: Final = (
+        # An empty mount point of React, Vue, Angular, Next.js or Nuxt apps
+        r'<(?:div|main)[^>]*\bid=["\']?(?:root|app|__next|__nuxt|svelte)["\']?[^>]*>\s*</(?:div|main)>',
+        r'<app-root[^>]*>\s*</app-root>',
+        r'<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript',
+    )
+
+    _INVISIBLE = re.compile(r'<(script|style|noscript|template|svg)\b.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+    _TAG = re.compile(r'<[^>]*>')
+    _SPACE = re.compile(r'\s+')
+
+    def __init__(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        logger: Optional[AsyncLogger] = None,
+        http_strategy: Optional[AsyncCrawlerStrategy] = None,
+        browser_strategy: Optional[AsyncCrawlerStrategy] = None,
+        min_text_length: int = 200,
+        spa_markers: Iterable[str] = DEFAULT_SPA_MARKERS,
+        min_samples: int = 3,
+        escalation_threshold: Optional[float] = 0.5,
+    ):
+        self.browser_config = browser_config or BrowserConfig()
+        self.logger = logger
+        self.http_strategy = http_strategy or AsyncHTTPCrawlerStrategy.for_browser(
+            self.browser_config, logger=logger
+        )
+        # Settings the HTTP client cannot apply send every page to the browser
+        self.browser_only = not AsyncHTTPCrawlerStrategy.can_replace_browser(self.browser_config)
+        self.browser_strategy = browser_strategy or AsyncPlaywrightCrawlerStrategy(
+            browser_config=self.browser_config, logger=logger
+        )
+        self.min_text_length = min_text_length
+        self.spa_markers = [re.compile(marker, re.I) for marker in spa_markers]
+        self.min_samples = min_samples
+        self.escalation_threshold = escalation_threshold
+        self.domain_stats: Dict[str, DomainFetchStats] = {}
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> AsyncHybridCrawlerStrategy:
+        await self.http_strategy.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.http_strategy.__aexit__(exc_type, exc_val, exc_tb)
+        if self._browser_started:
+            self._browser_started = False
+            await self.browser_strategy.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _browser(self) -> AsyncCrawlerStrategy:
+        if not self._browser_started:
+            async with self._browser_lock:
+                if not self._browser_started:
+                    await self.browser_strategy.__aenter__()
+                    self._browser_started = True
+        return self.browser_strategy
+
+    def set_hook(self, hook_type: str, hook: Callable) -> None:
+        """Set a hook of the browser strategy."""
+        self.browser_strategy.set_hook(hook_type, hook)
+
+    def update_user_agent(self, user_agent: str) -> None:
+        self.browser_strategy.update_user_agent(user_agent)
+
+    async def kill_session(self, session_id: str) -> None:
+        if self._browser_started:
+            await self.browser_strategy.kill_session(session_id)
+
+    async def revalidate(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        config: Optional[CrawlerRunConfig] = None,
+        head: bool = False
+    ) -> AsyncCrawlResponse:
+        """
+        Conditional request for a cached page, routed the way crawl() routes the page.
+
+        Pages crawl() would fetch over HTTP get a conditional GET, and a changed page
+        is escalated to the browser when its answer would be. Pages that go to the
+        browser are checked with a conditional HEAD and fetched by the browser when
+        they changed; with a proxy or cookies, which the HTTP client cannot use, the
+        browser fetches them without a request being sent first.
+        """
+        config = config or CrawlerRunConfig()
+        stats = self._stats(url)
+        if self.browser_only or stats.browser_only or self.needs_browser(config):
+            if AsyncHTTPCrawlerStrategy.can_replace_browser(self.browser_config, config):
+                response = await self.http_strategy.revalidate(
+                    url, etag, last_modified, config, head=True
+                )
+                if response.status_code == 304:
+                    return response
+            stats.browser_pages += 1
+            return await (await self._browser()).crawl(url, config=config)
+
+        if head:
+            return await self.http_strategy.revalidate(url, etag, last_modified, config, head=True)
+
+        return await self._fetch(
+            url,
+            config,
+            stats,
+            lambda: self.http_strategy.revalidate(url, etag, last_modified, config),
+        )
+
+    @staticmethod
+    def needs_browser(config: CrawlerRunConfig) -> bool:
+        """Whether the config asks for something only a browser can do."""
+        return bool(
+            config.js_code or config.wait_for or config.session_id or config.js_only
+            or config.screenshot or config.pdf or config.scan_full_page
+            or config.process_iframes or config.remove_overlay_elements
+            or config.simulate_user or config.override_navigator or config.magic
+            or config.proxy_config
+        )
+
+    def escalation_reason(self, response: AsyncCrawlResponse) -> Optional[str]:
+        """Why a page fetched over HTTP needs the browser, or None if it does not."""
+        html = response.html or ''
+        for marker in self.spa_markers:
+            if marker.search(html):
+                return f"matches {marker.pattern!r}"
+        text = self._SPACE.sub(' ', self._TAG.sub(' ', self._INVISIBLE.sub(' ', html))).strip()
+        if len(text) < self.min_text_length:
+            return f"{len(text)} characters of text"
+        return None
+
+    def _stats(self, url: str) -> DomainFetchStats:
+        domain = urlparse(url).netloc.lower()
+        stats = self.domain_stats.get(domain)
+        if stats is None:
+            stats = self.domain_stats[domain] = DomainFetchStats()
+        return stats
+
+    def _record_escalation(self, url: str, stats: DomainFetchStats, reason: str) -> None:
+        stats.escalated_pages += 1
+        if (
+            self.escalation_threshold is not None
+            and stats.http_pages + stats.escalated_pages >= self.min_samples
+            and stats.escalation_rate >= self.escalation_threshold
+        ):
+            stats.browser_only = True
+        if self.logger:
+            self.logger.info(
+                message="Escalating {url} to the browser: {reason}",
+                tag="HYBRID",
+                params={"url": url, "reason": reason},
+            )
+
+    async def crawl(
+        self,
+        url: str,
+        config: Optional[CrawlerRunConfig] = None,
+        **kwargs
+    ) -> AsyncCrawlResponse:
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+        stats = self._stats(url)
+        if self.browser_only or stats.browser_only or self.needs_browser(config):
+            stats.browser_pages += 1
+            return await (await self._browser()).crawl(url, config=config)
+
+        return await self._fetch(
+            url, config, stats, lambda: self.http_strategy.crawl(url, config=config)
+        )
+
+    async def _fetch(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        stats: DomainFetchStats,
+        fetch: Callable[[], Awaitable[AsyncCrawlResponse]],
+    ) -> AsyncCrawlResponse:
+        """Fetch over HTTP, escalating to the browser when the answer calls for it."""
+        try:
+            response = await fetch()
+        except HTTPStatusError as e:
+            reason = f"HTTP {e.status_code}"
+        except (HTTPCrawlerError, ConnectionError) as e:
+            reason = f"{type(e).__name__}: {e}"
+        else:
+            # The cached page is still current
+            if response.status_code == 304:
+                return response
+            reason = self.escalation_reason(response)
+            if reason is None:
+                stats.http_pages += 1
+                return response
+
+        self._record_escalation(url, stats, reason)
+        return await (await self._browser()).crawl(url, config=config)
@@ -2,14 +2,18 @@ import os
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+import copy
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple, Any, Callable
 from contextlib import asynccontextmanager
 import json  # Added for serialization/deserialization
-from .utils import ensure_content_dirs, generate_content_hash
+from pydantic import PrivateAttr
+from .blob_store import BlobStore, ShardedBlobStore, PackfileBlobStore
 from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
 # , StringCompatibleMarkdown
-import aiofiles
-from .utils import VersionManager
+from .utils import VersionManager, generate_content_hash
 from .async_logger import AsyncLogger
 from .utils import get_error_context, create_box_message
 
@@ -24,11 +28,381 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Column order of crawled_data rows as written by acache_url
+CACHE_COLUMNS = (
+    "url",
+    "html",
+    "cleaned_html",
+    "markdown",
+    "extracted_content",
+    "success",
+    "media",
+    "links",
+    "metadata",
+    "screenshot",
+    "response_headers",
+    "downloaded_files",
+    "fetched_at",
+    "accessed_at",
+    "size",
+    "etag",
+    "last_modified",
+)
+
+
+@dataclass
+class CacheEntryInfo:
+    """
+    Bookkeeping stored with each cached URL.
+
+    Attributes:
+        fetched_at (float): Epoch seconds when the page was fetched or last revalidated.
+        accessed_at (float): Epoch seconds of the last cache read.
+        size (int): Bytes of content stored for the entry.
+        etag (str): ETag response header, used for revalidation.
+        last_modified (str): Last-Modified response header, used for revalidation.
+    """
+
+    fetched_at: float = 0.0
+    accessed_at: float = 0.0
+    size: int = 0
+    etag: str = ""
+    last_modified: str = ""
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def is_stale(self, ttl: Optional[float], now: Optional[float] = None) -> bool:
+        """Whether the entry is older than `ttl` seconds. A ttl of None never expires."""
+        if ttl is None:
+            return False
+        return (now or time.time()) - (self.fetched_at or 0) > ttl
+
+
+def get_header(headers: Optional[Dict[str, Any]], name: str) -> str:
+    """Case-insensitive response header lookup"""
+    if not headers:
+        return ""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value or ""
+    return ""
+
+
+def default_blob_store() -> BlobStore:
+    """Blob store for the cache directory, chosen by CRAWL4_AI_BLOB_STORE (sharded or packfile)"""
+    mode = os.getenv("CRAWL4_AI_BLOB_STORE", "sharded")
+    if mode == "packfile":
+        return PackfileBlobStore(base_directory)
+    if mode != "sharded":
+        raise ValueError(f"Unknown CRAWL4_AI_BLOB_STORE mode: {mode!r}")
+    return ShardedBlobStore(base_directory)
+
+
+class CachedCrawlResult(CrawlResult):
+    """
+    CrawlResult backed by a crawled_data row.
+
+    Content blobs (html, cleaned_html, markdown, extracted_content, screenshot) are read
+    from their hash files, and JSON columns are decoded, the first time the attribute is
+    used. A cache hit therefore costs one row lookup plus the blobs the caller touches.
+    Serialization (`model_dump`, `model_dump_json`, pickling) loads every field first.
+
+    Attribute access reads files synchronously. Async code should `await result.aload()`
+    (or `aload(*fields)`) first, which reads them off the event loop.
+    """
+
+    _loaders: Dict[str, Callable[[], Any]] = PrivateAttr(default_factory=dict)
+    _cache_info: CacheEntryInfo = PrivateAttr(default_factory=CacheEntryInfo)
+
+    @classmethod
+    def from_row(
+        cls, row: Dict[str, Any], load_content: Callable[[str, str], Optional[str]]
+    ) -> "CachedCrawlResult":
+        """
+        Build a lazy result from a crawled_data row.
+
+        Args:
+            row (Dict[str, Any]): Column name to stored value.
+            load_content (Callable[[str, str], Optional[str]]): Reads a content file
+                given its hash and content type.
+        """
+
+        def blob(column, content_type):
+            def load():
+                if not row.get(column):
+                    return ""
+                return load_content(row[column], content_type) or ""
+
+            return load
+
+        def json_column(column, default):
+            def load():
+                try:
+                    value = json.loads(row[column]) if row.get(column) else None
+                except json.JSONDecodeError:
+                    value = None
+                return default() if value is None else value
+
+            return load
+
+        def markdown():
+            content = blob("markdown", "markdown")()
+            try:
+                value = json.loads(content) if content else {}
+            except json.JSONDecodeError:
+                value = content
+            if isinstance(value, dict):
+                value = {
+                    "raw_markdown": "",
+                    "markdown_with_citations": "",
+                    "references_markdown": "",
+                    **value,
+                }
+                return MarkdownGenerationResult(**value)
+            return MarkdownGenerationResult(
+                raw_markdown=value if isinstance(value, str) else str(value),
+                markdown_with_citations="",
+                references_markdown="",
+                fit_markdown="",
+                fit_html="",
+            )
+
+        result = cls.model_construct(url=row["url"], success=bool(row.get("success")))
+        loaders = {
+            "html": blob("html", "html"),
+            "cleaned_html": blob("cleaned_html", "cleaned"),
+            "extracted_content": blob("extracted_content", "extracted"),
+            "screenshot": blob("screenshot", "screenshots"),
+            "media": json_column("media", dict),
+            "links": json_column("links", dict),
+            "metadata": json_column("metadata", dict),
+            "response_headers": json_column("response_headers", dict),
+            "downloaded_files": json_column("downloaded_files", list),
+        }
+        for name in loaders:
+            result.__dict__.pop(name, None)
+        loaders["markdown"] = markdown
+        result._loaders = loaders
+        result._cache_info = CacheEntryInfo(
+            fetched_at=row.get("fetched_at") or 0.0,
+            accessed_at=row.get("accessed_at") or 0.0,
+            size=row.get("size") or 0,
+            etag=row.get("etag") or "",
+            last_modified=row.get("last_modified") or "",
+        )
+        return result
+
+    @property
+    def cache_info(self) -> CacheEntryInfo:
+        """Fetch time, access time, size and validators of the cache entry."""
+        return self._cache_info
+
+    def __getattr__(self, name: str):
+        private = self.__pydantic_private__
+        loader = private["_loaders"].pop(name, None) if private else None
+        if loader is None:
+            return super().__getattr__(name)
+        value = self.__dict__[name] = loader()
+        return value
+
+    @property
+    def markdown(self):
+        loader = self._loaders.pop("markdown", None)
+        if loader is not None:
+            self._markdown = loader()
+        return CrawlResult.markdown.fget(self)
+
+    @markdown.setter
+    def markdown(self, value):
+        self._loaders.pop("markdown", None)
+        self._markdown = value
+
+    def fork(self) -> "CachedCrawlResult":
+        """
+        Return a copy that can be modified independently. Fields not read yet are loaded
+        through this result, which keeps them, so each blob is read at most once no matter
+        how many forks use it.
+        """
+        clone = self.model_copy(deep=True)
+        clone._loaders = {name: self._forwarder(name) for name in self._loaders}
+        return clone
+
+    def _forwarder(self, name: str) -> Callable[[], Any]:
+        def load():
+            if name == "markdown":
+                self.markdown
+                return copy.deepcopy(self._markdown)
+            return copy.deepcopy(getattr(self, name))
+
+        return load
+
+    def load(self) -> "CachedCrawlResult":
+        """Load every field that has not been read yet."""
+        self.markdown
+        for name in list(self._loaders):
+            getattr(self, name)
+        # Fields assigned before they were read keep their loader; drop those too
+        self._loaders.clear()
+        return self
+
+    async def aload(self, *names: str) -> "CachedCrawlResult":
+        """
+        Load fields that have not been read yet in a worker thread, so the event loop
+        does not block on their files.
+
+        Args:
+            *names (str): Fields to load; every field when none are given.
+        """
+        if not names:
+            if self._loaders:
+                await asyncio.to_thread(self.load)
+            return self
+        pending = [name for name in names if name in self._loaders]
+        if pending:
+            await asyncio.to_thread(lambda: [getattr(self, name) for name in pending])
+        return self
+
+    def model_dump(self, *args, **kwargs):
+        return super(CachedCrawlResult, self.load()).model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args, **kwargs):
+        return super(CachedCrawlResult, self.load()).model_dump_json(*args, **kwargs)
+
+    def __getstate__(self):
+        return super(CachedCrawlResult, self.load()).__getstate__()
+
+
+class ResultCache:
+    """
+    In-memory LRU of recently read cache entries, bounded by bytes rather than entries.
+
+    Entries are CachedCrawlResult objects keyed by URL; the database keeps one row per
+    URL, so no run configuration changes what a lookup returns. Callers get forks, so
+    changes they make never reach the cached copy. Each entry is charged the stored size
+    of its row, i.e. what it holds once every field has been read.
+
+    Attributes:
+        max_bytes (int): Memory budget.
+        hits (int): Lookups answered from memory.
+        misses (int): Lookups that went to the database.
+        evictions (int): Entries dropped to stay within `max_bytes`.
+    """
+
+    # Rows cached before sizes were recorded report 0 bytes
+    UNKNOWN_SIZE = 256 * 1024
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[CachedCrawlResult, int]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url: str):
+        return url in self._entries
+
+    def get(self, url: str) -> Optional[CachedCrawlResult]:
+        entry = self._entries.get(url)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(url)
+        self.hits += 1
+        return entry[0].fork()
+
+    def put(self, url: str, result: CachedCrawlResult, size: int):
+        self.invalidate(url)
+        size = size or self.UNKNOWN_SIZE
+        if size > self.max_bytes:
+            return
+        self._entries[url] = (result, size)
+        self.current_bytes += size
+        self.resize(self.max_bytes)
+
+    def invalidate(self, url: str):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def resize(self, max_bytes: int):
+        """Change the budget, evicting least recently used entries as needed."""
+        self.max_bytes = max_bytes
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counters and occupancy, e.g. for logging."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
 
 class AsyncDatabaseManager:
-    def __init__(self, pool_size: int = 10, max_retries: int = 3):
+    """
+    Manages the crawl4ai cache database.
+
+    Writes made through `acache_url` are buffered and committed in batches: the pending
+    rows are written with a single `executemany` transaction once `write_batch_size`
+    rows are waiting, or `write_flush_interval` seconds after the first pending row,
+    whichever comes first. Pending rows are visible to `aget_cached_url` before they
+    are flushed. Call `aflush_writes()` (done by `AsyncWebCrawler.close()`) to commit
+    everything that is still buffered.
+
+    Every entry records when it was fetched and last read, how many bytes of content it
+    holds and its ETag/Last-Modified validators. `aevict()` uses them to drop entries
+    older than `max_entry_age` that cannot be revalidated, then the least recently used
+    entries until the cache fits in `max_cache_bytes`. It runs after a flush at most
+    once every `evict_interval` seconds when either limit is set.
+
+    With `enable_result_cache()`, recently read entries are also kept in an in-memory
+    ResultCache in front of the database.
+
+    Args:
+        pool_size (int): Maximum number of concurrent connections.
+        max_retries (int): Attempts per database operation before giving up.
+        write_batch_size (int): Number of pending rows that triggers a flush.
+            A value of 1 or less writes every row immediately.
+        write_flush_interval (float): Maximum seconds a row stays buffered.
+        blob_store (Optional[BlobStore]): Where content blobs live. Defaults to
+            `default_blob_store()`.
+        max_cache_bytes (Optional[int]): Content size budget, None for unbounded.
+        max_entry_age (Optional[float]): Seconds after which entries without
+            validators are evicted, None to keep them.
+        evict_interval (float): Minimum seconds between automatic evictions.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        write_batch_size: int = 100,
+        write_flush_interval: float = 1.0,
+        blob_store: Optional[BlobStore] = None,
+        max_cache_bytes: Optional[int] = None,
+        max_entry_age: Optional[float] = None,
+        evict_interval: float = 60.0,
+    ):
         self.db_path = DB_PATH
-        self.content_paths = ensure_content_dirs(os.path.dirname(DB_PATH))
+        self.blob_store = blob_store or default_blob_store()
+        self.content_paths = self.blob_store.content_paths
         self.pool_size = pool_size
         self.max_retries = max_retries
         self.connection_pool: Dict[int, aiosqlite.Connection] = {}
@@ -37,6 +411,19 @@ class AsyncDatabaseManager:
         self.connection_semaphore = asyncio.Semaphore(pool_size)
         self._initialized = False
         self.version_manager = VersionManager()
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        self._pending_writes: Dict[str, Tuple[Any, ...]] = {}
+        self._pending_access: Dict[str, float] = {}
+        self.max_cache_bytes = max_cache_bytes
+        self.max_entry_age = max_entry_age
+        self.evict_interval = evict_interval
+        self._last_evict = 0.0
+        self._storing: Counter = Counter()
+        self._blob_deletion: Optional[asyncio.Future] = None
+        self.result_cache: Optional[ResultCache] = None
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
         self.logger = AsyncLogger(
             log_file=os.path.join(base_directory, ".crawl4ai", "crawler_db.log"),
             verbose=False,
@@ -65,10 +452,12 @@ class AsyncDatabaseManager:
                     if not result:
                         raise Exception("crawled_data table was not created")
 
+            # Columns can be added without a version bump, so always check them
+            await self.update_db_schema()
+
             # If version changed or fresh install, run updates
             if needs_update:
                 self.logger.info("New version detected, running updates", tag="INIT")
-                await self.update_db_schema()
                 from .migrations import (
                     run_migration,
                 )  # Import here to avoid circular imports
@@ -97,6 +486,10 @@ class AsyncDatabaseManager:
 
     async def cleanup(self):
         """Cleanup connections when shutting down"""
+        await self.aflush_writes()
+        await asyncio.to_thread(self.blob_store.flush)
+        if self.result_cache is not None:
+            self.result_cache.clear()
         async with self.pool_lock:
             for conn in self.connection_pool.values():
                 await conn.close()
@@ -240,10 +633,18 @@ class AsyncDatabaseManager:
                     metadata TEXT DEFAULT "{}",
                     screenshot TEXT DEFAULT "",
                     response_headers TEXT DEFAULT "{}",
-                    downloaded_files TEXT DEFAULT "{}"  -- New column added
+                    downloaded_files TEXT DEFAULT "{}",  -- New column added
+                    fetched_at REAL,
+                    accessed_at REAL,
+                    size INTEGER DEFAULT 0,
+                    etag TEXT DEFAULT "",
+                    last_modified TEXT DEFAULT ""
                 )
             """
             )
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawled_data_accessed_at ON crawled_data (accessed_at)"
+            )
             await db.commit()
 
     async def update_db_schema(self):
@@ -261,11 +662,25 @@ class AsyncDatabaseManager:
                 "screenshot",
                 "response_headers",
                 "downloaded_files",
+                "fetched_at",
+                "accessed_at",
+                "size",
+                "etag",
+                "last_modified",
             ]
 
             for column in new_columns:
                 if column not in column_names:
                     await self.aalter_db_add_column(column, db)
+            if "fetched_at" not in column_names:
+                # Age of existing entries is unknown; count it from the upgrade
+                now = time.time()
+                await db.execute(
+                    "UPDATE crawled_data SET fetched_at = ?, accessed_at = ?", (now, now)
+                )
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawled_data_accessed_at ON crawled_data (accessed_at)"
+            )
             await db.commit()
 
     async def aalter_db_add_column(self, new_column: str, db):
@@ -274,6 +689,12 @@ class AsyncDatabaseManager:
             await db.execute(
                 f'ALTER TABLE crawled_data ADD COLUMN {new_column} TEXT DEFAULT "{{}}"'
             )
+        elif new_column in ("fetched_at", "accessed_at"):
+            await db.execute(f"ALTER TABLE crawled_data ADD COLUMN {new_column} REAL")
+        elif new_column == "size":
+            await db.execute(
+                f"ALTER TABLE crawled_data ADD COLUMN {new_column} INTEGER DEFAULT 0"
+            )
         else:
             await db.execute(
                 f'ALTER TABLE crawled_data ADD COLUMN {new_column} TEXT DEFAULT ""'
@@ -284,8 +705,49 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
+    def enable_result_cache(self, max_bytes: int) -> ResultCache:
+        """
+        Keep recently read entries in memory, up to `max_bytes`. Calling it again
+        resizes the existing cache; a budget of 0 or less disables it.
+        """
+        if max_bytes <= 0:
+            self.result_cache = None
+        elif self.result_cache is None:
+            self.result_cache = ResultCache(max_bytes)
+        else:
+            self.result_cache.resize(max_bytes)
+        return self.result_cache
+
+    def _remember(self, url: str, row: Dict[str, Any]) -> CachedCrawlResult:
+        """Build the result for a row, keeping it in the result cache if enabled"""
+        result = CachedCrawlResult.from_row(row, self._load_content_sync)
+        if self.result_cache is None:
+            return result
+        size = (row.get("size") or 0) + sum(
+            len(row.get(column) or "")
+            for column in ("media", "links", "metadata", "response_headers", "downloaded_files")
+        )
+        self.result_cache.put(url, result, size if row.get("size") else 0)
+        return result.fork()
+
     async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
-        """Retrieve cached URL data as CrawlResult"""
+        """
+        Retrieve cached URL data as CrawlResult.
+
+        The returned CachedCrawlResult reads content files on first attribute access;
+        `await result.aload()` reads them without blocking the event loop.
+        """
+        if self.result_cache is not None:
+            result = self.result_cache.get(url)
+            if result is not None:
+                self._pending_access[url] = time.time()
+                self._schedule_flush()
+                return result
+
+        pending = self._pending_writes.get(url)
+        if pending is not None:
+            # The pending row already carries the access time of its write
+            return self._remember(url, dict(zip(CACHE_COLUMNS, pending)))
 
         async def _get(db):
             async with db.execute(
@@ -298,76 +760,16 @@ class AsyncDatabaseManager:
                 # Get column names
                 columns = [description[0] for description in cursor.description]
                 # Create dict from row data
-                row_dict = dict(zip(columns, row))
-
-                # Load content from files using stored hashes
-                content_fields = {
-                    "html": row_dict["html"],
-                    "cleaned_html": row_dict["cleaned_html"],
-                    "markdown": row_dict["markdown"],
-                    "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
-                }
-
-                for field, hash_value in content_fields.items():
-                    if hash_value:
-                        content = await self._load_content(
-                            hash_value,
-                            field.split("_")[0],  # Get content type from field name
-                        )
-                        row_dict[field] = content or ""
-                    else:
-                        row_dict[field] = ""
-
-                # Parse JSON fields
-                json_fields = [
-                    "media",
-                    "links",
-                    "metadata",
-                    "response_headers",
-                    "markdown",
-                ]
-                for field in json_fields:
-                    try:
-                        row_dict[field] = (
-                            json.loads(row_dict[field]) if row_dict[field] else {}
-                        )
-                    except json.JSONDecodeError:
-                        # Very UGLY, never mention it to me please
-                        if field == "markdown" and isinstance(row_dict[field], str):
-                            row_dict[field] = MarkdownGenerationResult(
-                                raw_markdown=row_dict[field] or "",
-                                markdown_with_citations="",
-                                references_markdown="",
-                                fit_markdown="",
-                                fit_html="",
-                            )
-                        else:
-                            row_dict[field] = {}
-
-                if isinstance(row_dict["markdown"], Dict):
-                    if row_dict["markdown"].get("raw_markdown"):
-                        row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
-
-                # Parse downloaded_files
-                try:
-                    row_dict["downloaded_files"] = (
-                        json.loads(row_dict["downloaded_files"])
-                        if row_dict["downloaded_files"]
-                        else []
-                    )
-                except json.JSONDecodeError:
-                    row_dict["downloaded_files"] = []
-
-                # Remove any fields not in CrawlResult model
-                valid_fields = CrawlResult.__annotations__.keys()
-                filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
-                filtered_dict["markdown"] = row_dict["markdown"]
-                return CrawlResult(**filtered_dict)
+                return dict(zip(columns, row))
 
         try:
-            return await self.execute_with_retry(_get)
+            row_dict = await self.execute_with_retry(_get)
+            if row_dict is None:
+                return None
+            # Access times are written with the next flush rather than per read
+            self._pending_access[url] = time.time()
+            self._schedule_flush()
+            return self._remember(url, row_dict)
         except Exception as e:
             self.logger.error(
                 message="Error retrieving cached URL: {error}",
@@ -378,7 +780,12 @@ class AsyncDatabaseManager:
             return None
 
     async def acache_url(self, result: CrawlResult):
-        """Cache CrawlResult data"""
+        """
+        Cache CrawlResult data.
+
+        Content files are written right away; the database row is buffered and
+        committed with other pending rows (see `aflush_writes`).
+        """
         # Store content files and get hashes
         content_map = {
             "html": (result.html, "html"),
@@ -420,60 +827,332 @@ class AsyncDatabaseManager:
                 "markdown",
             )
 
-        content_hashes = {}
-        for field, (content, content_type) in content_map.items():
-            content_hashes[field] = await self._store_content(content, content_type)
+        # Blobs of this entry are protected from a concurrent eviction until its row is
+        # pending; an eviction already deleting blobs finishes before they are stored
+        while self._blob_deletion is not None:
+            await asyncio.wait([self._blob_deletion])
+        content_hashes = {
+            key: generate_content_hash(content) if content else ""
+            for key, (content, _) in content_map.items()
+        }
+        storing = [content_hash for content_hash in content_hashes.values() if content_hash]
+        self._storing.update(storing)
+        try:
+            await asyncio.gather(
+                *(
+                    self._store_content(content, content_type, content_hashes[key])
+                    for key, (content, content_type) in content_map.items()
+                )
+            )
+            size = sum(
+                len(content.encode("utf-8")) for content, _ in content_map.values() if content
+            )
+            now = time.time()
+
+            row = (
+                result.url,
+                content_hashes["html"],
+                content_hashes["cleaned_html"],
+                content_hashes["markdown"],
+                content_hashes["extracted_content"],
+                result.success,
+                json.dumps(result.media),
+                json.dumps(result.links),
+                json.dumps(result.metadata or {}),
+                content_hashes["screenshot"],
+                json.dumps(result.response_headers or {}),
+                json.dumps(result.downloaded_files or []),
+                now,
+                now,
+                size,
+                get_header(result.response_headers, "etag"),
+                get_header(result.response_headers, "last-modified"),
+            )
+
+            # A newer result for the same URL replaces the pending one, as the upsert would
+            if self.result_cache is not None:
+                self.result_cache.invalidate(result.url)
+            self._pending_writes.pop(result.url, None)
+            self._pending_writes[result.url] = row
+        except Exception as e:
+            self.logger.error(
+                message="Error caching URL: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return
+        finally:
+            self._storing.subtract(storing)
+            for content_hash in storing:
+                if self._storing[content_hash] <= 0:
+                    del self._storing[content_hash]
+
+        if len(self._pending_writes) >= max(self.write_batch_size, 1):
+            await self.aflush_writes()
+        else:
+            self._schedule_flush()
 
-        async def _cache(db):
+    def _schedule_flush(self):
+        """Make sure a timed flush is pending on the running event loop"""
+        task = self._flush_task
+        loop = asyncio.get_running_loop()
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._flush_task = loop.create_task(self._flush_after(self.write_flush_interval))
+
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.aflush_writes()
+
+    async def aflush_writes(self):
+        """Commit all buffered cache rows in a single transaction"""
+        task = self._flush_task
+        if (
+            task is not None
+            and task is not asyncio.current_task()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            task.cancel()
+            self._flush_task = None
+
+        async with self._write_lock:
+            if not self._pending_writes and not self._pending_access:
+                return
+            rows = list(self._pending_writes.values())
+            accesses = [(at, url) for url, at in self._pending_access.items()]
+            self._pending_access.clear()
+            # Rows must never reference blobs the store still buffers
+            if rows:
+                await asyncio.to_thread(self.blob_store.flush)
+
+            async def _cache(db):
+                await db.executemany(
+                    """
+                    INSERT INTO crawled_data (
+                        url, html, cleaned_html, markdown,
+                        extracted_content, success, media, links, metadata,
+                        screenshot, response_headers, downloaded_files,
+                        fetched_at, accessed_at, size, etag, last_modified
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        html = excluded.html,
+                        cleaned_html = excluded.cleaned_html,
+                        markdown = excluded.markdown,
+                        extracted_content = excluded.extracted_content,
+                        success = excluded.success,
+                        media = excluded.media,
+                        links = excluded.links,
+                        metadata = excluded.metadata,
+                        screenshot = excluded.screenshot,
+                        response_headers = excluded.response_headers,
+                        downloaded_files = excluded.downloaded_files,
+                        fetched_at = excluded.fetched_at,
+                        accessed_at = excluded.accessed_at,
+                        size = excluded.size,
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified
+                """,
+                    rows,
+                )
+                await db.executemany(
+                    "UPDATE crawled_data SET accessed_at = ? WHERE url = ?", accesses
+                )
+
+            try:
+                await self.execute_with_retry(_cache)
+            except Exception as e:
+                self.logger.error(
+                    message="Error caching {count} URLs: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"count": len(rows), "error": str(e)},
+                )
+            finally:
+                # Rows cached while the transaction ran stay pending for the next flush
+                for row in rows:
+                    if self._pending_writes.get(row[0]) is row:
+                        del self._pending_writes[row[0]]
+
+        if (
+            self.max_cache_bytes is not None or self.max_entry_age is not None
+        ) and time.monotonic() - self._last_evict >= self.evict_interval:
+            await self.aevict()
+
+    async def arefresh_url(self, url: str, response_headers: Optional[Dict[str, Any]] = None):
+        """
+        Mark a cached entry as fresh again after the server confirmed it (HTTP 304).
+
+        Validators present in `response_headers` replace the stored ones.
+        """
+        etag = get_header(response_headers, "etag")
+        last_modified = get_header(response_headers, "last-modified")
+        now = time.time()
+        if self.result_cache is not None:
+            self.result_cache.invalidate(url)
+
+        pending = self._pending_writes.get(url)
+        if pending is not None:
+            row = dict(zip(CACHE_COLUMNS, pending))
+            row.update(fetched_at=now, accessed_at=now)
+            row["etag"] = etag or row["etag"]
+            row["last_modified"] = last_modified or row["last_modified"]
+            self._pending_writes[url] = tuple(row[column] for column in CACHE_COLUMNS)
+            return
+
+        async def _refresh(db):
             await db.execute(
                 """
-                INSERT INTO crawled_data (
-                    url, html, cleaned_html, markdown,
-                    extracted_content, success, media, links, metadata,
-                    screenshot, response_headers, downloaded_files
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(url) DO UPDATE SET
-                    html = excluded.html,
-                    cleaned_html = excluded.cleaned_html,
-                    markdown = excluded.markdown,
-                    extracted_content = excluded.extracted_content,
-                    success = excluded.success,
-                    media = excluded.media,
-                    links = excluded.links,
-                    metadata = excluded.metadata,
-                    screenshot = excluded.screenshot,
-                    response_headers = excluded.response_headers,
-                    downloaded_files = excluded.downloaded_files
+                UPDATE crawled_data SET
+                    fetched_at = ?,
+                    accessed_at = ?,
+                    etag = CASE WHEN ? != '' THEN ? ELSE etag END,
+                    last_modified = CASE WHEN ? != '' THEN ? ELSE last_modified END
+                WHERE url = ?
             """,
-                (
-                    result.url,
-                    content_hashes["html"],
-                    content_hashes["cleaned_html"],
-                    content_hashes["markdown"],
-                    content_hashes["extracted_content"],
-                    result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
-                    content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
-                ),
+                (now, now, etag, etag, last_modified, last_modified, url),
             )
 
         try:
-            await self.execute_with_retry(_cache)
+            await self.execute_with_retry(_refresh)
         except Exception as e:
             self.logger.error(
-                message="Error caching URL: {error}",
+                message="Error refreshing cached URL: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+
+    async def aevict(self, now: Optional[float] = None) -> int:
+        """
+        Evict cache entries and delete blobs no other entry references.
+
+        Entries fetched more than `max_entry_age` seconds ago are removed when they have
+        no ETag/Last-Modified to revalidate with; then the least recently used entries
+        go until the total size fits in `max_cache_bytes`.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        self._last_evict = time.monotonic()
+        now = now or time.time()
+        blob_columns = {
+            "html": "html",
+            "cleaned_html": "cleaned",
+            "markdown": "markdown",
+            "extracted_content": "extracted",
+            "screenshot": "screenshots",
+        }
+        hash_list = ", ".join(blob_columns)
+
+        async def _evict(db):
+            victims = []
+            if self.max_entry_age is not None:
+                async with db.execute(
+                    f"""
+                    SELECT url, size, {hash_list} FROM crawled_data
+                    WHERE fetched_at < ? AND etag = '' AND last_modified = ''
+                """,
+                    (now - self.max_entry_age,),
+                ) as cursor:
+                    victims.extend(await cursor.fetchall())
+
+            if self.max_cache_bytes is not None:
+                async with db.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM crawled_data"
+                ) as cursor:
+                    total = (await cursor.fetchone())[0]
+                total -= sum(row[1] or 0 for row in victims)
+                if total > self.max_cache_bytes:
+                    evicted = {row[0] for row in victims}
+                    async with db.execute(
+                        f"SELECT url, size, {hash_list} FROM crawled_data ORDER BY accessed_at"
+                    ) as cursor:
+                        async for row in cursor:
+                            if total <= self.max_cache_bytes:
+                                break
+                            if row[0] in evicted:
+                                continue
+                            victims.append(row)
+                            total -= row[1] or 0
+
+            if not victims:
+                return victims
+            await db.executemany(
+                "DELETE FROM crawled_data WHERE url = ?", [(row[0],) for row in victims]
+            )
+
+            # Content is deduplicated by hash: keep blobs another entry still uses
+            orphans = []
+            for position, (column, content_type) in enumerate(blob_columns.items(), 2):
+                hashes = list({row[position] for row in victims if row[position]})
+                for start in range(0, len(hashes), 500):
+                    chunk = hashes[start : start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    async with db.execute(
+                        f"SELECT DISTINCT {column} FROM crawled_data WHERE {column} IN ({placeholders})",
+                        chunk,
+                    ) as cursor:
+                        in_use = {row[0] for row in await cursor.fetchall()}
+                    orphans.extend(
+                        (content_hash, content_type)
+                        for content_hash in chunk
+                        if content_hash not in in_use
+                    )
+            return victims, orphans
+
+        try:
+            outcome = await self.execute_with_retry(_evict)
+        except Exception as e:
+            self.logger.error(
+                message="Error evicting cache entries: {error}",
                 tag="ERROR",
                 force_verbose=True,
                 params={"error": str(e)},
             )
+            return 0
+        if not outcome:
+            return 0
+
+        victims, orphans = outcome
+        for url in [row[0] for row in victims]:
+            self._pending_access.pop(url, None)
+            if self.result_cache is not None:
+                self.result_cache.invalidate(url)
+
+        while self._blob_deletion is not None:
+            await asyncio.wait([self._blob_deletion])
+        # Rows still waiting to be flushed, and entries whose content is being stored,
+        # may share a blob with an evicted entry
+        in_use = set(self._storing)
+        in_use.update(
+            value for row in self._pending_writes.values() for value in row[1:5] + row[9:10]
+        )
+
+        def _delete_blobs():
+            for content_hash, content_type in orphans:
+                if content_hash not in in_use:
+                    self.blob_store.delete(content_hash, content_type)
+
+        deletion = asyncio.ensure_future(asyncio.to_thread(_delete_blobs))
+        self._blob_deletion = deletion
+        try:
+            await deletion
+        finally:
+            if self._blob_deletion is deletion:
+                self._blob_deletion = None
+        self.logger.info(
+            message="Evicted {count} cache entries",
+            tag="CACHE",
+            params={"count": len(victims)},
+        )
+        return len(victims)
 
     async def aget_total_count(self) -> int:
         """Get total number of cached URLs"""
+        await self.aflush_writes()
 
         async def _count(db):
             async with db.execute("SELECT COUNT(*) FROM crawled_data") as cursor:
@@ -493,6 +1172,10 @@ class AsyncDatabaseManager:
 
     async def aclear_db(self):
         """Clear all data from the database"""
+        self._pending_writes.clear()
+        self._pending_access.clear()
+        if self.result_cache is not None:
+            self.result_cache.clear()
 
         async def _clear(db):
             await db.execute("DELETE FROM crawled_data")
@@ -509,6 +1192,10 @@ class AsyncDatabaseManager:
 
     async def aflush_db(self):
         """Drop the entire table"""
+        self._pending_writes.clear()
+        self._pending_access.clear()
+        if self.result_cache is not None:
+            self.result_cache.clear()
 
         async def _flush(db):
             await db.execute("DROP TABLE IF EXISTS crawled_data")
@@ -523,40 +1210,50 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
-    async def _store_content(self, content: str, content_type: str) -> str:
-        """Store content in filesystem and return hash"""
+    async def _store_content(
+        self, content: str, content_type: str, content_hash: Optional[str] = None
+    ) -> str:
+        """Store content in the blob store and return hash"""
         if not content:
             return ""
-
-        content_hash = generate_content_hash(content)
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
-
-        # Only write if file doesn't exist
-        if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
-
-        return content_hash
+        return await asyncio.to_thread(
+            self.blob_store.put, content, content_type, content_hash
+        )
 
     async def _load_content(
         self, content_hash: str, content_type: str
     ) -> Optional[str]:
-        """Load content from filesystem by hash"""
+        """Load content from the blob store by hash"""
+        if not content_hash:
+            return None
+        return await asyncio.to_thread(self._load_content_sync, content_hash, content_type)
+
+    def _load_content_sync(
+        self, content_hash: str, content_type: str
+    ) -> Optional[str]:
+        """Blocking variant of `_load_content`, used by CachedCrawlResult attributes"""
         if not content_hash:
             return None
 
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                return await f.read()
-        except:
+            content = self.blob_store.get(content_hash, content_type)
+        except Exception as e:
+            content = None
             self.logger.error(
-                message="Failed to load content: {file_path}",
+                message="Failed to load content {content_type}/{hash}: {error}",
                 tag="ERROR",
                 force_verbose=True,
-                params={"file_path": file_path},
+                params={"content_type": content_type, "hash": content_hash, "error": str(e)},
             )
-            return None
+        else:
+            if content is None:
+                self.logger.error(
+                    message="Failed to load content: {content_type}/{hash}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"content_type": content_type, "hash": content_hash},
+                )
+        return content
 
 
 # Create a singleton instance
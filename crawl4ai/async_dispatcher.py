@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Union, Iterable, AsyncIterable
 from .async_configs import CrawlerRunConfig
 from .models import (
     CrawlResult,
@@ -18,7 +18,9 @@ from collections.abc import AsyncGenerator
 import time
 import psutil
 import asyncio
+import heapq
 import uuid
+from collections import deque
 
 from urllib.parse import urlparse
 import random
@@ -87,6 +89,37 @@ class RateLimiter:
         return True
 
 
+class TokenBucket:
+    """
+    Token bucket for one domain: `rate` requests per second on average, with bursts of
+    up to `capacity` requests. A rate of 0 or less disables the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: Optional[float] = None) -> float:
+        """Seconds until a token is available; 0 if one is available now."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill(time.monotonic() if now is None else now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self, now: Optional[float] = None) -> None:
+        if self.rate <= 0:
+            return
+        self._refill(time.monotonic() if now is None else now)
+        self.tokens -= 1
+
+
 class CrawlerMonitor:
     def __init__(
         self,
@@ -283,6 +316,86 @@ class CrawlerMonitor:
         return self._create_detailed_table()
 
 
+UrlSource = Union[Iterable[str], AsyncIterable[str], asyncio.Queue]
+
+
+class UrlIntake:
+    """
+    Pulls URLs one at a time from a list, any iterable, an async iterable or an
+    asyncio.Queue, so dispatchers only hold the URLs they are about to crawl.
+
+    A queue is read until it yields None, which marks the end of the input.
+
+    `poll()` returns the next URL if one is available without waiting. When it returns
+    None and `exhausted` is False, `waiter()` gives a future that completes once the
+    next URL has arrived, to be awaited alongside running crawls.
+    """
+
+    _END = object()
+
+    def __init__(self, urls: UrlSource):
+        self.exhausted = False
+        self.count = 0
+        self._queue = urls if isinstance(urls, asyncio.Queue) else None
+        self._aiter = None
+        self._iter = None
+        if self._queue is None:
+            if hasattr(urls, "__aiter__"):
+                self._aiter = urls.__aiter__()
+            else:
+                self._iter = iter(urls)
+        self._fetch: Optional[asyncio.Future] = None
+
+    def _accept(self, url) -> Optional[str]:
+        if url is self._END or (url is None and self._queue is not None):
+            self.exhausted = True
+            return None
+        self.count += 1
+        return url
+
+    async def _get_from_queue(self):
+        url = await self._queue.get()
+        self._queue.task_done()
+        return url
+
+    def poll(self) -> Optional[str]:
+        if self.exhausted:
+            return None
+        if self._iter is not None:
+            return self._accept(next(self._iter, self._END))
+        if self._fetch is not None:
+            if not self._fetch.done():
+                return None
+            fetch, self._fetch = self._fetch, None
+            try:
+                return self._accept(fetch.result())
+            except StopAsyncIteration:
+                return self._accept(self._END)
+        if self._queue is not None:
+            try:
+                url = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            self._queue.task_done()
+            return self._accept(url)
+        return None
+
+    def waiter(self) -> Optional[asyncio.Future]:
+        if self.exhausted or self._iter is not None:
+            return None
+        if self._fetch is None:
+            if self._queue is not None:
+                self._fetch = asyncio.ensure_future(self._get_from_queue())
+            else:
+                self._fetch = asyncio.ensure_future(self._aiter.__anext__())
+        return self._fetch
+
+    def close(self) -> None:
+        if self._fetch is not None and not self._fetch.done():
+            self._fetch.cancel()
+        self._fetch = None
+
+
 class BaseDispatcher(ABC):
     def __init__(
         self,
@@ -308,7 +421,7 @@ class BaseDispatcher(ABC):
     @abstractmethod
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: "AsyncWebCrawler",  # noqa: F821
         config: CrawlerRunConfig,
         monitor: Optional[CrawlerMonitor] = None,
@@ -418,61 +531,18 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
 
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: "AsyncWebCrawler",  # noqa: F821
         config: CrawlerRunConfig,
     ) -> List[CrawlerTaskResult]:
-        self.crawler = crawler
-
-        if self.monitor:
-            self.monitor.start()
-
-        try:
-            pending_tasks = []
-            active_tasks = []
-            task_queue = []
-
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task_queue.append((url, task_id))
-
-            while task_queue or active_tasks:
-                wait_start_time = time.time()
-                while len(active_tasks) < self.max_session_permit and task_queue:
-                    if psutil.virtual_memory().percent >= self.memory_threshold_percent:
-                        # Check if we've exceeded the timeout
-                        if time.time() - wait_start_time > self.memory_wait_timeout:
-                            raise MemoryError(
-                                f"Memory usage above threshold ({self.memory_threshold_percent}%) for more than {self.memory_wait_timeout} seconds"
-                            )
-                        await asyncio.sleep(self.check_interval)
-                        continue
-
-                    url, task_id = task_queue.pop(0)
-                    task = asyncio.create_task(self.crawl_url(url, config, task_id))
-                    active_tasks.append(task)
-
-                if not active_tasks:
-                    await asyncio.sleep(self.check_interval)
-                    continue
-
-                done, pending = await asyncio.wait(
-                    active_tasks, return_when=asyncio.FIRST_COMPLETED
-                )
-
-                pending_tasks.extend(done)
-                active_tasks = list(pending)
-
-            return await asyncio.gather(*pending_tasks)
-        finally:
-            if self.monitor:
-                self.monitor.stop()
+        return [
+            result
+            async for result in self.run_urls_stream(urls=urls, crawler=crawler, config=config)
+        ]
 
     async def run_urls_stream(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: "AsyncWebCrawler", # noqa: F821
         config: CrawlerRunConfig,
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
@@ -480,47 +550,51 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         if self.monitor:
             self.monitor.start()
 
+        # URLs are pulled only when a session slot is free, so at most
+        # max_session_permit of them are held at any time
+        intake = UrlIntake(urls)
+        active_tasks = set()
         try:
-            active_tasks = []
-            task_queue = []
-            completed_count = 0
-            total_urls = len(urls)
-
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task_queue.append((url, task_id))
-
-            while completed_count < total_urls:
-                # Start new tasks if memory permits
-                while len(active_tasks) < self.max_session_permit and task_queue:
+            while True:
+                wait_start_time = time.time()
+                while len(active_tasks) < self.max_session_permit and not intake.exhausted:
                     if psutil.virtual_memory().percent >= self.memory_threshold_percent:
+                        # Check if we've exceeded the timeout
+                        if time.time() - wait_start_time > self.memory_wait_timeout:
+                            raise MemoryError(
+                                f"Memory usage above threshold ({self.memory_threshold_percent}%) for more than {self.memory_wait_timeout} seconds"
+                            )
                         await asyncio.sleep(self.check_interval)
                         continue
 
-                    url, task_id = task_queue.pop(0)
-                    task = asyncio.create_task(self.crawl_url(url, config, task_id))
-                    active_tasks.append(task)
+                    url = intake.poll()
+                    if url is None:
+                        break
+                    task_id = str(uuid.uuid4())
+                    if self.monitor:
+                        self.monitor.add_task(task_id, url)
+                    active_tasks.add(
+                        asyncio.create_task(self.crawl_url(url, config, task_id))
+                    )
 
-                if not active_tasks and not task_queue:
+                if not active_tasks and intake.exhausted:
                     break
 
-                # Wait for any task to complete and yield results
-                if active_tasks:
-                    done, pending = await asyncio.wait(
-                        active_tasks, timeout=0.1, return_when=asyncio.FIRST_COMPLETED
-                    )
-                    for completed_task in done:
-                        result = await completed_task
-                        completed_count += 1
-                        yield result
-                    active_tasks = list(pending)
-                else:
-                    await asyncio.sleep(self.check_interval)
+                # Wait for any task to complete, or for the next URL to arrive
+                waiters = set(active_tasks)
+                if len(active_tasks) < self.max_session_permit:
+                    next_url = intake.waiter()
+                    if next_url is not None:
+                        waiters.add(next_url)
+                done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for completed_task in done & active_tasks:
+                    active_tasks.discard(completed_task)
+                    yield await completed_task
 
         finally:
+            intake.close()
+            for task in active_tasks:
+                task.cancel()
             if self.monitor:
                 self.monitor.stop()
 
@@ -621,27 +695,346 @@ class SemaphoreDispatcher(BaseDispatcher):
     async def run_urls(
         self,
         crawler: "AsyncWebCrawler",  # noqa: F821
-        urls: List[str],
+        urls: UrlSource,
         config: CrawlerRunConfig,
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
         if self.monitor:
             self.monitor.start()
 
+        intake = UrlIntake(urls)
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
             tasks = []
+            active_tasks = set()
+
+            # At most max_session_permit tasks exist at once; the rest of the URLs
+            # stay in the source until a task finishes
+            while True:
+                while len(active_tasks) < self.max_session_permit:
+                    url = intake.poll()
+                    if url is None:
+                        break
+                    task_id = str(uuid.uuid4())
+                    if self.monitor:
+                        self.monitor.add_task(task_id, url)
+                    task = asyncio.create_task(
+                        self.crawl_url(url, config, task_id, semaphore)
+                    )
+                    tasks.append(task)
+                    active_tasks.add(task)
 
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
-                )
-                tasks.append(task)
+                if not active_tasks and intake.exhausted:
+                    break
+                waiters = set(active_tasks)
+                if len(active_tasks) < self.max_session_permit:
+                    next_url = intake.waiter()
+                    if next_url is not None:
+                        waiters.add(next_url)
+                done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                active_tasks -= done
 
             return await asyncio.gather(*tasks, return_exceptions=True)
         finally:
+            intake.close()
+            if self.monitor:
+                self.monitor.stop()
+
+
+class _DomainQueue:
+    """Pending URLs, running count and politeness state of one domain."""
+
+    __slots__ = ("domain", "urls", "active", "bucket", "not_before", "scheduled")
+
+    def __init__(self, domain: str, bucket: TokenBucket):
+        self.domain = domain
+        self.urls = deque()
+        self.active = 0
+        self.bucket = bucket
+        # Earliest start of the next request, set from RateLimiter backoff
+        self.not_before = 0.0
+        # Whether the domain sits in the ready ring or the waiting heap
+        self.scheduled = False
+
+    def wait_time(self, now: float) -> float:
+        return max(self.bucket.wait_time(now), self.not_before - now)
+
+
+class DomainFairDispatcher(BaseDispatcher):
+    """
+    Dispatcher with one queue per domain and token-bucket politeness.
+
+    A session slot is only handed to a URL whose domain may be requested right now, so
+    a throttled or backed-off host never holds slots while it waits. Domains that are
+    ready take turns round-robin; domains waiting for a token sit in a heap ordered by
+    the time they become ready, and domains at their concurrency cap are parked until
+    one of their requests finishes. Scheduling costs O(log d) per URL for d domains.
+
+    Args:
+        max_session_permit: Maximum number of concurrent crawls overall.
+        max_per_domain: Maximum number of concurrent crawls per domain.
+        requests_per_second: Average request rate allowed per domain. 0 disables it.
+        burst: Number of requests a domain may start back to back after being idle.
+        memory_threshold_percent: No new crawl starts while system memory use is at or
+            above this percentage.
+        check_interval: Seconds between memory checks while above the threshold.
+        max_buffered_urls: Maximum number of URLs pulled from the input and waiting in
+            domain queues. Fairness only applies among buffered URLs; the bound keeps
+            memory flat for arbitrarily long inputs.
+        rate_limiter: Optional RateLimiter. Its backoff on rate-limit status codes is
+            applied to the domain's ready time instead of sleeping inside a slot, and
+            its retry limit still fails URLs of domains that keep answering with them.
+        monitor: Optional CrawlerMonitor.
+    """
+
+    def __init__(
+        self,
+        max_session_permit: int = 20,
+        max_per_domain: int = 2,
+        requests_per_second: float = 1.0,
+        burst: int = 1,
+        memory_threshold_percent: float = 90.0,
+        check_interval: float = 1.0,
+        max_buffered_urls: int = 1000,
+        rate_limiter: Optional[RateLimiter] = None,
+        monitor: Optional[CrawlerMonitor] = None,
+    ):
+        super().__init__(rate_limiter, monitor)
+        self.max_session_permit = max_session_permit
+        self.max_per_domain = max_per_domain
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.memory_threshold_percent = memory_threshold_percent
+        self.check_interval = check_interval
+        self.max_buffered_urls = max_buffered_urls
+        self.buffered = 0
+        self.domains: Dict[str, _DomainQueue] = {}
+        self._ready = deque()
+        self._waiting: List[Tuple[float, int, _DomainQueue]] = []
+        self._waiting_seq = 0
+
+    def get_domain(self, url: str) -> str:
+        return urlparse(url).netloc
+
+    def _enqueue(self, url: str) -> None:
+        domain = self.get_domain(url)
+        queue = self.domains.get(domain)
+        if queue is None:
+            queue = self.domains[domain] = _DomainQueue(
+                domain, TokenBucket(self.requests_per_second, self.burst)
+            )
+        task_id = str(uuid.uuid4())
+        if self.monitor:
+            self.monitor.add_task(task_id, url)
+        queue.urls.append((url, task_id))
+        self.buffered += 1
+        self._schedule(queue)
+
+    def _schedule(self, queue: _DomainQueue) -> None:
+        """Put a domain with pending URLs and free capacity in the ready ring."""
+        if queue.scheduled or not queue.urls or queue.active >= self.max_per_domain:
+            return
+        queue.scheduled = True
+        self._ready.append(queue)
+
+    def _next_url(self, now: float) -> Optional[Tuple[_DomainQueue, str, str]]:
+        """Pop the next URL whose domain may be requested now, round-robin."""
+        while self._waiting and self._waiting[0][0] <= now:
+            self._ready.append(heapq.heappop(self._waiting)[2])
+        while self._ready:
+            queue = self._ready.popleft()
+            if not queue.urls or queue.active >= self.max_per_domain:
+                queue.scheduled = False
+                continue
+            wait = queue.wait_time(now)
+            if wait > 0:
+                self._waiting_seq += 1
+                heapq.heappush(self._waiting, (now + wait, self._waiting_seq, queue))
+                continue
+            queue.bucket.consume(now)
+            queue.active += 1
+            url, task_id = queue.urls.popleft()
+            self.buffered -= 1
+            if queue.urls and queue.active < self.max_per_domain:
+                self._ready.append(queue)
+            else:
+                queue.scheduled = False
+            return queue, url, task_id
+        return None
+
+    def _finish(self, url: str, result: Optional[CrawlResult]) -> bool:
+        """Release the domain slot and apply backoff. False if retries are exhausted."""
+        queue = self.domains[self.get_domain(url)]
+        queue.active -= 1
+        allowed = True
+        if self.rate_limiter and result is not None and result.status_code:
+            state = self.rate_limiter.domains.setdefault(
+                self.rate_limiter.get_domain(url), DomainState()
+            )
+            # Seed the delay as wait_if_needed does, so a first 429 still backs off
+            if state.current_delay == 0:
+                state.current_delay = random.uniform(*self.rate_limiter.base_delay)
+            state.last_request_time = time.time()
+            allowed = self.rate_limiter.update_delay(url, result.status_code)
+            queue.not_before = time.monotonic() + state.current_delay
+        self._schedule(queue)
+        return allowed
+
+    async def crawl_url(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        task_id: str,
+    ) -> CrawlerTaskResult:
+        start_time = time.time()
+        error_message = ""
+        memory_usage = peak_memory = 0.0
+        released = False
+
+        try:
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id, status=CrawlStatus.IN_PROGRESS, start_time=start_time
+                )
+            self.concurrent_sessions += 1
+
+            process = psutil.Process()
+            start_memory = process.memory_info().rss / (1024 * 1024)
+            result = await self.crawler.arun(url, config=config, session_id=task_id)
+            end_memory = process.memory_info().rss / (1024 * 1024)
+            memory_usage = peak_memory = end_memory - start_memory
+
+            released = True
+            if not self._finish(url, result):
+                error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
+            elif not result.success:
+                error_message = result.error_message
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    status=CrawlStatus.FAILED if error_message else CrawlStatus.COMPLETED,
+                )
+
+        except Exception as e:
+            if not released:
+                self._finish(url, None)
+            error_message = str(e)
+            if self.monitor:
+                self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
+            result = CrawlResult(
+                url=url, html="", metadata={}, success=False, error_message=str(e)
+            )
+
+        finally:
+            end_time = time.time()
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    end_time=end_time,
+                    memory_usage=memory_usage,
+                    peak_memory=peak_memory,
+                    error_message=error_message,
+                )
+            self.concurrent_sessions -= 1
+
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=result,
+            memory_usage=memory_usage,
+            peak_memory=peak_memory,
+            start_time=start_time,
+            end_time=end_time,
+            error_message=error_message,
+        )
+
+    async def run_urls(
+        self,
+        urls: UrlSource,
+        crawler: "AsyncWebCrawler",  # noqa: F821
+        config: CrawlerRunConfig,
+    ) -> List[CrawlerTaskResult]:
+        return [
+            result
+            async for result in self.run_urls_stream(urls=urls, crawler=crawler, config=config)
+        ]
+
+    async def run_urls_stream(
+        self,
+        urls: UrlSource,
+        crawler: "AsyncWebCrawler",  # noqa: F821
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlerTaskResult, None]:
+        self.crawler = crawler
+        if self.monitor:
+            self.monitor.start()
+
+        # Politeness state carries over between runs, queued work does not
+        for queue in self.domains.values():
+            queue.urls.clear()
+            queue.active = 0
+            queue.scheduled = False
+        self._ready.clear()
+        self._waiting.clear()
+        self.buffered = 0
+
+        intake = UrlIntake(urls)
+        active_tasks = set()
+        try:
+            while True:
+                while self.buffered < self.max_buffered_urls:
+                    url = intake.poll()
+                    if url is None:
+                        break
+                    self._enqueue(url)
+
+                now = time.monotonic()
+                memory_ok = (
+                    psutil.virtual_memory().percent < self.memory_threshold_percent
+                )
+                while memory_ok and len(active_tasks) < self.max_session_permit:
+                    picked = self._next_url(now)
+                    if picked is None:
+                        break
+                    _, url, task_id = picked
+                    active_tasks.add(
+                        asyncio.create_task(self.crawl_url(url, config, task_id))
+                    )
+
+                if (
+                    not active_tasks
+                    and not self._ready
+                    and not self._waiting
+                    and intake.exhausted
+                ):
+                    break
+
+                # Wake up for the first finished crawl or the next domain that gets ready
+                if not memory_ok:
+                    timeout = self.check_interval
+                elif self._waiting:
+                    timeout = max(0.0, self._waiting[0][0] - time.monotonic())
+                else:
+                    timeout = None
+
+                waiters = set(active_tasks)
+                if self.buffered < self.max_buffered_urls:
+                    next_url = intake.waiter()
+                    if next_url is not None:
+                        waiters.add(next_url)
+                if not waiters:
+                    await asyncio.sleep(timeout or 0)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for completed_task in done & active_tasks:
+                    active_tasks.discard(completed_task)
+                    yield await completed_task
+        finally:
+            intake.close()
+            for task in active_tasks:
+                task.cancel()
             if self.monitor:
                 self.monitor.stop()
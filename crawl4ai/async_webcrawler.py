@@ -4,23 +4,28 @@ import sys
 import time
 from colorama import Fore
 from pathlib import Path
-from typing import Optional, List, Generic, TypeVar
+from typing import Optional, List, Generic, TypeVar, Tuple, Dict
 import json
 import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 # from contextlib import nullcontext, asynccontextmanager
 from contextlib import asynccontextmanager
 from .models import CrawlResult, MarkdownGenerationResult, DispatchResult, ScrapingResult
+from .parsed_document import DEFAULT_PARSER, ParsedDocument
 from .async_database import async_db_manager
 from .chunking_strategy import *  # noqa: F403
 from .chunking_strategy import RegexChunking, ChunkingStrategy, IdentityChunking
 from .content_filter_strategy import *  # noqa: F403
 from .content_filter_strategy import RelevantContentFilter
 from .extraction_strategy import * # noqa: F403
-from .extraction_strategy import NoExtractionStrategy, ExtractionStrategy
+from .extraction_strategy import NoExtractionStrategy, ExtractionStrategy, JsonElementExtractionStrategy
 from .async_crawler_strategy import (
     AsyncCrawlerStrategy,
     AsyncPlaywrightCrawlerStrategy,
+    AsyncHTTPCrawlerStrategy,
     AsyncCrawlResponse,
 )
 from .cache_context import CacheMode, CacheContext
@@ -32,13 +37,14 @@ from .deep_crawling import DeepCrawlDecorator
 from .async_logger import AsyncLogger, AsyncLoggerBase
 from .async_configs import BrowserConfig, CrawlerRunConfig
 from .async_dispatcher import * # noqa: F403
-from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
+from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter, UrlSource
 
 from .config import MIN_WORD_THRESHOLD
 from .utils import (
     sanitize_input_encode,
     InvalidCSSSelectorError,
     fast_format_html,
+    simhash_fingerprint,
     create_box_message,
     get_error_context,
     RobotsParser,
@@ -84,6 +90,261 @@ RunManyReturn = Union[
 
 
 
+class BufferedLogger(AsyncLoggerBase):
+    """
+    Logger that records calls instead of emitting them.
+
+    Used for HTML processing jobs that run in an executor: the records travel back
+    with the result (they are plain picklable tuples) and are replayed on the
+    crawler's own logger from the event loop.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def _record(self, method: str, *args, **kwargs):
+        self.records.append((method, args, kwargs))
+
+    def debug(self, message: str, tag: str = "DEBUG", **kwargs):
+        self._record("debug", message=message, tag=tag, **kwargs)
+
+    def info(self, message: str, tag: str = "INFO", **kwargs):
+        self._record("info", message=message, tag=tag, **kwargs)
+
+    def success(self, message: str, tag: str = "SUCCESS", **kwargs):
+        self._record("success", message=message, tag=tag, **kwargs)
+
+    def warning(self, message: str, tag: str = "WARNING", **kwargs):
+        self._record("warning", message=message, tag=tag, **kwargs)
+
+    def error(self, message: str, tag: str = "ERROR", **kwargs):
+        self._record("error", message=message, tag=tag, **kwargs)
+
+    def url_status(self, url: str, success: bool, timing: float, tag: str = "FETCH", url_length: int = 50):
+        self._record("url_status", url=url, success=success, timing=timing, tag=tag, url_length=url_length)
+
+    def error_status(self, url: str, error: str, tag: str = "ERROR", url_length: int = 50):
+        self._record("error_status", url=url, error=error, tag=tag, url_length=url_length)
+
+    def replay(self, logger: AsyncLoggerBase):
+        """Emit every recorded call on `logger`, in order, and clear the buffer."""
+        for method, args, kwargs in self.records:
+            getattr(logger, method)(*args, **kwargs)
+        self.records = []
+
+
+def _extracts_from(config: CrawlerRunConfig, content_format: str) -> bool:
+    """Whether the run's JSON extraction reads a shared parse tree of the given HTML."""
+    strategy = config.extraction_strategy
+    return (
+        isinstance(strategy, JsonElementExtractionStrategy)
+        and strategy.input_format == content_format
+        # A CSS strategy with its own parser builds its own soup
+        and getattr(strategy, "parser", DEFAULT_PARSER) == DEFAULT_PARSER
+    )
+
+
+def process_html(
+    url: str,
+    html: str,
+    extracted_content: str,
+    config: CrawlerRunConfig,
+    screenshot: str,
+    pdf_data: str,
+    logger: AsyncLoggerBase,
+    **kwargs,
+) -> CrawlResult:
+    """
+    Run scraping, markdown generation and structured extraction for one page.
+
+    This is the synchronous, CPU-bound part of `AsyncWebCrawler.aprocess_html`. It only
+    depends on its arguments, so it can run on the event loop, in a thread pool or in a
+    worker process.
+
+    Args:
+        url: The URL being processed
+        html: Raw HTML content
+        extracted_content: Previously extracted content (if any)
+        config: Configuration object controlling processing behavior
+        screenshot: Screenshot data (if any)
+        pdf_data: PDF data (if any)
+        logger: Logger used for progress messages
+        **kwargs: Additional parameters forwarded to the scraping strategy
+
+    Returns:
+        CrawlResult: Processed result containing extracted and formatted content
+    """
+    cleaned_html = ""
+    try:
+        _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
+        t1 = time.perf_counter()
+
+        # Get scraping strategy and ensure it has a logger
+        scraping_strategy = config.scraping_strategy
+        if not scraping_strategy.logger:
+            scraping_strategy.logger = logger
+
+        # Process HTML content
+        params = {k: v for k, v in config.to_dict().items() if k not in ["url"]}
+        # add keys from kwargs to params that doesn't exist in params
+        params.update({k: v for k, v in kwargs.items() if k not in params.keys()})
+
+        # Parse trees of the raw HTML are shared between scraping and extraction. The
+        # scraping strategy modifies its tree, so it gets a copy when extraction reads it later.
+        raw_document = ParsedDocument(html, keep=_extracts_from(config, "html"))
+        params["document"] = raw_document
+
+        
+        ################################
+        # Scraping Strategy Execution  #
+        ################################
+        result : ScrapingResult = scraping_strategy.scrap(url, html, **params)
+
+        if result is None:
+            raise ValueError(
+                f"Process HTML, Failed to extract content from the website: {url}"
+            )
+
+    except InvalidCSSSelectorError as e:
+        raise ValueError(str(e))
+    except Exception as e:
+        raise ValueError(
+            f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
+        )
+
+    # Extract results - handle both dict and ScrapingResult
+    if isinstance(result, dict):
+        cleaned_html = sanitize_input_encode(result.get("cleaned_html", ""))
+        media = result.get("media", {})
+        links = result.get("links", {})
+        metadata = result.get("metadata", {})
+    else:
+        cleaned_html = sanitize_input_encode(result.cleaned_html)
+        media = result.media.model_dump()
+        links = result.links.model_dump()
+        metadata = result.metadata
+
+    # Parse trees of the cleaned HTML are shared between filtering, markdown and extraction
+    document = ParsedDocument(cleaned_html, keep=_extracts_from(config, "cleaned_html"))
+
+    ################################
+    # Generate Markdown            #
+    ################################
+    markdown_generator: Optional[MarkdownGenerationStrategy] = (
+        config.markdown_generator or DefaultMarkdownGenerator()
+    )
+
+    # Uncomment if by default we want to use PruningContentFilter
+    # if not config.content_filter and not markdown_generator.content_filter:
+    #     markdown_generator.content_filter = PruningContentFilter()
+
+    markdown_result: MarkdownGenerationResult = (
+        markdown_generator.generate_markdown(
+            cleaned_html=cleaned_html,
+            base_url=url,
+            document=document,
+            # html2text_options=kwargs.get('html2text', {})
+        )
+    )
+
+    # Log processing completion
+    logger.info(
+        message="{url:.50}... | Time: {timing}s",
+        tag="SCRAPE",
+        params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000) / 1000},
+    )
+
+    ################################
+    # Structured Content Extraction           #
+    ################################
+    if (
+        not bool(extracted_content)
+        and config.extraction_strategy
+        and not isinstance(config.extraction_strategy, NoExtractionStrategy)
+    ):
+        t1 = time.perf_counter()
+        # Choose content based on input_format
+        content_format = config.extraction_strategy.input_format
+        if content_format == "fit_markdown" and not markdown_result.fit_markdown:
+            logger.warning(
+                message="Fit markdown requested but not available. Falling back to raw markdown.",
+                tag="EXTRACT",
+                params={"url": _url},
+            )
+            content_format = "markdown"
+
+        content = {
+            "markdown": markdown_result.raw_markdown,
+            "html": html,
+            "cleaned_html": cleaned_html,
+            "fit_markdown": markdown_result.fit_markdown,
+        }.get(content_format, markdown_result.raw_markdown)
+
+        # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
+        chunking = (
+            IdentityChunking()
+            if content_format in ["html", "cleaned_html"]
+            else config.chunking_strategy
+        )
+        sections = chunking.chunk(content)
+        if isinstance(config.extraction_strategy, JsonElementExtractionStrategy):
+            extracted_content = config.extraction_strategy.run(
+                url,
+                sections,
+                document=raw_document if content_format == "html" else document,
+            )
+        else:
+            extracted_content = config.extraction_strategy.run(url, sections)
+        extracted_content = json.dumps(
+            extracted_content, indent=4, default=str, ensure_ascii=False
+        )
+
+        # Log extraction completion
+        logger.info(
+            message="Completed for {url:.50}... | Time: {timing}s",
+            tag="EXTRACT",
+            params={"url": _url, "timing": time.perf_counter() - t1},
+        )
+
+    # Handle screenshot and PDF data
+    screenshot_data = None if not screenshot else screenshot
+    pdf_data = None if not pdf_data else pdf_data
+
+    # Apply HTML formatting if requested
+    if config.prettiify:
+        cleaned_html = fast_format_html(cleaned_html)
+
+    # Fingerprint the content for near-duplicate detection if requested
+    fingerprint = (
+        simhash_fingerprint(markdown_result.raw_markdown)
+        if config.content_fingerprint
+        else None
+    )
+
+    # Return complete crawl result
+    return CrawlResult(
+        url=url,
+        html=html,
+        cleaned_html=cleaned_html,
+        markdown=markdown_result,
+        media=media,
+        links=links,
+        metadata=metadata,
+        screenshot=screenshot_data,
+        pdf=pdf_data,
+        extracted_content=extracted_content,
+        success=True,
+        error_message="",
+        fingerprint=fingerprint,
+    )
+
+
+def _process_html_job(logger: BufferedLogger, **kwargs) -> Tuple[CrawlResult, BufferedLogger]:
+    """Executor entry point: run `process_html` and hand back the result with its log records."""
+    return process_html(logger=logger, **kwargs), logger
+
+
+
 class AsyncWebCrawler:
     """
     Asynchronous web crawler with flexible caching capabilities.
@@ -148,6 +409,11 @@ class AsyncWebCrawler:
         base_directory: str = str(os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home())),
         thread_safe: bool = False,
         logger: AsyncLoggerBase = None,
+        processing_executor: Union[str, Executor, None] = None,
+        processing_workers: Optional[int] = None,
+        result_cache_bytes: Optional[int] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = None,
         **kwargs,
     ):
         """
@@ -158,6 +424,23 @@ class AsyncWebCrawler:
             config: Configuration object for browser settings. Default BrowserConfig()
             base_directory: Base directory for storing cache
             thread_safe: Whether to use thread-safe operations
+            processing_executor: Where to run scraping, markdown generation and extraction.
+                None (default) runs them inline on the event loop. "thread" or "process"
+                makes the crawler create and own a ThreadPoolExecutor or ProcessPoolExecutor.
+                An Executor instance is used as-is and is not shut down by close().
+                Process pools require picklable strategies in CrawlerRunConfig.
+            processing_workers: Number of workers for an executor created from "thread"
+                or "process". Defaults to the executor's own default.
+            result_cache_bytes: Memory budget in bytes for keeping recently read cache
+                entries in process, in front of the cache database. None (default) keeps
+                none. The in-memory cache is shared by all crawlers in the process.
+            cache_max_bytes: Content size budget in bytes for the cache database. Least
+                recently used entries are evicted once it is exceeded. None (default)
+                leaves the current budget, unbounded unless set before.
+            cache_max_age: Seconds after which cached entries without an ETag or
+                Last-Modified validator are evicted. None (default) leaves the current
+                setting, which keeps them unless set before. Both limits apply to the
+                cache database shared by all crawlers in the process.
             **kwargs: Additional arguments for backwards compatibility
         """
         # Handle browser configuration
@@ -183,6 +466,30 @@ class AsyncWebCrawler:
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
 
+        # HTML processing executor setup
+        if processing_executor not in (None, "thread", "process") and not isinstance(
+            processing_executor, Executor
+        ):
+            raise ValueError(
+                "processing_executor must be None, 'thread', 'process' or an Executor instance"
+            )
+        self.processing_executor = processing_executor
+        self.processing_workers = processing_workers
+        self._revalidation_strategy: Optional[AsyncHTTPCrawlerStrategy] = None
+        self._processing_executor: Optional[Executor] = (
+            processing_executor if isinstance(processing_executor, Executor) else None
+        )
+
+        # In-memory cache of recent results
+        if result_cache_bytes:
+            async_db_manager.enable_result_cache(result_cache_bytes)
+
+        # Cache database eviction limits
+        if cache_max_bytes is not None:
+            async_db_manager.max_cache_bytes = cache_max_bytes
+        if cache_max_age is not None:
+            async_db_manager.max_entry_age = cache_max_age
+
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
         os.makedirs(self.crawl4ai_folder, exist_ok=True)
@@ -222,8 +529,17 @@ class AsyncWebCrawler:
         This method will:
         1. Clean up browser resources
         2. Close any open pages and contexts
+        3. Shut down the HTML processing executor if the crawler created it
+        4. Commit cache writes that are still buffered
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        if self._revalidation_strategy is not None:
+            await self._revalidation_strategy.close()
+            self._revalidation_strategy = None
+        await async_db_manager.aflush_writes()
+        if isinstance(self.processing_executor, str) and self._processing_executor:
+            self._processing_executor.shutdown(wait=True)
+            self._processing_executor = None
 
     async def __aenter__(self):
         return await self.start()
@@ -243,6 +559,21 @@ class AsyncWebCrawler:
         self.logger.info(f"Crawl4AI {crawl4ai_version}", tag="INIT")
         self.ready = True
 
+    def _get_processing_executor(self) -> Optional[Executor]:
+        """Return the HTML processing executor, creating an owned one on first use."""
+        if self._processing_executor is None and self.processing_executor == "thread":
+            self._processing_executor = ThreadPoolExecutor(
+                max_workers=self.processing_workers,
+                thread_name_prefix="crawl4ai-processing",
+            )
+        elif self._processing_executor is None and self.processing_executor == "process":
+            # spawn avoids forking a process that holds browser pipes and event loop state
+            self._processing_executor = ProcessPoolExecutor(
+                max_workers=self.processing_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._processing_executor
+
     @asynccontextmanager
     async def nullcontext(self):
         """异步空上下文管理器"""
@@ -305,30 +636,51 @@ class AsyncWebCrawler:
                 screenshot_data = None
                 pdf_data = None
                 extracted_content = None
+                prefetched_response: AsyncCrawlResponse = None
                 start_time = time.perf_counter()
 
                 # Try to get cached result if appropriate
                 if cache_context.should_read():
                     cached_result = await async_db_manager.aget_cached_url(url)
 
+                # Drop or revalidate entries older than config.cache_ttl
+                cache_info = getattr(cached_result, "cache_info", None)
+                if cache_info is not None:
+                    if cache_context.should_revalidate():
+                        if config.cache_ttl is None or cache_info.is_stale(config.cache_ttl):
+                            cached_result, prefetched_response = await self.arevalidate(
+                                url, cached_result, config
+                            )
+                    elif cache_info.is_stale(config.cache_ttl):
+                        cached_result = None
+
                 if cached_result:
+                    if hasattr(cached_result, "aload"):
+                        # Read the blobs used below off the event loop
+                        await cached_result.aload("html", *(["screenshot"] if config.screenshot else []))
                     html = sanitize_input_encode(cached_result.html)
-                    extracted_content = sanitize_input_encode(
-                        cached_result.extracted_content or ""
-                    )
-                    extracted_content = (
-                        None
-                        if not extracted_content or extracted_content == "[]"
-                        else extracted_content
-                    )
+                    # Cached results load blobs on first access, so only touch what is needed
+                    screenshot_data = cached_result.screenshot if config.screenshot else None
+                    pdf_data = cached_result.pdf if config.pdf else None
                     # If screenshot is requested but its not in cache, then set cache_result to None
-                    screenshot_data = cached_result.screenshot
-                    pdf_data = cached_result.pdf
-                    # if config.screenshot and not screenshot or config.pdf and not pdf:
-                    if config.screenshot and not screenshot_data:
-                        cached_result = None
-                    
-                    if config.pdf and not pdf_data:
+                    incomplete = (config.screenshot and not screenshot_data) or (
+                        config.pdf and not pdf_data
+                    )
+
+                    if incomplete or not html:
+                        # The page is fetched again; keep the cached extraction
+                        if hasattr(cached_result, "aload"):
+                            await cached_result.aload("extracted_content")
+                        extracted_content = sanitize_input_encode(
+                            cached_result.extracted_content or ""
+                        )
+                        extracted_content = (
+                            None
+                            if not extracted_content or extracted_content == "[]"
+                            else extracted_content
+                        )
+
+                    if incomplete:
                         cached_result = None
 
                     self.logger.url_status(
@@ -372,7 +724,7 @@ class AsyncWebCrawler:
                     ##############################
                     # Call CrawlerStrategy.crawl #
                     ##############################
-                    async_response = await self.crawler_strategy.crawl(
+                    async_response = prefetched_response or await self.crawler_strategy.crawl(
                         url,
                         config=config,  # Pass the entire config object
                     )
@@ -476,6 +828,72 @@ class AsyncWebCrawler:
                     )
                 )
 
+    async def arevalidate(
+        self, url: str, cached_result: CrawlResult, config: CrawlerRunConfig
+    ) -> Tuple[Optional[CrawlResult], Optional[AsyncCrawlResponse]]:
+        """
+        Check a stale cache entry with a conditional GET.
+
+        The request goes through the crawler strategy when it can revalidate, as
+        AsyncHTTPCrawlerStrategy and AsyncHybridCrawlerStrategy can, and its answer for a
+        changed page is used as the fresh page; the hybrid strategy routes and escalates
+        it to the browser as its crawl() would. Other strategies (browsers) fetch a changed page
+        themselves, so a lightweight AsyncHTTPCrawlerStrategy kept for this purpose sends
+        a conditional HEAD instead, which does not download the body. It sends the
+        browser's user agent and headers; with a proxy or cookies configured, which it
+        cannot use, the entry is treated as stale instead. On 304 the entry is marked
+        fresh and reused as is, without fetching or processing the page again.
+
+        Returns:
+            Tuple[Optional[CrawlResult], Optional[AsyncCrawlResponse]]: The cached result
+            if it is still valid, otherwise None plus the fresh response when the crawler
+            strategy can use it directly.
+        """
+        cache_info = cached_result.cache_info
+        if not cache_info.can_revalidate:
+            return None, None
+
+        revalidate_kwargs = {}
+        if hasattr(self.crawler_strategy, "revalidate"):
+            strategy = self.crawler_strategy
+        else:
+            browser_config = getattr(self.crawler_strategy, "browser_config", None)
+            if not isinstance(browser_config, BrowserConfig):
+                browser_config = self.browser_config
+            if not AsyncHTTPCrawlerStrategy.can_replace_browser(browser_config, config):
+                # A direct request would bypass the proxy or lack the browser's
+                # cookies, so the entry is treated as stale
+                return None, None
+            if self._revalidation_strategy is None:
+                self._revalidation_strategy = AsyncHTTPCrawlerStrategy.for_browser(
+                    browser_config, logger=self.logger
+                )
+            strategy = self._revalidation_strategy
+            revalidate_kwargs["head"] = True
+
+        try:
+            response = await strategy.revalidate(
+                url, cache_info.etag, cache_info.last_modified, config, **revalidate_kwargs
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="Revalidation failed for {url}: {error}",
+                tag="CACHE",
+                params={"url": url, "error": str(e)},
+            )
+            return None, None
+
+        if response.status_code == 304:
+            await async_db_manager.arefresh_url(url, response.response_headers)
+            self.logger.info(
+                message="{url:.50}... | Not modified, reusing cached result",
+                tag="CACHE",
+                params={"url": url},
+            )
+            return cached_result, None
+
+        return None, response if strategy is self.crawler_strategy else None
+
     async def aprocess_html(
         self,
         url: str,
@@ -490,6 +908,11 @@ class AsyncWebCrawler:
         """
         Process HTML content using the provided configuration.
 
+        Scraping, markdown generation and extraction run inline on the event loop
+        by default. When the crawler was created with a `processing_executor`, the
+        whole pipeline is submitted to that executor as a single job and only the
+        resulting CrawlResult is sent back.
+
         Args:
             url: The URL being processed
             html: Raw HTML content
@@ -503,149 +926,46 @@ class AsyncWebCrawler:
         Returns:
             CrawlResult: Processed result containing extracted and formatted content
         """
-        cleaned_html = ""
-        try:
-            _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
-            t1 = time.perf_counter()
-
-            # Get scraping strategy and ensure it has a logger
-            scraping_strategy = config.scraping_strategy
-            if not scraping_strategy.logger:
-                scraping_strategy.logger = self.logger
-
-            # Process HTML content
-            params = {k: v for k, v in config.to_dict().items() if k not in ["url"]}
-            # add keys from kwargs to params that doesn't exist in params
-            params.update({k: v for k, v in kwargs.items() if k not in params.keys()})
-
-            
-            ################################
-            # Scraping Strategy Execution  #
-            ################################
-            result : ScrapingResult = scraping_strategy.scrap(url, html, **params)
-
-            if result is None:
-                raise ValueError(
-                    f"Process HTML, Failed to extract content from the website: {url}"
-                )
-
-        except InvalidCSSSelectorError as e:
-            raise ValueError(str(e))
-        except Exception as e:
-            raise ValueError(
-                f"Process HTML, Failed to extract content from the website: {url}, error: {str(e)}"
+        executor = self._get_processing_executor()
+        if executor is None:
+            return process_html(
+                url=url,
+                html=html,
+                extracted_content=extracted_content,
+                config=config,
+                screenshot=screenshot,
+                pdf_data=pdf_data,
+                logger=self.logger,
+                **kwargs,
             )
 
-        # Extract results - handle both dict and ScrapingResult
-        if isinstance(result, dict):
-            cleaned_html = sanitize_input_encode(result.get("cleaned_html", ""))
-            media = result.get("media", {})
-            links = result.get("links", {})
-            metadata = result.get("metadata", {})
-        else:
-            cleaned_html = sanitize_input_encode(result.cleaned_html)
-            media = result.media.model_dump()
-            links = result.links.model_dump()
-            metadata = result.metadata
-
-        ################################
-        # Generate Markdown            #
-        ################################
-        markdown_generator: Optional[MarkdownGenerationStrategy] = (
-            config.markdown_generator or DefaultMarkdownGenerator()
-        )
-
-        # Uncomment if by default we want to use PruningContentFilter
-        # if not config.content_filter and not markdown_generator.content_filter:
-        #     markdown_generator.content_filter = PruningContentFilter()
-
-        markdown_result: MarkdownGenerationResult = (
-            markdown_generator.generate_markdown(
-                cleaned_html=cleaned_html,
-                base_url=url,
-                # html2text_options=kwargs.get('html2text', {})
-            )
-        )
-
-        # Log processing completion
-        self.logger.info(
-            message="{url:.50}... | Time: {timing}s",
-            tag="SCRAPE",
-            params={"url": _url, "timing": int((time.perf_counter() - t1) * 1000) / 1000},
-        )
-
-        ################################
-        # Structured Content Extraction           #
-        ################################
-        if (
-            not bool(extracted_content)
-            and config.extraction_strategy
-            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
-        ):
-            t1 = time.perf_counter()
-            # Choose content based on input_format
-            content_format = config.extraction_strategy.input_format
-            if content_format == "fit_markdown" and not markdown_result.fit_markdown:
-                self.logger.warning(
-                    message="Fit markdown requested but not available. Falling back to raw markdown.",
-                    tag="EXTRACT",
-                    params={"url": _url},
-                )
-                content_format = "markdown"
-
-            content = {
-                "markdown": markdown_result.raw_markdown,
-                "html": html,
-                "cleaned_html": cleaned_html,
-                "fit_markdown": markdown_result.fit_markdown,
-            }.get(content_format, markdown_result.raw_markdown)
-
-            # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
-            chunking = (
-                IdentityChunking()
-                if content_format in ["html", "cleaned_html"]
-                else config.chunking_strategy
-            )
-            sections = chunking.chunk(content)
-            extracted_content = config.extraction_strategy.run(url, sections)
-            extracted_content = json.dumps(
-                extracted_content, indent=4, default=str, ensure_ascii=False
-            )
-
-            # Log extraction completion
-            self.logger.info(
-                message="Completed for {url:.50}... | Time: {timing}s",
-                tag="EXTRACT",
-                params={"url": _url, "timing": time.perf_counter() - t1},
-            )
-
-        # Handle screenshot and PDF data
-        screenshot_data = None if not screenshot else screenshot
-        pdf_data = None if not pdf_data else pdf_data
-
-        # Apply HTML formatting if requested
-        if config.prettiify:
-            cleaned_html = fast_format_html(cleaned_html)
-
-        # Return complete crawl result
-        return CrawlResult(
-            url=url,
-            html=html,
-            cleaned_html=cleaned_html,
-            markdown=markdown_result,
-            media=media,
-            links=links,
-            metadata=metadata,
-            screenshot=screenshot_data,
-            pdf=pdf_data,
-            extracted_content=extracted_content,
-            success=True,
-            error_message="",
+        # Keep the strategy logging through the crawler logger when it runs in a thread;
+        # worker processes receive a copy without logger and log into the buffer instead.
+        if not config.scraping_strategy.logger:
+            config.scraping_strategy.logger = self.logger
+
+        log_buffer = BufferedLogger()
+        loop = asyncio.get_running_loop()
+        crawl_result, log_buffer = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _process_html_job,
+                url=url,
+                html=html,
+                extracted_content=extracted_content,
+                config=config,
+                screenshot=screenshot,
+                pdf_data=pdf_data,
+                logger=log_buffer,
+                **kwargs,
+            ),
         )
+        log_buffer.replay(self.logger)
+        return crawl_result
 
     async def arun_many(
         self,
-        urls: List[str],
+        urls: UrlSource,
         config: Optional[CrawlerRunConfig] = None, 
         dispatcher: Optional[BaseDispatcher] = None,
         # Legacy parameters maintained for backwards compatibility
@@ -666,7 +986,9 @@ class AsyncWebCrawler:
         Runs the crawler for multiple URLs concurrently using a configurable dispatcher strategy.
 
         Args:
-        urls: List of URLs to crawl
+        urls: URLs to crawl. A list, any iterable, an async iterable or an asyncio.Queue
+            (ended by putting None). URLs are pulled as session slots free up, so
+            generators and queues never need to be materialized.
         config: Configuration object controlling crawl behavior for all URLs
         dispatcher: The dispatcher strategy instance to use. Defaults to MemoryAdaptiveDispatcher
         [other parameters maintained for backwards compatibility]
@@ -691,6 +1013,20 @@ class AsyncWebCrawler:
             config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True),
         ):
             print(f"Processed {result.url}: {len(result.markdown)} chars")
+
+        # Feeding URLs through a queue while streaming results
+        queue = asyncio.Queue(maxsize=100)
+
+        async def produce():
+            for url in discovered_urls:
+                await queue.put(url)
+            await queue.put(None)  # End of input
+
+        producer = asyncio.create_task(produce())
+        async for result in await crawler.arun_many(
+            queue, config=CrawlerRunConfig(stream=True)
+        ):
+            print(f"Processed {result.url}")
         """
         config = config or CrawlerRunConfig()
         # if config is None:
@@ -733,8 +1069,12 @@ class AsyncWebCrawler:
         
         if stream:
             async def result_transformer():
-                async for task_result in dispatcher.run_urls_stream(crawler=self, urls=urls, config=config):
-                    yield transform_result(task_result)
+                stream = dispatcher.run_urls_stream(crawler=self, urls=urls, config=config)
+                try:
+                    async for task_result in stream:
+                        yield transform_result(task_result)
+                finally:
+                    await stream.aclose()
             return result_transformer()
         else:
             _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
@@ -751,3 +1091,9 @@ class AsyncWebCrawler:
     async def aget_cache_size(self):
         """Get the total number of cached items."""
         return await async_db_manager.aget_total_count()
+
+    @property
+    def result_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Hit, miss and eviction counters of the in-memory result cache, if enabled."""
+        cache = async_db_manager.result_cache
+        return cache.stats() if cache is not None else None
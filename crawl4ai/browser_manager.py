@@ -1,16 +1,19 @@
 import asyncio
 import time
-from typing import List, Optional
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
 import os
 import sys
 import shutil
 import tempfile
 import subprocess
-from playwright.async_api import BrowserContext
+from playwright.async_api import BrowserContext, Page
 import hashlib
+import weakref
 from .js_snippet import load_js_script
 from .config import DOWNLOAD_PAGE_TIMEOUT
 from .async_configs import BrowserConfig, CrawlerRunConfig
+from .models import PagePoolStats
 from playwright_stealth import StealthConfig
 from .utils import get_chromium_path
 
@@ -365,6 +368,113 @@ class ManagedBrowser:
 
 
 
+class PagePool:
+    """
+    Idle pages of one browser context, opened ahead of use and reused between crawls.
+
+    Whenever a page is handed out and the pool has fewer than `size` pages, the
+    missing ones are opened in the background. Released pages are reset (storage cleared, then navigated to about:blank) and
+    kept for the next crawl, up to `size` of them. A page is closed instead when it
+    has served `max_uses` crawls, when its crawl failed, when it cannot be reset, or
+    when its crawl resized the viewport, which may come with a device metrics
+    override the next crawl would inherit.
+
+    Args:
+        context: The context the pages belong to.
+        new_page: Opens and prepares a page of the context.
+        size: Idle pages kept open.
+        max_uses: Crawls a page serves before it is closed.
+        stats: Counters shared by the browser manager's pools.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        new_page: Callable[[BrowserContext], Awaitable[Page]],
+        size: int,
+        max_uses: int,
+        stats: PagePoolStats,
+    ):
+        self.context = context
+        self.new_page = new_page
+        self.size = size
+        self.max_uses = max_uses
+        self.stats = stats
+        self.idle: Deque[Page] = deque()
+        self.uses: Dict[Page, int] = {}
+        # Viewport of each page when it was opened
+        self.viewports: Dict[Page, Optional[Dict[str, int]]] = {}
+        self._warming: Optional[asyncio.Task] = None
+
+    async def _open(self) -> Page:
+        page = await self.new_page(self.context)
+        self.uses[page] = 0
+        self.viewports[page] = dict(page.viewport_size or {}) or None
+        self.stats.created += 1
+        return page
+
+    async def warm(self) -> None:
+        """Open pages until the pool has `size` of them, idle or in use."""
+        missing = self.size - len(self.uses)
+        if missing > 0:
+            pages = await asyncio.gather(*(self._open() for _ in range(missing)), return_exceptions=True)
+            self.idle.extend(page for page in pages if not isinstance(page, BaseException))
+
+    async def acquire(self) -> Page:
+        start = time.perf_counter()
+        page = None
+        while self.idle and page is None:
+            page = self.idle.popleft()
+            if page.is_closed():
+                self.uses.pop(page, None)
+                self.viewports.pop(page, None)
+                page = None
+        if page is None:
+            page = await self._open()
+        else:
+            self.stats.hits += 1
+        self.stats.acquired += 1
+        self.stats.wait_time += time.perf_counter() - start
+        if len(self.uses) < self.size and (self._warming is None or self._warming.done()):
+            self._warming = asyncio.create_task(self.warm())
+        return page
+
+    async def release(self, page: Page, failed: bool = False) -> None:
+        self.uses[page] = self.uses.get(page, 0) + 1
+        resized = (dict(page.viewport_size or {}) or None) != self.viewports.get(page)
+        if (
+            not failed
+            and not resized
+            and self.uses[page] < self.max_uses
+            and len(self.idle) < self.size
+        ):
+            try:
+                await page.evaluate(
+                    "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+                )
+                await page.goto("about:blank")
+                self.idle.append(page)
+                return
+            except Exception:
+                pass
+        await self.retire(page)
+
+    async def retire(self, page: Page) -> None:
+        self.uses.pop(page, None)
+        self.viewports.pop(page, None)
+        self.stats.retired += 1
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        if self._warming is not None:
+            self._warming.cancel()
+        while self.idle:
+            await self.retire(self.idle.popleft())
+
+
 class BrowserManager:
     """
     Manages the browser instance and context.
@@ -378,6 +488,8 @@ class BrowserManager:
         playwright (Playwright): The Playwright instance
         sessions (dict): Dictionary to store session information
         session_ttl (int): Session timeout in seconds
+        page_pools (dict): PagePool per config signature, when BrowserConfig.page_pool_size is set
+        page_pool_stats (PagePoolStats): Hits, waits and retirements across the page pools
     """
     
 
@@ -406,6 +518,13 @@ class BrowserManager:
         self.contexts_by_config = {}
         self._contexts_lock = asyncio.Lock() 
 
+        # Pre-opened pages per config signature, and the pool each handed-out page returns to
+        self.page_pools: Dict[str, PagePool] = {}
+        self.page_pool_stats = PagePoolStats()
+        self._page_owners: Dict[Page, PagePool] = {}
+        # Contexts that already run the navigator overrides in their pages
+        self._navigator_contexts = weakref.WeakSet()
+
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
             self.managed_browser = ManagedBrowser(
@@ -620,7 +739,7 @@ class BrowserManager:
                 or crawlerRunConfig.simulate_user
                 or crawlerRunConfig.magic
             ):
-                await context.add_init_script(load_js_script("navigator_overrider"))        
+                await self.add_navigator_overrides(context)        
 
     async def create_browser_context(self, crawlerRunConfig: CrawlerRunConfig = None):
         """
@@ -736,6 +855,57 @@ class BrowserManager:
                 await context.route(f"**/*.{ext}", lambda route: route.abort())
         return context
 
+    async def new_page(self, context: BrowserContext) -> Page:
+        """
+        Open a page of the context and prepare it for crawling. Pages are prepared
+        once here, whether they are pooled or not, rather than on every crawl.
+        """
+        page = await context.new_page()
+        # Generate a unique nonce for this page
+        nonce = hashlib.sha256(os.urandom(32)).hexdigest()
+        # Add CSP headers to the page's requests
+        await page.set_extra_http_headers(
+            {
+                "Content-Security-Policy": f"default-src 'self'; script-src 'self' 'nonce-{nonce}' 'strict-dynamic'"
+            }
+        )
+        return page
+
+    async def add_navigator_overrides(self, context: BrowserContext) -> None:
+        """Run the navigator overrides in the context's pages, once per context."""
+        if context not in self._navigator_contexts:
+            self._navigator_contexts.add(context)
+            await context.add_init_script(load_js_script("navigator_overrider"))
+
+    def _page_pool(self, key: str, context: BrowserContext) -> Optional[PagePool]:
+        if self.config.page_pool_size <= 0:
+            return None
+        pool = self.page_pools.get(key)
+        if pool is None:
+            pool = self.page_pools[key] = PagePool(
+                context,
+                self.new_page,
+                size=self.config.page_pool_size,
+                max_uses=self.config.page_max_uses,
+                stats=self.page_pool_stats,
+            )
+        return pool
+
+    async def release_page(self, page: Page, failed: bool = False) -> None:
+        """
+        Hand back a page from get_page once its crawl is done. Pooled pages are reset
+        and reused; others are closed.
+
+        Args:
+            page (Page): The page to release
+            failed (bool): Whether the crawl failed, which retires a pooled page
+        """
+        pool = self._page_owners.pop(page, None)
+        if pool is not None:
+            await pool.release(page, failed=failed)
+        else:
+            await page.close()
+
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
         """
         Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
@@ -790,7 +960,7 @@ class BrowserManager:
         # If using a managed browser, just grab the shared default_context
         if self.config.use_managed_browser:
             context = self.default_context
-            page = await context.new_page()
+            config_signature = "default"
         else:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
@@ -804,8 +974,17 @@ class BrowserManager:
                     await self.setup_context(context, crawlerRunConfig)
                     self.contexts_by_config[config_signature] = context
 
-            # Create a new page from the chosen context
-            page = await context.new_page()
+        # Session pages stay with their session, so they do not come from a pool
+        pool = None if crawlerRunConfig.session_id else self._page_pool(config_signature, context)
+        if pool is not None:
+            page = await pool.acquire()
+            self._page_owners[page] = pool
+        else:
+            start = time.perf_counter()
+            page = await self.new_page(context)
+            self.page_pool_stats.acquired += 1
+            self.page_pool_stats.created += 1
+            self.page_pool_stats.wait_time += time.perf_counter() - start
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -847,6 +1026,12 @@ class BrowserManager:
         for session_id in session_ids:
             await self.kill_session(session_id)
 
+        for pool in self.page_pools.values():
+            await pool.close()
+        self.page_pools.clear()
+        self._page_owners.clear()
+        self._navigator_contexts = weakref.WeakSet()
+
         # Now close all contexts we created. This reclaims memory from ephemeral contexts.
         for ctx in self.contexts_by_config.values():
             try:
@@ -871,3 +1056,206 @@ class BrowserManager:
         if self.playwright:
             await self.playwright.stop()
             self.playwright = None
+
+
+class ShardedBrowserManager:
+    """
+    Runs `browser_count` browsers, each a BrowserManager with its own Playwright
+    connection, for crawls where one browser process or its connection is the
+    bottleneck. It has the interface of BrowserManager, so crawler strategies use
+    either one the same way.
+
+    New pages go to the browser with the fewest open pages, session pages
+    included; pages of a session stay with the browser that opened the session.
+    With `browser_max_pages` set, a browser that has served that many pages takes
+    no new ones: a fresh browser is started in its place, and the old one is closed
+    once its open pages have been released and its sessions killed or expired.
+
+    Attributes:
+        config (BrowserConfig): Settings of every browser
+        logger: Logger instance for recording events and errors
+        shards (list): The BrowserManagers taking new pages
+        manager_factory (callable): Builds a BrowserManager from a config and logger
+    """
+
+    def __init__(
+        self,
+        browser_config: BrowserConfig,
+        logger=None,
+        manager_factory: Callable[..., BrowserManager] = BrowserManager,
+    ):
+        if browser_config.use_managed_browser:
+            raise ValueError("A managed browser cannot be sharded across browsers")
+        self.config = browser_config
+        self.logger = logger
+        self.manager_factory = manager_factory
+        self.shards: List[BrowserManager] = [
+            manager_factory(browser_config, logger=logger)
+            for _ in range(max(1, browser_config.browser_count))
+        ]
+        # Pages handed out and not yet released, and pages served, per browser
+        self._out: Dict[BrowserManager, int] = {}
+        self._served: Dict[BrowserManager, int] = {}
+        self._page_shards: Dict[Page, BrowserManager] = {}
+        self._session_shards: Dict[str, BrowserManager] = {}
+        self._context_shards = weakref.WeakKeyDictionary()
+        # Browsers replaced by a fresh one, set once their pages are released
+        self._retiring: Dict[BrowserManager, asyncio.Event] = {}
+        self._recycle_tasks = set()
+        self._changed = asyncio.Condition()
+
+    @property
+    def browser(self):
+        return self.shards[0].browser
+
+    @property
+    def default_context(self):
+        return self.shards[0].default_context
+
+    @property
+    def sessions(self) -> dict:
+        return {sid: shard.sessions[sid] for sid, shard in self._session_shards.items() if sid in shard.sessions}
+
+    @property
+    def page_pool_stats(self) -> PagePoolStats:
+        """Page pool counters summed over the running browsers"""
+        stats = PagePoolStats()
+        for shard in self.shards + list(self._retiring):
+            for name in ("acquired", "hits", "created", "retired", "wait_time"):
+                setattr(stats, name, getattr(stats, name) + getattr(shard.page_pool_stats, name))
+        return stats
+
+    def load(self, shard: BrowserManager) -> int:
+        """Open pages of a browser, session pages included."""
+        return self._out.get(shard, 0) + len(shard.sessions)
+
+    async def start(self):
+        """Start every browser, concurrently."""
+        await asyncio.gather(*(shard.start() for shard in self.shards))
+
+    async def get_page(self, crawlerRunConfig: CrawlerRunConfig):
+        """
+        Get a page from the least loaded browser, or from the browser of its session.
+
+        Returns:
+            (page, context): The Page and its BrowserContext
+        """
+        shard = self._session_shards.get(crawlerRunConfig.session_id)
+        if shard is not None and crawlerRunConfig.session_id not in shard.sessions:
+            # The session expired; a new one goes to the least loaded browser
+            del self._session_shards[crawlerRunConfig.session_id]
+            shard = None
+        if shard is None:
+            async with self._changed:
+                # Every browser may be retiring while its replacement starts
+                await self._changed.wait_for(lambda: self.shards)
+                shard = min(self.shards, key=lambda s: (self.load(s), self._served.get(s, 0)))
+            self._out[shard] = self._out.get(shard, 0) + 1
+            self._served[shard] = self._served.get(shard, 0) + 1
+            if self.config.browser_max_pages and self._served[shard] >= self.config.browser_max_pages:
+                self._retire(shard)
+            try:
+                page, context = await shard.get_page(crawlerRunConfig)
+            except Exception:
+                self._released(shard)
+                raise
+            if crawlerRunConfig.session_id:
+                # Session pages count towards the load through shard.sessions
+                self._session_shards[crawlerRunConfig.session_id] = shard
+                self._out[shard] -= 1
+            else:
+                self._page_shards[page] = shard
+        else:
+            page, context = await shard.get_page(crawlerRunConfig)
+        self._context_shards[context] = shard
+        return page, context
+
+    async def release_page(self, page: Page, failed: bool = False) -> None:
+        shard = self._page_shards.pop(page, None)
+        if shard is None:
+            await page.close()
+            return
+        try:
+            await shard.release_page(page, failed=failed)
+        finally:
+            self._released(shard)
+
+    async def add_navigator_overrides(self, context: BrowserContext) -> None:
+        shard = self._context_shards.get(context) or self.shards[0]
+        await shard.add_navigator_overrides(context)
+
+    async def kill_session(self, session_id: str):
+        shard = self._session_shards.pop(session_id, None)
+        if shard is not None:
+            await shard.kill_session(session_id)
+            self._check_drained(shard)
+
+    def _released(self, shard: BrowserManager) -> None:
+        self._out[shard] = max(0, self._out.get(shard, 0) - 1)
+        self._check_drained(shard)
+
+    def _check_drained(self, shard: BrowserManager) -> None:
+        event = self._retiring.get(shard)
+        if event is not None and not self.load(shard):
+            event.set()
+
+    def _retire(self, shard: BrowserManager) -> None:
+        self.shards.remove(shard)
+        self._retiring[shard] = asyncio.Event()
+        task = asyncio.create_task(self._recycle(shard))
+        self._recycle_tasks.add(task)
+        task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _recycle(self, shard: BrowserManager) -> None:
+        fresh = self.manager_factory(self.config, logger=self.logger)
+        try:
+            await fresh.start()
+            async with self._changed:
+                self.shards.append(fresh)
+                self._changed.notify_all()
+        except asyncio.CancelledError:
+            await fresh.close()
+            raise
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Failed to start a replacement browser: {error}",
+                    tag="ERROR",
+                    params={"error": str(e)},
+                )
+            # Keep crawling on the old browser rather than on none
+            async with self._changed:
+                del self._retiring[shard]
+                self._served[shard] = 0
+                self.shards.append(shard)
+                self._changed.notify_all()
+            return
+
+        # Sessions nobody kills keep the browser open until they expire, so expire
+        # them here; no get_page call on this browser does it any more
+        while self.load(shard):
+            shard._cleanup_expired_sessions()
+            try:
+                await asyncio.wait_for(self._retiring[shard].wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        del self._retiring[shard]
+        self._out.pop(shard, None)
+        self._served.pop(shard, None)
+        for session_id in [sid for sid, s in self._session_shards.items() if s is shard]:
+            del self._session_shards[session_id]
+        await shard.close()
+
+    async def close(self):
+        """Close every browser, including ones being replaced."""
+        tasks = list(self._recycle_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        shards = self.shards + list(self._retiring)
+        self.shards = []
+        self._retiring.clear()
+        self._page_shards.clear()
+        self._session_shards.clear()
+        for shard in shards:
+            await shard.close()
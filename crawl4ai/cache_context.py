@@ -11,6 +11,8 @@ class CacheMode(Enum):
     - READ_ONLY: Only read from cache, don't write
     - WRITE_ONLY: Only write to cache, don't read
     - BYPASS: Bypass cache for this operation
+    - REVALIDATE: Read and write, but check stale entries with the server using a
+      conditional GET (If-None-Match / If-Modified-Since) and keep them on 304
     """
 
     ENABLED = "enabled"
@@ -18,6 +20,7 @@ class CacheMode(Enum):
     READ_ONLY = "read_only"
     WRITE_ONLY = "write_only"
     BYPASS = "bypass"
+    REVALIDATE = "revalidate"
 
 
 class CacheContext:
@@ -62,14 +65,18 @@ class CacheContext:
 
         How it works:
         1. If always_bypass is True or is_cacheable is False, return False.
-        2. If cache_mode is ENABLED or READ_ONLY, return True.
+        2. If cache_mode is ENABLED, READ_ONLY or REVALIDATE, return True.
 
         Returns:
             bool: True if cache should be read, False otherwise.
         """
         if self.always_bypass or not self.is_cacheable:
             return False
-        return self.cache_mode in [CacheMode.ENABLED, CacheMode.READ_ONLY]
+        return self.cache_mode in [
+            CacheMode.ENABLED,
+            CacheMode.READ_ONLY,
+            CacheMode.REVALIDATE,
+        ]
 
     def should_write(self) -> bool:
         """
@@ -77,14 +84,33 @@ class CacheContext:
 
         How it works:
         1. If always_bypass is True or is_cacheable is False, return False.
-        2. If cache_mode is ENABLED or WRITE_ONLY, return True.
+        2. If cache_mode is ENABLED, WRITE_ONLY or REVALIDATE, return True.
 
         Returns:
             bool: True if cache should be written, False otherwise.
         """
         if self.always_bypass or not self.is_cacheable:
             return False
-        return self.cache_mode in [CacheMode.ENABLED, CacheMode.WRITE_ONLY]
+        return self.cache_mode in [
+            CacheMode.ENABLED,
+            CacheMode.WRITE_ONLY,
+            CacheMode.REVALIDATE,
+        ]
+
+    def should_revalidate(self) -> bool:
+        """
+        Determines if stale cache entries should be revalidated with the server.
+
+        Only web URLs can be revalidated, and only in REVALIDATE mode.
+
+        Returns:
+            bool: True if stale entries should be revalidated, False otherwise.
+        """
+        return (
+            self.should_read()
+            and self.is_web_url
+            and self.cache_mode == CacheMode.REVALIDATE
+        )
 
     @property
     def display_url(self) -> str:
@@ -22,6 +22,7 @@ from abc import ABC, abstractmethod
 import math
 from snowballstemmer import stemmer
 from .models import TokenUsage
+from .parsed_document import ParsedDocument
 from .prompts import PROMPT_FILTER_CONTENT
 import json
 import hashlib
@@ -119,10 +120,41 @@ class RelevantContentFilter(ABC):
         self.logger = logger
 
     @abstractmethod
-    def filter_content(self, html: str) -> List[str]:
-        """Abstract method to be implemented by specific filtering strategies"""
+    def filter_content(self, html: str, document: Optional[ParsedDocument] = None) -> List[str]:
+        """
+        Abstract method to be implemented by specific filtering strategies.
+
+        Args:
+            html (str): HTML content to be filtered.
+            document (Optional[ParsedDocument]): Already-parsed view of `html` to reuse (optional).
+        """
         pass
 
+    def parse_html(
+        self, html: str, document: Optional[ParsedDocument] = None, take: bool = False
+    ) -> BeautifulSoup:
+        """
+        Parse HTML with the lxml-backed BeautifulSoup parser, reusing `document` when it matches.
+
+        Args:
+            html (str): HTML content to parse.
+            document (Optional[ParsedDocument]): Shared parse of `html` (optional).
+            take (bool): Set when the caller modifies the soup, so the shared copy is not reused.
+
+        Returns:
+            BeautifulSoup: Parsed soup that always has a body element.
+        """
+        if document is not None and document.matches(html):
+            soup = document.soup(take=take)
+        else:
+            soup = BeautifulSoup(html, "lxml")
+
+        # Check if body is present
+        if not soup.body:
+            # Wrap in body tag if missing
+            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+        return soup
+
     def extract_page_query(self, soup: BeautifulSoup, body: Tag) -> str:
         """Common method to extract page metadata with fallbacks"""
         if self.user_query:
@@ -435,7 +467,12 @@ class BM25ContentFilter(RelevantContentFilter):
         }
         self.stemmer = stemmer(language)
 
-    def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
+    def filter_content(
+        self,
+        html: str,
+        min_word_threshold: int = None,
+        document: Optional[ParsedDocument] = None,
+    ) -> List[str]:
         """
         Implements content filtering using BM25 algorithm with priority tag handling.
 
@@ -446,6 +483,7 @@ class BM25ContentFilter(RelevantContentFilter):
         Args:
             html (str): HTML content to be filtered.
             min_word_threshold (int): Minimum word threshold for filtering (optional).
+            document (Optional[ParsedDocument]): Shared parse of `html` to reuse (optional).
 
         Returns:
             List[str]: List of filtered text chunks.
@@ -453,12 +491,8 @@ class BM25ContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
-        soup = BeautifulSoup(html, "lxml")
-
-        # Check if body is present
-        if not soup.body:
-            # Wrap in body tag if missing
-            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+        # BM25 only reads the tree, so the shared soup can be used as-is
+        soup = self.parse_html(html, document)
         body = soup.find("body")
 
         query = self.extract_page_query(soup, body)
@@ -615,7 +649,12 @@ class PruningContentFilter(RelevantContentFilter):
             "h6": 0.7,
         }
 
-    def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
+    def filter_content(
+        self,
+        html: str,
+        min_word_threshold: int = None,
+        document: Optional[ParsedDocument] = None,
+    ) -> List[str]:
         """
         Implements content filtering using pruning algorithm with dynamic threshold.
 
@@ -626,6 +665,7 @@ class PruningContentFilter(RelevantContentFilter):
         Args:
             html (str): HTML content to be filtered.
             min_word_threshold (int): Minimum word threshold for filtering (optional).
+            document (Optional[ParsedDocument]): Shared parse of `html` to reuse (optional).
 
         Returns:
             List[str]: List of filtered text chunks.
@@ -633,9 +673,8 @@ class PruningContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
-        soup = BeautifulSoup(html, "lxml")
-        if not soup.body:
-            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+        # Pruning decomposes nodes, so take the soup out of the shared document
+        soup = self.parse_html(html, document, take=True)
 
         # Remove comments and unwanted tags
         self._remove_comments(soup)
@@ -883,7 +922,13 @@ class LLMContentFilter(RelevantContentFilter):
         )
         return sections
 
-    def filter_content(self, html: str, ignore_cache: bool = True) -> List[str]:
+    def filter_content(
+        self,
+        html: str,
+        ignore_cache: bool = True,
+        document: Optional[ParsedDocument] = None,
+    ) -> List[str]:
+        # The LLM works on the HTML string itself, so `document` is not needed here
         if not html or not isinstance(html, str):
             return []
 
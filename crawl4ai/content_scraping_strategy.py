@@ -110,6 +110,13 @@ class WebScrapingStrategy(ContentScrapingStrategy):
     def __init__(self, logger=None):
         self.logger = logger
 
+    def __getstate__(self):
+        # Loggers are process-local; a strategy shipped to a worker process logs
+        # through whatever logger the worker assigns.
+        state = self.__dict__.copy()
+        state["logger"] = None
+        return state
+
     def _log(self, level, message, tag="SCRAPE", **kwargs):
         """Helper method to safely use logger."""
         if self.logger:
@@ -123,7 +130,8 @@ class WebScrapingStrategy(ContentScrapingStrategy):
         Args:
             url (str): The URL of the page to scrape.
             html (str): The HTML content of the page.
-            **kwargs: Additional keyword arguments.
+            **kwargs: Additional keyword arguments. A `document` (ParsedDocument) built
+                from `html` is used instead of parsing `html` again.
 
         Returns:
             ScrapingResult: A structured result containing the scraped content.
@@ -708,7 +716,12 @@ class WebScrapingStrategy(ContentScrapingStrategy):
             return None
 
         parser_type = kwargs.get("parser", "lxml")
-        soup = BeautifulSoup(html, parser_type)
+        document = kwargs.get("document")
+        if document is not None and document.matches(html):
+            # The tree is modified below, so take ownership of the shared parse
+            soup = document.soup(parser_type, take=True)
+        else:
+            soup = BeautifulSoup(html, parser_type)
         body = soup.body
         base_domain = get_base_domain(url)
 
@@ -1200,7 +1213,12 @@ class LXMLWebScrapingStrategy(WebScrapingStrategy):
 
         success = True
         try:
-            doc = lhtml.document_fromstring(html)
+            document = kwargs.get("document")
+            if document is not None and document.matches(html):
+                # The tree is modified below, so take ownership of the shared parse
+                doc = document.lxml_tree(take=True)
+            else:
+                doc = lhtml.document_fromstring(html)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
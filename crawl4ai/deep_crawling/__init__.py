@@ -3,6 +3,16 @@ from .base_strategy import DeepCrawlDecorator, DeepCrawlStrategy
 from .bfs_strategy import BFSDeepCrawlStrategy
 from .bff_strategy import BestFirstCrawlingStrategy
 from .dfs_strategy import DFSDeepCrawlStrategy
+from .parallel import MultiProcessDeepCrawlStrategy
+from .frontier import CrawlFrontier, FrontierEntry
+from .frontier_store import (
+    BloomFilter,
+    FrontierStore,
+    MemoryFrontierStore,
+    SQLiteFrontierStore,
+)
+from .seeding import SitemapEntry, SitemapSeeder
+from .dedup import NearDuplicateDetector, SimHashIndex
 from .filters import (
     FilterChain,
     ContentTypeFilter,
@@ -11,6 +21,7 @@ from .filters import (
     URLPatternFilter,
     FilterStats,
     ContentRelevanceFilter,
+    HeadSectionFilter,
     SEOFilter
 )
 from .scorers import (
@@ -29,6 +40,17 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "MultiProcessDeepCrawlStrategy",
+    "CrawlFrontier",
+    "FrontierEntry",
+    "FrontierStore",
+    "MemoryFrontierStore",
+    "SQLiteFrontierStore",
+    "BloomFilter",
+    "SitemapSeeder",
+    "SitemapEntry",
+    "NearDuplicateDetector",
+    "SimHashIndex",
     "FilterChain",
     "ContentTypeFilter",
     "DomainFilter",
@@ -36,6 +58,7 @@ __all__ = [
     "URLPatternFilter",
     "FilterStats",
     "ContentRelevanceFilter",
+    "HeadSectionFilter",
     "SEOFilter",
     "KeywordRelevanceScorer",
     "URLScorer",
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import os
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Optional, Set, List, Dict
+from datetime import datetime
+from typing import Any, AsyncGenerator, Optional, Set, List, Dict
 from functools import wraps
+from urllib.parse import urlparse
 from contextvars import ContextVar
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
+from ..utils import normalize_links_for_deep_crawl, normalize_url_for_deep_crawl
+from .frontier import CrawlFrontier
+from .frontier_store import FrontierStore, SQLiteFrontierStore
+from .seeding import SitemapSeeder
+from .dedup import NearDuplicateDetector
 
 
 class DeepCrawlDecorator:
@@ -32,6 +41,9 @@ class DeepCrawlDecorator:
                             async for result in result_obj:
                                 yield result
                         finally:
+                            # Close the strategy's generator now, not when it is
+                            # garbage collected, so its cleanup runs in this context
+                            await result_obj.aclose()
                             self.deep_crawl_active.reset(token)
                     return result_wrapper()
                 else:
@@ -42,6 +54,16 @@ class DeepCrawlDecorator:
             return await original_arun(url, config=config, **kwargs)
         return wrapped_arun
 
+def chain_filtered(can_process_url):
+    """
+    Marks a can_process_url that is just validate_url() followed, past depth 0,
+    by filter_chain.apply(); filter_urls then runs the chain over whole batches.
+    Overriding can_process_url again drops the mark.
+    """
+    can_process_url.chain_filtered = True
+    return can_process_url
+
+
 class DeepCrawlStrategy(ABC):
     """
     Abstract base class for deep crawling strategies.
@@ -53,6 +75,21 @@ class DeepCrawlStrategy(ABC):
       - _process_links: Extract and process links from a CrawlResult.
     """
 
+    # Whether collect_links also returns external links
+    include_external: bool = False
+    # Storage for the frontier of each run; None keeps it in memory
+    frontier_store: Optional[FrontierStore] = None
+    # Checkpoint file written during a run, results between checkpoints, and the
+    # checkpoint a run continues from
+    checkpoint_path: Optional[str] = None
+    checkpoint_interval: int = 100
+    resume_from: Optional[str] = None
+    _checkpoint_store: Optional[SQLiteFrontierStore] = None
+    # Source of URLs queued before the first page is crawled
+    seeder: Optional[SitemapSeeder] = None
+    # Detector of pages whose links are not followed because their content repeats
+    near_duplicates: Optional[NearDuplicateDetector] = None
+
     @abstractmethod
     async def _arun_batch(
         self,
@@ -98,11 +135,26 @@ class DeepCrawlStrategy(ABC):
         """
         if config is None:
             raise ValueError("CrawlerRunConfig must be provided")
+        if self.near_duplicates is not None:
+            self.near_duplicates.reset()
 
         if config.stream:
-            return self._arun_stream(start_url, crawler, config)
+            return self._close_after(self._arun_stream(start_url, crawler, config))
         else:
-            return await self._arun_batch(start_url, crawler, config)
+            try:
+                return await self._arun_batch(start_url, crawler, config)
+            finally:
+                self.close_frontier()
+
+    async def _close_after(
+        self, results: AsyncGenerator[CrawlResult, None]
+    ) -> AsyncGenerator[CrawlResult, None]:
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+            self.close_frontier()
 
     def __call__(self, start_url: str, crawler: AsyncWebCrawler, config: CrawlerRunConfig):
         return self.arun(start_url, crawler, config)
@@ -128,6 +180,266 @@ class DeepCrawlStrategy(ABC):
         """
         pass
 
+    def validate_url(self, url: str) -> bool:
+        """
+        Whether the URL is an http(s) URL with a dotted host; logs a warning if not.
+        """
+        try:
+            parsed = urlparse(url)
+            if not parsed.scheme or not parsed.netloc:
+                raise ValueError("Missing scheme or netloc")
+            if parsed.scheme not in ("http", "https"):
+                raise ValueError("Invalid scheme")
+            if "." not in parsed.netloc:
+                raise ValueError("Invalid domain")
+        except Exception as e:
+            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+            return False
+        return True
+
+    def create_frontier(self) -> CrawlFrontier:
+        """
+        The frontier for a new run.
+
+        With `resume_from` the frontier, `_pages_crawled` and `stats` are restored from
+        that checkpoint, and URLs that were in flight when it was written are queued
+        again; the start URL is already known, so adding it again is a no-op.
+        Otherwise the frontier starts empty, in `checkpoint_path` if set, or over
+        `frontier_store` once it is cleared.
+        """
+        self._checkpoint_store = None
+        self._since_checkpoint = 0
+        self._recorded_pages = getattr(self, "_pages_crawled", 0)
+        if self.resume_from or self.checkpoint_path:
+            if self.frontier_store is not None:
+                raise ValueError(
+                    "frontier_store cannot be combined with checkpoint_path or resume_from"
+                )
+            path = self.checkpoint_path or self.resume_from
+            if self.resume_from:
+                if not os.path.exists(self.resume_from):
+                    raise FileNotFoundError(f"Checkpoint not found: {self.resume_from}")
+                if os.path.abspath(path) != os.path.abspath(self.resume_from):
+                    source, target = sqlite3.connect(self.resume_from), sqlite3.connect(path)
+                    try:
+                        source.backup(target)
+                    finally:
+                        source.close()
+                        target.close()
+            # Commit only at checkpoints, so the frontier and the counters saved next to
+            # it always describe the same moment
+            store = self._checkpoint_store = SQLiteFrontierStore(path, commit_interval=0)
+            if not self.resume_from:
+                store.clear()
+                return CrawlFrontier(store)
+            frontier = CrawlFrontier(store)
+            self._restore_state(store.load_state() or {})
+            requeued = frontier.requeue_unfinished()
+            logger = getattr(self, "logger", None)
+            if logger:
+                logger.info(
+                    f"Resuming from {self.resume_from}: {len(frontier)} URLs queued, "
+                    f"{requeued} of them were in flight"
+                )
+            return frontier
+        if self.frontier_store is None:
+            return CrawlFrontier()
+        self.frontier_store.clear()
+        return CrawlFrontier(self.frontier_store)
+
+    def link_priority(self, depth: int, score: float) -> Optional[float]:
+        """Frontier priority of a new link, lowest first; None orders links by depth."""
+        return None
+
+    def queue_priority(self, url: str, depth: int, score: float) -> Optional[float]:
+        """
+        link_priority() of a link, raised by the duplicate penalty of its URL
+        pattern, so links to patterns that keep repeating content go last.
+        """
+        priority = self.link_priority(depth, score)
+        penalty = self.duplicate_penalty(url)
+        if penalty:
+            priority = (depth if priority is None else priority) + penalty
+        return priority
+
+    def duplicate_penalty(self, url: str) -> float:
+        """Share of crawled pages of the URL's pattern that were near-duplicates."""
+        if self.near_duplicates is None:
+            return 0.0
+        return self.near_duplicates.duplicate_rate(url)
+
+    def crawl_config(self, config: CrawlerRunConfig, stream: bool) -> CrawlerRunConfig:
+        """
+        The config the strategy's own arun_many calls run with: no deep crawling, the
+        given stream mode, and content fingerprints when `near_duplicates` is set.
+        """
+        if self.near_duplicates is not None:
+            return config.clone(deep_crawl_strategy=None, stream=stream, content_fingerprint=True)
+        return config.clone(deep_crawl_strategy=None, stream=stream)
+
+    def is_near_duplicate(self, url: str, result: CrawlResult) -> bool:
+        """
+        Check a successful result against the pages crawled so far. A near-duplicate
+        gets the URL of the page it repeats as `metadata["near_duplicate_of"]`, and
+        its links should not be followed. Call it before yielding the result, so
+        consumers see that metadata.
+        """
+        if self.near_duplicates is None or not result.success:
+            return False
+        original = self.near_duplicates.check(url, self.near_duplicates.fingerprint(result))
+        if original is None:
+            return False
+        result.metadata = result.metadata or {}
+        result.metadata["near_duplicate_of"] = original
+        logger = getattr(self, "logger", None)
+        if logger:
+            logger.debug(f"{url} is a near-duplicate of {original}, not following its links")
+        return True
+
+    async def seed_frontier(self, frontier: CrawlFrontier, start_url: str) -> int:
+        """
+        Queue the URLs the `seeder` lists for the start URL's site at depth 1, with
+        the start URL as parent, before any page is crawled. They go through
+        filter_urls, the scorer and score_threshold like discovered links, a batch
+        at a time, and their lastmod dates are handed to the scorer first. Seeding
+        stops once the seeds fill max_pages. A resumed run is not seeded again.
+
+        Returns:
+            int: The number of URLs queued.
+        """
+        if self.seeder is None or self.resume_from or getattr(self, "max_depth", 0) < 1:
+            return 0
+        budget = getattr(self, "max_pages", float("inf")) - 1
+        scorer = getattr(self, "url_scorer", None)
+        threshold = getattr(self, "score_threshold", float("-inf"))
+        queued = 0
+        batches = self.seeder.seed_batches(start_url)
+        try:
+            async for batch in batches:
+                lastmods: Dict[str, Any] = {}
+                for entry in batch:
+                    try:
+                        url = normalize_url_for_deep_crawl(entry.url, start_url)
+                    except ValueError:
+                        continue
+                    if url and url not in frontier:
+                        lastmods[url] = entry.lastmod
+                urls = await self.filter_urls(list(lastmods), 1)
+                if scorer is not None:
+                    scorer.record_lastmod(
+                        {url: lastmods[url] for url in urls if lastmods[url]}
+                    )
+                    scores = scorer.score_many(urls).tolist()
+                else:
+                    scores = [0] * len(urls)
+                for url, score in zip(urls, scores):
+                    if score < threshold:
+                        continue
+                    if queued >= budget:
+                        return queued
+                    frontier.add(
+                        url, 1, start_url, score=score, priority=self.queue_priority(url, 1, score)
+                    )
+                    queued += 1
+        finally:
+            await batches.aclose()
+            logger = getattr(self, "logger", None)
+            if logger and queued:
+                logger.info(f"Seeded {queued} URLs from sitemaps of {start_url}")
+        return queued
+
+    def record_result(self, frontier: CrawlFrontier, url: str, result: CrawlResult) -> None:
+        """
+        Mark a URL done once its result has been yielded and its links queued, and
+        write a checkpoint every `checkpoint_interval` results.
+        """
+        frontier.complete(url)
+        # Pages counted for results that were never recorded are fetched again on
+        # resume, so checkpoints keep the count as of the last recorded result
+        self._recorded_pages = getattr(self, "_pages_crawled", 0)
+        stats = getattr(self, "stats", None)
+        if stats is not None:
+            stats.urls_processed += 1
+            if not result.success:
+                stats.urls_failed += 1
+            depth = (result.metadata or {}).get("depth", 0)
+            stats.current_depth = depth
+            stats.total_depth_reached = max(stats.total_depth_reached, depth)
+        if self._checkpoint_store is not None:
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= self.checkpoint_interval:
+                self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Save the crawl counters and commit the frontier to `checkpoint_path`."""
+        if self._checkpoint_store is None:
+            return
+        state: Dict[str, Any] = {"pages_crawled": self._recorded_pages}
+        stats = getattr(self, "stats", None)
+        if stats is not None:
+            state["stats"] = {
+                "start_time": stats.start_time.isoformat(),
+                "urls_processed": stats.urls_processed,
+                "urls_failed": stats.urls_failed,
+                "urls_skipped": stats.urls_skipped,
+                "total_depth_reached": stats.total_depth_reached,
+                "current_depth": stats.current_depth,
+            }
+        self._checkpoint_store.save_state(state)
+        self._checkpoint_store.flush()
+        self._since_checkpoint = 0
+
+    def close_frontier(self) -> None:
+        """Write a last checkpoint at the end of a run and close the checkpoint file."""
+        if self._checkpoint_store is not None:
+            self.checkpoint()
+            self._checkpoint_store.close()
+            self._checkpoint_store = None
+
+    def _restore_state(self, state: Dict[str, Any]) -> None:
+        self._pages_crawled = self._recorded_pages = state.get("pages_crawled", 0)
+        stats = getattr(self, "stats", None)
+        saved = state.get("stats")
+        if stats is not None and saved:
+            for name, value in saved.items():
+                if name == "start_time":
+                    value = datetime.fromisoformat(value)
+                setattr(stats, name, value)
+
+    def collect_links(self, result: CrawlResult, source_url: str, visited) -> List[str]:
+        """
+        Normalized, distinct links of a page that are not in `visited`, in page order.
+
+        `visited` can be any container supporting `in`, such as a set or a CrawlFrontier.
+        """
+        links = result.links.get("internal", [])
+        if self.include_external:
+            links = links + result.links.get("external", [])
+        urls = normalize_links_for_deep_crawl([link.get("href") for link in links], source_url)
+        return [url for url in urls if url not in visited]
+
+    async def filter_urls(self, urls: List[str], depth: int) -> List[str]:
+        """
+        The URLs that pass can_process_url at the given depth, in order.
+        Rejected URLs are counted in `stats.urls_skipped` when the strategy keeps stats.
+        """
+        accepted = []
+        stats = getattr(self, "stats", None)
+        if getattr(type(self).can_process_url, "chain_filtered", False):
+            accepted = [url for url in urls if self.validate_url(url)]
+            if depth != 0:
+                decisions = await self.filter_chain.apply_many(accepted)
+                accepted = [url for url, passed in zip(accepted, decisions) if passed]
+            if stats is not None:
+                stats.urls_skipped += len(urls) - len(accepted)
+            return accepted
+        for url in urls:
+            if await self.can_process_url(url, depth):
+                accepted.append(url)
+            elif stats is not None:
+                stats.urls_skipped += 1
+        return accepted
+
     @abstractmethod
     async def link_discovery(
         self,
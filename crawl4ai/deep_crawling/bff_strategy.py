@@ -3,12 +3,14 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
-from urllib.parse import urlparse
 
 from ..models import TraversalStats
 from .filters import FilterChain
 from .scorers import URLScorer
-from . import DeepCrawlStrategy
+from .frontier_store import FrontierStore
+from .seeding import SitemapSeeder
+from .dedup import NearDuplicateDetector
+from .base_strategy import DeepCrawlStrategy, chain_filtered
 
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
 
@@ -31,6 +33,23 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
       - _arun_best_first: Core generator that uses a priority queue to yield CrawlResults.
       - can_process_url: Validates URLs and applies filtering (inherited behavior).
       - link_discovery: Extracts and validates links from a CrawlResult.
+
+    `frontier_store` holds the priority queue and the set of known URLs; pass a
+    SQLiteFrontierStore to keep memory bounded on very large crawls.
+
+    With `checkpoint_path` the queue, the known URLs with their depths and scores, the
+    page count and `stats` are written to that file every `checkpoint_interval`
+    results; `resume_from` continues an interrupted crawl from such a checkpoint
+    without fetching or scoring finished pages again.
+
+    A `seeder`, such as a SitemapSeeder, queues the URLs the site lists in its
+    sitemaps at depth 1, scored like discovered links, before the start page is
+    crawled. Their lastmod dates reach a FreshnessScorer through record_lastmod.
+
+    With `near_duplicates`, a NearDuplicateDetector, the links of a page whose
+    content nearly matches a page crawled earlier in the run are not followed, and
+    the priority of a new link is raised by the share of near-duplicates among the
+    crawled pages of its URL pattern, so those patterns are crawled last.
     """
     def __init__(
         self,
@@ -40,6 +59,12 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         include_external: bool = False,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        frontier_store: Optional[FrontierStore] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 100,
+        resume_from: Optional[str] = None,
+        seeder: Optional[SitemapSeeder] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -47,25 +72,23 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         self.include_external = include_external
         self.max_pages = max_pages
         self.logger = logger or logging.getLogger(__name__)
+        self.frontier_store = frontier_store
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.resume_from = resume_from
+        self.seeder = seeder
+        self.near_duplicates = near_duplicates
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
 
+    @chain_filtered
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
         Validate the URL format and apply filtering.
         For the starting URL (depth 0), filtering is bypassed.
         """
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
-        except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+        if not self.validate_url(url):
             return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
@@ -97,25 +120,14 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
             self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping link discovery")
             return
 
-        # Retrieve internal links; include external links if enabled.
-        links = result.links.get("internal", [])
-        if self.include_external:
-            links += result.links.get("external", [])
-
-        # If we have more links than remaining capacity, limit how many we'll process
-        valid_links = []
-        for link in links:
-            url = link.get("href")
-            if url in visited:
-                continue
-            if not await self.can_process_url(url, new_depth):
-                self.stats.urls_skipped += 1
-                continue
-                
-            valid_links.append(url)
+        # Normalize, deduplicate and filter the whole page at once
+        valid_links = self.collect_links(result, source_url, visited)
+        valid_links = await self.filter_urls(valid_links, new_depth)
             
         # If we have more valid links than capacity, limit them
         if len(valid_links) > remaining_capacity:
+            if self.near_duplicates:
+                valid_links.sort(key=self.duplicate_penalty)
             valid_links = valid_links[:remaining_capacity]
             self.logger.info(f"Limiting to {remaining_capacity} URLs due to max_pages limit")
             
@@ -124,6 +136,10 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
             depths[url] = new_depth
             next_links.append((url, source_url))
 
+    def link_priority(self, depth: int, score: float) -> Optional[float]:
+        """Links are queued by score."""
+        return score
+
     async def _arun_best_first(
         self,
         start_url: str,
@@ -133,68 +149,71 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         """
         Core best-first crawl method using a priority queue.
         
-        The queue items are tuples of (score, depth, url, parent_url). Lower scores
-        are treated as higher priority. URLs are processed in batches for efficiency.
+        The frontier is ordered by score. Lower scores are treated as higher priority.
+        URLs are processed in batches for efficiency.
         """
-        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
-        # Push the initial URL with score 0 and depth 0.
-        await queue.put((0, 0, start_url, None))
-        visited: Set[str] = set()
-        depths: Dict[str, int] = {start_url: 0}
+        # The frontier knows every URL queued so far, so links are deduplicated as
+        # they are discovered and results find their entry in O(1)
+        frontier = self.create_frontier()
+        frontier.add(start_url, depth=0, priority=0)
+        await self.seed_frontier(frontier, start_url)
 
-        while not queue.empty() and not self._cancel_event.is_set():
+        while frontier and not self._cancel_event.is_set():
             # Stop if we've reached the max pages limit
             if self._pages_crawled >= self.max_pages:
                 self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
                 break
                 
-            batch: List[Tuple[float, int, str, Optional[str]]] = []
-            # Retrieve up to BATCH_SIZE items from the priority queue.
-            for _ in range(BATCH_SIZE):
-                if queue.empty():
-                    break
-                item = await queue.get()
-                score, depth, url, parent_url = item
-                if url in visited:
-                    continue
-                visited.add(url)
-                batch.append(item)
-
-            if not batch:
-                continue
+            # Retrieve up to BATCH_SIZE items from the frontier.
+            # Never start more URLs than the remaining page budget.
+            batch = frontier.pop_many(min(BATCH_SIZE, self.max_pages - self._pages_crawled))
+            batch_urls = {url for url, _ in batch}
 
             # Process the current batch of URLs.
-            urls = [item[2] for item in batch]
-            batch_config = config.clone(deep_crawl_strategy=None, stream=True)
+            urls = [url for url, _ in batch]
+            batch_config = self.crawl_config(config, stream=True)
             stream_gen = await crawler.arun_many(urls=urls, config=batch_config)
             async for result in stream_gen:
                 result_url = result.url
-                # Find the corresponding tuple from the batch.
-                corresponding = next((item for item in batch if item[2] == result_url), None)
-                if not corresponding:
+                if result_url not in batch_urls:
                     continue
-                score, depth, url, parent_url = corresponding
+                entry = frontier.get(result_url)
+                depth = entry.depth
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                result.metadata["parent_url"] = parent_url
-                result.metadata["score"] = score
+                result.metadata["parent_url"] = entry.parent
+                result.metadata["score"] = entry.score
                 
                 # Count only successful crawls toward max_pages limit
                 if result.success:
                     self._pages_crawled += 1
                 
+                duplicate = self.is_near_duplicate(result_url, result)
                 yield result
                 
                 # Only discover links from successful crawls
-                if result.success:
+                if result.success and not duplicate:
                     # Discover new links from this result
                     new_links: List[Tuple[str, Optional[str]]] = []
-                    await self.link_discovery(result, result_url, depth, visited, new_links, depths)
+                    depths: Dict[str, int] = {}
+                    await self.link_discovery(result, result_url, depth, frontier, new_links, depths)
                     
-                    for new_url, new_parent in new_links:
+                    # Score the page's new links in one call
+                    new_scores = (
+                        self.url_scorer.score_many([new_url for new_url, _ in new_links]).tolist()
+                        if self.url_scorer
+                        else [0] * len(new_links)
+                    )
+                    for (new_url, new_parent), new_score in zip(new_links, new_scores):
                         new_depth = depths.get(new_url, depth + 1)
-                        new_score = self.url_scorer.score(new_url) if self.url_scorer else 0
-                        await queue.put((new_score, new_depth, new_url, new_parent))
+                        frontier.add(
+                            new_url,
+                            new_depth,
+                            new_parent,
+                            score=new_score,
+                            priority=self.queue_priority(new_url, new_depth, new_score),
+                        )
+                self.record_result(frontier, result_url, result)
 
         # End of crawl.
 
@@ -240,12 +259,7 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         Returns either a list (batch mode) or an async generator (stream mode)
         of CrawlResults.
         """
-        if config is None:
-            raise ValueError("CrawlerRunConfig must be provided")
-        if config.stream:
-            return self._arun_stream(start_url, crawler, config)
-        else:
-            return await self._arun_batch(start_url, crawler, config)
+        return await super().arun(start_url, crawler, config)
 
     async def shutdown(self) -> None:
         """
@@ -3,14 +3,16 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
-from urllib.parse import urlparse
 
 from ..models import TraversalStats
 from .filters import FilterChain
 from .scorers import URLScorer
-from . import DeepCrawlStrategy  
-from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
-from ..utils import normalize_url_for_deep_crawl, efficient_normalize_url_for_deep_crawl
+from .frontier import CrawlFrontier
+from .frontier_store import FrontierStore
+from .seeding import SitemapSeeder
+from .dedup import NearDuplicateDetector
+from .base_strategy import DeepCrawlStrategy, chain_filtered  
+from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, BaseDispatcher
 from math import inf as infinity
 
 class BFSDeepCrawlStrategy(DeepCrawlStrategy):
@@ -21,6 +23,32 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
       - arun: Main entry point; splits execution into batch or stream modes.
       - link_discovery: Extracts, filters, and (if needed) scores the outgoing URLs.
       - can_process_url: Validates URL format and applies the filter chain.
+
+    By default each depth level is crawled with its own arun_many call, and the next
+    level starts once the whole level is done. With `pipelined=True` a single arun_many
+    call is fed from a depth-ordered frontier instead: a discovered URL starts as soon
+    as a session slot frees up, the shallowest queued URL always goes first, and
+    max_pages caps started crawls so no more than max_pages succeed. `dispatcher` is
+    passed to arun_many in both modes.
+
+    `frontier_store` holds the frontier and the set of known URLs; pass a
+    SQLiteFrontierStore to keep memory bounded on very large crawls. It is cleared at
+    the start of each run. DFSDeepCrawlStrategy keeps its own stack and ignores it.
+
+    With `checkpoint_path` the frontier, the known URLs with their depths and scores,
+    the page count and `stats` are written to that file every `checkpoint_interval`
+    results. A crawl started with `resume_from` pointing at a checkpoint continues
+    where that one stopped: finished pages are not fetched again, and pages that were
+    in flight are queued again. Results returned before the checkpoint are not.
+
+    A `seeder`, such as a SitemapSeeder, queues the URLs the site lists in its
+    sitemaps at depth 1 before the start page is crawled; see seed_frontier.
+    DFSDeepCrawlStrategy ignores it.
+
+    With `near_duplicates`, a NearDuplicateDetector, the links of a page whose
+    content nearly matches a page crawled earlier in the run are not followed, and
+    links whose URL pattern keeps producing such pages are queued after the others
+    of their depth, and are the first dropped when max_pages limits a level.
     """
     def __init__(
         self,
@@ -31,6 +59,14 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         score_threshold: float = -infinity,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        pipelined: bool = False,
+        dispatcher: Optional[BaseDispatcher] = None,
+        frontier_store: Optional[FrontierStore] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = 100,
+        resume_from: Optional[str] = None,
+        seeder: Optional[SitemapSeeder] = None,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -39,25 +75,25 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.score_threshold = score_threshold
         self.max_pages = max_pages
         self.logger = logger or logging.getLogger(__name__)
+        self.frontier_store = frontier_store
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.resume_from = resume_from
+        self.seeder = seeder
+        self.near_duplicates = near_duplicates
+        self.pipelined = pipelined
+        self.dispatcher = dispatcher
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
 
+    @chain_filtered
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
         Validates the URL and applies the filter chain.
         For the start URL (depth 0) filtering is bypassed.
         """
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
-        except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+        if not self.validate_url(url):
             return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
@@ -78,8 +114,9 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Extracts links from the crawl result, validates and scores them, and
         prepares the next level of URLs.
         Each valid URL is appended to next_level as a tuple (url, parent_url)
-        and its depth is tracked.
-        """            
+        and its depth is tracked. URLs in `visited` (a set or a CrawlFrontier) are
+        skipped.
+        """
         next_depth = current_depth + 1
         if next_depth > self.max_depth:
             return
@@ -90,41 +127,28 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping link discovery")
             return
 
-        # Get internal links and, if enabled, external links.
-        links = result.links.get("internal", [])
-        if self.include_external:
-            links += result.links.get("external", [])
+        # Normalize, deduplicate and filter the whole page at once
+        urls = self.collect_links(result, source_url, visited)
+        urls = await self.filter_urls(urls, next_depth)
 
-        valid_links = []
-        
-        # First collect all valid links
-        for link in links:
-            url = link.get("href")
-            # Strip URL fragments to avoid duplicate crawling
-            # base_url = url.split('#')[0] if url else url
-            base_url = normalize_url_for_deep_crawl(url, source_url)
-            if base_url in visited:
-                continue
-            if not await self.can_process_url(url, next_depth):
-                self.stats.urls_skipped += 1
-                continue
+        # Score the whole page at once if a scorer is provided
+        scores = self.url_scorer.score_many(urls).tolist() if self.url_scorer else [0] * len(urls)
 
-            # Score the URL if a scorer is provided
-            score = self.url_scorer.score(base_url) if self.url_scorer else 0
-            
+        valid_links = []
+        for url, score in zip(urls, scores):
             # Skip URLs with scores below the threshold
             if score < self.score_threshold:
                 self.logger.debug(f"URL {url} skipped: score {score} below threshold {self.score_threshold}")
                 self.stats.urls_skipped += 1
                 continue
             
-            valid_links.append((base_url, score))
+            valid_links.append((url, score))
         
         # If we have more valid links than capacity, sort by score and take the top ones
         if len(valid_links) > remaining_capacity:
-            if self.url_scorer:
-                # Sort by score in descending order
-                valid_links.sort(key=lambda x: x[1], reverse=True)
+            if self.url_scorer or self.near_duplicates:
+                # Sort by duplicate penalty, then by score in descending order
+                valid_links.sort(key=lambda x: (self.duplicate_penalty(x[0]), -x[1]))
             # Take only as many as we have capacity for
             valid_links = valid_links[:remaining_capacity]
             self.logger.info(f"Limiting to {remaining_capacity} URLs due to max_pages limit")
@@ -148,21 +172,25 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
-        visited: Set[str] = set()
-        # current_level holds tuples: (url, parent_url)
-        current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-        depths: Dict[str, int] = {start_url: 0}
+        if self.pipelined:
+            return [result async for result in self._arun_pipelined(start_url, crawler, config)]
+
+        # The frontier knows every URL queued so far, so links are deduplicated as
+        # they are discovered and results find their depth and parent in O(1)
+        frontier = self.create_frontier()
+        frontier.add(start_url, depth=0)
+        await self.seed_frontier(frontier, start_url)
 
         results: List[CrawlResult] = []
 
-        while current_level and not self._cancel_event.is_set():
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
-            visited.update(urls)
+        while frontier and not self._cancel_event.is_set():
+            urls = [url for url, _ in frontier.drain()]
 
             # Clone the config to disable deep crawling recursion and enforce batch mode.
-            batch_config = config.clone(deep_crawl_strategy=None, stream=False)
-            batch_results = await crawler.arun_many(urls=urls, config=batch_config)
+            batch_config = self.crawl_config(config, stream=False)
+            batch_results = await crawler.arun_many(
+                urls=urls, config=batch_config, dispatcher=self.dispatcher
+            )
             
             # Update pages crawled counter - count only successful crawls
             successful_results = [r for r in batch_results if r.success]
@@ -170,22 +198,35 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             
             for result in batch_results:
                 url = result.url
-                depth = depths.get(url, 0)
+                entry = frontier.get(url)
+                depth = entry.depth if entry else 0
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = entry.parent if entry else None
                 results.append(result)
                 
                 # Only discover links from successful crawls
-                if result.success:
+                if result.success and not self.is_near_duplicate(url, result):
                     # Link discovery will handle the max pages limit internally
-                    await self.link_discovery(result, url, depth, visited, next_level, depths)
-
-            current_level = next_level
+                    await self._discover(result, url, depth, frontier)
+                self.record_result(frontier, url, result)
 
         return results
 
+    async def _discover(
+        self, result: CrawlResult, url: str, depth: int, frontier: CrawlFrontier, visited=None
+    ) -> None:
+        """Run link discovery for a result and queue the new links in the frontier."""
+        next_level: List[Tuple[str, Optional[str]]] = []
+        depths: Dict[str, int] = {}
+        await self.link_discovery(
+            result, url, depth, frontier if visited is None else visited, next_level, depths
+        )
+        for link, parent in next_level:
+            frontier.add(
+                link, depths[link], parent, priority=self.queue_priority(link, depths[link], 0)
+            )
+
     async def _arun_stream(
         self,
         start_url: str,
@@ -196,46 +237,124 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
-        visited: Set[str] = set()
-        current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-        depths: Dict[str, int] = {start_url: 0}
+        if self.pipelined:
+            pipelined = self._arun_pipelined(start_url, crawler, config)
+            try:
+                async for result in pipelined:
+                    yield result
+            finally:
+                await pipelined.aclose()
+            return
+
+        frontier = self.create_frontier()
+        frontier.add(start_url, depth=0)
+        await self.seed_frontier(frontier, start_url)
 
-        while current_level and not self._cancel_event.is_set():
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
-            visited.update(urls)
+        while frontier and not self._cancel_event.is_set():
+            urls = [url for url, _ in frontier.drain()]
 
-            stream_config = config.clone(deep_crawl_strategy=None, stream=True)
-            stream_gen = await crawler.arun_many(urls=urls, config=stream_config)
+            stream_config = self.crawl_config(config, stream=True)
+            stream_gen = await crawler.arun_many(
+                urls=urls, config=stream_config, dispatcher=self.dispatcher
+            )
             
             # Keep track of processed results for this batch
             results_count = 0
             async for result in stream_gen:
                 url = result.url
-                depth = depths.get(url, 0)
+                entry = frontier.get(url)
+                depth = entry.depth if entry else 0
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = entry.parent if entry else None
                 
                 # Count only successful crawls
                 if result.success:
                     self._pages_crawled += 1
                 
                 results_count += 1
+                # Checked before yielding, so the result carries near_duplicate_of
+                duplicate = self.is_near_duplicate(url, result)
                 yield result
                 
                 # Only discover links from successful crawls
-                if result.success:
+                if result.success and not duplicate:
                     # Link discovery will handle the max pages limit internally
-                    await self.link_discovery(result, url, depth, visited, next_level, depths)
+                    await self._discover(result, url, depth, frontier)
+                self.record_result(frontier, url, result)
             
             # If we didn't get results back (e.g. due to errors), avoid getting stuck in an infinite loop
             # by considering these URLs as visited but not counting them toward the max_pages limit
             if results_count == 0 and urls:
                 self.logger.warning(f"No results returned for {len(urls)} URLs, marking as visited")
-                
-            current_level = next_level
+
+    async def _arun_pipelined(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Pipelined mode:
+        Feeds one long-lived arun_many call from a frontier ordered by depth, yielding
+        results as they arrive. A URL rediscovered at a smaller depth before it starts
+        moves up to that depth, so recorded depths match level-by-level BFS unless the
+        shorter path is only found after the URL has started.
+        """
+        frontier = self.create_frontier()
+        frontier.add(start_url, depth=0)
+        await self.seed_frontier(frontier, start_url)
+        in_flight = 0
+        progress = asyncio.Event()
+
+        async def feed():
+            nonlocal in_flight
+            while not self._cancel_event.is_set():
+                # Stop starting crawls once the running ones could fill max_pages
+                if frontier and self._pages_crawled + in_flight < self.max_pages:
+                    url, _ = frontier.pop()
+                    in_flight += 1
+                    yield url
+                elif in_flight:
+                    progress.clear()
+                    await progress.wait()
+                else:
+                    return
+
+        stream_config = self.crawl_config(config, stream=True)
+        stream_gen = await crawler.arun_many(
+            urls=feed(), config=stream_config, dispatcher=self.dispatcher
+        )
+        try:
+            async for result in stream_gen:
+                url = result.url
+                entry = frontier.get(url)
+                depth = entry.depth if entry else 0
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = depth
+                result.metadata["parent_url"] = entry.parent if entry else None
+                if result.success:
+                    self._pages_crawled += 1
+
+                try:
+                    # Checked before yielding, so the result carries near_duplicate_of
+                    duplicate = self.is_near_duplicate(url, result)
+                    yield result
+
+                    # Only discover links from successful crawls
+                    # Only URLs that have started are skipped; queued ones may still
+                    # move up to a smaller depth
+                    if result.success and not duplicate:
+                        await self._discover(result, url, depth, frontier, frontier.started)
+                    self.record_result(frontier, url, result)
+                finally:
+                    # New links are queued before the slot counts as free, so the
+                    # feed never sees an empty frontier while a page is still pending
+                    in_flight -= 1
+                    progress.set()
+        finally:
+            # Stops the dispatcher's crawls when the consumer leaves early
+            await stream_gen.aclose()
 
     async def shutdown(self) -> None:
         """
@@ -0,0 +1,139 @@
+# dedup.py
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+from ..models import CrawlResult
+from ..utils import simhash_fingerprint
+
+_DIGIT = re.compile(r"\d")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of bits in which two fingerprints differ."""
+    return bin(a ^ b).count("1")
+
+
+def url_pattern(url: str) -> str:
+    """
+    The pattern a URL is counted under: its host and path, with path segments that
+    contain digits masked, and the names of its query parameters without their values.
+    """
+    parsed = urlparse(url)
+    path = "/".join("*" if _DIGIT.search(segment) else segment for segment in parsed.path.split("/"))
+    pattern = parsed.netloc.lower() + path
+    keys = sorted({key for key, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    if keys:
+        pattern += "?" + "&".join(keys)
+    return pattern
+
+
+class SimHashIndex:
+    """
+    Index of 64-bit SimHash fingerprints answering "is there one within
+    `max_distance` bits of this?" without comparing against all of them.
+
+    Fingerprints are split into `max_distance + 1` bands, each with its own hash
+    table. Two fingerprints at most `max_distance` bits apart agree on at least one
+    band, so only fingerprints sharing a band with the query are compared.
+    """
+
+    def __init__(self, max_distance: int = 6):
+        if not 0 <= max_distance < 64:
+            raise ValueError("max_distance must be between 0 and 63")
+        self.max_distance = max_distance
+        count = max_distance + 1
+        self._bands: List[Tuple[int, int]] = []
+        shift = 0
+        for band in range(count):
+            width = 64 // count + (band < 64 % count)
+            self._bands.append((shift, (1 << width) - 1))
+            shift += width
+        self._tables: List[Dict[int, List[Tuple[int, str]]]] = [{} for _ in self._bands]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, fingerprint: int, key: str) -> None:
+        for (shift, mask), table in zip(self._bands, self._tables):
+            table.setdefault((fingerprint >> shift) & mask, []).append((fingerprint, key))
+        self._size += 1
+
+    def query(self, fingerprint: int) -> Optional[str]:
+        """Key of the closest indexed fingerprint within max_distance, or None."""
+        best, best_distance = None, self.max_distance + 1
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for other, key in table.get((fingerprint >> shift) & mask, ()):
+                distance = hamming_distance(fingerprint, other)
+                if distance < best_distance:
+                    best, best_distance = key, distance
+                    if not distance:
+                        return best
+        return best
+
+
+class NearDuplicateDetector:
+    """
+    Spots pages of a deep crawl whose content nearly matches a page crawled earlier
+    in the same run, such as faceted listings, print views or session variants.
+
+    Pages are compared by the SimHash of their markdown, which the crawler computes
+    when `CrawlerRunConfig.content_fingerprint` is set; strategies given a detector
+    set it on the configs they crawl with. Only pages that are not near-duplicates
+    are indexed, so a chain of small edits does not drift away from the original.
+
+    Every checked page also counts towards its URL pattern (see url_pattern). Once
+    `min_samples` pages of a pattern have been checked, `duplicate_rate()` is the
+    share of them that were near-duplicates, and strategies queue new links of that
+    pattern behind the others.
+
+    Args:
+        max_distance: Pages whose fingerprints differ in at most this many of
+            their 64 bits are near-duplicates.
+        min_samples: Pages of a URL pattern checked before its duplicate rate counts.
+    """
+
+    def __init__(self, max_distance: int = 6, min_samples: int = 3):
+        self.max_distance = max_distance
+        self.min_samples = min_samples
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the pages of the previous run."""
+        self.index = SimHashIndex(self.max_distance)
+        # Pattern -> [pages checked, near-duplicates among them]
+        self._patterns: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def fingerprint(result: CrawlResult) -> int:
+        """The result's fingerprint, computed from its markdown if the crawler did not."""
+        if result.fingerprint is not None:
+            return result.fingerprint
+        return simhash_fingerprint(str(result.markdown or ""))
+
+    def check(self, url: str, fingerprint: int) -> Optional[str]:
+        """
+        Record a crawled page. Returns the URL of the earlier page it nearly
+        duplicates, or None and indexes it.
+
+        Pages without text, such as error or redirect stubs, all have fingerprint
+        0; they are neither indexed nor counted, so they never match each other.
+        """
+        if not fingerprint:
+            return None
+        original = self.index.query(fingerprint)
+        counts = self._patterns.setdefault(url_pattern(url), [0, 0])
+        counts[0] += 1
+        if original is None:
+            self.index.add(fingerprint, url)
+        else:
+            counts[1] += 1
+        return original
+
+    def duplicate_rate(self, url: str) -> float:
+        """Share of the checked pages of the URL's pattern that were near-duplicates."""
+        counts = self._patterns.get(url_pattern(url))
+        if not counts or counts[0] < self.min_samples:
+            return 0.0
+        return counts[1] / counts[0]
@@ -11,6 +11,7 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
 
     Inherits URL validation and link discovery from BFSDeepCrawlStrategy.
     Overrides _arun_batch and _arun_stream to use a stack (LIFO) for DFS traversal.
+    Links of near-duplicate pages are not followed either.
     """
     async def _arun_batch(
         self,
@@ -35,7 +36,7 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
             visited.add(url)
 
             # Clone config to disable recursive deep crawling.
-            batch_config = config.clone(deep_crawl_strategy=None, stream=False)
+            batch_config = self.crawl_config(config, stream=False)
             url_results = await crawler.arun_many(urls=[url], config=batch_config)
             
             for result in url_results:
@@ -49,6 +50,8 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                 # Count only successful crawls toward max_pages limit
                 if result.success:
                     self._pages_crawled += 1
+                    if self.is_near_duplicate(url, result):
+                        continue
                     
                     # Only discover links from successful crawls
                     new_links: List[Tuple[str, Optional[str]]] = []
@@ -80,7 +83,7 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                 continue
             visited.add(url)
 
-            stream_config = config.clone(deep_crawl_strategy=None, stream=True)
+            stream_config = self.crawl_config(config, stream=True)
             stream_gen = await crawler.arun_many(urls=[url], config=stream_config)
             async for result in stream_gen:
                 result.metadata = result.metadata or {}
@@ -88,12 +91,15 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                 result.metadata["parent_url"] = parent
                 if self.url_scorer:
                     result.metadata["score"] = self.url_scorer.score(url)
+                duplicate = self.is_near_duplicate(url, result)
                 yield result
 
                 # Only count successful crawls toward max_pages limit
                 # and only discover links from successful crawls
                 if result.success:
                     self._pages_crawled += 1
+                    if duplicate:
+                        continue
                     
                     new_links: List[Tuple[str, Optional[str]]] = []
                     await self.link_discovery(result, url, depth, visited, new_links, depths)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Pattern, Set, Union
+from typing import AsyncGenerator, Iterable, List, Optional, Pattern, Set, Tuple, Union
 from urllib.parse import urlparse
 from array import array
 import re
@@ -11,7 +11,7 @@ import weakref
 import math
 from collections import defaultdict
 from typing import Dict
-from ..utils import HeadPeekr
+from ..utils import HeadFetcher, HeadSection
 import asyncio
 import inspect
 
@@ -59,22 +59,34 @@ class URLFilter(ABC):
     def apply(self, url: str) -> bool:
         pass
 
+    def apply_many(self, urls: List[str]) -> List[bool]:
+        """Apply a synchronous filter to a batch of URLs"""
+        return [self.apply(url) for url in urls]
+
     def _update_stats(self, passed: bool):
         # Use direct array index for speed
         self.stats._counters[0] += 1  # total
         self.stats._counters[1] += passed  # passed
         self.stats._counters[2] += not passed  # rejected
 
+    def _update_stats_many(self, results: List[bool]):
+        passed = sum(results)
+        self.stats._counters[0] += len(results)
+        self.stats._counters[1] += passed
+        self.stats._counters[2] += len(results) - passed
+
 
 class FilterChain:
     """Optimized filter chain"""
 
-    __slots__ = ("filters", "stats", "_logger_ref")
+    __slots__ = ("filters", "stats", "_logger_ref", "_sync_filters", "_async_filters")
 
     def __init__(self, filters: List[URLFilter] = None):
         self.filters = tuple(filters or [])  # Immutable tuple for speed
         self.stats = FilterStats()
         self._logger_ref = None
+        self._sync_filters = None
+        self._async_filters = None
 
     @property
     def logger(self):
@@ -85,9 +97,24 @@ class FilterChain:
 
     def add_filter(self, filter_: URLFilter) -> "FilterChain":
         """Add a filter to the chain"""
-        self.filters.append(filter_)
+        self.filters = self.filters + (filter_,)
+        self._sync_filters = self._async_filters = None
         return self  # Enable method chaining
 
+    def compile(self) -> "FilterChain":
+        """
+        Split the chain into its synchronous filters, which run over whole batches
+        in apply_many, and its async ones, which fetch page heads per URL.
+        Called by apply_many on first use; filters compile their own rules when built.
+        """
+        self._sync_filters = tuple(
+            f for f in self.filters if not inspect.iscoroutinefunction(f.apply)
+        )
+        self._async_filters = tuple(
+            f for f in self.filters if inspect.iscoroutinefunction(f.apply)
+        )
+        return self
+
     async def apply(self, url: str) -> bool:
         """Apply all filters concurrently when possible"""
         self.stats._counters[0] += 1  # Total processed URLs
@@ -115,6 +142,46 @@ class FilterChain:
         self.stats._counters[1] += 1  # Passed
         return True
 
+    async def apply_many(self, urls: List[str]) -> List[bool]:
+        """
+        Apply all filters to a batch of URLs, returning one decision per URL.
+
+        Each synchronous filter runs once over the URLs that passed the filters
+        before it, with no coroutine per URL. Async filters are only awaited for
+        the URLs that pass every synchronous filter, all of them concurrently.
+        Decisions and stats are the same as calling apply() on each URL.
+        """
+        if self._sync_filters is None:
+            self.compile()
+        counters = self.stats._counters
+        counters[0] += len(urls)
+
+        kept = list(range(len(urls)))
+        for f in self._sync_filters:
+            if not kept:
+                break
+            results = f.apply_many([urls[i] for i in kept])
+            kept = [i for i, passed in zip(kept, results) if passed]
+        counters[2] += len(urls) - len(kept)  # Sync rejected
+
+        if self._async_filters and kept:
+            width = len(self._async_filters)
+            results = await asyncio.gather(
+                *(f.apply(urls[i]) for i in kept for f in self._async_filters)
+            )
+            counters[2] += results.count(False)
+            kept = [
+                i
+                for n, i in enumerate(kept)
+                if all(results[n * width : (n + 1) * width])
+            ]
+
+        counters[1] += len(kept)  # Passed
+        decisions = [False] * len(urls)
+        for i in kept:
+            decisions[i] = True
+        return decisions
+
 
 class URLPatternFilter(URLFilter):
     """Pattern filter balancing speed and completeness"""
@@ -124,6 +191,8 @@ class URLPatternFilter(URLFilter):
         "_simple_prefixes",
         "_domain_patterns",
         "_path_patterns",
+        "_prefixes",
+        "_matchers",
     )
 
     PATTERN_TYPES = {
@@ -151,6 +220,38 @@ class URLPatternFilter(URLFilter):
             pattern_type = self._categorize_pattern(pattern)
             self._add_pattern(pattern, pattern_type)
 
+        self._prefixes = tuple(self._simple_prefixes)
+        self._matchers = self._compile_matchers()
+
+    # Backreferences and conditionals would point at the wrong group once merged
+    _GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+    def _compile_matchers(self) -> List[Pattern]:
+        """
+        Merge the domain and path patterns into one alternation, so a URL is
+        matched in a single regex search. Patterns with flags or group references
+        are kept apart, and so is everything if the merged regex does not compile.
+        """
+        # Domain patterns are anchored, as with pattern.match()
+        matchers = [
+            re.compile(rf"\A(?:{p.pattern})", p.flags) for p in self._domain_patterns
+        ] + self._path_patterns
+        default_flags = re.compile("").flags
+        merged, separate = [], []
+        for matcher in matchers:
+            if matcher.flags != default_flags or self._GROUP_REFERENCE.search(
+                matcher.pattern
+            ):
+                separate.append(matcher)
+            else:
+                merged.append(f"(?:{matcher.pattern})")
+        if len(merged) < 2:
+            return matchers
+        try:
+            return [re.compile("|".join(merged))] + separate
+        except re.error:
+            return matchers
+
     def _categorize_pattern(self, pattern: str) -> int:
         """Categorize pattern for specialized handling"""
         if not isinstance(pattern, str):
@@ -206,35 +307,28 @@ class URLPatternFilter(URLFilter):
     @lru_cache(maxsize=10000)
     def apply(self, url: str) -> bool:
         """Hierarchical pattern matching"""
+        result = self._match(url)
+        self._update_stats(result)
+        return result
+
+    def apply_many(self, urls: List[str]) -> List[bool]:
+        results = [self._match(url) for url in urls]
+        self._update_stats_many(results)
+        return results
+
+    def _match(self, url: str) -> bool:
         # Quick suffix check (*.html)
         if self._simple_suffixes:
             path = url.split("?")[0]
             if path.split("/")[-1].split(".")[-1] in self._simple_suffixes:
-                self._update_stats(True)
                 return True
 
-        # Domain check
-        if self._domain_patterns:
-            for pattern in self._domain_patterns:
-                if pattern.match(url):
-                    self._update_stats(True)
-                    return True
-
         # Prefix check (/foo/*)
-        if self._simple_prefixes:
-            path = url.split("?")[0]
-            if any(path.startswith(p) for p in self._simple_prefixes):
-                self._update_stats(True)
-                return True
-
-        # Complex patterns
-        if self._path_patterns:
-            if any(p.search(url) for p in self._path_patterns):
-                self._update_stats(True)
-                return True
+        if self._prefixes and url.split("?")[0].startswith(self._prefixes):
+            return True
 
-        self._update_stats(False)
-        return False
+        # Domain and complex patterns, merged into one regex where possible
+        return any(matcher.search(url) for matcher in self._matchers)
 
 
 class ContentTypeFilter(URLFilter):
@@ -393,6 +487,17 @@ class ContentTypeFilter(URLFilter):
         self._update_stats(result)
         return result
 
+    def apply_many(self, urls: List[str]) -> List[bool]:
+        if not self._check_extension:
+            results = [True] * len(urls)
+        else:
+            ext_map = self._ext_map
+            results = [
+                not ext or ext in ext_map for ext in map(self._extract_extension, urls)
+            ]
+        self._update_stats_many(results)
+        return results
+
 
 class DomainFilter(URLFilter):
     """Optimized domain filter with fast lookups and caching"""
@@ -433,6 +538,21 @@ class DomainFilter(URLFilter):
         """Check if domain is a subdomain of parent_domain"""
         return domain == parent_domain or domain.endswith(f".{parent_domain}")
 
+    @staticmethod
+    def _in_domains(domain: str, domains: frozenset) -> bool:
+        """
+        Whether domain is one of domains or a subdomain of one: looks up each
+        label suffix of domain in the set instead of scanning the set.
+        """
+        if domain in domains:
+            return True
+        dot = domain.find(".")
+        while dot != -1:
+            if domain[dot + 1 :] in domains:
+                return True
+            dot = domain.find(".", dot + 1)
+        return False
+
     @staticmethod
     @lru_cache(maxsize=10000)
     def _extract_domain(url: str) -> str:
@@ -447,31 +567,70 @@ class DomainFilter(URLFilter):
             self._update_stats(True)
             return True
 
-        domain = self._extract_domain(url)
+        result = self._check_domain(self._extract_domain(url))
+        self._update_stats(result)
+        return result
+
+    def apply_many(self, urls: List[str]) -> List[bool]:
+        if not self._blocked_domains and self._allowed_domains is None:
+            results = [True] * len(urls)
+        else:
+            results = [
+                self._check_domain(domain) for domain in map(self._extract_domain, urls)
+            ]
+        self._update_stats_many(results)
+        return results
 
+    def _check_domain(self, domain: str) -> bool:
         # Check for blocked domains, including subdomains
-        for blocked in self._blocked_domains:
-            if self._is_subdomain(domain, blocked):
-                self._update_stats(False)
-                return False
+        if self._blocked_domains and self._in_domains(domain, self._blocked_domains):
+            return False
 
         # If no allowed domains specified, accept all non-blocked
         if self._allowed_domains is None:
-            self._update_stats(True)
             return True
 
         # Check if domain matches any allowed domain (including subdomains)
-        for allowed in self._allowed_domains:
-            if self._is_subdomain(domain, allowed):
-                self._update_stats(True)
-                return True
+        return self._in_domains(domain, self._allowed_domains)
 
-        # No matches found
-        self._update_stats(False)
-        return False
 
+class HeadSectionFilter(URLFilter):
+    """
+    Base for filters deciding from a page's `<head>`. Heads come from a shared
+    HeadFetcher, pooled and cached, so many links can be checked at once.
+    """
 
-class ContentRelevanceFilter(URLFilter):
+    __slots__ = ("head_fetcher",)
+
+    def __init__(self, name: str = None, head_fetcher: Optional[HeadFetcher] = None):
+        super().__init__(name=name)
+        self.head_fetcher = head_fetcher
+
+    @property
+    def fetcher(self) -> HeadFetcher:
+        return self.head_fetcher or HeadFetcher.default()
+
+    @abstractmethod
+    def _decide(self, url: str, head: HeadSection) -> bool:
+        pass
+
+    def _decide_head(self, url: str, head: Optional[HeadSection]) -> bool:
+        decision = head is not None and self._decide(url, head)
+        self._update_stats(decision)
+        return decision
+
+    async def apply(self, url: str) -> bool:
+        return self._decide_head(url, await self.fetcher.fetch(url))
+
+    async def apply_stream(
+        self, urls: Iterable[str]
+    ) -> AsyncGenerator[Tuple[str, bool], None]:
+        """Submit a batch of URLs, yielding (url, decision) as each head arrives"""
+        async for url, head in self.fetcher.fetch_many(urls):
+            yield url, self._decide_head(url, head)
+
+
+class ContentRelevanceFilter(HeadSectionFilter):
     """BM25-based relevance filter using head section content"""
 
     __slots__ = ("query_terms", "threshold", "k1", "b", "avgdl")
@@ -483,31 +642,25 @@ class ContentRelevanceFilter(URLFilter):
         k1: float = 1.2,
         b: float = 0.75,
         avgdl: int = 1000,
+        head_fetcher: Optional[HeadFetcher] = None,
     ):
-        super().__init__(name="BM25RelevanceFilter")
+        super().__init__(name="BM25RelevanceFilter", head_fetcher=head_fetcher)
         self.query_terms = self._tokenize(query)
         self.threshold = threshold
         self.k1 = k1  # TF saturation parameter
         self.b = b  # Length normalization parameter
         self.avgdl = avgdl  # Average document length (empirical value)
 
-    async def apply(self, url: str) -> bool:
-        head_content = await HeadPeekr.peek_html(url)
-        if not head_content:
-            self._update_stats(False)
-            return False
-
+    def _decide(self, url: str, head: HeadSection) -> bool:
         # Field extraction with weighting
         fields = {
-            "title": HeadPeekr.get_title(head_content) or "",
-            "meta": HeadPeekr.extract_meta_tags(head_content),
+            "title": head.title or "",
+            "meta": head.meta,
         }
         doc_text = self._build_document(fields)
 
         score = self._bm25(doc_text)
-        decision = score >= self.threshold
-        self._update_stats(decision)
-        return decision
+        return score >= self.threshold
 
     def _build_document(self, fields: Dict) -> str:
         """Weighted document construction"""
@@ -546,7 +699,7 @@ class ContentRelevanceFilter(URLFilter):
         return score
 
 
-class SEOFilter(URLFilter):
+class SEOFilter(HeadSectionFilter):
     """Quantitative SEO quality assessment filter using head section analysis"""
 
     __slots__ = ("threshold", "_weights", "_kw_patterns")
@@ -567,8 +720,9 @@ class SEOFilter(URLFilter):
         threshold: float = 0.65,
         keywords: List[str] = None,
         weights: Dict[str, float] = None,
+        head_fetcher: Optional[HeadFetcher] = None,
     ):
-        super().__init__(name="SEOFilter")
+        super().__init__(name="SEOFilter", head_fetcher=head_fetcher)
         self.threshold = threshold
         self._weights = weights or self.DEFAULT_WEIGHTS
         self._kw_patterns = (
@@ -579,14 +733,9 @@ class SEOFilter(URLFilter):
             else None
         )
 
-    async def apply(self, url: str) -> bool:
-        head_content = await HeadPeekr.peek_html(url)
-        if not head_content:
-            self._update_stats(False)
-            return False
-
-        meta = HeadPeekr.extract_meta_tags(head_content)
-        title = HeadPeekr.get_title(head_content) or ""
+    def _decide(self, url: str, head: HeadSection) -> bool:
+        meta = head.meta
+        title = head.title or ""
         parsed_url = urlparse(url)
 
         scores = {
@@ -597,7 +746,7 @@ class SEOFilter(URLFilter):
             ),
             "canonical": self._score_canonical(meta.get("canonical"), url),
             "robot_ok": 1.0 if "noindex" not in meta.get("robots", "") else 0.0,
-            "schema_org": self._score_schema_org(head_content),
+            "schema_org": self._score_schema_org(head.html),
             "url_quality": self._score_url_quality(parsed_url),
         }
 
@@ -605,9 +754,7 @@ class SEOFilter(URLFilter):
             weight * scores[factor] for factor, weight in self._weights.items()
         )
 
-        decision = total_score >= self.threshold
-        self._update_stats(decision)
-        return decision
+        return total_score >= self.threshold
 
     def _score_title_length(self, title: str) -> float:
         length = len(title)
@@ -0,0 +1,140 @@
+# frontier.py
+import itertools
+from typing import List, Optional, Tuple
+
+from .frontier_store import FrontierEntry, FrontierStore, MemoryFrontierStore
+
+
+class CrawlFrontier:
+    """
+    Priority queue of URLs to crawl, indexed by URL.
+
+    Every URL ever added keeps its FrontierEntry, so `get()` answers depth, parent and
+    score lookups in O(1) for queued as well as crawled URLs, and `add()` drops
+    duplicates at enqueue time. A pending URL added again at a smaller depth moves to
+    that depth instead. Ties in priority are broken by insertion order.
+
+    Entries and the queue live in a FrontierStore: a MemoryFrontierStore by default,
+    or a SQLiteFrontierStore to keep memory bounded on very large crawls. A frontier
+    built over a store that already holds a crawl carries on from where it stopped.
+
+    Example:
+        frontier = CrawlFrontier()
+        frontier.add("https://example.com", depth=0)
+        while frontier:
+            url, entry = frontier.pop()
+    """
+
+    def __init__(self, store: Optional[FrontierStore] = None):
+        self.store = store if store is not None else MemoryFrontierStore()
+        self._pending, last_seq = self.store.restore()
+        self._sequence = itertools.count(last_seq + 1)
+
+    def __len__(self) -> int:
+        """Number of URLs waiting to be handed out."""
+        return self._pending
+
+    def __contains__(self, url: str) -> bool:
+        """Whether the URL has ever been added, pending or not."""
+        return self.store.contains(url)
+
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        return self.store.get(url)
+
+    @property
+    def started(self) -> "_StartedView":
+        """Container view of the URLs handed out by pop(), for `in` checks."""
+        return _StartedView(self)
+
+    def add(
+        self,
+        url: str,
+        depth: int,
+        parent: Optional[str] = None,
+        score: float = 0.0,
+        priority: Optional[float] = None,
+    ) -> bool:
+        """
+        Queue a URL. `priority` orders the queue, lowest first, and defaults to depth.
+
+        Returns:
+            bool: False if the URL was already known and nothing changed.
+        """
+        entry = self.store.get(url)
+        if entry is not None:
+            if not entry.pending or depth >= entry.depth:
+                return False
+            entry.depth, entry.parent, entry.score = depth, parent, score
+        else:
+            entry = FrontierEntry(depth, parent, score)
+            self._pending += 1
+        entry.priority = depth if priority is None else priority
+        self._enqueue(url, entry)
+        return True
+
+    def _enqueue(self, url: str, entry: FrontierEntry) -> None:
+        entry.seq = next(self._sequence)
+        self.store.put(url, entry)
+        self.store.push(entry.priority, entry.seq, url)
+
+    def complete(self, url: str) -> None:
+        """Mark a handed-out URL as done, so requeue_unfinished() leaves it alone."""
+        entry = self.store.get(url)
+        if entry is not None and not entry.done:
+            entry.done = True
+            self.store.put(url, entry)
+
+    def requeue_unfinished(self) -> int:
+        """
+        Queue again, at their old priority, the URLs handed out but never completed,
+        such as the ones in flight when a crawl stopped. Returns how many there were.
+
+        They keep their old sequence numbers too, so they are handed out before URLs
+        of the same priority that were queued after them, as in the original crawl.
+        """
+        unfinished = self.store.unfinished()
+        for url, entry in unfinished:
+            entry.pending = True
+            self._pending += 1
+            self.store.put(url, entry)
+            self.store.push(entry.priority, entry.seq, url)
+        return len(unfinished)
+
+    def pop(self) -> Optional[Tuple[str, FrontierEntry]]:
+        """Hand out the pending URL with the lowest priority, or None if there is none."""
+        while True:
+            item = self.store.pop()
+            if item is None:
+                return None
+            _, seq, url = item
+            entry = self.store.get(url)
+            if entry.pending and entry.seq == seq:
+                entry.pending = False
+                self.store.put(url, entry)
+                self._pending -= 1
+                return url, entry
+
+    def pop_many(self, count: int) -> List[Tuple[str, FrontierEntry]]:
+        """Hand out up to `count` pending URLs in priority order."""
+        items = []
+        while len(items) < count:
+            item = self.pop()
+            if item is None:
+                break
+            items.append(item)
+        return items
+
+    def drain(self) -> List[Tuple[str, FrontierEntry]]:
+        """Hand out every pending URL in priority order."""
+        return self.pop_many(self._pending)
+
+
+class _StartedView:
+    __slots__ = ("_frontier",)
+
+    def __init__(self, frontier: CrawlFrontier):
+        self._frontier = frontier
+
+    def __contains__(self, url: str) -> bool:
+        entry = self._frontier.get(url)
+        return entry is not None and not entry.pending
@@ -0,0 +1,339 @@
+# frontier_store.py
+import hashlib
+import heapq
+import json
+import math
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class FrontierEntry:
+    """What a deep crawl knows about one URL."""
+
+    depth: int
+    parent: Optional[str] = None
+    score: float = 0.0
+    # Queue priority, lowest first
+    priority: float = 0.0
+    # True while the URL waits in the frontier, False once it has been handed out
+    pending: bool = True
+    # True once the URL's result has been processed
+    done: bool = False
+    # Sequence number of the URL's current queue item; older items are stale
+    seq: int = 0
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized for `capacity` items at `error_rate` false positives; adding more items
+    raises the false positive rate but never produces false negatives. Uses double
+    hashing over one blake2b digest, so it needs nothing outside the standard library.
+    """
+
+    __slots__ = ("size", "hashes", "bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _hash(self, item: str) -> Tuple[int, int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, item: str) -> None:
+        h1, h2 = self._hash(item)
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = self._hash(item)
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+
+
+class FrontierStore(ABC):
+    """
+    Storage behind a CrawlFrontier: the entry of every URL seen, indexed by URL, and
+    the priority queue of (priority, seq, url) items. Queue items are not deduplicated
+    here; CrawlFrontier skips the stale ones.
+    """
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        pass
+
+    @abstractmethod
+    def put(self, url: str, entry: FrontierEntry) -> None:
+        """Insert or replace the entry of a URL."""
+        pass
+
+    @abstractmethod
+    def push(self, priority: float, seq: int, url: str) -> None:
+        pass
+
+    @abstractmethod
+    def pop(self) -> Optional[Tuple[float, int, str]]:
+        """Remove and return the queue item with the lowest (priority, seq)."""
+        pass
+
+    @abstractmethod
+    def restore(self) -> Tuple[int, int]:
+        """Number of pending URLs and the highest sequence number used so far."""
+        pass
+
+    @abstractmethod
+    def unfinished(self) -> List[Tuple[str, FrontierEntry]]:
+        """URLs that were handed out but never marked done."""
+        pass
+
+    @abstractmethod
+    def save_state(self, state: Dict[str, Any]) -> None:
+        """Keep a JSON-serializable dict of crawl state next to the frontier."""
+        pass
+
+    @abstractmethod
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def contains(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def flush(self) -> None:
+        """Make every change so far durable."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryFrontierStore(FrontierStore):
+    """Default store: a dict of entries and a heapq list."""
+
+    def __init__(self):
+        self._entries: Dict[str, FrontierEntry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._state: Optional[Dict[str, Any]] = None
+
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        return self._entries.get(url)
+
+    def put(self, url: str, entry: FrontierEntry) -> None:
+        self._entries[url] = entry
+
+    def contains(self, url: str) -> bool:
+        return url in self._entries
+
+    def push(self, priority: float, seq: int, url: str) -> None:
+        heapq.heappush(self._heap, (priority, seq, url))
+
+    def pop(self) -> Optional[Tuple[float, int, str]]:
+        return heapq.heappop(self._heap) if self._heap else None
+
+    def restore(self) -> Tuple[int, int]:
+        pending = sum(1 for entry in self._entries.values() if entry.pending)
+        return pending, max((entry.seq for entry in self._entries.values()), default=-1)
+
+    def unfinished(self) -> List[Tuple[str, FrontierEntry]]:
+        return [
+            (url, entry)
+            for url, entry in self._entries.items()
+            if not entry.pending and not entry.done
+        ]
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        self._state = dict(state)
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        return self._state
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+        self._state = None
+
+
+class SQLiteFrontierStore(FrontierStore):
+    """
+    On-disk store for crawls that outgrow memory.
+
+    Entries and queue items live in a SQLite database, so memory use is bounded by
+    SQLite's page cache (`cache_size_kib`) whatever the size of the crawl. Changes are
+    committed every `commit_interval` writes, or only on flush() if it is 0; the
+    database survives the process and can be reopened.
+
+    With `bloom_capacity` set, a BloomFilter answers most lookups of URLs never seen
+    before without touching the database; only possible hits go on to the exact
+    check. The filter is rebuilt from the database when an existing file is opened.
+
+    Args:
+        path: Database file. Created if missing.
+        bloom_capacity: Expected number of distinct URLs, or None for no filter.
+        bloom_error_rate: False positive rate of the filter at `bloom_capacity` URLs.
+        commit_interval: Writes between commits, or 0 to commit only on flush().
+        cache_size_kib: SQLite page cache size.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        bloom_capacity: Optional[int] = 1_000_000,
+        bloom_error_rate: float = 0.01,
+        commit_interval: int = 1000,
+        cache_size_kib: int = 8192,
+    ):
+        self.path = path
+        self.commit_interval = commit_interval
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA cache_size=-{int(cache_size_kib)}")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS frontier_entries (
+                url TEXT PRIMARY KEY,
+                depth INTEGER NOT NULL,
+                parent TEXT,
+                score REAL NOT NULL,
+                priority REAL NOT NULL,
+                pending INTEGER NOT NULL,
+                done INTEGER NOT NULL,
+                seq INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS frontier_queue (
+                priority REAL NOT NULL,
+                seq INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (priority, seq)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS frontier_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._writes = 0
+        self.bloom = (
+            BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        )
+        if self.bloom is not None:
+            for (url,) in self._conn.execute("SELECT url FROM frontier_entries"):
+                self.bloom.add(url)
+
+    def _written(self) -> None:
+        self._writes += 1
+        if self.commit_interval and self._writes >= self.commit_interval:
+            self.flush()
+
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        if self.bloom is not None and url not in self.bloom:
+            return None
+        row = self._conn.execute(
+            "SELECT depth, parent, score, priority, pending, done, seq"
+            " FROM frontier_entries WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return None if row is None else self._entry(row)
+
+    @staticmethod
+    def _entry(row) -> FrontierEntry:
+        depth, parent, score, priority, pending, done, seq = row
+        return FrontierEntry(depth, parent, score, priority, bool(pending), bool(done), seq)
+
+    def put(self, url: str, entry: FrontierEntry) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO frontier_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                url,
+                entry.depth,
+                entry.parent,
+                entry.score,
+                entry.priority,
+                int(entry.pending),
+                int(entry.done),
+                entry.seq,
+            ),
+        )
+        if self.bloom is not None:
+            self.bloom.add(url)
+        self._written()
+
+    def push(self, priority: float, seq: int, url: str) -> None:
+        self._conn.execute(
+            "INSERT INTO frontier_queue VALUES (?, ?, ?)", (priority, seq, url)
+        )
+        self._written()
+
+    def pop(self) -> Optional[Tuple[float, int, str]]:
+        row = self._conn.execute(
+            "SELECT priority, seq, url FROM frontier_queue ORDER BY priority, seq LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "DELETE FROM frontier_queue WHERE priority = ? AND seq = ?", row[:2]
+        )
+        self._written()
+        return row
+
+    def restore(self) -> Tuple[int, int]:
+        pending, max_seq = self._conn.execute(
+            "SELECT COALESCE(SUM(pending), 0), COALESCE(MAX(seq), -1) FROM frontier_entries"
+        ).fetchone()
+        return pending, max_seq
+
+    def unfinished(self) -> List[Tuple[str, FrontierEntry]]:
+        rows = self._conn.execute(
+            "SELECT url, depth, parent, score, priority, pending, done, seq"
+            " FROM frontier_entries WHERE pending = 0 AND done = 0"
+        ).fetchall()
+        return [(row[0], self._entry(row[1:])) for row in rows]
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO frontier_state VALUES ('state', ?)", (json.dumps(state),)
+        )
+        self._written()
+
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT value FROM frontier_state WHERE key = 'state'"
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM frontier_entries")
+        self._conn.execute("DELETE FROM frontier_queue")
+        self._conn.execute("DELETE FROM frontier_state")
+        if self.bloom is not None:
+            self.bloom.clear()
+        self.flush()
+
+    def flush(self) -> None:
+        self._conn.commit()
+        self._writes = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
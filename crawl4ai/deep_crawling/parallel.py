@@ -0,0 +1,384 @@
+# parallel.py
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import traceback
+from datetime import datetime
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple
+
+from ..models import CrawlResult, TraversalStats
+from .base_strategy import DeepCrawlStrategy
+from .dfs_strategy import DFSDeepCrawlStrategy
+from ..types import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+
+# Message a worker's task queue and the result queue end with
+_STOP = None
+
+
+class MultiProcessDeepCrawlStrategy(DeepCrawlStrategy):
+    """
+    Runs a BFS or best-first deep crawl on `workers` processes, each with its own
+    AsyncWebCrawler, so scraping and link discovery are not bound to one event loop.
+
+    This process is the broker: it owns the wrapped strategy's frontier, and with it
+    the set of known URLs, and hands each worker the next URLs in frontier order as
+    its `tasks_per_worker` slots free up. Workers crawl them, run the wrapped
+    strategy's link discovery, filter chain and scorer on their own copy of it, and
+    send back each result with its new links. Results come out of this process in
+    the order they arrive, with the `depth`, `parent_url` and, with a scorer,
+    `score` metadata the wrapped strategy attaches.
+
+    Everything else stays with the wrapped strategy, in this process: max_pages,
+    seeding, near-duplicate detection, frontier_store, checkpoints and `stats`.
+
+    Workers build their crawler with `crawler_factory`, a picklable callable, or as
+    AsyncWebCrawler(config=...) with the browser config of the crawler this strategy
+    runs under. The wrapped strategy and the CrawlerRunConfig are pickled to reach
+    them, so their filters, scorers and strategies must be picklable.
+
+    Example:
+        strategy = MultiProcessDeepCrawlStrategy(BFSDeepCrawlStrategy(max_depth=3), workers=8)
+        config = CrawlerRunConfig(deep_crawl_strategy=strategy, stream=True)
+        async for result in await crawler.arun(start_url, config=config):
+            ...
+
+    Args:
+        strategy: The BFSDeepCrawlStrategy or BestFirstCrawlingStrategy to run.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+        tasks_per_worker: URLs handed to a worker before it returns any.
+        crawler_factory: Builds each worker's AsyncWebCrawler.
+        start_method: multiprocessing start method of the workers.
+    """
+
+    def __init__(
+        self,
+        strategy: DeepCrawlStrategy,
+        workers: Optional[int] = None,
+        tasks_per_worker: int = 10,
+        crawler_factory: Optional[Callable[[], AsyncWebCrawler]] = None,
+        start_method: str = "spawn",
+        logger: Optional[logging.Logger] = None,
+    ):
+        if isinstance(strategy, DFSDeepCrawlStrategy):
+            raise ValueError("Depth-first crawls cannot be split across processes")
+        if isinstance(strategy, MultiProcessDeepCrawlStrategy):
+            raise ValueError("MultiProcessDeepCrawlStrategy cannot wrap itself")
+        self.strategy = strategy
+        self.workers = workers or os.cpu_count() or 1
+        self.tasks_per_worker = tasks_per_worker
+        self.crawler_factory = crawler_factory
+        self.start_method = start_method
+        self.logger = logger or logging.getLogger(__name__)
+        self._cancel_event = asyncio.Event()
+
+    @property
+    def stats(self) -> TraversalStats:
+        return self.strategy.stats
+
+    async def can_process_url(self, url: str, depth: int) -> bool:
+        return await self.strategy.can_process_url(url, depth)
+
+    async def link_discovery(self, result, source_url, current_depth, visited, next_level, depths) -> None:
+        await self.strategy.link_discovery(
+            result, source_url, current_depth, visited, next_level, depths
+        )
+
+    def close_frontier(self) -> None:
+        self.strategy.close_frontier()
+
+    async def _arun_batch(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> List[CrawlResult]:
+        """Crawl on the workers and return all the results."""
+        return [result async for result in self._arun_stream(start_url, crawler, config)]
+
+    async def _arun_stream(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """Crawl on the workers, yielding results as they arrive."""
+        strategy = self.strategy
+        self._cancel_event = asyncio.Event()
+        if strategy.near_duplicates is not None:
+            strategy.near_duplicates.reset()
+        frontier = strategy.create_frontier()
+        frontier.add(start_url, depth=0, priority=0)
+        await strategy.seed_frontier(frontier, start_url)
+
+        context = multiprocessing.get_context(self.start_method)
+        outbox = context.Queue()
+        task_queues = [context.Queue() for _ in range(self.workers)]
+        spec = _WorkerSpec(
+            strategy=_worker_copy(strategy),
+            config=strategy.crawl_config(config, stream=True),
+            crawler_factory=self.crawler_factory,
+            browser_config=getattr(crawler, "browser_config", None),
+        )
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(worker, spec, task_queues[worker], outbox),
+                name=f"crawl4ai-deep-crawl-{worker}",
+                daemon=True,
+            )
+            for worker in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        loop = asyncio.get_running_loop()
+        inbox: asyncio.Queue = asyncio.Queue()
+        reader = threading.Thread(
+            target=_forward, args=(outbox, loop, inbox), name="crawl4ai-deep-crawl-results", daemon=True
+        )
+        reader.start()
+
+        assigned: Dict[int, Set[str]] = {worker: set() for worker in range(self.workers)}
+        max_pages = getattr(strategy, "max_pages", float("inf"))
+        try:
+            while not self._cancel_event.is_set() and not strategy._cancel_event.is_set():
+                self._assign(frontier, assigned, task_queues)
+                in_flight = sum(len(urls) for urls in assigned.values())
+                if not in_flight:
+                    break
+                try:
+                    message = await asyncio.wait_for(inbox.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    message = None
+                if message is None or message[0] == "failed":
+                    if message is not None:
+                        self.logger.error(f"Deep crawl worker {message[1]} failed: {message[2]}")
+                    # URLs of workers that are gone come back as failed results
+                    for url, result in self._reap(processes, assigned):
+                        self._annotate(frontier, url, result)
+                        yield result
+                        strategy.record_result(frontier, url, result)
+                    continue
+
+                _, worker, url, result, links, skipped = message
+                assigned.get(worker, set()).discard(url)
+                entry = self._annotate(frontier, url, result)
+                if result.success:
+                    strategy._pages_crawled += 1
+                strategy.stats.urls_skipped += skipped
+
+                duplicate = strategy.is_near_duplicate(url, result)
+                yield result
+
+                if result.success and not duplicate:
+                    # Workers cap links by the page count when the URL was handed out
+                    room = max_pages - strategy._pages_crawled
+                    if room < len(links):
+                        links = links[: max(0, int(room))]
+                    depth = entry.depth + 1
+                    for link, score in links:
+                        frontier.add(
+                            link, depth, url, score=score,
+                            priority=strategy.queue_priority(link, depth, score),
+                        )
+                strategy.record_result(frontier, url, result)
+        finally:
+            for queue in task_queues:
+                queue.put(_STOP)
+            # Workers finish the URLs they hold; the reader keeps draining their
+            # results meanwhile, so none blocks on a full pipe while exiting
+            for process in processes:
+                await asyncio.to_thread(process.join, 30)
+                if process.is_alive():
+                    process.terminate()
+                    await asyncio.to_thread(process.join)
+            outbox.put(_STOP)
+            await asyncio.to_thread(reader.join)
+            for queue in task_queues + [outbox]:
+                queue.close()
+            strategy.stats.end_time = datetime.now()
+
+    def _annotate(self, frontier, url: str, result: CrawlResult):
+        """Attach the URL's depth, parent and score to its result; returns its entry."""
+        entry = frontier.get(url)
+        result.metadata = result.metadata or {}
+        result.metadata["depth"] = entry.depth
+        result.metadata["parent_url"] = entry.parent
+        if self.strategy.url_scorer is not None:
+            result.metadata["score"] = entry.score
+        return entry
+
+    def _assign(
+        self,
+        frontier,
+        assigned: Dict[int, Set[str]],
+        task_queues: List[Any],
+    ) -> None:
+        """Hand frontier URLs to the least busy live workers while slots and pages remain."""
+        strategy = self.strategy
+        max_pages = getattr(strategy, "max_pages", float("inf"))
+        while frontier:
+            in_flight = sum(len(urls) for urls in assigned.values())
+            # Like pipelined BFS, never start more crawls than could fill max_pages
+            if strategy._pages_crawled + in_flight >= max_pages:
+                return
+            worker = min(assigned, key=lambda w: len(assigned[w]), default=None)
+            if worker is None or len(assigned[worker]) >= self.tasks_per_worker:
+                return
+            url, entry = frontier.pop()
+            assigned[worker].add(url)
+            task_queues[worker].put((url, entry.depth, strategy._pages_crawled + in_flight))
+
+    def _reap(self, processes, assigned: Dict[int, Set[str]]) -> List[Tuple[str, CrawlResult]]:
+        """Failed results for the URLs of workers that exited, which get no more URLs."""
+        failed = []
+        for worker, process in enumerate(processes):
+            if worker not in assigned or process.is_alive():
+                continue
+            for url in assigned.pop(worker):
+                failed.append((url, CrawlResult(
+                    url=url,
+                    html="",
+                    success=False,
+                    error_message=f"Deep crawl worker {worker} exited with code {process.exitcode}",
+                )))
+        if not assigned:
+            raise RuntimeError("All deep crawl worker processes exited")
+        return failed
+
+    async def shutdown(self) -> None:
+        """Stop handing out URLs; workers stop once their queued URLs are done."""
+        self._cancel_event.set()
+        await self.strategy.shutdown()
+
+
+class _WorkerSpec:
+    """What a worker process needs to run; pickled once per worker."""
+
+    def __init__(
+        self,
+        strategy: DeepCrawlStrategy,
+        config: CrawlerRunConfig,
+        crawler_factory: Optional[Callable[[], AsyncWebCrawler]],
+        browser_config: Optional[BrowserConfig],
+    ):
+        self.strategy = strategy
+        self.config = config
+        self.crawler_factory = crawler_factory
+        self.browser_config = browser_config
+
+
+def _worker_copy(strategy: DeepCrawlStrategy) -> DeepCrawlStrategy:
+    """
+    A copy of the strategy for the workers, without what stays with the broker:
+    frontier storage, checkpoints, the seeder and the near-duplicate index.
+    """
+    worker = copy.copy(strategy)
+    worker.frontier_store = None
+    worker.checkpoint_path = None
+    worker.resume_from = None
+    worker._checkpoint_store = None
+    worker.seeder = None
+    worker.near_duplicates = None
+    worker.stats = TraversalStats(start_time=datetime.now())
+    return worker
+
+
+def _forward(queue, loop: asyncio.AbstractEventLoop, inbox: asyncio.Queue) -> None:
+    """Move pickled messages from a process queue to an asyncio queue until _STOP."""
+    while True:
+        message = queue.get()
+        if message is _STOP:
+            loop.call_soon_threadsafe(inbox.put_nowait, _STOP)
+            return
+        loop.call_soon_threadsafe(inbox.put_nowait, pickle.loads(message))
+
+
+def _worker_main(worker: int, spec: _WorkerSpec, tasks, outbox) -> None:
+    """Worker process entry point."""
+    try:
+        asyncio.run(_run_worker(worker, spec, tasks, outbox))
+    except Exception:
+        outbox.put(pickle.dumps(("failed", worker, traceback.format_exc())))
+
+
+async def _run_worker(worker: int, spec: _WorkerSpec, tasks, outbox) -> None:
+    """Crawl the URLs of the task queue and send back each result with its new links."""
+    from ..async_webcrawler import AsyncWebCrawler, CrawlResultContainer
+
+    strategy = spec.strategy
+    strategy._cancel_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    urls: asyncio.Queue = asyncio.Queue()
+    # URL -> (depth, pages counted when it was handed out)
+    tasks_by_url: Dict[str, Tuple[int, int]] = {}
+    # URLs the broker handed out, so surely known to it. Links this worker sent are
+    # not: the broker drops those of near-duplicates and past max_pages, and another
+    # page may still lead to them
+    known: Set[str] = set()
+
+    def accept(task) -> None:
+        if task is not _STOP:
+            url, depth, pages_crawled = task
+            tasks_by_url[url] = (depth, pages_crawled)
+            known.add(url)
+            task = url
+        urls.put_nowait(task)
+
+    threading.Thread(target=_read_tasks, args=(tasks, loop, accept), daemon=True).start()
+
+    crawler = (
+        spec.crawler_factory()
+        if spec.crawler_factory is not None
+        else AsyncWebCrawler(config=spec.browser_config)
+    )
+    async with crawler:
+        stream = await crawler.arun_many(
+            urls=urls, config=spec.config, dispatcher=getattr(strategy, "dispatcher", None)
+        )
+        async for result in stream:
+            if isinstance(result, CrawlResultContainer):
+                result = result[0]
+            url = result.url
+            depth, pages_crawled = tasks_by_url.pop(url, (0, 0))
+            links: List[Tuple[str, float]] = []
+            skipped = 0
+            if result.success:
+                strategy._pages_crawled = pages_crawled
+                skipped_before = strategy.stats.urls_skipped
+                next_level: List[Tuple[str, Optional[str]]] = []
+                await strategy.link_discovery(result, url, depth, known, next_level, {})
+                found = [link for link, _ in next_level]
+                scores = (
+                    strategy.url_scorer.score_many(found).tolist()
+                    if strategy.url_scorer is not None
+                    else [0.0] * len(found)
+                )
+                links = list(zip(found, scores))
+                skipped = strategy.stats.urls_skipped - skipped_before
+            try:
+                message = pickle.dumps(("result", worker, url, result, links, skipped))
+            except Exception as e:
+                # The broker must hear back about every URL it handed out
+                message = pickle.dumps((
+                    "result", worker, url,
+                    CrawlResult(url=url, html="", success=False, error_message=f"Unpicklable result: {e}"),
+                    [], skipped,
+                ))
+            outbox.put(message)
+
+
+def _read_tasks(tasks, loop: asyncio.AbstractEventLoop, accept: Callable[[Any], None]) -> None:
+    while True:
+        task = tasks.get()
+        try:
+            loop.call_soon_threadsafe(accept, task)
+        except RuntimeError:
+            # The worker's loop is gone, as after a failed start
+            return
+        if task is _STOP:
+            return
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import List, Dict, Mapping, Optional, Sequence
+from datetime import datetime
 from dataclasses import dataclass
 from urllib.parse import urlparse, unquote
 import re
@@ -8,6 +10,7 @@ from functools import lru_cache
 from array import array
 import ctypes
 import platform
+import numpy as np
 PLATFORM = platform.system()
 
 # Pre-computed scores for common year differences
@@ -45,6 +48,17 @@ class ScoringStats:
             if score > self._max_score:
                 self._max_score = score
                 
+    def update_many(self, scores: np.ndarray) -> None:
+        """update() for a whole array of scores at once"""
+        if not len(scores):
+            return
+        self._urls_scored += len(scores)
+        self._total_score += float(scores.sum())
+        if self._min_score is not None:
+            self._min_score = min(self._min_score, float(scores.min()))
+        if self._max_score is not None:
+            self._max_score = max(self._max_score, float(scores.max()))
+
     def get_average(self) -> float:
         """Direct calculation instead of property"""
         return self._total_score / self._urls_scored if self._urls_scored else 0.0
@@ -61,23 +75,81 @@ class ScoringStats:
             self._max_score = self._total_score / self._urls_scored if self._urls_scored else 0.0
         return self._max_score
 class URLScorer(ABC):
-    __slots__ = ('_weight', '_stats')
+    __slots__ = ('_weight', '_stats', '_cache', '_cache_size')
     
-    def __init__(self, weight: float = 1.0):
+    def __init__(self, weight: float = 1.0, cache_size: int = 10000):
         # Store weight directly as float32 for memory efficiency
         self._weight = ctypes.c_float(weight).value
         self._stats = ScoringStats()
+        # Raw scores by URL, per instance; the oldest entry goes first when full
+        self._cache: "OrderedDict[str, float]" = OrderedDict()
+        self._cache_size = cache_size
     
     @abstractmethod
     def _calculate_score(self, url: str) -> float:
         """Calculate raw score for URL."""
         pass
+
+    def record_lastmod(self, lastmods: Mapping[str, datetime]) -> None:
+        """Dates pages were last modified, e.g. from a sitemap; only FreshnessScorer uses them."""
+        pass
+
+    def _forget(self, urls) -> None:
+        for url in urls:
+            self._cache.pop(url, None)
+
+    def _calculate_many(self, urls: List[str]) -> np.ndarray:
+        """Raw scores for many URLs; subclasses override this with a vectorized version."""
+        return np.fromiter((self._calculate_score(url) for url in urls), dtype=np.float64, count=len(urls))
+
+    def _remember(self, url: str, score: float) -> None:
+        cache = self._cache
+        if len(cache) >= self._cache_size:
+            cache.popitem(last=False)
+        cache[url] = score
+
+    def _raw_score(self, url: str) -> float:
+        score = self._cache.get(url)
+        if score is None:
+            score = self._calculate_score(url)
+            if self._cache_size:
+                self._remember(url, score)
+        return score
     
     def score(self, url: str) -> float:
         """Calculate weighted score with minimal overhead."""
-        score = self._calculate_score(url) * self._weight
+        score = self._raw_score(url) * self._weight
         self._stats.update(score)
         return score
+
+    def score_many(self, urls: Sequence[str]) -> np.ndarray:
+        """
+        Weighted scores of many URLs as a float64 array, in order.
+
+        Same values as score() for each URL, but cache misses are scored in one
+        _calculate_many call and stats are updated once.
+        """
+        get = self._cache.get
+        values = [get(url) for url in urls]
+        # Each distinct uncached URL is scored once, however often it repeats
+        missing: Dict[str, int] = {}
+        for url, value in zip(urls, values):
+            if value is None and url not in missing:
+                missing[url] = len(missing)
+        if missing:
+            missing_urls = list(missing)
+            computed = self._calculate_many(missing_urls).tolist()
+            values = [
+                computed[missing[url]] if value is None else value
+                for url, value in zip(urls, values)
+            ]
+            if self._cache_size:
+                keep = slice(-self._cache_size, None)
+                for url, score in zip(missing_urls[keep], computed[keep]):
+                    self._remember(url, score)
+        scores = np.array(values, dtype=np.float64) * self._weight
+        self._stats.update_many(scores)
+        return scores
     
     @property
     def stats(self):
@@ -112,7 +184,6 @@ class CompositeScorer(URLScorer):
         self._weights_array = array('f', [s.weight for s in scorers])
         self._score_array = array('f', [0.0] * len(scorers))
 
-    @lru_cache(maxsize=10000)
     def _calculate_score(self, url: str) -> float:
         """Calculate combined score from all scoring strategies.
         
@@ -144,18 +215,23 @@ class CompositeScorer(URLScorer):
             
         return total_score
 
-    def score(self, url: str) -> float:
-        """Public scoring interface with stats tracking.
-        
-        Args:
-            url: URL to score
-            
-        Returns:
-            Final combined score
-        """
-        score = self._calculate_score(url)
-        self.stats.update(score)
-        return score
+    def record_lastmod(self, lastmods: Mapping[str, datetime]) -> None:
+        for scorer in self._scorers:
+            scorer.record_lastmod(lastmods)
+        self._forget(lastmods)
+
+    def _calculate_many(self, urls: List[str]) -> np.ndarray:
+        """Combined scores for many URLs: one score_many call per scoring strategy."""
+        if not self._scorers:
+            return np.zeros(len(urls))
+        # Round through float32 like the scalar path's score array does
+        total = np.sum(
+            [scorer.score_many(urls).astype(np.float32).astype(np.float64) for scorer in self._scorers],
+            axis=0,
+        )
+        if self._normalize:
+            return total / len(self._scorers)
+        return total
 
 class KeywordRelevanceScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_keywords', '_case_sensitive')
@@ -166,7 +242,6 @@ class KeywordRelevanceScorer(URLScorer):
         # Pre-process keywords once
         self._keywords = [k if case_sensitive else k.lower() for k in keywords]
     
-    @lru_cache(maxsize=10000)
     def _url_bytes(self, url: str) -> bytes:
         """Cache decoded URL bytes"""
         return url.encode('utf-8') if self._case_sensitive else url.lower().encode('utf-8')
@@ -187,6 +262,20 @@ class KeywordRelevanceScorer(URLScorer):
             
         return matches / len(self._keywords)
 
+    def _calculate_many(self, urls: List[str]) -> np.ndarray:
+        """Keyword match ratios, with each URL lowercased once."""
+        keywords = self._keywords
+        if not keywords:
+            return np.zeros(len(urls))
+        if not self._case_sensitive:
+            urls = [url.lower() for url in urls]
+        count = len(keywords)
+        return np.fromiter(
+            (sum(k in url for k in keywords) / count for url in urls),
+            dtype=np.float64,
+            count=len(urls),
+        )
+
 class PathDepthScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_optimal_depth')  # Remove _url_cache
     
@@ -227,7 +316,11 @@ class PathDepthScorer(URLScorer):
             
         return depth
 
-    @lru_cache(maxsize=10000)  # Cache the whole calculation
+    @classmethod
+    def _url_depth(cls, url: str) -> int:
+        pos = url.find('/', url.find('://') + 3)
+        return 0 if pos == -1 else cls._quick_depth(url[pos:])
+
     def _calculate_score(self, url: str) -> float:
         pos = url.find('/', url.find('://') + 3)
         if pos == -1:
@@ -244,6 +337,11 @@ class PathDepthScorer(URLScorer):
             
         return 1.0 / (1.0 + distance)                                             
 
+    def _calculate_many(self, urls: List[str]) -> np.ndarray:
+        """Depth scores; 1 / (1 + distance) is also what the lookup table holds."""
+        depths = np.fromiter(map(self._url_depth, urls), dtype=np.float64, count=len(urls))
+        return 1.0 / (1.0 + np.abs(depths - self._optimal_depth))
+
 class ContentTypeScorer(URLScorer):
     __slots__ = ('_weight', '_exact_types', '_regex_types')
 
@@ -301,7 +399,6 @@ class ContentTypeScorer(URLScorer):
                 
         return url[pos + 1:end].lower()
 
-    @lru_cache(maxsize=10000)
     def _calculate_score(self, url: str) -> float:
         """Calculate content type score for URL.
         
@@ -330,7 +427,7 @@ class ContentTypeScorer(URLScorer):
         return 0.0
 
 class FreshnessScorer(URLScorer):
-    __slots__ = ('_weight', '_date_pattern', '_current_year')
+    __slots__ = ('_weight', '_date_pattern', '_current_year', '_lastmod_years')
 
     def __init__(self, weight: float = 1.0, current_year: int = 2024):
         """Initialize freshness scorer.
@@ -340,6 +437,9 @@ class FreshnessScorer(URLScorer):
         - YYYY-MM-DD
         - YYYY_MM_DD
         - YYYY (year only)
+
+        The year of a last-modified date passed to record_lastmod, such as a
+        sitemap's <lastmod>, takes precedence over dates in the URL.
         
         Args:
             weight: Score multiplier
@@ -347,6 +447,7 @@ class FreshnessScorer(URLScorer):
         """
         super().__init__(weight=weight)
         self._current_year = current_year
+        self._lastmod_years: Dict[str, int] = {}
         
         # Combined pattern for all date formats
         # Uses non-capturing groups (?:) and alternation
@@ -364,7 +465,6 @@ class FreshnessScorer(URLScorer):
             r')?'  # Month/day group is optional
         )
 
-    @lru_cache(maxsize=10000)
     def _extract_year(self, url: str) -> Optional[int]:
         """Extract the most recent year from URL.
         
@@ -386,7 +486,12 @@ class FreshnessScorer(URLScorer):
                 
         return latest_year
 
-    @lru_cache(maxsize=10000) 
+    def record_lastmod(self, lastmods: Mapping[str, datetime]) -> None:
+        for url, lastmod in lastmods.items():
+            # Dates after current_year count as current
+            self._lastmod_years[url] = min(lastmod.year, self._current_year)
+        self._forget(lastmods)
+
     def _calculate_score(self, url: str) -> float:
         """Calculate freshness score based on URL date.
         
@@ -399,7 +504,7 @@ class FreshnessScorer(URLScorer):
         Returns:
             Score between 0.0 and 1.0 * weight
         """
-        year = self._extract_year(url)
+        year = self._lastmod_years.get(url) or self._extract_year(url)
         if year is None:
             return 0.5  # Default score
             
@@ -411,6 +516,37 @@ class FreshnessScorer(URLScorer):
         # Fallback calculation for older content
         return max(0.1, 1.0 - year_diff * 0.1)
 
+    def _calculate_many(self, urls: List[str]) -> np.ndarray:
+        """Freshness scores from a single regex pass over all URLs joined by newlines.
+
+        The date pattern never matches a newline, so matches stay within one URL.
+        """
+        text = "\n".join(urls)
+        starts = np.cumsum([0] + [len(url) + 1 for url in urls[:-1]])
+        positions, years = [], []
+        for match in self._date_pattern.finditer(text):
+            positions.append(match.start())
+            years.append(int(match.group(1)))
+        latest = np.zeros(len(urls), dtype=np.int64)
+        if years:
+            owners = np.searchsorted(starts, positions, side="right") - 1
+            years = np.array(years)
+            valid = years <= self._current_year
+            np.maximum.at(latest, owners[valid], years[valid])
+        if self._lastmod_years:
+            get = self._lastmod_years.get
+            recorded = np.fromiter((get(url, 0) for url in urls), dtype=np.int64, count=len(urls))
+            latest = np.where(recorded > 0, recorded, latest)
+
+        year_diff = self._current_year - latest
+        table = np.array(_FRESHNESS_SCORES)
+        scores = np.where(
+            year_diff < len(table),
+            table[np.minimum(year_diff, len(table) - 1)],
+            np.maximum(0.1, 1.0 - year_diff * 0.1),
+        )
+        return np.where(latest == 0, 0.5, scores)
+
 class DomainAuthorityScorer(URLScorer):
     __slots__ = ('_weight', '_domain_weights', '_default_weight', '_top_domains')
     
@@ -493,7 +629,6 @@ class DomainAuthorityScorer(URLScorer):
             
         return domain.lower()
 
-    @lru_cache(maxsize=10000)
     def _calculate_score(self, url: str) -> float:
         """Calculate domain authority score.
         
@@ -516,4 +651,4 @@ class DomainAuthorityScorer(URLScorer):
             return score
             
         # Regular path: check all domains
-        return self._domain_weights.get(domain, self._default_weight)
\ No newline at end of file
+        return self._domain_weights.get(domain, self._default_weight)
@@ -0,0 +1,229 @@
+# seeding.py
+import asyncio
+import logging
+import re
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncGenerator, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from xml.etree import ElementTree
+
+import aiohttp
+
+from ..utils import RobotsParser
+
+_W3C_DATE = re.compile(r"(\d{4})(?:-(\d{2}))?(?:-(\d{2}))?")
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """A sitemap <lastmod> (W3C datetime: a full timestamp down to just a year), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    match = _W3C_DATE.match(value)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    try:
+        return datetime(int(year), int(month or 1), int(day or 1))
+    except ValueError:
+        return None
+
+
+def _site_host(url: str) -> str:
+    """Host name of a URL, without port or a leading www."""
+    host = urlparse(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+@dataclass
+class SitemapEntry:
+    """A page listed in a sitemap."""
+
+    url: str
+    lastmod: Optional[datetime] = None
+
+
+class SitemapSeeder:
+    """
+    Streams the URLs a site lists in its sitemaps, so a deep crawl can queue them
+    without fetching the pages that link to them.
+
+    Sitemaps come from `sitemaps` if given, else from the `Sitemap:` lines of the
+    site's robots.txt, else `/sitemap.xml`. Sitemap indexes are followed, up to
+    `max_sitemaps` sitemaps in all, and gzipped sitemaps are inflated as they
+    arrive. Each sitemap is parsed incrementally, one chunk at a time, and every
+    <url> is dropped once yielded, so memory use does not grow with its size.
+
+    With `use_robots` the robots.txt rules, as cached by `robots_parser`, are
+    applied to every listed URL for `user_agent`. URLs on another host than the
+    start URL, ignoring ports and a leading www., are skipped unless `same_host`
+    is False.
+
+    Args:
+        sitemaps: Sitemap URLs to read instead of discovering them.
+        use_robots: Read Sitemap lines and apply the rules of robots.txt.
+        robots_parser: RobotsParser whose cache holds the rules; one is created if None.
+        user_agent: User agent the robots.txt rules are checked for.
+        same_host: Only yield URLs on the start URL's host.
+        max_urls: Stop after this many URLs.
+        max_sitemaps: Stop after reading this many sitemaps, indexes included.
+        timeout: Seconds allowed for each sitemap.
+        chunk_size: Bytes read from the network at a time.
+    """
+
+    def __init__(
+        self,
+        sitemaps: Optional[List[str]] = None,
+        use_robots: bool = True,
+        robots_parser: Optional[RobotsParser] = None,
+        user_agent: str = "*",
+        same_host: bool = True,
+        max_urls: Optional[int] = None,
+        max_sitemaps: int = 50,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.sitemaps = list(sitemaps or [])
+        self.use_robots = use_robots
+        self.robots_parser = robots_parser
+        self.user_agent = user_agent
+        self.same_host = same_host
+        self.max_urls = max_urls
+        self.max_sitemaps = max_sitemaps
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def seed(self, start_url: str) -> AsyncGenerator[SitemapEntry, None]:
+        """Yield the entries of the start URL's site's sitemaps, in sitemap order."""
+        parsed = urlparse(start_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        host = _site_host(start_url)
+
+        rules = None
+        if self.use_robots:
+            if self.robots_parser is None:
+                self.robots_parser = RobotsParser()
+            text = await self.robots_parser.fetch_rules(start_url)
+            if text:
+                rules = RobotFileParser()
+                rules.parse(text.splitlines())
+
+        queue = deque(
+            self.sitemaps or (rules and rules.site_maps()) or [f"{origin}/sitemap.xml"]
+        )
+        read, yielded = set(), 0
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while queue and len(read) < self.max_sitemaps:
+                sitemap = queue.popleft()
+                if sitemap in read:
+                    continue
+                read.add(sitemap)
+                entries = self._read_sitemap(session, sitemap)
+                try:
+                    async for kind, loc, lastmod in entries:
+                        if kind == "sitemap":
+                            queue.append(loc)
+                            continue
+                        if self.same_host and _site_host(loc) != host:
+                            continue
+                        if rules is not None and not rules.can_fetch(self.user_agent, loc):
+                            continue
+                        yield SitemapEntry(loc, parse_lastmod(lastmod))
+                        yielded += 1
+                        if self.max_urls is not None and yielded >= self.max_urls:
+                            return
+                finally:
+                    # Release the connection now if the caller stops early
+                    await entries.aclose()
+
+    async def seed_batches(
+        self, start_url: str, size: int = 1000
+    ) -> AsyncGenerator[List[SitemapEntry], None]:
+        """seed() in lists of up to `size` entries."""
+        batch: List[SitemapEntry] = []
+        async for entry in self.seed(start_url):
+            batch.append(entry)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _read_sitemap(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> AsyncGenerator[Tuple[str, str, Optional[str]], None]:
+        """
+        Stream one sitemap, yielding ("url" or "sitemap", loc, lastmod) per entry.
+        Errors end the sitemap early, keeping what was read so far.
+        """
+        parser = ElementTree.XMLPullParser(events=("start", "end"))
+        state = {"root": None, "loc": None, "lastmod": None}
+        inflate, head = None, b""
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    self.logger.warning(f"Sitemap {url} returned status {response.status}")
+                    return
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    if inflate is None:
+                        # Sniff gzip from the content, as .gz sitemaps are often
+                        # served without a Content-Encoding
+                        head += chunk
+                        if len(head) < 2:
+                            continue
+                        inflate = (
+                            zlib.decompressobj(16 + zlib.MAX_WBITS)
+                            if head[:2] == b"\x1f\x8b"
+                            else False
+                        )
+                        chunk, head = head, b""
+                    if not inflate:
+                        parser.feed(chunk)
+                        for item in self._entries(parser, state):
+                            yield item
+                        continue
+                    # Sitemaps compress very well, so a chunk is inflated a piece at
+                    # a time and its entries read before the next piece
+                    while chunk:
+                        parser.feed(inflate.decompress(chunk, self.chunk_size))
+                        chunk = inflate.unconsumed_tail
+                        for item in self._entries(parser, state):
+                            yield item
+                # Whatever is left: a body too short to sniff, or the inflated tail
+                parser.feed(head if inflate is None else inflate.flush() if inflate else b"")
+                parser.close()
+                for item in self._entries(parser, state):
+                    yield item
+        except (aiohttp.ClientError, asyncio.TimeoutError, ElementTree.ParseError, zlib.error) as e:
+            self.logger.warning(f"Failed to read sitemap {url}: {e}")
+
+    @staticmethod
+    def _entries(parser: ElementTree.XMLPullParser, state: dict) -> Iterator[Tuple[str, str, Optional[str]]]:
+        for event, element in parser.read_events():
+            tag = element.tag.rpartition("}")[2]
+            if event == "start":
+                if state["root"] is None:
+                    state["root"] = element
+                elif tag in ("url", "sitemap"):
+                    state["loc"] = state["lastmod"] = None
+                continue
+            if tag == "loc":
+                state["loc"] = (element.text or "").strip()
+            elif tag == "lastmod":
+                state["lastmod"] = element.text
+            elif tag in ("url", "sitemap"):
+                if state["loc"]:
+                    yield tag, state["loc"], state["lastmod"]
+                # Parsed entries are dropped, so only the open one is kept
+                state["root"].clear()
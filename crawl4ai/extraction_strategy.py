@@ -35,6 +35,7 @@ from .model_loader import (
 )
 
 from .types import LLMConfig
+from .parsed_document import ParsedDocument
 
 from functools import partial
 import numpy as np
@@ -819,13 +820,18 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             url (str): The URL of the page being processed.
             html_content (str): The raw HTML content to parse and extract.
             *q: Additional positional arguments.
-            **kwargs: Additional keyword arguments for custom extraction.
+            **kwargs: Additional keyword arguments for custom extraction. A `document`
+                (ParsedDocument) built from `html_content` is reused instead of re-parsing.
 
         Returns:
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        document: Optional[ParsedDocument] = kwargs.get("document")
+        if document is not None and document.matches(html_content):
+            parsed_html = self._parse_document(document)
+        else:
+            parsed_html = self._parse_html(html_content)
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -854,6 +860,10 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         """Parse HTML content into appropriate format"""
         pass
 
+    def _parse_document(self, document: ParsedDocument):
+        """Get the parsed format from a shared document; subclasses reuse its cached trees"""
+        return self._parse_html(document.html)
+
     @abstractmethod
     def _get_base_elements(self, parsed_html, selector: str):
         """Get all base elements using the selector"""
@@ -1153,6 +1163,9 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
     Attributes:
         schema (Dict[str, Any]): The schema defining the extraction rules.
         verbose (bool): Enables verbose logging for debugging purposes.
+        parser (str): BeautifulSoup parser, "html.parser" by default. Parsers repair
+            broken HTML differently, so selectors can match differently; with "lxml"
+            the soup built by the scraping strategy and content filters is reused.
 
     Methods:
         _parse_html(html_content): Parses HTML content into a BeautifulSoup object.
@@ -1163,12 +1176,17 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         _get_element_attribute(element, attribute): Retrieves an attribute value from a BeautifulSoup element.
     """
 
-    def __init__(self, schema: Dict[str, Any], **kwargs):
+    def __init__(self, schema: Dict[str, Any], parser: str = "html.parser", **kwargs):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
+        self.parser = parser
 
     def _parse_html(self, html_content: str):
-        return BeautifulSoup(html_content, "html.parser")
+        return BeautifulSoup(html_content, self.parser)
+
+    def _parse_document(self, document: ParsedDocument):
+        # Shared with the scraping strategy and content filters when the parsers match
+        return document.soup(self.parser)
 
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.select(selector)
@@ -1218,6 +1236,9 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
     def _parse_html(self, html_content: str):
         return html.fromstring(html_content)
 
+    def _parse_document(self, document: ParsedDocument):
+        return document.lxml_tree(fragment=True)
+
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.xpath(selector)
 
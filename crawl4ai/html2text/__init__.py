@@ -8,6 +8,9 @@ import urllib.parse as urlparse
 from textwrap import wrap
 from typing import Dict, List, Optional, Tuple, Union
 
+from lxml import etree
+from lxml import html as lhtml
+
 from . import config
 from ._typing import OutCallback
 from .elements import AnchorElement, ListElement
@@ -1168,3 +1171,105 @@ class CustomHTML2Text(HTML2Text):
     #         self.preserved_content.append(data)
     #         return
     #     super().handle_data(data, entity_char)
+
+
+class LXMLHTML2Text(CustomHTML2Text):
+    """
+    CustomHTML2Text driven by an lxml element tree instead of `html.parser`.
+
+    The markdown state machine (`handle_tag`, `handle_data`, `o`) and every option of
+    CustomHTML2Text are unchanged. Only tokenization is replaced: the tree is walked
+    iteratively and the same start tag, data and end tag events are dispatched, so an
+    already parsed tree (e.g. from a shared ParsedDocument) can be converted directly.
+
+    Some sources produce events the tree cannot reproduce; `needs_tokenizer` detects
+    them and `handle` converts those with `html.parser` instead. Serialized (cleaned)
+    HTML practically never contains them.
+    """
+
+    # References html.parser reports as entities, which are unified unless unicode_snob
+    # (&nbsp; also survives whitespace collapsing); lxml decodes them to plain text.
+    ENTITY_REF = re.compile(
+        r"&(?!(?:amp|lt|gt|quot);)(?:[a-zA-Z][-.a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+)[^a-zA-Z0-9]"
+    )
+    # lxml closes an open link when another starts, and ends list items still open
+    # at the end of their list, where html.parser reports no end tag
+    ANCHOR_TAG = re.compile(r"<(/?)a[\s>/]", re.IGNORECASE)
+    LI_START = re.compile(r"<li[\s>/]", re.IGNORECASE)
+    LI_END = re.compile(r"</li\s*>", re.IGNORECASE)
+    # lxml drops everything after </html>
+    HTML_END = re.compile(r"</html\s*>(.*)", re.IGNORECASE | re.DOTALL)
+
+    def needs_tokenizer(self, data: str) -> bool:
+        """Whether converting `data` through an lxml tree would differ from `html.parser`."""
+        if self.ENTITY_REF.search(data):
+            return True
+        if len(self.LI_START.findall(data)) != len(self.LI_END.findall(data)):
+            return True
+        after_html = self.HTML_END.search(data)
+        if after_html and after_html.group(1).strip():
+            return True
+        depth = 0
+        for match in self.ANCHOR_TAG.finditer(data):
+            depth = max(depth - 1, 0) if match.group(1) else depth + 1
+            if depth > 1:
+                return True
+        return False
+
+    def handle(self, data: str) -> str:
+        if not data or not data.strip() or self.needs_tokenizer(data):
+            return super().handle(data)
+        try:
+            root = lhtml.document_fromstring(data)
+        except (etree.ParserError, ValueError):
+            return super().handle(data)
+        return self.handle_tree(root)
+
+    # Characters serializers write as entities; html.parser reports them as separate
+    # entity data, which changes escaping and automatic-link detection.
+    ENTITY_CHARS = re.compile(r"([&<>])")
+
+    def _handle_text(self, text: str) -> None:
+        if "&" in text or "<" in text or ">" in text:
+            for part in self.ENTITY_CHARS.split(text):
+                if part in ("&", "<", ">"):
+                    self.handle_data(part, True)
+                elif part:
+                    self.handle_data(part)
+        else:
+            self.handle_data(text)
+
+    def handle_tree(self, root: "lhtml.HtmlElement") -> str:
+        """Convert an lxml element tree (the root and its descendants) to markdown."""
+        self.start = True
+        handle_data = self._handle_text
+        handle_tag = self.handle_tag
+
+        # (element, closing) pairs; the root's tail lies outside the tree and is skipped
+        stack = [(root, False)]
+        while stack:
+            element, closing = stack.pop()
+            if closing:
+                handle_tag(element.tag, {}, False)
+                if element.tail and element is not root:
+                    handle_data(element.tail)
+                continue
+
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions only contribute their tail
+                if element.tail and element is not root:
+                    handle_data(element.tail)
+                continue
+
+            handle_tag(tag, dict(element.attrib), True)
+            if element.text:
+                handle_data(element.text)
+            stack.append((element, True))
+            stack.extend((child, False) for child in reversed(element))
+
+        markdown = self.optwrap(self.finish())
+        if self.pad_tables:
+            return pad_tables_in_text(markdown)
+        else:
+            return markdown
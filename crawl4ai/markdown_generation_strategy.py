@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple
 from .models import MarkdownGenerationResult
-from .html2text import CustomHTML2Text
+from .html2text import CustomHTML2Text, LXMLHTML2Text
 # from .types import RelevantContentFilter
 from .content_filter_strategy import RelevantContentFilter
+from .parsed_document import ParsedDocument
+import inspect
 import re
+from functools import lru_cache
 from urllib.parse import urljoin
 
 # Pre-compile the regex pattern
@@ -23,6 +26,23 @@ def fast_urljoin(base: str, url: str) -> str:
     return urljoin(base, url)
 
 
+@lru_cache(maxsize=None)
+def _accepts_document(filter_content) -> bool:
+    return "document" in inspect.signature(filter_content).parameters
+
+
+def filter_html(
+    content_filter: RelevantContentFilter,
+    html: str,
+    document: Optional[ParsedDocument] = None,
+):
+    """Run a content filter, handing it the shared document when it accepts one."""
+    # Checked once per filter class rather than on every page
+    if document is not None and _accepts_document(type(content_filter).filter_content):
+        return content_filter.filter_content(html, document=document)
+    return content_filter.filter_content(html)
+
+
 class MarkdownGenerationStrategy(ABC):
     """Abstract base class for markdown generation strategies."""
 
@@ -44,9 +64,10 @@ class MarkdownGenerationStrategy(ABC):
         html2text_options: Optional[Dict[str, Any]] = None,
         content_filter: Optional[RelevantContentFilter] = None,
         citations: bool = True,
+        document: Optional[ParsedDocument] = None,
         **kwargs,
     ) -> MarkdownGenerationResult:
-        """Generate markdown from cleaned HTML."""
+        """Generate markdown from cleaned HTML, reusing `document` (a parse of cleaned_html) if given."""
         pass
 
 
@@ -75,6 +96,29 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
     ):
         super().__init__(content_filter, options)
 
+    def create_html2text(self, base_url: str = "") -> CustomHTML2Text:
+        """Create the HTML2Text converter used for this page."""
+        return CustomHTML2Text(baseurl=base_url)
+
+    def convert_html(
+        self,
+        h: CustomHTML2Text,
+        html: str,
+        document: Optional[ParsedDocument] = None,
+    ) -> str:
+        """
+        Convert HTML to markdown with the given converter.
+
+        Args:
+            h (CustomHTML2Text): Converter created by `create_html2text`.
+            html (str): HTML to convert.
+            document (Optional[ParsedDocument]): Shared parse of `html` (unused by the html.parser path).
+
+        Returns:
+            str: Markdown text.
+        """
+        return h.handle(html)
+
     def convert_links_to_citations(
         self, markdown: str, base_url: str = ""
     ) -> Tuple[str, str]:
@@ -149,6 +193,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
         options: Optional[Dict[str, Any]] = None,
         content_filter: Optional[RelevantContentFilter] = None,
         citations: bool = True,
+        document: Optional[ParsedDocument] = None,
         **kwargs,
     ) -> MarkdownGenerationResult:
         """
@@ -167,13 +212,14 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             options (Optional[Dict[str, Any]]): Additional options for markdown generation.
             content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
             citations (bool): Whether to generate citations.
+            document (Optional[ParsedDocument]): Shared parse of cleaned_html, passed on to the content filter.
 
         Returns:
             MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
         """
         try:
             # Initialize HTML2Text with default options for better conversion
-            h = CustomHTML2Text(baseurl=base_url)
+            h = self.create_html2text(base_url)
             default_options = {
                 "body_width": 0,  # Disable text wrapping
                 "ignore_emphasis": False,
@@ -203,7 +249,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
 
             # Generate raw markdown
             try:
-                raw_markdown = h.handle(cleaned_html)
+                raw_markdown = self.convert_html(h, cleaned_html, document)
             except Exception as e:
                 raw_markdown = f"Error converting HTML to markdown: {str(e)}"
 
@@ -228,11 +274,11 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             if content_filter or self.content_filter:
                 try:
                     content_filter = content_filter or self.content_filter
-                    filtered_html = content_filter.filter_content(cleaned_html)
+                    filtered_html = filter_html(content_filter, cleaned_html, document)
                     filtered_html = "\n".join(
                         "<div>{}</div>".format(s) for s in filtered_html
                     )
-                    fit_markdown = h.handle(filtered_html)
+                    fit_markdown = self.convert_html(h, filtered_html)
                 except Exception as e:
                     fit_markdown = f"Error generating fit markdown: {str(e)}"
                     filtered_html = ""
@@ -254,3 +300,44 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
                 fit_markdown="",
                 fit_html="",
             )
+
+
+class LXMLMarkdownGenerator(DefaultMarkdownGenerator):
+    """
+    Markdown generator that converts an lxml element tree instead of re-tokenizing HTML.
+
+    How it works:
+    1. Takes the lxml tree of cleaned HTML from the shared ParsedDocument, or parses it with lxml.
+    2. Walks the tree iteratively, feeding the html2text markdown state machine (LXMLHTML2Text).
+    3. Converts links to citations and generates fit markdown exactly like DefaultMarkdownGenerator.
+
+    Output fields and html2text options are the same as DefaultMarkdownGenerator; only the
+    pure-Python `html.parser` tokenization step is replaced by lxml.
+
+    Args:
+        content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
+        options (Optional[Dict[str, Any]]): Additional options for markdown generation. Defaults to None.
+
+    Returns:
+        MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
+    """
+
+    def create_html2text(self, base_url: str = "") -> LXMLHTML2Text:
+        return LXMLHTML2Text(baseurl=base_url)
+
+    def convert_html(
+        self,
+        h: LXMLHTML2Text,
+        html: str,
+        document: Optional[ParsedDocument] = None,
+    ) -> str:
+        if (
+            document is not None
+            and html
+            and html.strip()
+            and document.matches(html)
+            and not h.needs_tokenizer(html)
+        ):
+            # Read-only walk, so the shared tree can be used as-is
+            return h.handle_tree(document.lxml_tree())
+        return h.handle(html)
@@ -8,6 +8,7 @@ import aiofiles
 import shutil
 from datetime import datetime
 from .async_logger import AsyncLogger, LogLevel
+from .blob_store import BlobStore, ShardedBlobStore, PackfileBlobStore
 
 # Initialize logger
 logger = AsyncLogger(log_level=LogLevel.DEBUG, verbose=True)
@@ -177,6 +178,61 @@ async def run_migration(db_path: Optional[str] = None):
     await migration.migrate_database()
 
 
+def _move_legacy_blobs(store: BlobStore, remove_legacy: bool) -> int:
+    moved = 0
+    for content_type, content_hash, path in store.iter_legacy():
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        # Keep the legacy hash as the key: crawled_data rows already reference it
+        store.put(content, content_type, content_hash=content_hash)
+        if remove_legacy and store.contains(content_hash, content_type):
+            os.remove(path)
+        moved += 1
+        if moved % 1000 == 0:
+            logger.info(f"Moved {moved} blobs...", tag="INIT")
+    store.flush()
+    return moved
+
+
+async def migrate_blob_store(
+    base_path: Optional[str] = None,
+    store: Optional[BlobStore] = None,
+    remove_legacy: bool = True,
+) -> int:
+    """
+    Move content files from the legacy layout (one uncompressed file per blob in a flat
+    directory per content type) into a blob store. Blob hashes do not change, so the
+    database needs no update. Safe to run again after an interruption.
+
+    Args:
+        base_path (Optional[str]): Cache directory, defaults to `~/.crawl4ai`.
+        store (Optional[BlobStore]): Destination, defaults to a ShardedBlobStore.
+        remove_legacy (bool): Delete each legacy file once it is stored.
+
+    Returns:
+        int: Number of blobs moved.
+    """
+    if store is None:
+        if base_path is None:
+            base_path = os.path.join(Path.home(), ".crawl4ai")
+        store = ShardedBlobStore(base_path)
+
+    logger.info("Starting blob store migration...", tag="INIT")
+    try:
+        moved = await asyncio.to_thread(_move_legacy_blobs, store, remove_legacy)
+    except Exception as e:
+        logger.error(
+            message="Blob store migration failed: {error}",
+            tag="ERROR",
+            params={"error": str(e)},
+        )
+        raise e
+    logger.success(
+        f"Blob store migration completed. {moved} blobs moved.", tag="COMPLETE"
+    )
+    return moved
+
+
 def main():
     """CLI entry point for migration"""
     import argparse
@@ -185,8 +241,23 @@ def main():
         description="Migrate Crawl4AI database to file-based storage"
     )
     parser.add_argument("--db-path", help="Custom database path")
+    parser.add_argument(
+        "--blob-store",
+        choices=["sharded", "packfile"],
+        help="Move legacy content files into this blob store instead of migrating the database",
+    )
     args = parser.parse_args()
 
+    if args.blob_store:
+        base_path = os.path.dirname(args.db_path) if args.db_path else None
+        store = None
+        if args.blob_store == "packfile":
+            store = PackfileBlobStore(base_path or os.path.join(Path.home(), ".crawl4ai"))
+        asyncio.run(migrate_blob_store(base_path, store))
+        if store is not None:
+            store.close()
+        return
+
     asyncio.run(run_migration(args.db_path))
 
 
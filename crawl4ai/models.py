@@ -130,6 +130,56 @@ class TraversalStats:
     total_depth_reached: int = 0
     current_depth: int = 0
 
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse of an HTTP crawler strategy"""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests sent over a connection an earlier request opened"""
+        return max(0, self.requests - self.connections_opened)
+
+
+@dataclass
+class PagePoolStats:
+    """Use of a browser manager's pools of pre-opened pages"""
+
+    acquired: int = 0
+    hits: int = 0
+    created: int = 0
+    retired: int = 0
+    wait_time: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the pages handed out that came from a pool"""
+        return self.hits / self.acquired if self.acquired else 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Seconds spent getting a page, on average"""
+        return self.wait_time / self.acquired if self.acquired else 0.0
+
+
+@dataclass
+class DomainFetchStats:
+    """How a hybrid crawler strategy has fetched the pages of one domain"""
+
+    http_pages: int = 0
+    escalated_pages: int = 0
+    browser_pages: int = 0
+    browser_only: bool = False
+
+    @property
+    def escalation_rate(self) -> float:
+        """Share of the pages first fetched over HTTP that needed the browser"""
+        tried = self.http_pages + self.escalated_pages
+        return self.escalated_pages / tried if tried else 0.0
+
 class DispatchResult(BaseModel):
     task_id: str
     memory_usage: float
@@ -159,6 +209,8 @@ class CrawlResult(BaseModel):
     ssl_certificate: Optional[SSLCertificate] = None
     dispatch_result: Optional[DispatchResult] = None
     redirected_url: Optional[str] = None
+    # SimHash of the markdown, set when CrawlerRunConfig.content_fingerprint is on
+    fingerprint: Optional[int] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,110 @@
+import copy
+from typing import Any, Callable, Dict, Tuple
+
+from bs4 import BeautifulSoup
+from lxml import html as lhtml
+
+# Parser the scraping strategy and content filters ask for, so they share one BeautifulSoup tree
+DEFAULT_PARSER = "lxml"
+
+
+class ParsedDocument:
+    """
+    One HTML string plus the parse trees built from it, each built at most once.
+
+    Several stages of `aprocess_html` need a parsed view of the same HTML: the scraping
+    strategy, content filters, markdown generators and JSON element extraction. Passing
+    a ParsedDocument around lets them share parse work instead of each re-parsing the
+    string.
+
+    Consumers that only read a tree use the shared, cached instance. Consumers that
+    modify the tree (scraping strategies, PruningContentFilter) pass `take=True`: they
+    get the cached tree if one exists, or a fresh parse, and the cache entry is dropped
+    so later readers never see the modified tree. When a later stage is known to read
+    the tree (`keep=True`), taking hands out a copy and the original stays cached:
+    copying an lxml tree costs a fraction of parsing it, while a soup is parsed again.
+
+    Attributes:
+        html (str): The HTML string this document represents.
+        keep (bool): Whether taken trees are copies, leaving the cached tree for later readers.
+
+    Methods:
+        lxml_tree(fragment, take): lxml tree from `lxml.html.document_fromstring`
+            (or `lxml.html.fromstring` when `fragment=True`).
+        soup(parser, take): BeautifulSoup tree built with the given parser.
+        matches(html): Whether this document represents the given HTML string.
+        clear(): Drop all cached trees.
+    """
+
+    __slots__ = ("html", "keep", "_trees")
+
+    def __init__(self, html: str, keep: bool = False):
+        self.html = html or ""
+        self.keep = keep
+        self._trees: Dict[Tuple[str, Any], Any] = {}
+
+    def _get(
+        self,
+        key: Tuple[str, Any],
+        build: Callable[[], Any],
+        take: bool,
+        copy_tree: Callable[[Any], Any],
+    ):
+        if take and not self.keep:
+            tree = self._trees.pop(key, None)
+            return tree if tree is not None else build()
+        tree = self._trees.get(key)
+        if tree is None:
+            tree = self._trees[key] = build()
+        return copy_tree(tree) if take else tree
+
+    def lxml_tree(self, fragment: bool = False, take: bool = False) -> lhtml.HtmlElement:
+        """
+        Return the lxml tree of the document.
+
+        Args:
+            fragment (bool): Parse with `lxml.html.fromstring` instead of `document_fromstring`.
+            take (bool): Hand ownership of the tree to the caller, who may modify it.
+
+        Returns:
+            lhtml.HtmlElement: Root element of the parsed tree.
+        """
+        parse = lhtml.fromstring if fragment else lhtml.document_fromstring
+        return self._get(("lxml", fragment), lambda: parse(self.html), take, copy.deepcopy)
+
+    def soup(self, parser: str = DEFAULT_PARSER, take: bool = False) -> BeautifulSoup:
+        """
+        Return the BeautifulSoup tree of the document.
+
+        Args:
+            parser (str): BeautifulSoup parser name, e.g. "lxml" or "html.parser".
+            take (bool): Hand ownership of the tree to the caller, who may modify it.
+
+        Returns:
+            BeautifulSoup: The parsed soup.
+        """
+        def build():
+            return BeautifulSoup(self.html, parser)
+
+        # Copying a soup costs as much as parsing it again
+        return self._get(("soup", parser), build, take, lambda tree: build())
+
+    def matches(self, html: str) -> bool:
+        """Check whether this document was built from `html`."""
+        return html is self.html or html == self.html
+
+    def clear(self):
+        """Drop all cached trees to release their memory."""
+        self._trees.clear()
+
+    def __getstate__(self):
+        # Parse trees are cheap to rebuild compared to pickling them for a worker process.
+        return {"html": self.html, "keep": self.keep}
+
+    def __setstate__(self, state):
+        self.html = state["html"]
+        self.keep = state.get("keep", False)
+        self._trees = {}
+
+    def __repr__(self):
+        return f"ParsedDocument(len={len(self.html)}, trees={sorted(k[0] for k in self._trees)})"
@@ -40,8 +40,10 @@ from . import __version__
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
-from typing import  Generator, Iterable
+from collections import Counter, deque, OrderedDict
+from typing import  Generator, Iterable, AsyncGenerator, Tuple
+import weakref
+import numpy as np
 
 def chunk_documents(
     documents: Iterable[str],
@@ -273,25 +275,20 @@ class RobotsParser:
                     (domain, content, int(time.time()), hash_val)
                 )
 
-    async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
+    async def fetch_rules(self, url: str) -> Optional[str]:
         """
-        Check if URL can be fetched according to robots.txt rules.
-        
-        Args:
-            url: The URL to check
-            user_agent: User agent string to check against (default: "*")
-            
-        Returns:
-            bool: True if allowed, False if disallowed by robots.txt
+        The robots.txt of the URL's site, from the cache while fresh.
+
+        Returns None if the site has none or it cannot be fetched.
         """
         # Handle empty/invalid URLs
         try:
             parsed = urlparse(url)
             domain = parsed.netloc
             if not domain:
-                return True
+                return None
         except Exception as _ex:
-            return True
+            return None
 
         # Fast path - check cache first
         rules, is_fresh = self._get_cached_rules(domain)
@@ -309,11 +306,25 @@ class RobotsParser:
                             rules = await response.text()
                             self._cache_rules(domain, rules)
                         else:
-                            return True
+                            return None
             except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
+                # On any error (timeout, connection failed, etc), there are no rules
+                return None
 
+        return rules or None
+
+    async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
+        """
+        Check if URL can be fetched according to robots.txt rules.
+        
+        Args:
+            url: The URL to check
+            user_agent: User agent string to check against (default: "*")
+            
+        Returns:
+            bool: True if allowed, False if disallowed by robots.txt
+        """
+        rules = await self.fetch_rules(url)
         if not rules:
             return True
 
@@ -2010,6 +2021,30 @@ def normalize_url_for_deep_crawl(href, base_url):
     
     return normalized
 
+def normalize_links_for_deep_crawl(hrefs, base_url):
+    """
+    Normalize all links of a page in one pass.
+
+    Repeated hrefs are normalized once and hrefs that fail to parse are dropped.
+
+    Returns:
+        List[str]: The distinct normalized URLs, in the order they first appear.
+    """
+    seen_hrefs = set()
+    urls = {}
+    for href in hrefs:
+        if not href or href in seen_hrefs:
+            continue
+        seen_hrefs.add(href)
+        try:
+            url = normalize_url_for_deep_crawl(href, base_url)
+        except ValueError:
+            continue
+        if url:
+            urls[url] = None
+    return list(urls)
+
+
 @lru_cache(maxsize=10000)
 def efficient_normalize_url_for_deep_crawl(href, base_url):
     """Efficient URL normalization with proper parsing"""
@@ -2442,6 +2477,39 @@ def generate_content_hash(content: str) -> str:
     # return hashlib.sha256(content.encode()).hexdigest()
 
 
+_MARKDOWN_LINK_TARGET = re.compile(r"\]\([^)]*\)")
+_FINGERPRINT_WORD = re.compile(r"\w+")
+_SIMHASH_BITS = np.arange(64, dtype=np.uint64)
+
+
+def simhash_fingerprint(text: str, shingle_size: int = 3) -> int:
+    """
+    64-bit SimHash of the word shingles of a text, weighted by their counts.
+
+    Texts that differ in a few words get fingerprints a few bits apart. The targets
+    of markdown links and images are left out, so pages whose links differ only in
+    session or tracking parameters get the same fingerprint. A text without words
+    gets 0.
+    """
+    words = _FINGERPRINT_WORD.findall(_MARKDOWN_LINK_TARGET.sub("]", text or "").lower())
+    if not words:
+        return 0
+    shingles = Counter(
+        " ".join(words[i:i + shingle_size])
+        for i in range(max(1, len(words) - shingle_size + 1))
+    )
+    hashes = np.fromiter(
+        (xxhash.xxh64_intdigest(shingle) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+    bits = ((hashes[:, None] >> _SIMHASH_BITS) & np.uint64(1)).astype(np.int64)
+    # A bit is set when the shingles having it outweigh those that do not
+    votes = 2 * (weights @ bits) - weights.sum()
+    return sum(1 << int(bit) for bit in np.flatnonzero(votes > 0))
+
+
 def ensure_content_dirs(base_path: str) -> Dict[str, str]:
     """Create content directories if they don't exist"""
     dirs = {
@@ -2564,28 +2632,8 @@ def optimize_html(html_str, threshold=200):
 class HeadPeekr:
     @staticmethod
     async def fetch_head_section(url, timeout=0.3):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; CrawlBot/1.0)",
-            "Accept": "text/html",
-            "Connection": "close"  # Force close after response
-        }
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                
-                # Handle redirects explicitly by using the final URL
-                if response.url != url:
-                    url = str(response.url)
-                    response = await client.get(url, headers=headers)
-                
-                content = b""
-                async for chunk in response.aiter_bytes():
-                    content += chunk
-                    if b"</head>" in content:
-                        break  # Stop after detecting </head>
-                return content.split(b"</head>")[0] + b"</head>"
-        except (httpx.HTTPError, gaierror) :
-            return None
+        # Pooled connections of the event loop's shared HeadFetcher
+        return await HeadFetcher.default().fetch_head_section(url, timeout=timeout)
 
     @staticmethod
     async def peek_html(url, timeout=0.3):
@@ -2617,3 +2665,162 @@ class HeadPeekr:
     def get_title(head_content: str):
         title_match = re.search(r'<title>(.*?)</title>', head_content, re.IGNORECASE | re.DOTALL)
         return title_match.group(1) if title_match else None
+
+
+class HeadSection:
+    """The `<head>` of a page, with its title and meta tags parsed once."""
+
+    __slots__ = ("html", "title", "meta")
+
+    def __init__(self, html: str):
+        self.html = html
+        self.title = HeadPeekr.get_title(html)
+        self.meta = HeadPeekr.extract_meta_tags(html)
+
+
+class HeadFetcher:
+    """
+    Shared service fetching the `<head>` section of pages.
+
+    All fetches go through one httpx client with pooled keep-alive connections,
+    at most `max_per_host` at a time to any host. Parsed heads are cached for
+    `cache_ttl` seconds, and concurrent fetches of the same URL share one request.
+    The body is streamed into a bytearray until `</head>` arrives, or for at most
+    `max_head_bytes`. The rest is read and dropped when it is known to be under
+    `drain_bytes`, which keeps the connection reusable; otherwise it is closed.
+
+    HeadFetcher.default() gives one instance per event loop, used by HeadPeekr
+    and the head-based filters unless they are given their own.
+    """
+
+    _defaults = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        timeout: float = 0.3,
+        max_connections: int = 100,
+        max_per_host: int = 4,
+        cache_ttl: float = 3600,
+        cache_size: int = 10000,
+        max_head_bytes: int = 256 * 1024,
+        drain_bytes: int = 64 * 1024,
+        user_agent: str = "Mozilla/5.0 (compatible; CrawlBot/1.0)",
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.max_head_bytes = max_head_bytes
+        self.drain_bytes = drain_bytes
+        self.headers = {"User-Agent": user_agent, "Accept": "text/html"}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def default(cls) -> "HeadFetcher":
+        """The shared fetcher of the running event loop."""
+        loop = asyncio.get_running_loop()
+        fetcher = cls._defaults.get(loop)
+        if fetcher is None:
+            fetcher = cls._defaults[loop] = cls()
+        return fetcher
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def fetch_head_section(self, url: str, timeout: float = None) -> Optional[bytes]:
+        """The raw `<head>` of a page, ending with `</head>`, or None if it cannot be fetched."""
+        host = urlparse(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        try:
+            async with limit:
+                async with self.client.stream(
+                    "GET", url, timeout=self.timeout if timeout is None else timeout
+                ) as response:
+                    content = bytearray()
+                    received = 0
+                    chunks = response.aiter_bytes()
+                    async for chunk in chunks:
+                        received += len(chunk)
+                        # </head> may straddle two chunks
+                        start = max(0, len(content) - 6)
+                        content += chunk
+                        end = content.find(b"</head>", start)
+                        if end != -1:
+                            del content[end:]
+                            break
+                        if len(content) >= self.max_head_bytes:
+                            break
+                    # Read the rest of a short body, so the connection can go back to the pool
+                    length = response.headers.get("content-length", "")
+                    if length.isdigit() and int(length) - received <= self.drain_bytes:
+                        async for chunk in chunks:
+                            pass
+                    return bytes(content) + b"</head>"
+        except (httpx.HTTPError, httpx.InvalidURL, gaierror):
+            return None
+
+    async def fetch(self, url: str) -> Optional[HeadSection]:
+        """The parsed `<head>` of a page, from the cache when fresh."""
+        cached = self._cache.get(url)
+        if cached is not None:
+            expires, head = cached
+            if expires > time.monotonic():
+                self._cache.move_to_end(url)
+                return head
+            del self._cache[url]
+
+        task = self._in_flight.get(url)
+        if task is None:
+            task = self._in_flight[url] = asyncio.ensure_future(self._fetch_and_cache(url))
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        # A cancelled caller leaves the fetch running for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, url: str) -> Optional[HeadSection]:
+        content = await self.fetch_head_section(url)
+        if not content:
+            # Failed fetches are not cached, so they are tried again next time
+            return None
+        head = HeadSection(content.decode("utf-8", errors="ignore"))
+        self._cache[url] = (time.monotonic() + self.cache_ttl, head)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return head
+
+    async def fetch_many(
+        self, urls: Iterable[str]
+    ) -> AsyncGenerator[Tuple[str, Optional[HeadSection]], None]:
+        """Fetch the heads of many pages, yielding (url, head) as each one completes."""
+
+        async def fetch_one(url):
+            return url, await self.fetch(url)
+
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in urls]
+        try:
+            for done in asyncio.as_completed(tasks):
+                yield await done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
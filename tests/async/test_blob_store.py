@@ -0,0 +1,214 @@
+import os
+import sys
+import time
+import multiprocessing
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.blob_store import BlobCodec, ShardedBlobStore, PackfileBlobStore
+from crawl4ai.migrations import migrate_blob_store
+from crawl4ai.utils import ensure_content_dirs, generate_content_hash
+
+SAMPLE_HTML = os.path.join(os.path.dirname(__file__), "sample_wikipedia.html")
+
+
+def pages(n: int):
+    return [
+        f"<html><head><title>Page {i}</title></head><body>"
+        + "".join(f"<div class='row'><a href='/item/{i}/{j}'>Item {j}</a></div>" for j in range(50))
+        + "</body></html>"
+        for i in range(n)
+    ]
+
+
+def codecs():
+    available = ["gzip", "raw"]
+    try:
+        import zstandard  # noqa
+        available.insert(0, "zstd")
+    except ImportError:
+        pass
+    return available
+
+
+@pytest.mark.parametrize("codec", codecs())
+@pytest.mark.parametrize("store_class", [ShardedBlobStore, PackfileBlobStore])
+def test_round_trip(tmp_path, store_class, codec):
+    store = store_class(str(tmp_path), codec=codec)
+    contents = pages(20) + ["héllo wörld ✓", "x"]
+    hashes = [store.put(content, "html") for content in contents]
+
+    assert hashes == [generate_content_hash(content) for content in contents]
+    assert store.put("", "html") == ""
+    for content, content_hash in zip(contents, hashes):
+        assert store.contains(content_hash, "html")
+        assert store.get(content_hash, "html") == content
+    assert store.get(hashes[0], "markdown") is None
+    assert store.get("0123456789abcdef", "html") is None
+    store.close()
+
+
+def test_sharded_layout(tmp_path):
+    store = ShardedBlobStore(str(tmp_path))
+    content_hash = store.put("<p>sharded</p>", "cleaned")
+    path = tmp_path / "cleaned_html" / content_hash[:2] / content_hash[2:4] / content_hash
+    assert path.is_file()
+    assert path.read_bytes() != b"<p>sharded</p>"
+
+    # Writing the same content again leaves the blob untouched
+    mtime = path.stat().st_mtime_ns
+    assert store.put("<p>sharded</p>", "cleaned") == content_hash
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_packfile_reopen_and_rollover(tmp_path):
+    store = PackfileBlobStore(str(tmp_path), segment_size=4096)
+    contents = pages(30)
+    hashes = [store.put(content, "html") for content in contents]
+    store.close()
+
+    pack_dir = tmp_path / "packs" / "html_content"
+    assert len(list(pack_dir.glob("*.pack"))) > 1
+
+    reopened = PackfileBlobStore(str(tmp_path), segment_size=4096)
+    for content, content_hash in zip(contents, hashes):
+        assert reopened.get(content_hash, "html") == content
+    extra = reopened.put("<p>after reopen</p>", "html")
+    assert reopened.get(extra, "html") == "<p>after reopen</p>"
+    reopened.close()
+
+
+def test_packfile_ignores_torn_writes(tmp_path):
+    store = PackfileBlobStore(str(tmp_path))
+    kept = store.put("<p>kept</p>", "html")
+    lost = store.put("<p>lost</p>" * 100, "html")
+    store.close()
+
+    # Simulate a crash after the index record was written but before the pack was
+    pack_path = tmp_path / "packs" / "html_content" / "000001.pack"
+    with open(pack_path, "r+b") as f:
+        f.truncate(os.path.getsize(pack_path) - 10)
+    index_path = pack_path.with_suffix(".idx")
+    with open(index_path, "ab") as f:
+        f.write(b"\x00\x01\x02")
+
+    reopened = PackfileBlobStore(str(tmp_path))
+    assert reopened.get(kept, "html") == "<p>kept</p>"
+    assert reopened.get(lost, "html") is None
+
+
+def _put_pages(base_path, worker, hashes):
+    store = PackfileBlobStore(base_path, segment_size=64 * 1024)
+    for content in pages(40)[worker::3] + pages(3):
+        hashes.put(store.put(content, "html"))
+    store.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_packfile_shared_between_processes(tmp_path):
+    # Opened before the other processes write, so it has to pick up their records
+    reader = PackfileBlobStore(str(tmp_path), segment_size=64 * 1024)
+    context = multiprocessing.get_context("fork")
+    hashes = context.Queue()
+    workers = [
+        context.Process(target=_put_pages, args=(str(tmp_path), worker, hashes)) for worker in range(3)
+    ]
+    for process in workers:
+        process.start()
+    # Every worker stores its share of 40 pages plus the same 3 pages as the others
+    put = {hashes.get(timeout=30) for _ in range(40 + 2 * 3)}
+    for process in workers:
+        process.join()
+    assert all(process.exitcode == 0 for process in workers)
+
+    expected = {generate_content_hash(content): content for content in pages(40)}
+    assert put == set(expected)
+    for content_hash, content in expected.items():
+        assert reader.get(content_hash, "html") == content
+
+    # Concurrent appends landed at the offsets their records name, and each blob was stored once
+    pack_dir = tmp_path / "packs" / "html_content"
+    records = sum(path.stat().st_size for path in pack_dir.glob("*.idx"))
+    assert records == len(expected) * PackfileBlobStore.INDEX_RECORD.size
+    reopened = PackfileBlobStore(str(tmp_path))
+    for content_hash, content in expected.items():
+        assert reopened.get(content_hash, "html") == content
+
+
+@pytest.mark.parametrize("store_class", [ShardedBlobStore, PackfileBlobStore])
+def test_legacy_files_and_migration(tmp_path, store_class):
+    content_paths = ensure_content_dirs(str(tmp_path))
+    legacy = {}
+    for i, content in enumerate(pages(5)):
+        content_hash = generate_content_hash(content)
+        with open(os.path.join(content_paths["markdown"], content_hash), "w", encoding="utf-8") as f:
+            f.write(content)
+        legacy[content_hash] = content
+
+    store = store_class(str(tmp_path))
+    for content_hash, content in legacy.items():
+        assert store.get(content_hash, "markdown") == content
+
+    import asyncio
+
+    moved = asyncio.run(migrate_blob_store(str(tmp_path), store))
+    assert moved == len(legacy)
+    assert not [p for p in os.listdir(content_paths["markdown"]) if p in legacy]
+    for content_hash, content in legacy.items():
+        assert store.get(content_hash, "markdown") == content
+    assert asyncio.run(migrate_blob_store(str(tmp_path), store)) == 0
+    store.close()
+
+
+def test_zstd_dictionary(tmp_path):
+    pytest.importorskip("zstandard")
+    codec = BlobCodec(str(tmp_path), codec="zstd")
+    samples = pages(300)
+    plain = codec.encode(samples[0].encode(), "html")
+
+    codec.train_dictionary("html", samples, dict_size=16 * 1024)
+    trained = codec.encode(samples[0].encode(), "html")
+    assert len(trained) < len(plain)
+    assert codec.decode(trained) == codec.decode(plain) == samples[0].encode()
+
+    # A fresh codec finds the dictionary on disk
+    assert BlobCodec(str(tmp_path), codec="zstd").decode(trained) == samples[0].encode()
+
+
+def test_disk_usage(tmp_path):
+    with open(SAMPLE_HTML, "r", encoding="utf-8") as f:
+        html = f.read()
+    contents = [html.replace("Wikipedia", f"Wikipedia {i}") for i in range(20)]
+
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    start = time.perf_counter()
+    for content in contents:
+        (legacy_dir / generate_content_hash(content)).write_text(content, encoding="utf-8")
+    legacy_time = time.perf_counter() - start
+    legacy_size = sum(p.stat().st_size for p in legacy_dir.iterdir())
+
+    results = {"legacy": (legacy_size, legacy_time)}
+    for store_class in (ShardedBlobStore, PackfileBlobStore):
+        base = tmp_path / store_class.__name__
+        store = store_class(str(base))
+        start = time.perf_counter()
+        for content in contents:
+            store.put(content, "html")
+        store.flush()
+        elapsed = time.perf_counter() - start
+        size = sum(p.stat().st_size for p in base.rglob("*") if p.is_file())
+        results[store_class.__name__] = (size, elapsed)
+        store.close()
+
+    for name, (size, elapsed) in results.items():
+        print(f"{name}: {size / 1024:.0f} KiB in {elapsed * 1000:.1f} ms")
+    assert results["ShardedBlobStore"][0] < legacy_size / 3
+    assert results["PackfileBlobStore"][0] < legacy_size / 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
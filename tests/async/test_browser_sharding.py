@@ -0,0 +1,227 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.browser_manager import BrowserManager, ShardedBrowserManager
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+
+    async def new_page(self):
+        # One browser process handles its page operations one after another
+        async with self.browser.lock:
+            await asyncio.sleep(self.browser.delay)
+        self.pages.append(FakePage(self))
+        return self.pages[-1]
+
+    async def add_init_script(self, script):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.lock = asyncio.Lock()
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, **settings):
+        self.contexts.append(FakeContext(self))
+        return self.contexts[-1]
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserManager(BrowserManager):
+    """A BrowserManager whose start launches a fake browser."""
+
+    started = []
+    delay = 0
+
+    async def start(self):
+        await asyncio.sleep(0.01)
+        self.browser = FakeBrowser(self.delay)
+        FakeBrowserManager.started.append(self)
+
+
+def sharded(delay=0, **kwargs):
+    FakeBrowserManager.started = []
+    FakeBrowserManager.delay = delay
+    return ShardedBrowserManager(BrowserConfig(**kwargs), manager_factory=FakeBrowserManager)
+
+
+@pytest.mark.asyncio
+async def test_pages_go_to_the_least_loaded_browser():
+    manager = sharded(browser_count=3)
+    await manager.start()
+    assert len(FakeBrowserManager.started) == 3
+    config = CrawlerRunConfig()
+
+    pages = [(await manager.get_page(config))[0] for _ in range(6)]
+    assert [manager.load(shard) for shard in manager.shards] == [2, 2, 2]
+    assert len({page.context.browser for page in pages}) == 3
+
+    # Release both pages of one browser: the next two pages go there
+    browser = pages[0].context.browser
+    for page in [p for p in pages if p.context.browser is browser]:
+        await manager.release_page(page)
+    more = [(await manager.get_page(config))[0] for _ in range(2)]
+    assert all(page.context.browser is browser for page in more)
+
+    await manager.close()
+    assert all(shard.browser is None for shard in FakeBrowserManager.started)
+
+
+@pytest.mark.asyncio
+async def test_session_pages_stay_with_their_browser():
+    manager = sharded(browser_count=2)
+    await manager.start()
+
+    page, context = await manager.get_page(CrawlerRunConfig(session_id="s1"))
+    # The session counts as an open page, so other pages go to the other browser
+    other, _ = await manager.get_page(CrawlerRunConfig())
+    assert other.context.browser is not page.context.browser
+    for _ in range(3):
+        again, _ = await manager.get_page(CrawlerRunConfig(session_id="s1"))
+        assert again is page
+    assert set(manager.sessions) == {"s1"}
+
+    await manager.kill_session("s1")
+    assert page.closed and not manager.sessions
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_browsers_are_replaced_after_max_pages():
+    manager = sharded(browser_count=2, browser_max_pages=3)
+    await manager.start()
+    config = CrawlerRunConfig()
+
+    held, _ = await manager.get_page(config)
+    old = held.context.browser
+    for _ in range(5):
+        page, _ = await manager.get_page(config)
+        await manager.release_page(page)
+    await asyncio.sleep(0.05)
+
+    # Both browsers served 3 pages and were replaced
+    assert len(FakeBrowserManager.started) == 4
+    assert len(manager.shards) == 2
+    assert all(shard.browser not in (old, None) for shard in manager.shards)
+    # The one with a page still open is kept until that page is released
+    assert not old.closed
+    await manager.release_page(held)
+    await asyncio.sleep(0.01)
+    assert old.closed
+    assert all(shard.browser is None for shard in FakeBrowserManager.started[:2])
+
+    await manager.close()
+    assert all(shard.browser is None for shard in FakeBrowserManager.started)
+
+
+@pytest.mark.asyncio
+async def test_abandoned_sessions_expire_on_replaced_browsers():
+    manager = sharded(browser_max_pages=2)
+    await manager.start()
+    old = manager.shards[0]
+
+    # A session that is never killed, then a page that retires the browser
+    session_page, _ = await manager.get_page(CrawlerRunConfig(session_id="s1"))
+    page, _ = await manager.get_page(CrawlerRunConfig())
+    await manager.release_page(page)
+    await asyncio.sleep(0.05)
+    assert manager.shards[0] is not old and old.browser is not None
+
+    # Once the session expires, the old browser is closed
+    old.session_ttl = 0
+    deadline = time.perf_counter() + 5
+    while old.browser is not None and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+    assert session_page.closed and old.browser is None
+    assert not manager.sessions
+
+    # The session's next page opens a new session on the running browser
+    again, _ = await manager.get_page(CrawlerRunConfig(session_id="s1"))
+    assert again is not session_page
+    assert manager.sessions["s1"][1] is again
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_strategy_shards_when_configured():
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig(browser_count=3))
+    assert isinstance(strategy.browser_manager, ShardedBrowserManager)
+    assert len(strategy.browser_manager.shards) == 3
+
+    strategy = AsyncPlaywrightCrawlerStrategy(browser_config=BrowserConfig())
+    assert type(strategy.browser_manager) is BrowserManager
+
+    with pytest.raises(ValueError):
+        ShardedBrowserManager(BrowserConfig(browser_count=2, use_managed_browser=True))
+
+
+@pytest.mark.asyncio
+async def test_sharding_benchmark():
+    async def run(manager):
+        await manager.start()
+        config = CrawlerRunConfig()
+        semaphore = asyncio.Semaphore(20)
+
+        async def crawl():
+            async with semaphore:
+                page, _ = await manager.get_page(config)
+                await asyncio.sleep(0.01)
+                await manager.release_page(page)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(crawl() for _ in range(200)))
+        elapsed = time.perf_counter() - start
+        await manager.close()
+        return elapsed
+
+    # Each browser opens one page at a time, 5 ms apiece
+    single = await run(sharded(delay=0.005))
+    four = await run(sharded(delay=0.005, browser_count=4))
+
+    print(f"200 pages, 20 at a time: one browser {single:.2f}s, four browsers {four:.2f}s")
+    assert four < single
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,359 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import uuid
+import pytest
+import pytest_asyncio
+import aiosqlite
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy, AsyncHTTPCrawlerStrategy
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.blob_store import ShardedBlobStore
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.models import AsyncCrawlResponse, CrawlResult, MarkdownGenerationResult
+from crawl4ai.utils import generate_content_hash
+
+
+async def make_db(tmp_path, **kwargs) -> AsyncDatabaseManager:
+    db = AsyncDatabaseManager(
+        write_batch_size=1, blob_store=ShardedBlobStore(str(tmp_path)), **kwargs
+    )
+    db.db_path = str(tmp_path / "crawl4ai.db")
+    await db.ainit_db()
+    db._initialized = True
+    return db
+
+
+def make_result(url: str, body: str, headers=None) -> CrawlResult:
+    return CrawlResult(
+        url=url,
+        html=f"<html><body>{body}</body></html>",
+        cleaned_html=body,
+        markdown=MarkdownGenerationResult(
+            raw_markdown=body, markdown_with_citations=body, references_markdown=""
+        ),
+        success=True,
+        response_headers=headers or {},
+    )
+
+
+async def cached_urls(db: AsyncDatabaseManager):
+    async def _urls(conn):
+        async with conn.execute("SELECT url FROM crawled_data") as cursor:
+            return {row[0] for row in await cursor.fetchall()}
+
+    return await db.execute_with_retry(_urls)
+
+
+@pytest.mark.asyncio
+async def test_entry_metadata(tmp_path):
+    db = await make_db(tmp_path)
+    before = time.time()
+    await db.acache_url(
+        make_result("https://a.test/", "<p>a</p>", {"ETag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    )
+
+    info = (await db.aget_cached_url("https://a.test/")).cache_info
+    assert info.fetched_at >= before
+    assert info.size > len("<html><body><p>a</p></body></html>") + len("<p>a</p>")
+    assert info.etag == '"v1"'
+    assert info.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert info.can_revalidate
+    assert not info.is_stale(60)
+    assert info.is_stale(60, now=info.fetched_at + 61)
+    assert not info.is_stale(None)
+
+
+@pytest.mark.asyncio
+async def test_access_time_is_recorded(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result("https://a.test/", "<p>a</p>"))
+    first = (await db.aget_cached_url("https://a.test/")).cache_info.accessed_at
+
+    time.sleep(0.01)
+    await db.aget_cached_url("https://a.test/")
+    await db.aflush_writes()
+    assert (await db.aget_cached_url("https://a.test/")).cache_info.accessed_at > first
+
+
+@pytest.mark.asyncio
+async def test_age_eviction_keeps_revalidatable_entries(tmp_path):
+    db = await make_db(tmp_path, max_entry_age=3600)
+    await db.acache_url(make_result("https://plain.test/", "<p>plain</p>"))
+    await db.acache_url(make_result("https://etag.test/", "<p>etag</p>", {"ETag": '"x"'}))
+
+    assert await db.aevict() == 0
+    assert await db.aevict(now=time.time() + 7200) == 1
+    assert await cached_urls(db) == {"https://etag.test/"}
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_to_budget(tmp_path):
+    db = await make_db(tmp_path)
+    for i in range(5):
+        await db.acache_url(make_result(f"https://lru.test/{i}", f"<p>{i}</p>" * 100))
+    # Page 0 becomes the most recently used entry
+    await db.aget_cached_url("https://lru.test/0")
+    await db.aflush_writes()
+
+    size = (await db.aget_cached_url("https://lru.test/1")).cache_info.size
+    await db.aflush_writes()
+    db.max_cache_bytes = size * 2
+    evicted = await db.aevict()
+
+    assert evicted == 3
+    assert await cached_urls(db) == {"https://lru.test/0", "https://lru.test/1"}
+
+
+@pytest.mark.asyncio
+async def test_eviction_deletes_only_unshared_blobs(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result("https://one.test/", "<p>shared</p>"))
+    await db.acache_url(make_result("https://two.test/", "<p>shared</p>"))
+    await db.acache_url(make_result("https://three.test/", "<p>own</p>"))
+    for url in ("https://two.test/", "https://one.test/"):
+        time.sleep(0.01)
+        size = (await db.aget_cached_url(url)).cache_info.size
+    await db.aflush_writes()
+
+    # three.test was never read, so it is the least recently used entry
+    db.max_cache_bytes = size * 2
+    assert await db.aevict() == 1
+    assert await cached_urls(db) == {"https://one.test/", "https://two.test/"}
+
+    assert db.blob_store.contains(generate_content_hash("<p>shared</p>"), "cleaned")
+    assert not db.blob_store.contains(generate_content_hash("<p>own</p>"), "cleaned")
+    assert (await db.aget_cached_url("https://two.test/")).cleaned_html == "<p>shared</p>"
+
+
+@pytest.mark.asyncio
+async def test_eviction_keeps_blobs_of_entries_being_stored(tmp_path):
+    db = await make_db(tmp_path, max_entry_age=3600)
+    await db.acache_url(make_result("https://old.test/", "<p>shared</p>"))
+
+    # The new entry finds the shared blob already stored and skips writing it,
+    # while an eviction removes the only entry that referenced it
+    storing, release = threading.Event(), threading.Event()
+    put = db.blob_store.put
+
+    def slow_put(content, content_type, content_hash=None):
+        content_hash = put(content, content_type, content_hash)
+        storing.set()
+        release.wait(5)
+        return content_hash
+
+    db.blob_store.put = slow_put
+    caching = asyncio.create_task(db.acache_url(make_result("https://new.test/", "<p>shared</p>")))
+    await asyncio.to_thread(storing.wait, 5)
+    eviction = asyncio.create_task(db.aevict(now=time.time() + 7200))
+    await asyncio.sleep(0.1)
+    release.set()
+    assert await eviction == 1
+    await caching
+
+    assert db.blob_store.contains(generate_content_hash("<p>shared</p>"), "cleaned")
+    assert (await db.aget_cached_url("https://new.test/")).cleaned_html == "<p>shared</p>"
+
+
+@pytest.mark.asyncio
+async def test_schema_upgrade_adds_columns(tmp_path):
+    db = AsyncDatabaseManager(blob_store=ShardedBlobStore(str(tmp_path)))
+    db.db_path = str(tmp_path / "legacy.db")
+    async with aiosqlite.connect(db.db_path) as conn:
+        await conn.execute(
+            """CREATE TABLE crawled_data (
+                url TEXT PRIMARY KEY, html TEXT, cleaned_html TEXT, markdown TEXT,
+                extracted_content TEXT, success BOOLEAN)"""
+        )
+        await conn.execute(
+            "INSERT INTO crawled_data (url, html, success) VALUES ('https://old.test/', '', 1)"
+        )
+        await conn.commit()
+
+    await db.update_db_schema()
+
+    async with aiosqlite.connect(db.db_path) as conn:
+        async with conn.execute("PRAGMA table_info(crawled_data)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        async with conn.execute("SELECT fetched_at, size, etag FROM crawled_data") as cursor:
+            fetched_at, size, etag = await cursor.fetchone()
+    assert {"fetched_at", "accessed_at", "size", "etag", "last_modified"} <= columns
+    assert fetched_at > 0 and size == 0 and etag == ""
+
+
+class ConditionalServer:
+    """Serves one page with an ETag and answers If-None-Match with 304."""
+
+    def __init__(self):
+        self.version = 1
+        self.statuses = []
+        self.methods = []
+        self.user_agents = []
+
+    async def handle(self, request):
+        etag = f'"v{self.version}"'
+        self.methods.append(request.method)
+        self.user_agents.append(request.headers.get("User-Agent"))
+        if request.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            return web.Response(status=304, headers={"ETag": etag})
+        self.statuses.append(200)
+        return web.Response(
+            text=f"<html><body><h1>Version {self.version}</h1><p>Some text for the page.</p></body></html>",
+            content_type="text/html",
+            headers={"ETag": etag},
+        )
+
+
+@pytest_asyncio.fixture
+async def conditional_server():
+    server = ConditionalServer()
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    # A unique path keeps runs from reusing each other's cache entries
+    server.url = f"http://127.0.0.1:{port}/{uuid.uuid4().hex}"
+    yield server
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_revalidate_reuses_result_on_304(conditional_server):
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        first = await crawler.arun(
+            conditional_server.url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED)
+        )
+        assert "Version 1" in first.html
+
+        second = await crawler.arun(
+            conditional_server.url, config=CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE)
+        )
+        assert conditional_server.statuses == [200, 304]
+        assert second.html == first.html
+        assert second.markdown == first.markdown
+
+        # Fresh within the TTL: no request at all
+        await crawler.arun(
+            conditional_server.url,
+            config=CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE, cache_ttl=3600),
+        )
+        assert conditional_server.statuses == [200, 304]
+
+        conditional_server.version = 2
+        third = await crawler.arun(
+            conditional_server.url, config=CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE)
+        )
+        # The 200 answer to the conditional GET is used directly
+        assert conditional_server.statuses == [200, 304, 200]
+        assert "Version 2" in third.html
+
+
+class FakeBrowser(AsyncCrawlerStrategy):
+    """A strategy without revalidate that renders the server's current version."""
+
+    def __init__(self, server):
+        self.server = server
+        self.crawls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.crawls += 1
+        return AsyncCrawlResponse(
+            html=f"<html><body><h1>Version {self.server.version}</h1><p>Rendered.</p></body></html>",
+            response_headers={"ETag": f'"v{self.server.version}"'},
+            status_code=200,
+        )
+
+
+@pytest.mark.asyncio
+async def test_browser_strategies_revalidate_with_head(conditional_server):
+    browser = FakeBrowser(conditional_server)
+    config = CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE)
+    async with AsyncWebCrawler(crawler_strategy=browser) as crawler:
+        await crawler.arun(conditional_server.url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        await crawler.arun(conditional_server.url, config=config)
+        assert browser.crawls == 1
+
+        conditional_server.version = 2
+        result = await crawler.arun(conditional_server.url, config=config)
+        assert "Version 2" in result.html
+        assert browser.crawls == 2
+
+    # Only the page's validators crossed the wire; the browser fetched the changed page
+    assert conditional_server.methods == ["HEAD", "HEAD"]
+    assert conditional_server.statuses == [304, 200]
+
+
+@pytest.mark.asyncio
+async def test_browser_revalidation_follows_browser_settings(conditional_server):
+    browser = FakeBrowser(conditional_server)
+    browser_config = BrowserConfig(user_agent="TestBrowser/1.0", headers={"X-Test": "1"})
+    config = CrawlerRunConfig(cache_mode=CacheMode.REVALIDATE)
+    async with AsyncWebCrawler(config=browser_config, crawler_strategy=browser) as crawler:
+        await crawler.arun(conditional_server.url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        await crawler.arun(conditional_server.url, config=config)
+        assert conditional_server.user_agents == ["TestBrowser/1.0"]
+
+        # The HEAD could not go through the proxy, so the browser fetches the page
+        proxied = config.clone(proxy_config={"server": "http://127.0.0.1:3128"})
+        await crawler.arun(conditional_server.url, config=proxied)
+        assert browser.crawls == 2
+    assert conditional_server.methods == ["HEAD"]
+
+    browser = FakeBrowser(conditional_server)
+    with_cookies = BrowserConfig(cookies=[{"name": "sid", "value": "1", "url": conditional_server.url}])
+    async with AsyncWebCrawler(config=with_cookies, crawler_strategy=browser) as crawler:
+        await crawler.arun(conditional_server.url, config=config)
+        assert browser.crawls == 1
+    assert conditional_server.methods == ["HEAD"]
+
+
+@pytest.mark.asyncio
+async def test_ttl_expires_entries(conditional_server):
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, cache_ttl=3600)
+        await crawler.arun(conditional_server.url, config=config)
+        await crawler.arun(conditional_server.url, config=config)
+        assert conditional_server.statuses == [200]
+
+        await crawler.arun(
+            conditional_server.url,
+            config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED, cache_ttl=0),
+        )
+        assert conditional_server.statuses == [200, 200]
+
+
+
+@pytest.mark.asyncio
+async def test_crawler_sets_eviction_limits(monkeypatch):
+    from crawl4ai import async_webcrawler
+
+    db = AsyncDatabaseManager()
+    monkeypatch.setattr(async_webcrawler, "async_db_manager", db)
+    AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy(), cache_max_bytes=1024, cache_max_age=60)
+    assert (db.max_cache_bytes, db.max_entry_age) == (1024, 60)
+
+    # Crawlers created without limits leave the shared settings alone
+    AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy())
+    assert (db.max_cache_bytes, db.max_entry_age) == (1024, 60)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
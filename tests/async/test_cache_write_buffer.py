@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.blob_store import ShardedBlobStore
+
+
+async def make_db(tmp_path, **kwargs) -> AsyncDatabaseManager:
+    db = AsyncDatabaseManager(blob_store=ShardedBlobStore(str(tmp_path)), **kwargs)
+    db.db_path = str(tmp_path / "crawl4ai.db")
+    await db.ainit_db()
+    db._initialized = True
+    return db
+
+
+def make_result(i: int) -> CrawlResult:
+    return CrawlResult(
+        url=f"https://example.com/page/{i}",
+        html=f"<html><body><p>Page {i}</p></body></html>",
+        cleaned_html=f"<p>Page {i}</p>",
+        markdown=MarkdownGenerationResult(
+            raw_markdown=f"Page {i}",
+            markdown_with_citations=f"Page {i}",
+            references_markdown="",
+        ),
+        success=True,
+        links={"internal": [{"href": f"https://example.com/page/{i + 1}"}]},
+        metadata={"title": f"Page {i}"},
+    )
+
+
+async def count_rows(db: AsyncDatabaseManager) -> int:
+    async def _count(conn):
+        async with conn.execute("SELECT COUNT(*) FROM crawled_data") as cursor:
+            return (await cursor.fetchone())[0]
+
+    return await db.execute_with_retry(_count)
+
+
+@pytest.mark.asyncio
+async def test_pending_rows_are_readable(tmp_path):
+    db = await make_db(tmp_path, write_batch_size=100, write_flush_interval=60)
+    await db.acache_url(make_result(1))
+
+    assert await count_rows(db) == 0
+    cached = await db.aget_cached_url("https://example.com/page/1")
+    assert cached is not None
+    assert cached.html == "<html><body><p>Page 1</p></body></html>"
+    assert cached.metadata == {"title": "Page 1"}
+
+    await db.aflush_writes()
+    assert await count_rows(db) == 1
+    flushed = await db.aget_cached_url("https://example.com/page/1")
+    assert flushed.model_dump() == cached.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_batch_size(tmp_path):
+    db = await make_db(tmp_path, write_batch_size=10, write_flush_interval=60)
+    for i in range(9):
+        await db.acache_url(make_result(i))
+    assert await count_rows(db) == 0
+
+    await db.acache_url(make_result(9))
+    assert await count_rows(db) == 10
+    assert not db._pending_writes
+
+
+@pytest.mark.asyncio
+async def test_flush_on_interval(tmp_path):
+    db = await make_db(tmp_path, write_batch_size=100, write_flush_interval=0.05)
+    await db.acache_url(make_result(1))
+    await asyncio.sleep(0.5)
+    assert await count_rows(db) == 1
+
+
+@pytest.mark.asyncio
+async def test_latest_result_wins(tmp_path):
+    db = await make_db(tmp_path, write_batch_size=100, write_flush_interval=60)
+    first, second = make_result(1), make_result(2)
+    second.url = first.url
+    await db.acache_url(first)
+    await db.acache_url(second)
+    await db.aflush_writes()
+
+    assert await count_rows(db) == 1
+    cached = await db.aget_cached_url(first.url)
+    assert cached.cleaned_html == "<p>Page 2</p>"
+
+
+@pytest.mark.asyncio
+async def test_total_count_includes_pending(tmp_path):
+    db = await make_db(tmp_path, write_batch_size=100, write_flush_interval=60)
+    for i in range(3):
+        await db.acache_url(make_result(i))
+    assert await db.aget_total_count() == 3
+
+
+@pytest.mark.asyncio
+async def test_write_throughput(tmp_path):
+    n = 300
+    results = [make_result(i) for i in range(n)]
+
+    timings = {}
+    for label, batch_size in (("per-row", 1), ("batched", 100)):
+        db = await make_db(tmp_path / label, write_batch_size=batch_size)
+        start = time.perf_counter()
+        for result in results:
+            await db.acache_url(result)
+        await db.aflush_writes()
+        timings[label] = time.perf_counter() - start
+        assert await count_rows(db) == n
+
+    for label, elapsed in timings.items():
+        print(f"{label}: {n / elapsed:.0f} rows/sec")
+    assert timings["batched"] < timings["per-row"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
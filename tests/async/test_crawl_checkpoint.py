@@ -0,0 +1,128 @@
+import os
+import sys
+import asyncio
+from collections import Counter
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, BestFirstCrawlingStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+SITE = "https://site.test"
+ALL_PAGES = 1 + 3 + 9 + 27
+
+
+class TreeSite(AsyncCrawlerStrategy):
+    """Three children per page, three levels deep; counts every fetch."""
+
+    def __init__(self):
+        self.fetches = Counter()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0.001)
+        path = url[len(SITE):].rstrip("/")
+        self.fetches[path or "/"] += 1
+        links = f'<a href="{SITE}/">Home</a>'
+        if path.count("/") < 3:
+            links += "".join(f'<a href="{SITE}{path}/{i}">Child {i}</a>' for i in range(3))
+        return AsyncCrawlResponse(
+            html=f"<html><body><p>Page {path or '/'}</p>{links}</body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+async def crawl(site, strategy, stop_after=None):
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy, stream=True
+    )
+    urls = []
+    async with AsyncWebCrawler(crawler_strategy=site) as crawler:
+        results = await crawler.arun(SITE + "/", config=config)
+        try:
+            async for result in results:
+                urls.append(result.url.rstrip("/"))
+                if len(urls) == stop_after:
+                    break
+        finally:
+            # Close the stream here, as an interrupted crawl would
+            await results.aclose()
+    return urls
+
+
+def bfs(pipelined, **kwargs):
+    return BFSDeepCrawlStrategy(
+        max_depth=3,
+        pipelined=pipelined,
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=4),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pipelined", [False, True])
+async def test_resume_after_crash(tmp_path, pipelined):
+    path = str(tmp_path / "crawl.ckpt")
+    site = TreeSite()
+
+    strategy = bfs(pipelined, checkpoint_path=path, checkpoint_interval=5)
+    # Simulate a crash: drop whatever was not committed instead of a final checkpoint
+    strategy.close_frontier = lambda: strategy._checkpoint_store._conn.close()
+    first = await crawl(site, strategy, stop_after=17)
+
+    resumed = bfs(pipelined, resume_from=path)
+    second = await crawl(site, resumed)
+
+    # The 15 results covered by the last checkpoint are not fetched again
+    assert not set(first[:15]) & set(second)
+    assert set(first) | set(second) == {SITE + k.rstrip("/") for k in site.fetches}
+    assert len(site.fetches) == ALL_PAGES
+    # Only pages after the checkpoint or in flight at the crash are fetched twice
+    assert sum(site.fetches.values()) - ALL_PAGES <= 2 + 4
+    assert resumed.stats.urls_processed == 15 + len(second)
+
+
+@pytest.mark.asyncio
+async def test_best_first_resume_keeps_page_budget(tmp_path):
+    path = str(tmp_path / "crawl.ckpt")
+    site = TreeSite()
+
+    strategy = BestFirstCrawlingStrategy(max_depth=3, max_pages=20, checkpoint_path=path)
+    first = await crawl(site, strategy, stop_after=8)
+
+    resumed = BestFirstCrawlingStrategy(
+        max_depth=3, max_pages=20, resume_from=path, checkpoint_path=str(tmp_path / "next.ckpt")
+    )
+    second = await crawl(site, resumed)
+
+    # The last result was yielded but its links were never queued, so it is fetched again
+    assert set(first) & set(second) == {first[-1]}
+    assert len(first) - 1 + len(second) == 20
+    assert resumed._pages_crawled == 20
+    # Resuming into another checkpoint file leaves the original untouched
+    assert os.path.exists(tmp_path / "next.ckpt")
+
+
+@pytest.mark.asyncio
+async def test_resume_from_missing_checkpoint(tmp_path):
+    strategy = bfs(False, resume_from=str(tmp_path / "missing.ckpt"))
+    with pytest.raises(FileNotFoundError):
+        await crawl(TreeSite(), strategy)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,165 @@
+import os
+import sys
+import time
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    CrawlFrontier,
+    FilterChain,
+    URLPatternFilter,
+)
+from crawl4ai.models import CrawlResult
+from crawl4ai.utils import normalize_url_for_deep_crawl
+
+SOURCE = "https://example.com/index"
+
+
+def page_with_links(hrefs):
+    return CrawlResult(
+        url=SOURCE,
+        html="",
+        success=True,
+        links={"internal": [{"href": href} for href in hrefs], "external": []},
+    )
+
+
+def test_frontier_order_and_lookup():
+    frontier = CrawlFrontier()
+    assert frontier.add("https://a.test/", depth=0)
+    assert frontier.add("https://a.test/2", depth=2, parent="https://a.test/1")
+    assert frontier.add("https://a.test/1", depth=1, parent="https://a.test/")
+    assert not frontier.add("https://a.test/1", depth=1)
+    assert len(frontier) == 3
+
+    assert [url for url, _ in frontier.drain()] == [
+        "https://a.test/",
+        "https://a.test/1",
+        "https://a.test/2",
+    ]
+    assert not frontier
+    entry = frontier.get("https://a.test/2")
+    assert (entry.depth, entry.parent, entry.pending) == (2, "https://a.test/1", False)
+    # Crawled URLs stay known, so they are never queued again
+    assert "https://a.test/2" in frontier
+    assert not frontier.add("https://a.test/2", depth=0)
+
+
+def test_frontier_moves_pending_url_up():
+    frontier = CrawlFrontier()
+    frontier.add("https://a.test/x", depth=3, parent="https://a.test/deep")
+    frontier.add("https://a.test/y", depth=2)
+    assert frontier.add("https://a.test/x", depth=1, parent="https://a.test/")
+
+    url, entry = frontier.pop()
+    assert (url, entry.depth, entry.parent) == ("https://a.test/x", 1, "https://a.test/")
+    assert frontier.pop()[0] == "https://a.test/y"
+    assert frontier.pop() is None
+
+
+def test_frontier_priority_and_batches():
+    frontier = CrawlFrontier()
+    for i, score in enumerate([0.5, 0.1, 0.9, 0.1]):
+        frontier.add(f"https://a.test/{i}", depth=1, score=score, priority=score)
+    assert [url for url, _ in frontier.pop_many(3)] == [
+        "https://a.test/1",
+        "https://a.test/3",
+        "https://a.test/0",
+    ]
+    assert len(frontier) == 1
+
+
+@pytest.mark.asyncio
+async def test_link_discovery_deduplicates_and_filters():
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=2, filter_chain=FilterChain([URLPatternFilter(patterns=["*/keep/*"])])
+    )
+    hrefs = [
+        "https://example.com/keep/1",
+        "https://example.com/keep/1#section",
+        "https://example.com/keep/1/",
+        "/keep/2",
+        "https://example.com/drop/3",
+        "https://example.com/keep/known",
+        "",
+    ]
+    frontier = CrawlFrontier()
+    frontier.add("https://example.com/keep/known", depth=1)
+
+    next_level, depths = [], {}
+    await strategy.link_discovery(page_with_links(hrefs), SOURCE, 0, frontier, next_level, depths)
+
+    assert next_level == [
+        ("https://example.com/keep/1", SOURCE),
+        ("https://example.com/keep/2", SOURCE),
+    ]
+    assert depths == {url: 1 for url, _ in next_level}
+    assert strategy.stats.urls_skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_best_first_link_discovery_normalizes():
+    strategy = BestFirstCrawlingStrategy(max_depth=2)
+    next_links, depths = [], {}
+    await strategy.link_discovery(
+        page_with_links(["/a", "/a#top", "https://example.com/b"]), SOURCE, 0, set(), next_links, depths
+    )
+    assert [url for url, _ in next_links] == ["https://example.com/a", "https://example.com/b"]
+
+
+@pytest.mark.asyncio
+async def test_large_page_benchmark():
+    # 50k links: 10k distinct pages, each linked five times with and without fragments
+    hrefs = [
+        f"https://example.com/item/{i % 10000}" + ("#reviews" if i % 2 else "")
+        for i in range(50000)
+    ]
+    result = page_with_links(hrefs)
+    strategy = BFSDeepCrawlStrategy(max_depth=2)
+
+    start = time.perf_counter()
+    next_level, depths = [], {}
+    await strategy.link_discovery(result, SOURCE, 0, CrawlFrontier(), next_level, depths)
+    bulk = time.perf_counter() - start
+    assert len(next_level) == 10000
+
+    # The previous per-link path: normalize, check and filter every link
+    start = time.perf_counter()
+    visited = set()
+    per_link = []
+    for link in result.links["internal"]:
+        url = normalize_url_for_deep_crawl(link["href"], SOURCE)
+        if url in visited:
+            continue
+        if await strategy.can_process_url(link["href"], 1):
+            per_link.append(url)
+    per_link_time = time.perf_counter() - start
+
+    # Parent lookup for a whole level: linear scan versus frontier index
+    level = [(url, SOURCE) for url, _ in next_level]
+    frontier = CrawlFrontier()
+    for url, parent in level:
+        frontier.add(url, 1, parent)
+    sample = [url for url, _ in level[::100]]
+    start = time.perf_counter()
+    for url in sample:
+        next((parent for (u, parent) in level if u == url), None)
+    scan = (time.perf_counter() - start) * len(level) / len(sample)
+    start = time.perf_counter()
+    for url, _ in level:
+        frontier.get(url).parent
+    indexed = time.perf_counter() - start
+
+    print(f"link discovery, 50k links: bulk {bulk * 1000:.0f} ms, per link {per_link_time * 1000:.0f} ms")
+    print(f"parent lookup, 10k results: scan ~{scan * 1000:.0f} ms, indexed {indexed * 1000:.1f} ms")
+    assert bulk < per_link_time
+    assert indexed < scan
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,164 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+from collections import defaultdict
+from urllib.parse import urlparse
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import (
+    DomainFairDispatcher,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
+    TokenBucket,
+)
+from crawl4ai.models import CrawlResult
+
+
+class FakeCrawler:
+    """Stands in for AsyncWebCrawler: records timings and per-domain concurrency."""
+
+    def __init__(self, delay: float = 0.01, status_codes=None):
+        self.delay = delay
+        self.status_codes = status_codes or {}
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.total_active = 0
+        self.total_peak = 0
+        self.starts = defaultdict(list)
+        self.finished = {}
+
+    async def arun(self, url, config=None, session_id=None):
+        domain = urlparse(url).netloc
+        self.starts[domain].append(time.monotonic())
+        self.active[domain] += 1
+        self.total_active += 1
+        self.peak[domain] = max(self.peak[domain], self.active[domain])
+        self.total_peak = max(self.total_peak, self.total_active)
+        await asyncio.sleep(self.delay)
+        self.active[domain] -= 1
+        self.total_active -= 1
+        self.finished[url] = time.monotonic()
+        return CrawlResult(
+            url=url, html="", success=True, status_code=self.status_codes.get(domain, 200)
+        )
+
+
+def mixed_urls(slow_pages: int = 20, other_domains: int = 20):
+    return [f"https://slow.test/{i}" for i in range(slow_pages)] + [
+        f"https://site{i}.test/" for i in range(other_domains)
+    ]
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    bucket.consume(now=bucket.updated)
+    bucket.consume(now=bucket.updated)
+    assert bucket.wait_time(now=bucket.updated) == pytest.approx(0.5)
+    assert bucket.wait_time(now=bucket.updated + 0.5) == 0
+    assert TokenBucket(rate=0).wait_time() == 0
+
+
+@pytest.mark.asyncio
+async def test_all_urls_crawled_within_caps():
+    crawler = FakeCrawler()
+    dispatcher = DomainFairDispatcher(
+        max_session_permit=5, max_per_domain=2, requests_per_second=0
+    )
+    urls = [f"https://d{i % 4}.test/{i}" for i in range(40)]
+
+    results = await dispatcher.run_urls(urls, crawler, CrawlerRunConfig())
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert all(r.result.success for r in results)
+    assert max(crawler.peak.values()) == 2
+    assert crawler.total_peak == 5
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_each_domain():
+    crawler = FakeCrawler(delay=0)
+    dispatcher = DomainFairDispatcher(requests_per_second=20, burst=1)
+    urls = [f"https://a.test/{i}" for i in range(5)] + [f"https://b.test/{i}" for i in range(5)]
+
+    await dispatcher.run_urls(urls, crawler, CrawlerRunConfig())
+
+    for domain in ("a.test", "b.test"):
+        starts = crawler.starts[domain]
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.04
+    # Both domains are paced in parallel rather than one after the other
+    assert abs(crawler.starts["a.test"][-1] - crawler.starts["b.test"][-1]) < 0.04
+
+
+@pytest.mark.asyncio
+async def test_backoff_does_not_hold_slots():
+    crawler = FakeCrawler(status_codes={"slow.test": 429})
+    dispatcher = DomainFairDispatcher(
+        max_session_permit=2,
+        requests_per_second=0,
+        rate_limiter=RateLimiter(base_delay=(0.5, 0.5), max_delay=5.0, max_retries=1),
+    )
+
+    results = []
+    async for result in dispatcher.run_urls_stream(
+        urls=mixed_urls(slow_pages=3, other_domains=10), crawler=crawler, config=CrawlerRunConfig()
+    ):
+        results.append(result)
+
+    assert len(results) == 13
+    # The second 429 exceeds max_retries and fails the URL
+    failures = [r for r in results if r.error_message]
+    assert failures and all("slow.test" in r.url for r in failures)
+    other = [t for url, t in crawler.finished.items() if "site" in url]
+    assert max(other) < max(crawler.starts["slow.test"])
+
+
+
+@pytest.mark.asyncio
+async def test_first_rate_limited_response_backs_off():
+    crawler = FakeCrawler(delay=0, status_codes={"limited.test": 429})
+    dispatcher = DomainFairDispatcher(
+        max_per_domain=1,
+        requests_per_second=0,
+        rate_limiter=RateLimiter(base_delay=(0.2, 0.2), max_delay=5.0, max_retries=3),
+    )
+
+    await dispatcher.run_urls(
+        ["https://limited.test/1", "https://limited.test/2"], crawler, CrawlerRunConfig()
+    )
+
+    # The first 429 doubles the base delay instead of a delay the domain never had
+    first, second = crawler.starts["limited.test"]
+    assert second - first >= 0.2 * 2 * 0.75
+
+@pytest.mark.asyncio
+async def test_mixed_domains_throughput():
+    urls = mixed_urls(slow_pages=10, other_domains=30)
+
+    async def time_other_domains(dispatcher):
+        crawler = FakeCrawler()
+        start = time.monotonic()
+        await dispatcher.run_urls(urls=urls, crawler=crawler, config=CrawlerRunConfig())
+        return max(t for url, t in crawler.finished.items() if "site" in url) - start
+
+    limiter = lambda: RateLimiter(base_delay=(0.2, 0.2), max_delay=1.0)
+    fifo = await time_other_domains(
+        MemoryAdaptiveDispatcher(max_session_permit=4, rate_limiter=limiter())
+    )
+    fair = await time_other_domains(
+        DomainFairDispatcher(max_session_permit=4, requests_per_second=0, rate_limiter=limiter())
+    )
+
+    print(f"MemoryAdaptiveDispatcher: other domains done after {fifo:.2f}s")
+    print(f"DomainFairDispatcher: other domains done after {fair:.2f}s")
+    assert fair < fifo
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
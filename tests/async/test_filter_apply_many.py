@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import random
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.deep_crawling.filters import (
+    ContentTypeFilter,
+    DomainFilter,
+    FilterChain,
+    URLFilter,
+    URLPatternFilter,
+)
+
+PARTS = ["docs", "blog", "blog-post-1", "download", "api", "v2", "page.html",
+         "paper.pdf", "img.png", "archive.tar.gz", "2024", "x"]
+HOSTS = ["example.com", "docs.example.com", "ads.example.com", "python.org",
+         "cdn.python.org", "example.org", "tracker.net", "sub.example.com:8080"]
+
+
+def make_urls(count, seed=5):
+    rng = random.Random(seed)
+    urls = {
+        f"https://{rng.choice(HOSTS)}/"
+        + "/".join(rng.choice(PARTS) for _ in range(rng.randint(0, 5)))
+        + rng.choice(["", "/", "?q=1", "#top"])
+        for _ in range(count)
+    }
+    return sorted(urls)
+
+
+def make_filters():
+    return [
+        DomainFilter(
+            allowed_domains=["example.com", "python.org", "example.org"],
+            blocked_domains=["ads.example.com"],
+        ),
+        URLPatternFilter(
+            ["*.html", "*/docs/*", "*/download/*", r"^https://cdn\.python\.org/\d+",
+             "*blog-*-[0-9]", "https://python.org/*", "*/api/v2*"]
+        ),
+        ContentTypeFilter(["text/html", "application/pdf"]),
+    ]
+
+
+class HeadFilter(URLFilter):
+    """Async filter standing in for the head-fetching ones; records what it saw."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen = []
+
+    async def apply(self, url: str) -> bool:
+        self.seen.append(url)
+        result = "example" in url
+        self._update_stats(result)
+        return result
+
+
+def counters(chain):
+    return [tuple(chain.stats._counters)] + [tuple(f.stats._counters) for f in chain.filters]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_async", [False, True])
+async def test_apply_many_matches_apply(with_async):
+    urls = make_urls(3000) + ["", "not a url", "https://EXAMPLE.com/page.html"]
+    extra = [HeadFilter()] if with_async else []
+    scalar = FilterChain(make_filters() + extra)
+    batch = FilterChain(make_filters() + ([HeadFilter()] if with_async else []))
+
+    expected = [await scalar.apply(url) for url in urls]
+    assert 0 < sum(expected) < len(urls)
+    assert await batch.apply_many(urls) == expected
+    assert counters(batch) == counters(scalar)
+    if with_async:
+        # Head fetches only happen for URLs that pass every synchronous filter
+        assert batch.filters[-1].seen == scalar.filters[-1].seen
+        assert len(batch.filters[-1].seen) < len(urls)
+    assert await batch.apply_many([]) == []
+
+
+def test_merged_patterns_match_separately():
+    patterns = ["*.example.com://x*", "*/docs/*", r"^https?://.*\.org/\d+",
+                "(a)\\1", "blog-*-[0-9]"]
+    merged = URLPatternFilter(patterns)
+    assert len(merged._matchers) == 2  # The backreference is kept apart
+    urls = make_urls(1000) + ["https://aa.test/", "https://cdn.python.org/2024",
+                              "https://a.example.com://xyz"]
+    for url in urls:
+        expected = any(
+            (URLPatternFilter([p])._matchers[0].search(url)) for p in patterns
+        )
+        assert merged._match(url) == expected, url
+
+
+@pytest.mark.asyncio
+async def test_add_filter_recompiles():
+    chain = FilterChain([DomainFilter(allowed_domains="example.com")])
+    urls = ["https://example.com/a.html", "https://example.com/a.png", "https://b.com/"]
+    assert await chain.apply_many(urls) == [True, True, False]
+    assert chain.add_filter(ContentTypeFilter("text/html")) is chain
+    assert await chain.apply_many(urls) == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_apply_many_benchmark():
+    urls = make_urls(60000, seed=9)
+
+    start = time.perf_counter()
+    scalar = FilterChain(make_filters())
+    for url in urls:
+        await scalar.apply(url)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await FilterChain(make_filters()).apply_many(urls)
+    batch_time = time.perf_counter() - start
+
+    print(f"{len(urls)} URLs, 3 filters: apply() loop {loop_time * 1000:.0f} ms, "
+          f"apply_many {batch_time * 1000:.0f} ms")
+    assert batch_time < loop_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
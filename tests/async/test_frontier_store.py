@@ -0,0 +1,206 @@
+import os
+import sys
+import time
+import asyncio
+import tracemalloc
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    BloomFilter,
+    CrawlFrontier,
+    MemoryFrontierStore,
+    SQLiteFrontierStore,
+)
+from crawl4ai.models import AsyncCrawlResponse
+
+SITE = "https://site.test"
+
+
+class TreeSite(AsyncCrawlerStrategy):
+    """Every page links to three children and back to the home page, three levels deep."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0)
+        path = url[len(SITE):].rstrip("/")
+        links = f'<a href="{SITE}/">Home</a>'
+        if path.count("/") < 3:
+            links += "".join(f'<a href="{SITE}{path}/{i}">Child {i}</a>' for i in range(3))
+        return AsyncCrawlResponse(
+            html=f"<html><body><p>Page {path or '/'}</p>{links}</body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryFrontierStore()
+    else:
+        store = SQLiteFrontierStore(str(tmp_path / "frontier.db"), bloom_capacity=1000)
+        yield store
+        store.close()
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(capacity=10000, error_rate=0.01)
+    for i in range(10000):
+        bloom.add(f"https://a.test/{i}")
+    assert all(f"https://a.test/{i}" in bloom for i in range(10000))
+    false_positives = sum(f"https://b.test/{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_frontier_over_store(store):
+    frontier = CrawlFrontier(store)
+    frontier.add("https://a.test/x", depth=3, parent="https://a.test/deep")
+    frontier.add("https://a.test/y", depth=2)
+    assert frontier.add("https://a.test/x", depth=1, parent="https://a.test/")
+    assert not frontier.add("https://a.test/y", depth=2)
+    assert len(frontier) == 2
+
+    url, entry = frontier.pop()
+    assert (url, entry.depth, entry.parent) == ("https://a.test/x", 1, "https://a.test/")
+    assert "https://a.test/x" in frontier.started
+    assert "https://a.test/y" not in frontier.started
+    assert frontier.pop()[0] == "https://a.test/y"
+    assert frontier.pop() is None
+    assert not frontier.add("https://a.test/x", depth=0)
+    assert frontier.get("https://a.test/y").pending is False
+    assert "https://a.test/z" not in frontier
+
+
+def test_requeued_urls_keep_their_place(store):
+    frontier = CrawlFrontier(store)
+    for i in range(3):
+        frontier.add(f"https://a.test/{i}", depth=1)
+    assert frontier.pop()[0] == "https://a.test/0"
+    frontier.add("https://a.test/late", depth=1)
+
+    # A URL handed out but never completed goes back ahead of the ones queued after it
+    assert CrawlFrontier(store).requeue_unfinished() == 1
+    frontier = CrawlFrontier(store)
+    assert [url for url, _ in frontier.drain()] == [
+        "https://a.test/0",
+        "https://a.test/1",
+        "https://a.test/2",
+        "https://a.test/late",
+    ]
+
+
+def test_sqlite_store_reopens(tmp_path):
+    path = str(tmp_path / "frontier.db")
+    store = SQLiteFrontierStore(path)
+    frontier = CrawlFrontier(store)
+    for i in range(5):
+        frontier.add(f"https://a.test/{i}", depth=i)
+    assert frontier.pop()[0] == "https://a.test/0"
+    store.close()
+
+    frontier = CrawlFrontier(SQLiteFrontierStore(path))
+    assert len(frontier) == 4
+    assert "https://a.test/0" in frontier.started
+    frontier.add("https://a.test/late", depth=1)
+    assert [url for url, _ in frontier.drain()] == [
+        "https://a.test/1",
+        "https://a.test/late",
+        "https://a.test/2",
+        "https://a.test/3",
+        "https://a.test/4",
+    ]
+    frontier.store.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pipelined", [False, True])
+async def test_bfs_with_sqlite_store(tmp_path, pipelined):
+    async def crawl(store):
+        strategy = BFSDeepCrawlStrategy(
+            max_depth=3,
+            pipelined=pipelined,
+            dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10),
+            frontier_store=store,
+        )
+        config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy)
+        async with AsyncWebCrawler(crawler_strategy=TreeSite()) as crawler:
+            results = await crawler.arun(SITE + "/", config=config)
+        return {r.url.rstrip("/"): r.metadata["depth"] for r in results}
+
+    store = SQLiteFrontierStore(str(tmp_path / "frontier.db"))
+    on_disk = await crawl(store)
+    # A second run over the same store starts from scratch
+    assert await crawl(store) == on_disk
+    store.close()
+    assert on_disk == await crawl(None)
+    assert len(on_disk) == 1 + 3 + 9 + 27
+
+
+@pytest.mark.asyncio
+async def test_best_first_with_sqlite_store(tmp_path):
+    store = SQLiteFrontierStore(str(tmp_path / "frontier.db"))
+    strategy = BestFirstCrawlingStrategy(max_depth=2, frontier_store=store)
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy)
+    async with AsyncWebCrawler(crawler_strategy=TreeSite()) as crawler:
+        results = await crawler.arun(SITE + "/", config=config)
+    store.close()
+    assert len({r.url.rstrip("/") for r in results}) == len(results) == 1 + 3 + 9
+
+
+def test_frontier_memory_benchmark(tmp_path):
+    count = 50_000
+
+    def fill(store):
+        frontier = CrawlFrontier(store)
+        tracemalloc.start()
+        for i in range(count):
+            frontier.add(f"https://example.com/section/{i % 97}/page/{i}", depth=i % 5)
+        for _ in range(count // 2):
+            frontier.pop()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return frontier, peak
+
+    _, memory_peak = fill(MemoryFrontierStore())
+    store = SQLiteFrontierStore(str(tmp_path / "frontier.db"), bloom_capacity=count)
+    frontier, disk_peak = fill(store)
+
+    # Lookups of unseen URLs are answered by the Bloom filter; false positives
+    # still go through the exact check
+    start = time.perf_counter()
+    misses = sum(f"https://example.com/new/{i}" in frontier for i in range(10000))
+    bloom_time = time.perf_counter() - start
+    store.bloom = None
+    start = time.perf_counter()
+    sum(f"https://example.com/new/{i}" in frontier for i in range(10000))
+    exact_time = time.perf_counter() - start
+    store.close()
+
+    print(
+        f"{count} URLs, half crawled: memory store peak {memory_peak / 2**20:.1f} MiB, "
+        f"SQLite store peak {disk_peak / 2**20:.1f} MiB"
+    )
+    print(f"10k unseen lookups: Bloom filter {bloom_time * 1000:.0f} ms, exact {exact_time * 1000:.0f} ms")
+    assert misses == 0
+    assert disk_peak < memory_peak / 4
+    assert bloom_time < exact_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import asyncio
+import httpx
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.deep_crawling.filters import ContentRelevanceFilter, FilterChain, SEOFilter
+from crawl4ai.utils import HeadFetcher, HeadPeekr
+
+HEAD = (
+    "<html><head><title>{title}</title>"
+    '<meta name="description" content="{description}">'
+    '<meta name="keywords" content="{keywords}"></head>'
+)
+
+
+class HeadServer:
+    """Local site counting requests, connections and concurrent requests."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = set()
+        self.active = 0
+        self.max_active = 0
+
+    async def page(self, request):
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            name = request.match_info["name"]
+            if name == "moved":
+                raise web.HTTPFound("/page/target")
+            if "crawl" in name:
+                head = HEAD.format(
+                    title="Async crawling guide",
+                    description="Guides to async crawling in Python",
+                    keywords="crawl, python, async",
+                )
+            else:
+                head = HEAD.format(title="About us", description="Our team", keywords="team")
+            if name == "huge":
+                # A head that never ends, followed by a body that never does either
+                response = web.StreamResponse()
+                await response.prepare(request)
+                await response.write(b"<html><head><title>Huge</title>")
+                for _ in range(200):
+                    await response.write(b"x" * 16384)
+                    await asyncio.sleep(0.001)
+                return response
+            body = head + "<body>" + "text " * 2000 + "</body></html>"
+            return web.Response(text=body, content_type="text/html")
+        finally:
+            self.active -= 1
+
+
+@pytest_asyncio.fixture
+async def server():
+    site = HeadServer()
+    app = web.Application()
+    app.router.add_get("/page/{name}", site.page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    site.base = f"http://127.0.0.1:{tcp._server.sockets[0].getsockname()[1]}/page"
+    yield site
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_fetch_pools_connections_and_caches(server):
+    fetcher = HeadFetcher(timeout=5, max_per_host=3)
+    urls = [f"{server.base}/crawl-{i}" for i in range(30)]
+    heads = await asyncio.gather(*(fetcher.fetch(url) for url in urls + urls[:5]))
+
+    assert all(head.title == "Async crawling guide" for head in heads)
+    assert heads[0].meta["keywords"] == "crawl, python, async"
+    assert heads[0].html.endswith("</head>") and "<body>" not in heads[0].html
+    # Concurrent fetches of the same URL share a request, over a few keep-alive connections
+    assert server.requests == 30
+    assert server.max_active <= 3
+    assert len(server.connections) <= 3
+
+    assert await fetcher.fetch(urls[0]) is heads[0]
+    assert server.requests == 30
+    await fetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_expiry_failures_and_limits(server):
+    fetcher = HeadFetcher(timeout=5, cache_ttl=0, max_head_bytes=64 * 1024)
+    url = f"{server.base}/about"
+    await fetcher.fetch(url)
+    await fetcher.fetch(url)
+    assert server.requests == 2
+
+    # Redirects are followed once, and the body is not read past the limit
+    assert (await fetcher.fetch(f"{server.base}/moved")).title == "About us"
+    start = time.perf_counter()
+    head = await fetcher.fetch(f"{server.base}/huge")
+    assert head.title == "Huge" and len(head.html) < 64 * 1024 + 16384 + 100
+    assert time.perf_counter() - start < 0.2
+
+    assert await fetcher.fetch("http://127.0.0.1:1/nothing") is None
+    assert "http://127.0.0.1:1/nothing" not in fetcher._cache
+    await fetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_filters_share_fetcher_and_stream(server):
+    fetcher = HeadFetcher(timeout=5)
+    relevance = ContentRelevanceFilter("async crawling", threshold=0.5, head_fetcher=fetcher)
+    seo = SEOFilter(threshold=0.3, keywords=["crawl"], head_fetcher=fetcher)
+    urls = [f"{server.base}/crawl-{i}" for i in range(10)] + [f"{server.base}/about-{i}" for i in range(10)]
+
+    decisions = dict([item async for item in relevance.apply_stream(urls)])
+    assert sorted(decisions) == sorted(urls)
+    assert [decisions[url] for url in urls] == [True] * 10 + [False] * 10
+    assert relevance.stats.total_urls == 20 and relevance.stats.passed_urls == 10
+
+    # Both filters read the same cached heads
+    assert await FilterChain([relevance, seo]).apply_many(urls) == [True] * 10 + [False] * 10
+    assert server.requests == 20
+    await fetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_head_peekr_uses_shared_fetcher(server):
+    head = await HeadPeekr.peek_html(f"{server.base}/crawl", timeout=5)
+    assert HeadPeekr.get_title(head) == "Async crawling guide"
+    assert HeadFetcher.default() is HeadFetcher.default()
+    await HeadFetcher.default().close()
+
+
+@pytest.mark.asyncio
+async def test_head_fetch_benchmark(server):
+    urls = [f"{server.base}/crawl-{i}" for i in range(200)]
+
+    async def fresh_client(url):
+        # What HeadPeekr used to do: a new client and connection per URL
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.get(url, headers={"Connection": "close"}, follow_redirects=True)
+            content = b""
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                if b"</head>" in content:
+                    break
+            return content.split(b"</head>")[0]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fresh_client(url) for url in urls))
+    fresh_time = time.perf_counter() - start
+
+    fetcher = HeadFetcher(timeout=5, max_per_host=10)
+    start = time.perf_counter()
+    await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+    pooled_time = time.perf_counter() - start
+    await fetcher.close()
+
+    print(f"200 heads, one host: client per URL {fresh_time * 1000:.0f} ms, pooled {pooled_time * 1000:.0f} ms")
+    assert pooled_time < fresh_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
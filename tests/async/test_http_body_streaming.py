@@ -0,0 +1,149 @@
+import os
+import sys
+import asyncio
+import tracemalloc
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import (
+    AsyncHTTPCrawlerStrategy,
+    BodyTooLargeError,
+    UnwantedContentError,
+)
+from crawl4ai.cache_context import CacheMode
+
+CHUNK = 64 * 1024
+# Accented text in ISO-8859-1, and in UTF-8 with a two-byte character on every chunk boundary
+LATIN1 = ("<html><body><p>Café crème, déjà vu, naïve façade.</p></body></html>" * 2000).encode("latin-1")
+UTF8 = ("<p>" + "a" * (CHUNK - 4) + "é</p>").encode() * 20
+
+
+class BodyServer:
+    """Streams bodies of every kind, counting the bytes it managed to send."""
+
+    def __init__(self):
+        self.sent = 0
+        self.large = b"<html><body>" + b"<p>Some page text, long enough to matter.</p>" * 400000 + b"</body></html>"
+
+    async def stream(self, request, body, content_type, length=True):
+        headers = {"Content-Type": content_type}
+        if length:
+            headers["Content-Length"] = str(len(body))
+        response = web.StreamResponse(headers=headers)
+        await response.prepare(request)
+        try:
+            for start in range(0, len(body), CHUNK):
+                await response.write(body[start:start + CHUNK])
+                self.sent += min(CHUNK, len(body) - start)
+        except (ConnectionResetError, ConnectionError):
+            pass
+        return response
+
+    async def handle(self, request):
+        path = request.path
+        if path == "/binary":
+            return await self.stream(request, bytes(50 * 2**20), "application/octet-stream")
+        if path == "/latin1":
+            return await self.stream(request, LATIN1, "text/html")
+        if path == "/utf8":
+            return await self.stream(request, UTF8, "text/html; charset=utf-8")
+        if path == "/bad-charset":
+            return await self.stream(request, "<p>Plain</p>".encode(), "text/html; charset=no-such-charset")
+        if path == "/json":
+            return await self.stream(request, b'{"ok": true}', "application/json")
+        if path == "/large":
+            return await self.stream(request, self.large, "text/html; charset=utf-8", length=False)
+        raise web.HTTPNotFound()
+
+
+@pytest_asyncio.fixture
+async def server():
+    server = BodyServer()
+    app = web.Application()
+    app.router.add_get("/{path:.*}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    server.base = f"http://127.0.0.1:{tcp._server.sockets[0].getsockname()[1]}"
+    yield server
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_charsets(server):
+    async with AsyncHTTPCrawlerStrategy() as strategy:
+        latin1 = await strategy.crawl(server.base + "/latin1")
+        utf8 = await strategy.crawl(server.base + "/utf8")
+        fallback = await strategy.crawl(server.base + "/bad-charset")
+        json = await strategy.crawl(server.base + "/json")
+
+    # Detected on the first 64 KiB, without a charset in the headers
+    assert latin1.html == LATIN1.decode("latin-1")
+    # Characters split across chunks are decoded whole
+    assert utf8.html == UTF8.decode()
+    assert fallback.html == "<p>Plain</p>"
+    assert json.html == '{"ok": true}'
+
+
+@pytest.mark.asyncio
+async def test_unwanted_and_oversized_bodies_are_not_read(server):
+    async with AsyncHTTPCrawlerStrategy() as strategy:
+        with pytest.raises(UnwantedContentError):
+            await strategy.crawl(server.base + "/binary")
+
+    strategy = AsyncHTTPCrawlerStrategy(max_body_size=2**20, allowed_content_types=None)
+    async with strategy:
+        # Rejected on its Content-Length
+        with pytest.raises(BodyTooLargeError, match="52428800 bytes"):
+            await strategy.crawl(server.base + "/binary")
+        # No Content-Length: reading stops once the limit is passed
+        await asyncio.sleep(0.1)
+        server.sent = 0
+        with pytest.raises(BodyTooLargeError):
+            await strategy.crawl(server.base + "/large")
+    await asyncio.sleep(0.1)
+    assert server.sent < len(server.large) / 2
+
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        result = await crawler.arun(server.base + "/binary", config=config)
+    assert not result.success
+    assert "application/octet-stream" in result.error_message
+
+
+@pytest.mark.asyncio
+async def test_http2_client_streams_too(server):
+    async with AsyncHTTPCrawlerStrategy(http2=True, max_body_size=2**20) as strategy:
+        assert (await strategy.crawl(server.base + "/latin1")).html == LATIN1.decode("latin-1")
+        with pytest.raises(UnwantedContentError):
+            await strategy.crawl(server.base + "/binary")
+        with pytest.raises(BodyTooLargeError):
+            await strategy.crawl(server.base + "/large")
+
+
+@pytest.mark.asyncio
+async def test_peak_memory_benchmark(server):
+    size = len(server.large)
+    async with AsyncHTTPCrawlerStrategy(max_body_size=None) as strategy:
+        await strategy.crawl(server.base + "/large")
+        tracemalloc.start()
+        response = await strategy.crawl(server.base + "/large")
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    assert len(response.html) == size
+    print(f"{size / 2**20:.1f} MiB page: peak {peak / 2**20:.1f} MiB while reading ({peak / size:.1f}x the body)")
+    # The decoded text and its chunks, but no full copies of the raw body
+    assert peak < 2.5 * size
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+import pytest_asyncio
+import httpx
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+
+
+class PageServer:
+    """Serves /page/<n>, recording the client port each request came from."""
+
+    def __init__(self):
+        self.ports = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0
+
+    async def handle(self, request):
+        self.ports.append(request.transport.get_extra_info("peername")[1])
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            number = request.match_info["number"]
+            return web.Response(
+                text=f"<html><body><h1>Page {number}</h1></body></html>", content_type="text/html"
+            )
+        finally:
+            self.active -= 1
+
+
+@pytest_asyncio.fixture
+async def server():
+    server = PageServer()
+    app = web.Application()
+    app.router.add_get("/page/{number}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    server.base = f"http://127.0.0.1:{tcp._server.sockets[0].getsockname()[1]}"
+    yield server
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_across_arun_many(server):
+    strategy = AsyncHTTPCrawlerStrategy()
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+        for batch in range(3):
+            results = await crawler.arun_many(
+                [f"{server.base}/page/{batch * 10 + i}" for i in range(10)],
+                config=config,
+                dispatcher=MemoryAdaptiveDispatcher(max_session_permit=5),
+            )
+            assert all(r.success for r in results)
+
+    stats = strategy.connection_stats
+    assert stats.requests == len(server.ports) == 30
+    # At most one connection per concurrent request, opened in the first batch
+    assert stats.connections_opened == len(set(server.ports)) <= 5
+    assert stats.connections_reused >= 25
+    assert strategy._session is None
+
+
+@pytest.mark.asyncio
+async def test_unstarted_strategy_closes_each_client(server):
+    strategy = AsyncHTTPCrawlerStrategy()
+    responses = await asyncio.gather(*(strategy.crawl(f"{server.base}/page/{i}") for i in range(4)))
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert "Page 3" in responses[3].html
+    assert strategy.connection_stats.connections_opened == len(set(server.ports)) == 4
+    assert strategy._session is None
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit(server):
+    server.delay = 0.05
+    async with AsyncHTTPCrawlerStrategy(max_connections_per_host=2) as strategy:
+        await asyncio.gather(*(strategy.crawl(f"{server.base}/page/{i}") for i in range(10)))
+    assert server.max_active == 2
+    assert len(set(server.ports)) == 2
+
+
+@pytest.mark.asyncio
+async def test_httpx_clients(server):
+    # Without TLS there is no HTTP/2 to negotiate, so this runs over HTTP/1.1
+    async with AsyncHTTPCrawlerStrategy(http2=True) as strategy:
+        assert isinstance(strategy._session, httpx.AsyncClient)
+        for i in range(5):
+            response = await strategy.crawl(f"{server.base}/page/{i}")
+            assert f"Page {i}" in response.html
+    assert strategy.connection_stats.requests == 5
+    assert strategy.connection_stats.connections_opened == 1
+
+    factory_clients = []
+
+    def factory():
+        factory_clients.append(httpx.AsyncClient())
+        return factory_clients[-1]
+
+    async with AsyncHTTPCrawlerStrategy(client_factory=factory) as strategy:
+        response = await strategy.crawl(f"{server.base}/page/7")
+    assert response.status_code == 200 and "Page 7" in response.html
+    assert len(factory_clients) == 1 and factory_clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_connection_reuse_benchmark(server):
+    urls = [f"{server.base}/page/{i}" for i in range(300)]
+    config = CrawlerRunConfig()
+
+    async def run(strategy):
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch(url):
+            async with semaphore:
+                await strategy.crawl(url, config=config)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(url) for url in urls))
+        return len(urls) / (time.perf_counter() - start)
+
+    per_request = await run(AsyncHTTPCrawlerStrategy())
+    async with AsyncHTTPCrawlerStrategy() as strategy:
+        pooled = await run(strategy)
+
+    print(
+        f"{len(urls)} requests, 10 at a time: {per_request:.0f} req/s with a client per request, "
+        f"{pooled:.0f} req/s pooled ({strategy.connection_stats.connections_opened} connections opened)"
+    )
+    assert strategy.connection_stats.connections_opened <= 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
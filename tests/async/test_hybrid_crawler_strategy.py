@@ -0,0 +1,251 @@
+import os
+import sys
+import time
+import uuid
+import asyncio
+from collections import Counter
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy, AsyncHybridCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.models import AsyncCrawlResponse
+
+ARTICLE = "<p>" + "Server-rendered article text that reads fine without any JavaScript. " * 10 + "</p>"
+
+
+class Site:
+    """Server-rendered articles, client-rendered app pages, a thin page and a blocked one."""
+
+    def __init__(self):
+        self.requests = Counter()
+
+    async def handle(self, request):
+        path = request.path
+        self.requests[path] += 1
+        if path.startswith("/article/"):
+            body = f"<h1>Article {path[9:]}</h1>{ARTICLE}"
+        elif path.startswith("/app/"):
+            body = '<div id="root"></div><script src="/bundle.js"></script>'
+        elif path == "/thin":
+            body = "<p>Loading...</p><script>" + "render();" * 500 + "</script>"
+        elif path == "/blocked":
+            raise web.HTTPForbidden()
+        elif path == "/report.pdf":
+            return web.Response(body=b"%PDF-1.4", content_type="application/pdf")
+        else:
+            raise web.HTTPNotFound()
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(
+            text=f"<html><body>{body}</body></html>", content_type="text/html", headers={"ETag": '"v1"'}
+        )
+
+
+class FakeBrowser(AsyncCrawlerStrategy):
+    """Renders any page after a delay, recording what it was asked for."""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.started = False
+        self.urls = []
+
+    async def __aenter__(self):
+        self.started = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.started = False
+
+    async def crawl(self, url, config=None, **kwargs):
+        await asyncio.sleep(self.delay)
+        self.urls.append(url)
+        return AsyncCrawlResponse(
+            html=f"<html><body><h1>Rendered {url}</h1>{ARTICLE}</body></html>",
+            response_headers={"ETag": '"rendered"'},
+            status_code=200,
+        )
+
+
+@pytest_asyncio.fixture
+async def site():
+    site = Site()
+    app = web.Application()
+    app.router.add_get("/{path:.*}", site.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    site.host = f"127.0.0.1:{tcp._server.sockets[0].getsockname()[1]}"
+    site.base = f"http://{site.host}"
+    yield site
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_escalates_pages_that_need_javascript(site):
+    browser = FakeBrowser()
+    strategy = AsyncHybridCrawlerStrategy(browser_strategy=browser)
+    config = CrawlerRunConfig()
+    async with strategy:
+        for i in range(5):
+            response = await strategy.crawl(f"{site.base}/article/{i}", config=config)
+            assert f"Article {i}" in response.html
+        # The browser is only launched once a page needs it
+        assert not browser.started
+
+        for path in ["/app/0", "/thin", "/blocked"]:
+            response = await strategy.crawl(site.base + path, config=config)
+            assert "Rendered" in response.html
+        assert browser.started
+    assert not browser.started
+
+    assert browser.urls == [site.base + path for path in ["/app/0", "/thin", "/blocked"]]
+    stats = strategy.domain_stats[site.host]
+    assert (stats.http_pages, stats.escalated_pages, stats.browser_pages) == (5, 3, 0)
+    assert stats.escalation_rate == pytest.approx(3 / 8)
+    assert not stats.browser_only
+
+
+@pytest.mark.asyncio
+async def test_browser_features_skip_http(site):
+    browser = FakeBrowser()
+    async with AsyncHybridCrawlerStrategy(browser_strategy=browser) as strategy:
+        for config in [CrawlerRunConfig(js_code="window.scrollTo(0, 1000)"), CrawlerRunConfig(screenshot=True)]:
+            await strategy.crawl(site.base + "/article/1", config=config)
+
+    assert site.requests["/article/1"] == 0
+    assert len(browser.urls) == 2
+    assert strategy.domain_stats[site.host].browser_pages == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_http_fetches_escalate(site):
+    browser = FakeBrowser()
+    # Nothing listens on port 1, so connecting is refused
+    urls = [site.base + "/missing", site.base + "/report.pdf", "http://127.0.0.1:1/page"]
+    async with AsyncHybridCrawlerStrategy(browser_strategy=browser) as strategy:
+        for url in urls:
+            response = await strategy.crawl(url, config=CrawlerRunConfig())
+            assert "Rendered" in response.html
+
+    assert browser.urls == urls
+    assert strategy.domain_stats[site.host].escalated_pages == 2
+    assert strategy.domain_stats["127.0.0.1:1"].escalated_pages == 1
+
+
+@pytest.mark.asyncio
+async def test_settings_the_http_client_lacks_skip_http(site):
+    proxy = {"server": "http://127.0.0.1:3128"}
+    cookie = {"name": "sid", "value": "1", "url": site.base}
+    for browser_config, config in [
+        (BrowserConfig(proxy_config=proxy), CrawlerRunConfig()),
+        (BrowserConfig(cookies=[cookie]), CrawlerRunConfig()),
+        (BrowserConfig(), CrawlerRunConfig(proxy_config=proxy)),
+    ]:
+        browser = FakeBrowser()
+        strategy = AsyncHybridCrawlerStrategy(browser_config, browser_strategy=browser)
+        async with strategy:
+            await strategy.crawl(site.base + "/article/1", config=config)
+        assert browser.urls == [site.base + "/article/1"]
+    assert site.requests["/article/1"] == 0
+
+    # Certificate checks follow the browser's setting
+    for ignore in (True, False):
+        strategy = AsyncHybridCrawlerStrategy(BrowserConfig(ignore_https_errors=ignore))
+        assert strategy.http_strategy.browser_config.verify_ssl is not ignore
+
+
+@pytest.mark.asyncio
+async def test_domains_that_keep_escalating_go_straight_to_the_browser(site):
+    browser = FakeBrowser()
+    async with AsyncHybridCrawlerStrategy(browser_strategy=browser, min_samples=3) as strategy:
+        for i in range(6):
+            await strategy.crawl(f"{site.base}/app/{i}", config=CrawlerRunConfig())
+
+    stats = strategy.domain_stats[site.host]
+    assert stats.browser_only
+    assert (stats.escalated_pages, stats.browser_pages) == (3, 3)
+    assert sum(site.requests.values()) == 3
+    assert len(browser.urls) == 6
+
+
+async def cache_then_revalidate(site, path, browser, config):
+    """Cache the page, then crawl it again under `config`, with REVALIDATE."""
+    config = config.clone(cache_mode=CacheMode.REVALIDATE)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHybridCrawlerStrategy(browser_strategy=browser)) as crawler:
+        await crawler.arun(site.base + path, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        return await crawler.arun(site.base + path, config=config)
+
+
+@pytest.mark.asyncio
+async def test_revalidation_keeps_proxied_pages_in_the_browser(site):
+    article = f"/article/{uuid.uuid4().hex}"
+    browser = FakeBrowser()
+    result = await cache_then_revalidate(
+        site, article, browser, CrawlerRunConfig(proxy_config={"server": "http://127.0.0.1:3128"})
+    )
+
+    # The conditional GET could not go through the proxy; the browser fetched the page
+    assert "Rendered" in result.html
+    assert site.requests[article] == 1
+    assert browser.urls == [site.base + article]
+
+
+@pytest.mark.asyncio
+async def test_revalidation_escalates_app_shells(site):
+    app = f"/app/{uuid.uuid4().hex}"
+    browser = FakeBrowser()
+    result = await cache_then_revalidate(site, app, browser, CrawlerRunConfig())
+
+    # The changed page is still an empty app shell, so it is rendered rather than used as is
+    assert "Rendered" in result.html
+    assert site.requests[app] == 2
+    assert browser.urls == [site.base + app] * 2
+
+    # Server-rendered pages are still confirmed with one conditional GET
+    article = f"/article/{uuid.uuid4().hex}"
+    result = await cache_then_revalidate(site, article, browser, CrawlerRunConfig())
+    assert "Rendered" not in result.html
+    assert site.requests[article] == 2
+
+
+@pytest.mark.asyncio
+async def test_hybrid_crawl_benchmark(site):
+    urls = [f"{site.base}/{'app' if i % 10 == 0 else 'article'}/{i}" for i in range(100)]
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+
+    async def run(strategy):
+        start = time.perf_counter()
+        async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+            results = await crawler.arun_many(
+                urls, config=config, dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10)
+            )
+        assert all(r.success for r in results)
+        return time.perf_counter() - start, results
+
+    # A browser costing 50 ms a page
+    browser_only = FakeBrowser(delay=0.05)
+    browser_time, _ = await run(browser_only)
+
+    hybrid_browser = FakeBrowser(delay=0.05)
+    hybrid_time, results = await run(AsyncHybridCrawlerStrategy(browser_strategy=hybrid_browser))
+
+    print(
+        f"{len(urls)} pages, 10% client-rendered: browser only {browser_time:.2f}s, "
+        f"hybrid {hybrid_time:.2f}s with {len(hybrid_browser.urls)} pages in the browser"
+    )
+    assert len(hybrid_browser.urls) == 10
+    assert all("Rendered" in r.html for r in results if "/app/" in r.url)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import pickle
+import threading
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_database import AsyncDatabaseManager, CachedCrawlResult
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.blob_store import ShardedBlobStore
+
+URL = "https://example.com/article"
+
+
+async def make_db(tmp_path) -> AsyncDatabaseManager:
+    db = AsyncDatabaseManager(
+        write_batch_size=1, blob_store=ShardedBlobStore(str(tmp_path))
+    )
+    db.db_path = str(tmp_path / "crawl4ai.db")
+    await db.ainit_db()
+    db._initialized = True
+    return db
+
+
+def make_result(size: int = 1) -> CrawlResult:
+    body = "<p>Lorem ipsum dolor sit amet.</p>" * size
+    return CrawlResult(
+        url=URL,
+        html=f"<html><body>{body}</body></html>",
+        cleaned_html=body,
+        markdown=MarkdownGenerationResult(
+            raw_markdown="Lorem ipsum dolor sit amet.\n" * size,
+            markdown_with_citations="Lorem ipsum dolor sit amet.\n" * size,
+            references_markdown="",
+        ),
+        extracted_content=json.dumps([{"text": "Lorem ipsum"}]),
+        screenshot="iVBORw0KGgo" * size,
+        success=True,
+        media={"images": [{"src": "a.png"}]},
+        links={"internal": [{"href": "https://example.com/next"}]},
+        metadata={"title": "Article"},
+        response_headers={"content-type": "text/html"},
+        downloaded_files=["report.pdf"],
+    )
+
+
+def count_loads(db: AsyncDatabaseManager):
+    loads = []
+    load_content = db._load_content_sync
+
+    def counting(content_hash, content_type):
+        loads.append(content_type)
+        return load_content(content_hash, content_type)
+
+    db._load_content_sync = counting
+    return loads
+
+
+@pytest.mark.asyncio
+async def test_blobs_load_on_first_access(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result())
+    loads = count_loads(db)
+
+    cached = await db.aget_cached_url(URL)
+    assert isinstance(cached, CachedCrawlResult)
+    assert loads == []
+
+    assert cached.markdown.raw_markdown == "Lorem ipsum dolor sit amet.\n"
+    assert loads == ["markdown"]
+
+    assert cached.screenshot == "iVBORw0KGgo"
+    assert cached.screenshot == "iVBORw0KGgo"
+    assert loads == ["markdown", "screenshots"]
+    assert cached.metadata == {"title": "Article"}
+    assert loads == ["markdown", "screenshots"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_result_matches_original(tmp_path):
+    db = await make_db(tmp_path)
+    original = make_result()
+    await db.acache_url(original)
+
+    dumped = (await db.aget_cached_url(URL)).model_dump()
+    expected = original.model_dump()
+    for field in (
+        "url", "html", "cleaned_html", "extracted_content", "screenshot",
+        "success", "media", "links", "metadata", "response_headers", "downloaded_files",
+    ):
+        assert dumped[field] == expected[field], field
+    assert dumped["markdown"]["raw_markdown"] == expected["markdown"]["raw_markdown"]
+
+
+@pytest.mark.asyncio
+async def test_aload_reads_off_the_event_loop(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result())
+    threads = []
+    load_content = db._load_content_sync
+
+    def recording(content_hash, content_type):
+        threads.append(threading.current_thread())
+        return load_content(content_hash, content_type)
+
+    db._load_content_sync = recording
+
+    cached = await db.aget_cached_url(URL)
+    await cached.aload("html", "screenshot")
+    assert len(threads) == 2
+    await cached.aload()
+    assert len(threads) == 5
+    assert threading.main_thread() not in threads
+
+    # Everything is loaded, so reading fields touches no files
+    assert cached.html and cached.markdown.raw_markdown and cached.extracted_content
+    assert len(threads) == 5
+
+
+@pytest.mark.asyncio
+async def test_assigned_fields_are_kept(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result())
+
+    cached = await db.aget_cached_url(URL)
+    cached.html = "<p>replaced</p>"
+    cached.success = False
+    cached.load()
+    assert cached.html == "<p>replaced</p>"
+    assert cached.success is False
+
+
+@pytest.mark.asyncio
+async def test_pickle_round_trip(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result())
+
+    cached = await db.aget_cached_url(URL)
+    restored = pickle.loads(pickle.dumps(cached))
+    assert restored.html == cached.html
+    assert restored.markdown.raw_markdown == cached.markdown.raw_markdown
+
+
+@pytest.mark.asyncio
+async def test_markdown_stored_as_json(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result())
+    # Rows written by older versions hold the full MarkdownGenerationResult as JSON
+    markdown_hash = await db._store_content(
+        MarkdownGenerationResult(
+            raw_markdown="raw", markdown_with_citations="cited", references_markdown=""
+        ).model_dump_json(),
+        "markdown",
+    )
+
+    async def _set_markdown(conn):
+        await conn.execute(
+            "UPDATE crawled_data SET markdown = ? WHERE url = ?", (markdown_hash, URL)
+        )
+
+    await db.execute_with_retry(_set_markdown)
+
+    cached = await db.aget_cached_url(URL)
+    assert cached.markdown == "raw"
+    assert cached.markdown.markdown_with_citations == "cited"
+
+
+@pytest.mark.asyncio
+async def test_markdown_only_read_speed(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result(size=5000))
+
+    rounds = 50
+    # Time field access only; the row lookup costs the same either way
+    results = [await db.aget_cached_url(URL) for _ in range(2 * rounds)]
+
+    start = time.perf_counter()
+    for result in results[:rounds]:
+        result.load()
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for result in results[rounds:]:
+        result.markdown
+    lazy = time.perf_counter() - start
+
+    print(f"all fields: {eager / rounds * 1000:.2f} ms/read")
+    print(f"markdown only: {lazy / rounds * 1000:.2f} ms/read")
+    assert lazy < eager
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
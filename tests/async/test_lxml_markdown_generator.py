@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import pytest
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai import (
+    DefaultMarkdownGenerator,
+    LXMLMarkdownGenerator,
+    LXMLWebScrapingStrategy,
+    ParsedDocument,
+    PruningContentFilter,
+    WebScrapingStrategy,
+)
+from crawl4ai.html2text import LXMLHTML2Text
+
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+BASE_URL = "https://example.com/docs/"
+
+FIELDS = [
+    "raw_markdown",
+    "markdown_with_citations",
+    "references_markdown",
+    "fit_markdown",
+    "fit_html",
+]
+
+# Parity corpus: each snippet must convert identically with both generators
+CORPUS = {
+    "headings": "<h1>Title</h1><h2>Sub <em>title</em></h2><h3>Third</h3><p>Body text.</p>",
+    "paragraphs": "<div><p>First   paragraph\nwith newline.</p><p>Second paragraph.</p></div>",
+    "emphasis": "<p>Some <strong>bold</strong>, <em>italic</em>, <b>b</b>word<i>i</i> and <del>gone</del>.</p>",
+    "links": '<p>See <a href="/guide" title="Guide">the guide</a>, <a href="https://x.org/a?b=1&amp;c=2">https://x.org/a?b=1&amp;c=2</a> and <a href="mailto:a@b.c">mail</a>.</p>',
+    "automatic_link": '<p><a href="https://example.org/">https://example.org/</a></p>',
+    "images": '<p><img src="/img/a.png" alt="An image"><img src="b.png"></p>',
+    "image_link": '<a href="/target"><img src="/i.png" alt="icon"></a>',
+    "nested_lists": "<ul><li>One<ul><li>One.a</li><li>One.b</li></ul></li><li>Two</li></ul><ol start=\"3\"><li>Three</li><li>Four<ul><li>sub</li></ul></li></ol>",
+    "code": "<p>Use <code>pip install x</code> now.</p><pre><code>def f():\n    return 1\n</code></pre>",
+    "blockquote": "<blockquote><p>Quoted text.</p><p>More<br>lines</p></blockquote>",
+    "table": "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr><tr><td>3</td><td>4</td></tr></table>",
+    "definition_list": "<dl><dt>Term</dt><dd>Definition</dd><dt>Other</dt><dd>Second</dd></dl>",
+    "breaks_and_rules": "<p>Line one<br>Line two</p><hr><p>After rule</p>",
+    "entities": "<p>Fish &amp; chips &lt;tag&gt; café — 5 &gt; 3</p>",
+    "unified_entities": "<p>a &nbsp; b &copy; c &#169; caf&eacute; &mdash; &#x2192;</p>",
+    "unclosed_list_items": "<ul><li>a<li>b</ul><ol><li>c<li>d</ol>after",
+    "nested_links": '<p><a href="/x">one <a href="/y">two</a> three</a> four</p>',
+    "after_html_end": "<html><body><p>in</p></body></html><p>after</p>",
+    "sup_sub": "<p>H<sub>2</sub>O and x<sup>2</sup></p>",
+    "comments": "<div><!-- hidden -->Visible<!-- also hidden --> tail</div>",
+    "inline_quote": "<p>He said <q>hello</q> twice.</p>",
+    "abbr": '<p><abbr title="HyperText Markup Language">HTML</abbr> rocks.</p>',
+    "script_style": "<div><style>p {color: red}</style><script>var x = 1;</script><p>Only this</p></div>",
+    "escapes": "<p>Back\\slash and *stars* and _under_ 1. item</p>",
+    "header_link": '<h2><a href="/anchor">Linked header</a></h2>',
+    "bare_text": "Just some text without tags",
+    "empty": "",
+}
+
+OPTION_SETS = [
+    None,
+    {"ignore_links": True},
+    {"ignore_images": True, "ignore_emphasis": True},
+    {"body_width": 40},
+    {"mark_code": False, "single_line_break": False},
+    {"escape_dot": True, "escape_plus": True, "escape_dash": True},
+    {"preserve_tags": ["table"]},
+    {"inline_links": False},
+    {"unicode_snob": True},
+]
+
+
+def _assert_parity(html, options=None, content_filter=None):
+    default = DefaultMarkdownGenerator(content_filter=content_filter, options=options)
+    lxml_based = LXMLMarkdownGenerator(content_filter=content_filter, options=options)
+    expected = default.generate_markdown(html, base_url=BASE_URL)
+    result = lxml_based.generate_markdown(html, base_url=BASE_URL)
+    for field in FIELDS:
+        assert getattr(result, field) == getattr(expected, field), field
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+@pytest.mark.parametrize("options", OPTION_SETS)
+def test_corpus_parity(name, options):
+    _assert_parity(CORPUS[name], options=options)
+
+
+@pytest.mark.parametrize("strategy", [LXMLWebScrapingStrategy(), WebScrapingStrategy()])
+def test_wikipedia_parity(strategy):
+    with open(os.path.join(__location__, "sample_wikipedia.html"), encoding="utf-8") as f:
+        html = f.read()
+    cleaned_html = strategy.scrap("https://en.wikipedia.org/wiki/Apple", html).cleaned_html
+    _assert_parity(cleaned_html, content_filter=PruningContentFilter())
+    # Serialized HTML takes the lxml path, not the html.parser fallback
+    assert not LXMLHTML2Text().needs_tokenizer(cleaned_html)
+
+
+def test_shared_document_tree_is_used():
+    html = CORPUS["nested_lists"]
+    document = ParsedDocument(html)
+    tree = document.lxml_tree()
+    result = LXMLMarkdownGenerator().generate_markdown(html, base_url=BASE_URL, document=document)
+    expected = DefaultMarkdownGenerator().generate_markdown(html, base_url=BASE_URL)
+    assert result.raw_markdown == expected.raw_markdown
+    assert document.lxml_tree() is tree
+
+
+def test_throughput_benchmark():
+    """Throughput benchmark: html.parser-based vs lxml-based generator on a large page."""
+    with open(os.path.join(__location__, "sample_wikipedia.html"), encoding="utf-8") as f:
+        html = f.read()
+    cleaned_html = LXMLWebScrapingStrategy().scrap("https://en.wikipedia.org/wiki/Apple", html).cleaned_html
+    size_mb = len(cleaned_html.encode("utf-8")) / 1024 / 1024
+    rounds = 5
+
+    timings = {}
+    outputs = {}
+    for generator in (DefaultMarkdownGenerator(), LXMLMarkdownGenerator()):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = generator.generate_markdown(cleaned_html, base_url="https://en.wikipedia.org/wiki/Apple")
+            best = min(best, time.perf_counter() - start)
+        timings[type(generator).__name__] = best
+        outputs[type(generator).__name__] = [getattr(result, field) for field in FIELDS]
+
+    for name, seconds in timings.items():
+        print(f"{name}: {seconds * 1000:.1f} ms/page, {size_mb / seconds:.2f} MB/s")
+    # Same markdown, and skipping the tokenizer never makes the lxml path slower
+    # beyond timing noise
+    assert outputs["LXMLMarkdownGenerator"] == outputs["DefaultMarkdownGenerator"]
+    assert timings["LXMLMarkdownGenerator"] < timings["DefaultMarkdownGenerator"] * 1.25
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-s"])
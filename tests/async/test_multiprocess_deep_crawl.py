@@ -0,0 +1,200 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    DFSDeepCrawlStrategy,
+    MultiProcessDeepCrawlStrategy,
+    NearDuplicateDetector,
+)
+from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
+from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
+from crawl4ai.models import AsyncCrawlResponse
+
+BASE = "https://tree.example.com"
+
+
+class TreeSite(AsyncCrawlerStrategy):
+    """Page n links to pages 3n+1 to 3n+3 and to an excluded /private page."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0)
+        number = int(url.rsplit("/", 1)[1] or 0)
+        links = "".join(
+            f'<a href="{BASE}/page/{child}">Child {child}</a> '
+            for child in range(3 * number + 1, 3 * number + 4)
+        )
+        paragraphs = "".join(
+            f"<p>Paragraph {i} of page {number} with enough words to be kept as content.</p>"
+            for i in range(200)
+        )
+        return AsyncCrawlResponse(
+            html=f'<html><body><h1>Page {number}</h1>{paragraphs}{links}'
+                 f'<a href="{BASE}/private">Private</a></body></html>',
+            response_headers={},
+            status_code=200,
+        )
+
+
+def make_crawler():
+    return AsyncWebCrawler(crawler_strategy=TreeSite(), config=BrowserConfig(verbose=False))
+
+
+class MirrorSite(AsyncCrawlerStrategy):
+    """/copy repeats the home page; it and /original both link to /shared."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        path = url[len(BASE):] or "/"
+        rng = random.Random("/" if path == "/copy" else path)
+        paragraphs = "".join(
+            "<p>" + " ".join(f"word{rng.randrange(2000)}" for _ in range(30)) + "</p>"
+            for _ in range(10)
+        )
+        links = {"/": ["/copy", "/original"], "/copy": ["/shared"], "/original": ["/shared"]}
+        anchors = "".join(f'<a href="{BASE}{link}">Link</a> ' for link in links.get(path, []))
+        return AsyncCrawlResponse(
+            html=f"<html><body>{paragraphs}{anchors}</body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+def make_mirror_crawler():
+    return AsyncWebCrawler(crawler_strategy=MirrorSite(), config=BrowserConfig(verbose=False))
+
+
+def broken_crawler():
+    raise RuntimeError("no browser here")
+
+
+def bfs(max_depth=3, **kwargs):
+    return BFSDeepCrawlStrategy(
+        max_depth=max_depth,
+        filter_chain=FilterChain([URLPatternFilter(["*/page/*"])]),
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10),
+        **kwargs,
+    )
+
+
+async def crawl(strategy, stream=False):
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy, stream=stream)
+    async with make_crawler() as crawler:
+        if stream:
+            return [result async for result in await crawler.arun(BASE + "/page/0", config=config)]
+        return await crawler.arun(BASE + "/page/0", config=config)
+
+
+def tree(results):
+    return {r.url: (r.metadata["depth"], r.metadata["parent_url"]) for r in results}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_workers_match_single_process(stream):
+    expected = tree(await crawl(bfs()))
+    assert len(expected) == 1 + 3 + 9 + 27
+
+    strategy = MultiProcessDeepCrawlStrategy(bfs(), workers=2, crawler_factory=make_crawler)
+    results = await crawl(strategy, stream=stream)
+
+    assert tree(results) == expected
+    assert len(results) == len(expected)
+    assert all(r.success for r in results)
+    # The filter chain ran in the workers, and its rejections reached the broker's stats
+    assert strategy.stats.urls_skipped == 1 + 3 + 9
+    assert strategy.stats.urls_processed == 40
+
+
+@pytest.mark.asyncio
+async def test_best_first_scores_and_max_pages():
+    inner = BestFirstCrawlingStrategy(
+        max_depth=3,
+        max_pages=12,
+        url_scorer=KeywordRelevanceScorer(["page"]),
+        filter_chain=FilterChain([URLPatternFilter(["*/page/*"])]),
+    )
+    strategy = MultiProcessDeepCrawlStrategy(inner, workers=2, tasks_per_worker=3, crawler_factory=make_crawler)
+    results = await crawl(strategy, stream=True)
+
+    assert len(results) == 12
+    assert all("score" in r.metadata for r in results)
+    assert len({r.url for r in results}) == 12
+    for r in results[1:]:
+        assert r.metadata["parent_url"] in {p.url for p in results}
+
+
+@pytest.mark.asyncio
+async def test_rejected_strategies_and_failed_workers():
+    with pytest.raises(ValueError):
+        MultiProcessDeepCrawlStrategy(DFSDeepCrawlStrategy(max_depth=2))
+
+    strategy = MultiProcessDeepCrawlStrategy(bfs(), workers=2, crawler_factory=broken_crawler)
+    with pytest.raises(RuntimeError, match="All deep crawl worker processes exited"):
+        await crawl(strategy)
+
+
+
+@pytest.mark.asyncio
+async def test_links_of_near_duplicates_stay_reachable():
+    inner = BFSDeepCrawlStrategy(max_depth=2, near_duplicates=NearDuplicateDetector())
+    strategy = MultiProcessDeepCrawlStrategy(
+        inner, workers=1, tasks_per_worker=1, crawler_factory=make_mirror_crawler
+    )
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy)
+    async with make_mirror_crawler() as crawler:
+        results = await crawler.arun(BASE + "/", config=config)
+
+    by_path = {r.url[len(BASE):]: r for r in results}
+    # The broker drops the links of /copy; the same worker then finds /shared on /original
+    assert "near_duplicate_of" in by_path["/copy"].metadata
+    assert by_path["/shared"].metadata["parent_url"] == BASE + "/original"
+
+@pytest.mark.asyncio
+async def test_multiprocess_benchmark():
+    # Deeper tree: 364 pages, each scraped and turned into markdown
+    start = time.perf_counter()
+    single = await crawl(bfs(max_depth=5))
+    single_time = time.perf_counter() - start
+
+    workers = max(2, min(4, os.cpu_count() or 1))
+    start = time.perf_counter()
+    parallel = await crawl(
+        MultiProcessDeepCrawlStrategy(bfs(max_depth=5), workers=workers, crawler_factory=make_crawler)
+    )
+    parallel_time = time.perf_counter() - start
+
+    print(
+        f"{len(single)} pages on {os.cpu_count()} CPUs: one process {single_time:.2f}s, "
+        f"{workers} workers {parallel_time:.2f}s (including process start-up)"
+    )
+    assert {r.url for r in parallel} == {r.url for r in single}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
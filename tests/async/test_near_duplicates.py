@@ -0,0 +1,237 @@
+import os
+import sys
+import random
+import asyncio
+from urllib.parse import urlparse, parse_qs
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    DFSDeepCrawlStrategy,
+    NearDuplicateDetector,
+    SimHashIndex,
+)
+from crawl4ai.deep_crawling.dedup import hamming_distance, url_pattern
+from crawl4ai.models import AsyncCrawlResponse
+from crawl4ai.utils import simhash_fingerprint
+
+BASE = "https://shop.example.com"
+COLORS = ["red", "blue", "green", "black", "white", "grey"]
+VOCAB = [f"word{i}" for i in range(2000)]
+
+
+def text(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCAB) for _ in range(words))
+
+
+class ShopSite(AsyncCrawlerStrategy):
+    """
+    A shop whose listing comes in a variant per color, and per sort order and page
+    of each of those, all showing the same products. Only the product pages differ.
+    """
+
+    def __init__(self):
+        self.fetches = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0)
+        self.fetches.append(url)
+        parsed = urlparse(url)
+        if parsed.path == "/shoes":
+            color = parse_qs(parsed.query).get("color", ["any"])[0]
+            links = [(f"/product/{i}", f"Product {i}") for i in range(5)]
+            links += [
+                (f"/shoes?{parsed.query}&{facet}", label)
+                for facet, label in [("sort=price", "By price"), ("sort=name", "By name"),
+                                     ("page=2", "Page 2"), ("page=3", "Page 3")]
+            ]
+            body = f"<h1>Shoes</h1><p>Color {color}</p><p>{text('listing')}</p>"
+        elif parsed.path.startswith("/product/"):
+            number = int(parsed.path.rsplit("/", 1)[1])
+            links = [(f"/shoes?color=c{number}", "Similar colors"), (f"/product/{number + 5}", "Related")]
+            body = f"<h1>Product</h1><p>{text(parsed.path)}</p>"
+        elif parsed.path == "/about":
+            links = [("/", "Home")]
+            body = f"<h1>About</h1><p>{text('about')}</p>"
+        else:
+            links = [(f"/shoes?color={c}", f"{c.title()} shoes") for c in COLORS] + [("/about", "About")]
+            body = f"<h1>Home</h1><p>{text('home')}</p>"
+        anchors = "".join(f'<a href="{BASE}{link}">{label}</a> ' for link, label in links)
+        return AsyncCrawlResponse(
+            html=f"<html><body>{body}<nav>{anchors}</nav></body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+async def crawl(strategy, stream=False):
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy, stream=stream)
+    site = ShopSite()
+    async with AsyncWebCrawler(crawler_strategy=site) as crawler:
+        if stream:
+            results = [result async for result in await crawler.arun(BASE + "/", config=config)]
+        else:
+            results = await crawler.arun(BASE + "/", config=config)
+    return results, site
+
+
+def test_simhash_and_index():
+    original = text("page", 500)
+    words = original.split()
+    words[100] = words[300] = "changed"
+    edited = " ".join(words)
+    assert simhash_fingerprint(original) == simhash_fingerprint(original)
+    assert hamming_distance(simhash_fingerprint(original), simhash_fingerprint(edited)) <= 6
+    assert hamming_distance(simhash_fingerprint(original), simhash_fingerprint(text("other", 500))) > 12
+    # Link targets do not count, so session parameters in links change nothing
+    assert simhash_fingerprint(f"{original} [Next](/p?sid=1)") == simhash_fingerprint(
+        f"{original} [Next](/p?sid=2)"
+    )
+
+    index = SimHashIndex(max_distance=6)
+    index.add(simhash_fingerprint(original), "original")
+    index.add(simhash_fingerprint(text("other", 500)), "other")
+    assert index.query(simhash_fingerprint(edited)) == "original"
+    assert index.query(simhash_fingerprint(text("third", 500))) is None
+    assert len(index) == 2
+    with pytest.raises(ValueError):
+        SimHashIndex(max_distance=64)
+
+    assert url_pattern("https://Shop.com/item/123/reviews?sid=9&b=2") == "shop.com/item/*/reviews?b&sid"
+    assert url_pattern("https://shop.com/item/456/reviews?b=1&sid=3") == url_pattern(
+        "https://shop.com/item/123/reviews?sid=9&b=2"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pipelined", [False, True])
+async def test_bfs_skips_links_of_near_duplicates(pipelined):
+    detector = NearDuplicateDetector()
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=3,
+        near_duplicates=detector,
+        pipelined=pipelined,
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=1),
+    )
+    results, site = await crawl(strategy)
+
+    assert all(r.fingerprint is not None for r in results)
+    duplicates = [r for r in results if "near_duplicate_of" in r.metadata]
+    listings = [r for r in results if urlparse(r.url).path == "/shoes"]
+    # One listing is expanded; its facets are crawled once found, but not followed
+    assert len(listings) - len(duplicates) == 1
+    assert all(urlparse(r.metadata["near_duplicate_of"]).path == "/shoes" for r in duplicates)
+    assert {f"{BASE}/product/{i}" for i in range(10)} <= {r.url for r in results}
+    # Home; colors and about; the first listing's products and facets; their links
+    assert len(results) == len(set(site.fetches)) == 1 + 7 + 9 + 10
+
+    # The listing's URL pattern is mostly duplicates now, the products' is not
+    assert strategy.duplicate_penalty(f"{BASE}/shoes?color=pink") == pytest.approx(10 / 11)
+    assert strategy.duplicate_penalty(f"{BASE}/product/99") == 0
+    assert strategy.queue_priority(f"{BASE}/shoes?color=pink", 2, 0) > 2
+
+    # A second run starts from an empty index
+    results, _ = await crawl(strategy)
+    assert len(results) == 27
+
+
+@pytest.mark.asyncio
+async def test_best_first_and_dfs_skip_near_duplicates():
+    strategy = BestFirstCrawlingStrategy(max_depth=3, near_duplicates=NearDuplicateDetector())
+    results, _ = await crawl(strategy, stream=True)
+    listings = [r for r in results if urlparse(r.url).path == "/shoes"]
+    assert len([r for r in listings if "near_duplicate_of" not in r.metadata]) == 1
+    assert len(results) == 27
+
+    strategy = DFSDeepCrawlStrategy(max_depth=3, near_duplicates=NearDuplicateDetector())
+    results, _ = await crawl(strategy)
+    listings = [r for r in results if urlparse(r.url).path == "/shoes"]
+    assert len([r for r in listings if "near_duplicate_of" not in r.metadata]) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "make_strategy",
+    [
+        lambda: BFSDeepCrawlStrategy(max_depth=3, near_duplicates=NearDuplicateDetector()),
+        lambda: BFSDeepCrawlStrategy(
+            max_depth=3, near_duplicates=NearDuplicateDetector(), pipelined=True
+        ),
+        lambda: BestFirstCrawlingStrategy(max_depth=3, near_duplicates=NearDuplicateDetector()),
+        lambda: DFSDeepCrawlStrategy(max_depth=3, near_duplicates=NearDuplicateDetector()),
+    ],
+    ids=["bfs", "pipelined", "best_first", "dfs"],
+)
+async def test_streamed_results_are_marked_when_yielded(make_strategy):
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS, deep_crawl_strategy=make_strategy(), stream=True
+    )
+    marked = []
+    async with AsyncWebCrawler(crawler_strategy=ShopSite()) as crawler:
+        async for result in await crawler.arun(BASE + "/", config=config):
+            # Read as the consumer sees it, before the strategy resumes
+            marked.append("near_duplicate_of" in result.metadata)
+    assert any(marked)
+
+
+def test_pages_without_text_are_not_indexed():
+    detector = NearDuplicateDetector()
+    assert simhash_fingerprint("") == simhash_fingerprint("![](/a.png) [](/b)") == 0
+    assert detector.check(f"{BASE}/empty/1", 0) is None
+    assert detector.check(f"{BASE}/empty/2", 0) is None
+    assert len(detector.index) == 0
+    assert detector.check(f"{BASE}/about", simhash_fingerprint(text("about"))) is None
+    assert len(detector.index) == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_patterns_are_deprioritized():
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=3,
+        near_duplicates=NearDuplicateDetector(),
+        pipelined=True,
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=1),
+    )
+    results, _ = await crawl(strategy)
+
+    # Products link to a new color before a related product, but by depth 3 most
+    # color listings have been duplicates, so the related products go first
+    deepest = [urlparse(r.url).path for r in results if r.metadata["depth"] == 3]
+    assert deepest == [f"/product/{i}" for i in range(5, 10)] + ["/shoes"] * 5
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_benchmark():
+    plain, _ = await crawl(
+        BFSDeepCrawlStrategy(max_depth=3, dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10))
+    )
+    pruned, _ = await crawl(
+        BFSDeepCrawlStrategy(
+            max_depth=3,
+            near_duplicates=NearDuplicateDetector(),
+            dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10),
+        )
+    )
+    print(f"Faceted shop, depth 3: {len(plain)} pages without near-duplicate detection, {len(pruned)} with")
+    assert len(pruned) < len(plain) / 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,214 @@
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.browser_manager import BrowserManager
+
+
+class FakePage:
+    """The Playwright page calls BrowserManager makes, with the latency of a real browser."""
+
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.url = "about:blank"
+        self.headers = None
+        self.resets = 0
+        self.viewport_size = {"width": 1080, "height": 600}
+
+    async def set_extra_http_headers(self, headers):
+        self.headers = headers
+
+    async def set_viewport_size(self, size):
+        self.viewport_size = size
+
+    async def evaluate(self, script):
+        if "localStorage.clear" in script:
+            self.resets += 1
+
+    async def goto(self, url, **kwargs):
+        if self.context.fail_goto:
+            raise RuntimeError("Target closed")
+        self.url = url
+
+    async def close(self):
+        await asyncio.sleep(self.context.close_delay)
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self, open_delay=0, close_delay=0):
+        self.open_delay = open_delay
+        self.close_delay = close_delay
+        self.fail_goto = False
+        self.pages = []
+        self.init_scripts = 0
+
+    async def new_page(self):
+        await asyncio.sleep(self.open_delay)
+        self.pages.append(FakePage(self))
+        return self.pages[-1]
+
+    async def add_init_script(self, script):
+        self.init_scripts += 1
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, **delays):
+        self.delays = delays
+        self.contexts = []
+
+    async def new_context(self, **settings):
+        self.contexts.append(FakeContext(**self.delays))
+        return self.contexts[-1]
+
+    async def close(self):
+        pass
+
+
+def manager(**kwargs):
+    delays = {k: kwargs.pop(k) for k in ("open_delay", "close_delay") if k in kwargs}
+    manager = BrowserManager(BrowserConfig(**kwargs))
+    manager.browser = FakeBrowser(**delays)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_pages_are_pre_opened_reset_and_reused():
+    browser_manager = manager(page_pool_size=3, page_max_uses=2)
+    config = CrawlerRunConfig()
+
+    page, context = await browser_manager.get_page(config)
+    await asyncio.sleep(0.01)  # Let the pool open the rest of its pages
+    assert len(context.pages) == 3
+    # Pages are prepared once, when they are opened
+    assert all("Content-Security-Policy" in p.headers for p in context.pages)
+
+    await browser_manager.release_page(page)
+    assert page.resets == 1 and page.url == "about:blank" and not page.closed
+
+    # The idle pages are handed out in turn; a fourth crawl at once needs a new page
+    pages = [(await browser_manager.get_page(config))[0] for _ in range(4)]
+    assert pages[2] is page
+    assert len(context.pages) == 4
+    for p in pages:
+        await browser_manager.release_page(p)
+    # Its second crawl reached page_max_uses
+    assert page.closed
+    assert len(browser_manager.page_pools[next(iter(browser_manager.page_pools))].idle) == 3
+
+    stats = browser_manager.page_pool_stats
+    assert (stats.acquired, stats.hits, stats.created, stats.retired) == (5, 3, 4, 1)
+    assert stats.hit_rate == pytest.approx(0.6)
+
+    await browser_manager.close()
+    assert all(p.closed for p in context.pages)
+
+
+@pytest.mark.asyncio
+async def test_failed_and_unresettable_pages_are_retired():
+    browser_manager = manager(page_pool_size=2)
+    config = CrawlerRunConfig()
+
+    page, context = await browser_manager.get_page(config)
+    await browser_manager.release_page(page, failed=True)
+    assert page.closed
+
+    page, _ = await browser_manager.get_page(config)
+    context.fail_goto = True
+    await browser_manager.release_page(page)
+    assert page.closed
+    assert browser_manager.page_pool_stats.retired == 2
+
+
+@pytest.mark.asyncio
+async def test_resized_pages_are_retired():
+    browser_manager = manager(page_pool_size=2)
+    config = CrawlerRunConfig()
+
+    # As adjust_viewport_to_content and full-page screenshots do
+    page, _ = await browser_manager.get_page(config)
+    await page.set_viewport_size({"width": 1080, "height": 8000})
+    await browser_manager.release_page(page)
+    assert page.closed
+
+    page, _ = await browser_manager.get_page(config)
+    await browser_manager.release_page(page)
+    assert not page.closed
+    assert page in next(iter(browser_manager.page_pools.values())).idle
+    assert browser_manager.page_pool_stats.retired == 1
+
+
+@pytest.mark.asyncio
+async def test_unpooled_and_session_pages_are_not_reused():
+    browser_manager = manager()
+    page, context = await browser_manager.get_page(CrawlerRunConfig())
+    assert "Content-Security-Policy" in page.headers
+    await browser_manager.release_page(page)
+    assert page.closed and not browser_manager.page_pools
+
+    browser_manager = manager(page_pool_size=2)
+    page, context = await browser_manager.get_page(CrawlerRunConfig(session_id="s1"))
+    again, _ = await browser_manager.get_page(CrawlerRunConfig(session_id="s1"))
+    assert again is page
+    assert not browser_manager.page_pools
+
+    # Navigator overrides are added to a context once, however many crawls ask
+    for _ in range(3):
+        await browser_manager.add_navigator_overrides(context)
+    assert context.init_scripts == 1
+
+
+@pytest.mark.asyncio
+async def test_page_pool_benchmark():
+    async def run(browser_manager):
+        config = CrawlerRunConfig()
+        semaphore = asyncio.Semaphore(20)
+
+        async def crawl():
+            async with semaphore:
+                page, _ = await browser_manager.get_page(config)
+                await asyncio.sleep(0.005)  # A short page
+                await browser_manager.release_page(page)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(crawl() for _ in range(400)))
+        return time.perf_counter() - start
+
+    # 20 ms to open a page, 5 ms to close one
+    delays = dict(open_delay=0.02, close_delay=0.005)
+    plain = manager(**delays)
+    plain_time = await run(plain)
+    pooled = manager(page_pool_size=20, page_max_uses=50, **delays)
+    pooled_time = await run(pooled)
+
+    stats = pooled.page_pool_stats
+    print(
+        f"400 short pages, 20 at a time: new page per crawl {plain_time:.2f}s "
+        f"({plain.page_pool_stats.average_wait * 1000:.1f} ms per page), pooled {pooled_time:.2f}s "
+        f"({stats.average_wait * 1000:.1f} ms per page, {stats.hit_rate:.0%} hits)"
+    )
+    assert stats.hit_rate > 0.8
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,143 @@
+import os
+import sys
+import pytest
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai import (
+    AsyncWebCrawler,
+    BM25ContentFilter,
+    CrawlerRunConfig,
+    DefaultMarkdownGenerator,
+    JsonCssExtractionStrategy,
+    LXMLWebScrapingStrategy,
+    ParsedDocument,
+    PruningContentFilter,
+)
+
+HTML = """
+<html>
+    <head><title>Products</title></head>
+    <body>
+        <nav>Home | Shop | About</nav>
+        <article>
+            <h1>Product catalogue</h1>
+            <div class="product"><h2>Alpha</h2><span class="price">10</span></div>
+            <div class="product"><h2>Beta</h2><span class="price">20</span></div>
+            <p>This catalogue lists every product we sell together with its current price in euros.</p>
+        </article>
+    </body>
+</html>
+"""
+
+SCHEMA = {
+    "name": "products",
+    "baseSelector": "div.product",
+    "fields": [
+        {"name": "title", "selector": "h2", "type": "text"},
+        {"name": "price", "selector": ".price", "type": "text"},
+    ],
+}
+
+
+def test_trees_are_cached_and_taken():
+    document = ParsedDocument(HTML)
+    assert document.soup() is document.soup()
+    assert document.lxml_tree() is document.lxml_tree()
+
+    taken = document.soup(take=True)
+    assert document.soup() is not taken
+
+
+def test_pruning_does_not_modify_shared_soup():
+    document = ParsedDocument(HTML)
+    shared = document.soup()
+    nav_count = len(shared.find_all("nav"))
+
+    PruningContentFilter().filter_content(HTML, document=document)
+
+    assert document.soup() is not shared or len(shared.find_all("nav")) == nav_count
+    assert len(document.soup().find_all("nav")) == nav_count
+
+
+def test_filters_match_without_document():
+    for content_filter in (BM25ContentFilter(), PruningContentFilter()):
+        expected = content_filter.filter_content(HTML)
+        assert content_filter.filter_content(HTML, document=ParsedDocument(HTML)) == expected
+
+
+def test_document_ignored_for_other_html():
+    document = ParsedDocument("<p>something else</p>")
+    strategy = JsonCssExtractionStrategy(SCHEMA)
+    assert strategy.extract("https://example.com", HTML, document=document) == strategy.extract(
+        "https://example.com", HTML
+    )
+
+
+def test_extraction_reuses_document_soup():
+    document = ParsedDocument(HTML)
+    strategy = JsonCssExtractionStrategy(SCHEMA)
+    items = strategy.run("https://example.com", [HTML], document=document)
+    assert items == [{"title": "Alpha", "price": "10"}, {"title": "Beta", "price": "20"}]
+    assert ("soup", "html.parser") in document._trees
+
+
+def test_lxml_extraction_shares_the_filters_soup():
+    document = ParsedDocument(HTML)
+    BM25ContentFilter().filter_content(HTML, document=document)
+    JsonCssExtractionStrategy(SCHEMA, parser="lxml").run("https://example.com", [HTML], document=document)
+    assert list(document._trees) == [("soup", "lxml")]
+
+
+def test_extraction_keeps_html_parser_by_default():
+    # lxml moves the div out of the paragraph, html.parser keeps it inside
+    html = '<p class="item"><div class="name">Alpha</div></p>'
+    schema = {
+        "name": "Items",
+        "baseSelector": "p.item",
+        "fields": [{"name": "name", "selector": "p > div.name", "type": "text"}],
+    }
+    assert JsonCssExtractionStrategy(schema).extract("https://example.com", html) == [{"name": "Alpha"}]
+    assert JsonCssExtractionStrategy(schema, parser="lxml").extract("https://example.com", html) == []
+
+
+def test_kept_trees_are_copied_when_taken():
+    document = ParsedDocument(HTML, keep=True)
+    shared = document.lxml_tree()
+    taken = document.lxml_tree(take=True)
+    assert taken is not shared
+    taken.body.clear()
+    assert document.lxml_tree() is shared
+    assert shared.xpath("//h1")[0].text == "Product catalogue"
+
+    soup = document.soup()
+    assert document.soup(take=True) is not soup
+    assert document.soup() is soup
+
+
+@pytest.mark.asyncio
+async def test_process_html_with_shared_documents(tmp_path):
+    config = CrawlerRunConfig(
+        scraping_strategy=LXMLWebScrapingStrategy(),
+        markdown_generator=DefaultMarkdownGenerator(content_filter=PruningContentFilter()),
+        extraction_strategy=JsonCssExtractionStrategy(SCHEMA),
+        verbose=False,
+    )
+    crawler = AsyncWebCrawler(base_directory=str(tmp_path))
+    result = await crawler.aprocess_html(
+        url="https://example.com",
+        html=HTML,
+        extracted_content=None,
+        config=config,
+        screenshot=None,
+        pdf_data=None,
+        verbose=False,
+    )
+    assert result.success
+    assert "Product catalogue" in result.markdown.raw_markdown
+    assert '"Alpha"' in result.extracted_content
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
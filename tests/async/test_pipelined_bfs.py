@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import asyncio
+import statistics
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.models import AsyncCrawlResponse
+
+SITE = "https://site.test"
+BRANCHING = 3
+DEPTH = 3
+SLOW_PAGE = "/p/0"
+SLOW_DELAY = 0.6
+FAST_DELAY = 0.02
+
+
+class SyntheticSite(AsyncCrawlerStrategy):
+    """
+    Serves a tree of pages in process, BRANCHING children each, with network-like
+    latency. One depth-1 page is much slower than the rest.
+    """
+
+    def __init__(self):
+        self.slow_running = False
+        # Deeper pages whose fetch started while the slow page was being fetched
+        self.started_during_slow = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        path = url[len(SITE):].rstrip("/") or "/"
+        depth = 0 if path == "/" else path.count("/") - 1
+        if path == SLOW_PAGE:
+            self.slow_running = True
+            await asyncio.sleep(SLOW_DELAY)
+            self.slow_running = False
+        else:
+            self.started_during_slow += self.slow_running and depth > 1
+            await asyncio.sleep(FAST_DELAY)
+        prefix = "/p" if path == "/" else path
+        links = ""
+        if depth < DEPTH:
+            links = "".join(
+                f'<a href="{SITE}{prefix}/{i}">Page {prefix}/{i}</a> ' for i in range(BRANCHING)
+            )
+        return AsyncCrawlResponse(
+            html=f"<html><body><h1>{path}</h1><p>Some text on this page.</p>{links}</body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+async def deep_crawl(pipelined: bool, max_pages=float("inf")):
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=DEPTH,
+        max_pages=max_pages,
+        pipelined=pipelined,
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=4),
+    )
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy, stream=True, verbose=False
+    )
+    latencies = []
+    results = []
+    site = SyntheticSite()
+    async with AsyncWebCrawler(crawler_strategy=site) as crawler:
+        start = time.perf_counter()
+        async for result in await crawler.arun(SITE + "/", config=config):
+            latencies.append(time.perf_counter() - start)
+            results.append(result)
+        elapsed = time.perf_counter() - start
+    return results, latencies, elapsed, site
+
+
+@pytest.mark.asyncio
+async def test_pipelined_matches_level_by_level():
+    level_results, _, _, _ = await deep_crawl(pipelined=False)
+    pipelined_results, _, _, _ = await deep_crawl(pipelined=True)
+    expected_pages = sum(BRANCHING**d for d in range(DEPTH + 1))
+    assert len(level_results) == len(pipelined_results) == expected_pages
+
+    def depths(results):
+        return {r.url.rstrip("/"): r.metadata["depth"] for r in results}
+
+    assert depths(pipelined_results) == depths(level_results)
+    assert all(r.metadata["parent_url"] for r in pipelined_results if r.metadata["depth"])
+
+
+@pytest.mark.asyncio
+async def test_pipelined_respects_max_pages():
+    results, _, _, _ = await deep_crawl(pipelined=True, max_pages=10)
+    assert len(results) == 10
+    # The frontier hands out the shallowest URLs first
+    assert sorted(r.metadata["depth"] for r in results) == [0, 1, 1, 1, 2, 2, 2, 2, 2, 2]
+
+
+class ClosingDispatcher(MemoryAdaptiveDispatcher):
+    """Records whether its result stream has been closed."""
+
+    stream_closed = False
+
+    async def run_urls_stream(self, *args, **kwargs):
+        try:
+            async for result in super().run_urls_stream(*args, **kwargs):
+                yield result
+        finally:
+            self.stream_closed = True
+
+
+@pytest.mark.asyncio
+async def test_pipelined_stream_closed_early():
+    dispatcher = ClosingDispatcher(max_session_permit=4)
+    strategy = BFSDeepCrawlStrategy(max_depth=DEPTH, pipelined=True, dispatcher=dispatcher)
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy, stream=True, verbose=False
+    )
+    site = SyntheticSite()
+    fetched = []
+    crawl = site.crawl
+
+    async def counting_crawl(url, **kwargs):
+        fetched.append(url)
+        return await crawl(url, **kwargs)
+
+    site.crawl = counting_crawl
+    async with AsyncWebCrawler(crawler_strategy=site) as crawler:
+        stream = await crawler.arun(SITE + "/", config=config)
+        async for _ in stream:
+            if len(fetched) >= 3:
+                break
+        await stream.aclose()
+        # The dispatcher's stream is closed by then, not later by the garbage
+        # collector, and no new fetches start
+        assert dispatcher.stream_closed
+        started = len(fetched)
+        await asyncio.sleep(0.2)
+        assert len(fetched) == started < sum(BRANCHING**d for d in range(DEPTH + 1))
+
+
+@pytest.mark.asyncio
+async def test_pipelined_throughput_and_tail_latency():
+    overlap = {}
+    for pipelined in (False, True):
+        results, latencies, elapsed, site = await deep_crawl(pipelined=pipelined)
+        quantiles = statistics.quantiles(latencies, n=20)
+        overlap[pipelined] = site.started_during_slow
+        print(
+            f"{'pipelined' if pipelined else 'level-by-level'}: {len(results)} pages in "
+            f"{elapsed:.2f}s ({len(results) / elapsed:.1f} pages/s), "
+            f"p50 {quantiles[9]:.2f}s, p95 {quantiles[18]:.2f}s, "
+            f"{site.started_during_slow} deeper fetches started behind the slow page"
+        )
+    # Level by level, the next level waits for the slow page; pipelined, the other
+    # branches' children are fetched while it loads
+    assert overlap[False] == 0
+    assert overlap[True] >= 2 * BRANCHING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,72 @@
+import os
+import sys
+import pytest
+
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LXMLWebScrapingStrategy
+from crawl4ai.async_webcrawler import BufferedLogger
+
+SAMPLE_HTML = """
+<html>
+    <head><title>Executor test</title></head>
+    <body>
+        <h1>Main heading</h1>
+        <p>First paragraph with a <a href="/docs">link to the docs</a> and enough words to keep.</p>
+        <p>Second paragraph that also carries some text for the markdown output.</p>
+    </body>
+</html>
+"""
+
+
+async def _process(crawler: AsyncWebCrawler, config: CrawlerRunConfig):
+    return await crawler.aprocess_html(
+        url="https://example.com/page",
+        html=SAMPLE_HTML,
+        extracted_content=None,
+        config=config,
+        screenshot=None,
+        pdf_data=None,
+        verbose=False,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "process"])
+async def test_executor_matches_inline(mode, tmp_path):
+    config = CrawlerRunConfig(scraping_strategy=LXMLWebScrapingStrategy(), verbose=False)
+    inline = AsyncWebCrawler(base_directory=str(tmp_path))
+    offloaded = AsyncWebCrawler(base_directory=str(tmp_path), processing_executor=mode, processing_workers=1)
+    try:
+        expected = await _process(inline, config)
+        result = await _process(offloaded, config)
+    finally:
+        await offloaded.close()
+
+    assert result.success
+    assert result.cleaned_html == expected.cleaned_html
+    assert result.markdown.raw_markdown == expected.markdown.raw_markdown
+    assert result.links == expected.links
+    assert offloaded._processing_executor is None
+
+
+def test_invalid_executor(tmp_path):
+    with pytest.raises(ValueError):
+        AsyncWebCrawler(base_directory=str(tmp_path), processing_executor="gpu")
+
+
+def test_buffered_logger_replay():
+    buffer = BufferedLogger()
+    buffer.info(message="hello {name}", tag="SCRAPE", params={"name": "world"})
+    buffer.url_status(url="https://example.com", success=True, timing=0.1)
+
+    target = BufferedLogger()
+    buffer.replay(target)
+
+    assert buffer.records == []
+    assert [record[0] for record in target.records] == ["info", "url_status"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
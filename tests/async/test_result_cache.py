@@ -0,0 +1,158 @@
+import os
+import sys
+import time
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_database import AsyncDatabaseManager, ResultCache
+from crawl4ai.blob_store import ShardedBlobStore
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+
+async def make_db(tmp_path, max_bytes: int = 1024 * 1024) -> AsyncDatabaseManager:
+    db = AsyncDatabaseManager(
+        write_batch_size=1, blob_store=ShardedBlobStore(str(tmp_path))
+    )
+    db.db_path = str(tmp_path / "crawl4ai.db")
+    await db.ainit_db()
+    db._initialized = True
+    db.enable_result_cache(max_bytes)
+    return db
+
+
+def make_result(url: str, body: str) -> CrawlResult:
+    return CrawlResult(
+        url=url,
+        html=f"<html><body>{body}</body></html>",
+        cleaned_html=body,
+        markdown=MarkdownGenerationResult(
+            raw_markdown=body, markdown_with_citations=body, references_markdown=""
+        ),
+        success=True,
+        links={"internal": [{"href": url + "next"}]},
+    )
+
+
+def count_loads(db: AsyncDatabaseManager):
+    loads = []
+    load_content = db._load_content_sync
+
+    def counting(content_hash, content_type):
+        loads.append(content_type)
+        return load_content(content_hash, content_type)
+
+    db._load_content_sync = counting
+    return loads
+
+
+@pytest.mark.asyncio
+async def test_hits_and_misses(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result("https://a.test/", "<p>a</p>"))
+    loads = count_loads(db)
+
+    first = await db.aget_cached_url("https://a.test/")
+    second = await db.aget_cached_url("https://a.test/")
+    assert await db.aget_cached_url("https://missing.test/") is None
+
+    assert first.html == second.html == "<html><body><p>a</p></body></html>"
+    # The second read shares the blob loaded by the first
+    assert loads == ["html"]
+    stats = db.result_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_results_are_independent(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result("https://a.test/", "<p>a</p>"))
+
+    first = await db.aget_cached_url("https://a.test/")
+    first.html = "<p>changed</p>"
+    first.links["internal"].append({"href": "https://a.test/other"})
+
+    second = await db.aget_cached_url("https://a.test/")
+    assert second.html == "<html><body><p>a</p></body></html>"
+    assert second.links == {"internal": [{"href": "https://a.test/next"}]}
+    assert second.markdown.raw_markdown == "<p>a</p>"
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_evicts_least_recent(tmp_path):
+    db = await make_db(tmp_path)
+    for i in range(3):
+        await db.acache_url(make_result(f"https://lru.test/{i}", f"<p>{i}</p>" * 100))
+    await db.aget_cached_url("https://lru.test/0")
+    # Room for two of the three entries, which all have the same size
+    db.enable_result_cache(db.result_cache.current_bytes * 2 + 10)
+
+    await db.aget_cached_url("https://lru.test/1")
+    await db.aget_cached_url("https://lru.test/0")
+    await db.aget_cached_url("https://lru.test/2")
+
+    cache = db.result_cache
+    assert "https://lru.test/1" not in cache
+    assert "https://lru.test/0" in cache and "https://lru.test/2" in cache
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_oversized_and_unknown_sizes():
+    cache = ResultCache(max_bytes=ResultCache.UNKNOWN_SIZE)
+    result = object()
+    cache.put("https://big.test/", result, ResultCache.UNKNOWN_SIZE + 1)
+    assert len(cache) == 0
+    # Legacy rows without a recorded size are charged a default
+    cache.put("https://old.test/", result, 0)
+    assert cache.current_bytes == ResultCache.UNKNOWN_SIZE
+
+
+@pytest.mark.asyncio
+async def test_invalidation(tmp_path):
+    db = await make_db(tmp_path)
+    await db.acache_url(make_result("https://a.test/", "<p>old</p>"))
+    await db.aget_cached_url("https://a.test/")
+
+    await db.acache_url(make_result("https://a.test/", "<p>new</p>"))
+    assert "https://a.test/" not in db.result_cache
+    assert (await db.aget_cached_url("https://a.test/")).cleaned_html == "<p>new</p>"
+
+    assert "https://a.test/" in db.result_cache
+    await db.aclear_db()
+    assert len(db.result_cache) == 0
+    assert await db.aget_cached_url("https://a.test/") is None
+
+    await db.acache_url(make_result("https://a.test/", "<p>again</p>"))
+    await db.aget_cached_url("https://a.test/")
+    await db.aflush_db()
+    assert len(db.result_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_read_speed(tmp_path):
+    db = await make_db(tmp_path, max_bytes=0)
+    await db.acache_url(make_result("https://a.test/", "<p>Lorem ipsum</p>" * 2000))
+    await db.aflush_writes()
+
+    rounds = 100
+    start = time.perf_counter()
+    for _ in range(rounds):
+        (await db.aget_cached_url("https://a.test/")).html
+    uncached = time.perf_counter() - start
+
+    db.enable_result_cache(1024 * 1024)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        (await db.aget_cached_url("https://a.test/")).html
+    cached = time.perf_counter() - start
+
+    print(f"database: {uncached / rounds * 1000:.2f} ms/read")
+    print(f"result cache: {cached / rounds * 1000:.2f} ms/read")
+    assert cached < uncached
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import random
+import pytest
+import numpy as np
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.deep_crawling.scorers import (
+    CompositeScorer,
+    ContentTypeScorer,
+    DomainAuthorityScorer,
+    FreshnessScorer,
+    KeywordRelevanceScorer,
+    PathDepthScorer,
+)
+
+PARTS = ["python", "Blog", "2019", "2024", "2023-05-01", "a", "docs", "x.html", "y.pdf",
+         "img.JPG", "q.php?id=1", "2031", "1999_12"]
+HOSTS = ["python.org", "github.com", "unknown.com", "Sub.Example.com:8080"]
+
+
+def make_urls(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        f"https://{rng.choice(HOSTS)}/"
+        + "/".join(rng.choice(PARTS) for _ in range(rng.randint(0, 6)))
+        + rng.choice(["", "/", "#top", "?page=2"])
+        for _ in range(count)
+    ]
+
+
+def make_scorers():
+    return [
+        KeywordRelevanceScorer(["python", "blog"], weight=0.7),
+        PathDepthScorer(optimal_depth=2, weight=0.3),
+        ContentTypeScorer({".html$": 1.0, ".pdf$": 0.8, ".jpg$": 0.6, r"\?id=\d": 0.4}),
+        FreshnessScorer(weight=0.9, current_year=2024),
+        DomainAuthorityScorer({"python.org": 1.0, "github.com": 0.9}, default_weight=0.3),
+    ]
+
+
+@pytest.mark.parametrize("index", range(len(make_scorers()) + 1))
+def test_score_many_matches_score(index):
+    def make():
+        return CompositeScorer(make_scorers()) if index == len(make_scorers()) else make_scorers()[index]
+
+    urls = make_urls(2000) + ["https://example.com", "https://example.com/"]
+    scalar, batch = make(), make()
+    expected = [scalar.score(url) for url in urls]
+
+    scores = batch.score_many(urls)
+    assert isinstance(scores, np.ndarray)
+    assert scores.tolist() == expected
+    # Cached URLs come back the same, and stats count every call
+    assert batch.score_many(urls[:10]).tolist() == expected[:10]
+    assert batch.stats._urls_scored == len(urls) + 10
+    assert batch.stats.get_average() == pytest.approx(
+        (sum(expected) + sum(expected[:10])) / (len(urls) + 10)
+    )
+    assert batch.score_many([]).tolist() == []
+
+
+def test_cache_is_per_instance_and_bounded():
+    python = KeywordRelevanceScorer(["python"])
+    blog = KeywordRelevanceScorer(["blog"])
+    url = "https://example.com/python"
+    assert python.score(url) == 1.0
+    assert blog.score(url) == 0.0
+
+    small = PathDepthScorer(optimal_depth=1)
+    small._cache_size = 100
+    small.score_many(make_urls(1000))
+    assert len(small._cache) <= 100
+
+    # No class-level lru_cache holding on to scorer instances
+    for scorer in make_scorers() + [CompositeScorer([])]:
+        assert not hasattr(type(scorer)._calculate_score, "cache_info")
+
+
+def test_score_many_benchmark():
+    urls = make_urls(50000, seed=3)
+    # Realistic pages link to the same URLs again, so half the batch repeats
+    urls = urls + urls[:25000]
+
+    start = time.perf_counter()
+    scalar = CompositeScorer(make_scorers())
+    for url in urls:
+        scalar.score(url)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    CompositeScorer(make_scorers()).score_many(urls)
+    batch_time = time.perf_counter() - start
+
+    print(f"75k URLs, 5 scorers: score() loop {loop_time * 1000:.0f} ms, score_many {batch_time * 1000:.0f} ms")
+    assert batch_time < loop_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
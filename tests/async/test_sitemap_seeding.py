@@ -0,0 +1,220 @@
+import os
+import sys
+import gzip
+import asyncio
+import tracemalloc
+from collections import Counter
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, BestFirstCrawlingStrategy, SitemapSeeder
+from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
+from crawl4ai.deep_crawling.scorers import FreshnessScorer
+from crawl4ai.deep_crawling.seeding import parse_lastmod
+from crawl4ai.models import AsyncCrawlResponse
+from crawl4ai.utils import RobotsParser
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(entries):
+    items = "".join(
+        f"<url><loc>{loc}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</url>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{items}</urlset>'.encode()
+
+
+class SitemapSite:
+    """robots.txt, a sitemap index, a plain and a gzipped sitemap, and a large one."""
+
+    def __init__(self):
+        self.requests = Counter()
+
+    def setup(self, base):
+        self.base = base
+        pages = [(f"{base}/page/{i}", f"{2015 + i}-06-01") for i in range(10)]
+        pages += [(f"{base}/private/secret", None), ("https://elsewhere.test/page", None)]
+        # Listed under www., which counts as the same host
+        self.www_page = base.replace("//", "//www.") + "/page/www"
+        pages += [(self.www_page, None)]
+        news = [(f"{base}/news/{i}", "2024-01-02T10:00:00Z") for i in range(5)]
+        self.files = {
+            "/robots.txt": (
+                f"User-agent: *\nDisallow: /private\nSitemap: {base}/sitemap_index.xml\n".encode(),
+                "text/plain",
+            ),
+            "/sitemap_index.xml": (
+                f'<sitemapindex {NS}><sitemap><loc>{base}/sitemap-pages.xml</loc></sitemap>'
+                f"<sitemap><loc>{base}/sitemap-news.xml.gz</loc></sitemap></sitemapindex>".encode(),
+                "application/xml",
+            ),
+            "/sitemap-pages.xml": (urlset(pages), "application/xml"),
+            "/sitemap-news.xml.gz": (gzip.compress(urlset(news)), "application/x-gzip"),
+            "/big.xml.gz": (
+                gzip.compress(urlset((f"{base}/big/{i}", "2023-03-04") for i in range(50000))),
+                "application/x-gzip",
+            ),
+        }
+
+    async def handle(self, request):
+        self.requests[request.path] += 1
+        if request.path not in self.files:
+            raise web.HTTPNotFound()
+        body, content_type = self.files[request.path]
+        response = web.StreamResponse(headers={"Content-Type": content_type})
+        await response.prepare(request)
+        for start in range(0, len(body), 16384):
+            await response.write(body[start:start + 16384])
+        return response
+
+
+class PageSite(AsyncCrawlerStrategy):
+    """Pages without links, so every URL beyond the start page comes from a sitemap."""
+
+    def __init__(self):
+        self.fetches = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
+        await asyncio.sleep(0)
+        self.fetches.append(url)
+        return AsyncCrawlResponse(
+            html="<html><body><p>No links here</p></body></html>",
+            response_headers={},
+            status_code=200,
+        )
+
+
+@pytest_asyncio.fixture
+async def site():
+    site = SitemapSite()
+    app = web.Application()
+    app.router.add_get("/{path:.*}", site.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    tcp = web.TCPSite(runner, "127.0.0.1", 0)
+    await tcp.start()
+    site.setup(f"http://127.0.0.1:{tcp._server.sockets[0].getsockname()[1]}")
+    yield site
+    await runner.cleanup()
+
+
+def seeder(tmp_path, **kwargs):
+    return SitemapSeeder(robots_parser=RobotsParser(cache_dir=str(tmp_path)), **kwargs)
+
+
+async def crawl(strategy, start_url):
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, deep_crawl_strategy=strategy)
+    pages = PageSite()
+    async with AsyncWebCrawler(crawler_strategy=pages) as crawler:
+        results = await crawler.arun(start_url, config=config)
+    return results, pages
+
+
+def test_parse_lastmod():
+    assert parse_lastmod("2024-01-02T10:00:00Z").year == 2024
+    assert parse_lastmod(" 2023-05-06 ").month == 5
+    assert parse_lastmod("2021-07").month == 7
+    assert parse_lastmod("2020").year == 2020
+    assert parse_lastmod("yesterday") is None
+    assert parse_lastmod(None) is None
+
+
+@pytest.mark.asyncio
+async def test_seeder_follows_robots_and_sitemap_index(site, tmp_path):
+    entries = [entry async for entry in seeder(tmp_path).seed(site.base + "/")]
+
+    urls = [entry.url for entry in entries]
+    assert urls == (
+        [f"{site.base}/page/{i}" for i in range(10)]
+        + [site.www_page]
+        + [f"{site.base}/news/{i}" for i in range(5)]
+    )
+    assert entries[3].lastmod.year == 2018
+    assert entries[-1].lastmod.year == 2024 and entries[-1].lastmod.tzinfo is not None
+
+    # The robots.txt rules come from RobotsParser's cache the second time
+    again = seeder(tmp_path, max_urls=3)
+    assert len([entry async for entry in again.seed(site.base + "/")]) == 3
+    assert site.requests["/robots.txt"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bfs_crawls_seeded_urls(site, tmp_path):
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=1,
+        seeder=seeder(tmp_path),
+        filter_chain=FilterChain([URLPatternFilter(["*/page/*"])]),
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10),
+    )
+    results, pages = await crawl(strategy, site.base + "/")
+
+    crawled = {r.url: r.metadata for r in results}
+    assert set(crawled) == (
+        {site.base + "/", site.www_page} | {f"{site.base}/page/{i}" for i in range(10)}
+    )
+    assert crawled[f"{site.base}/page/0"]["depth"] == 1
+    assert crawled[f"{site.base}/page/0"]["parent_url"] == site.base + "/"
+    assert strategy.stats.urls_skipped == 5  # The news pages
+
+    # Seeds count towards max_pages
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=1, max_pages=4, seeder=seeder(tmp_path),
+        dispatcher=MemoryAdaptiveDispatcher(max_session_permit=10),
+    )
+    results, _ = await crawl(strategy, site.base + "/")
+    assert len(results) == 4
+
+
+@pytest.mark.asyncio
+async def test_best_first_scores_seeds_by_lastmod(site, tmp_path):
+    strategy = BestFirstCrawlingStrategy(
+        max_depth=1,
+        seeder=seeder(tmp_path),
+        url_scorer=FreshnessScorer(current_year=2024),
+    )
+    results, _ = await crawl(strategy, site.base + "/")
+
+    scores = {r.url: r.metadata["score"] for r in results}
+    assert len(scores) == 17
+    # No dates in these URLs: the scores come from each page's <lastmod>
+    assert scores[f"{site.base}/page/9"] == pytest.approx(1.0)
+    assert scores[f"{site.base}/page/7"] == pytest.approx(0.8)
+    assert scores[f"{site.base}/page/0"] == pytest.approx(0.1)
+    assert scores[f"{site.base}/news/0"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_large_sitemap_is_streamed(site, tmp_path):
+    big = seeder(tmp_path, sitemaps=[site.base + "/big.xml.gz"], use_robots=False)
+    count = 0
+    tracemalloc.start()
+    async for entry in big.seed(site.base + "/"):
+        count += 1
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    inflated = 50000 * len(f"<url><loc>{site.base}/big/00000</loc><lastmod>2023-03-04</lastmod></url>")
+    print(f"50k-entry sitemap ({inflated / 2**20:.1f} MiB inflated): peak {peak / 2**20:.2f} MiB while seeding")
+    assert count == 50000
+    assert peak < inflated / 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
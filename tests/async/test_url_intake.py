@@ -0,0 +1,125 @@
+import os
+import sys
+import asyncio
+import tracemalloc
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import (
+    DomainFairDispatcher,
+    MemoryAdaptiveDispatcher,
+    SemaphoreDispatcher,
+)
+from crawl4ai.models import CrawlResult
+
+
+class FakeCrawler:
+    """Counts crawls so the number of URLs pulled but not yet crawled can be checked."""
+
+    def __init__(self):
+        self.done = 0
+
+    async def arun(self, url, config=None, session_id=None):
+        await asyncio.sleep(0)
+        self.done += 1
+        return CrawlResult(url=url, html="", success=True, status_code=200)
+
+
+class Source:
+    """URL generator that records how far ahead of the crawler it has been read."""
+
+    def __init__(self, crawler: FakeCrawler, count: int):
+        self.crawler = crawler
+        self.count = count
+        self.pulled = 0
+        self.max_ahead = 0
+
+    def _next(self, i: int) -> str:
+        self.pulled += 1
+        self.max_ahead = max(self.max_ahead, self.pulled - self.crawler.done)
+        return f"https://site{i % 7}.test/{i}"
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self._next(i)
+
+    async def aiter(self):
+        for i in range(self.count):
+            await asyncio.sleep(0)
+            yield self._next(i)
+
+
+def dispatchers():
+    return [
+        MemoryAdaptiveDispatcher(max_session_permit=5, check_interval=0.01),
+        SemaphoreDispatcher(semaphore_count=5, max_session_permit=5),
+        DomainFairDispatcher(
+            max_session_permit=5, max_per_domain=5, requests_per_second=0, max_buffered_urls=5
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatcher", dispatchers(), ids=lambda d: type(d).__name__)
+@pytest.mark.parametrize("kind", ["iterable", "async_iterable"])
+async def test_sources_are_pulled_lazily(dispatcher, kind):
+    crawler = FakeCrawler()
+    source = Source(crawler, 200)
+    urls = iter(source) if kind == "iterable" else source.aiter()
+
+    results = await dispatcher.run_urls(urls=urls, crawler=crawler, config=CrawlerRunConfig())
+
+    assert len(results) == 200
+    # Never more than one slot's worth of URLs (plus the one being pulled) ahead
+    assert source.max_ahead <= 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatcher", dispatchers(), ids=lambda d: type(d).__name__)
+async def test_queue_source(dispatcher):
+    crawler = FakeCrawler()
+    queue = asyncio.Queue(maxsize=3)
+    urls = [f"https://q{i % 3}.test/{i}" for i in range(30)]
+
+    async def produce():
+        for url in urls:
+            await queue.put(url)
+            await asyncio.sleep(0.001)
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    results = await dispatcher.run_urls(urls=queue, crawler=crawler, config=CrawlerRunConfig())
+    await producer
+
+    assert sorted(r.url for r in results) == sorted(urls)
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_streaming_memory_is_flat():
+    async def peak_memory(count: int) -> int:
+        crawler = FakeCrawler()
+        dispatcher = MemoryAdaptiveDispatcher(max_session_permit=10)
+        seen = 0
+        tracemalloc.start()
+        async for _ in dispatcher.run_urls_stream(
+            urls=iter(Source(crawler, count)), crawler=crawler, config=CrawlerRunConfig()
+        ):
+            seen += 1
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert seen == count
+        return peak
+
+    small = await peak_memory(500)
+    large = await peak_memory(5000)
+    print(f"peak traced memory: {small / 1024:.0f} KiB for 500 URLs, {large / 1024:.0f} KiB for 5000")
+    assert large < small * 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])